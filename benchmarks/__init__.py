@@ -0,0 +1,4 @@
+"""
+Benchmarks Package
+Berisi script pengukuran performa sistem pemesanan restoran.
+"""
@@ -0,0 +1,67 @@
+"""
+Benchmark Analisis Laporan
+Membandingkan analisis_laporan di Python (semua baris laporan dialirkan
+ke aplikasi), get_statistik_pemesanan (GROUP BY/SUM di database), dan
+get_statistik_harian (tabel ringkasan pemesanan_harian) untuk rentang
+satu tahun data.
+
+Cara menjalankan (MySQL/MariaDB atau SQLite, lihat benchmarks/common.py):
+    python -m benchmarks.bench_analisis --baris 1000000 --hari 365
+"""
+
+import argparse
+from datetime import timedelta
+
+from services.restaurant_service import analisis_laporan
+from benchmarks.bench_laporan_tanggal import isi_data, AWAL
+from benchmarks.common import buat_database, Timer
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark analisis laporan Python vs SQL")
+    parser.add_argument('--baris', type=int, default=1_000_000)
+    parser.add_argument('--hari', type=int, default=365, help="Panjang rentang laporan")
+    parser.add_argument('--ulang', type=int, default=3)
+    args = parser.parse_args()
+    
+    db = buat_database()
+    if not db.connect() or not db.create_tables():
+        print("✗ Gagal menyiapkan database benchmark")
+        return
+    
+    try:
+        isi_data(db, args.baris)
+        db.refresh_rollup()
+        mulai = AWAL.date()
+        akhir = mulai + timedelta(days=args.hari - 1)
+        
+        t_python = t_sql = t_harian = float('inf')
+        for _ in range(args.ulang):
+            with Timer() as t:
+                hasil_python = analisis_laporan(db.iter_laporan_pemesanan(
+                    tanggal_mulai=mulai, tanggal_akhir=akhir))
+            t_python = min(t_python, t.elapsed)
+            with Timer() as t:
+                hasil_sql = db.get_statistik_pemesanan(tanggal_mulai=mulai, tanggal_akhir=akhir)
+            t_sql = min(t_sql, t.elapsed)
+            with Timer() as t:
+                db.get_statistik_harian(tanggal_mulai=mulai, tanggal_akhir=akhir,
+                                        dengan_pelanggan=False)
+            t_harian = min(t_harian, t.elapsed)
+        
+        print(f"Rentang {mulai} s/d {akhir}: {hasil_python['total_pemesanan']} pemesanan")
+        print(f"Python (stream + loop) : {t_python * 1000:9.1f} ms")
+        print(f"SQL (GROUP BY)         : {t_sql * 1000:9.1f} ms")
+        print(f"Ringkasan harian       : {t_harian * 1000:9.1f} ms")
+        print(f"Percepatan SQL         : {t_python / t_sql:.1f}x")
+        print(f"Percepatan ringkasan   : {t_python / t_harian:.1f}x")
+        
+        sama = all(hasil_python[k] == hasil_sql[k]
+                   for k in ('total_pemesanan', 'total_orang', 'status_count'))
+        print(f"Hasil total/status sama: {'ya' if sama else 'TIDAK'}")
+    finally:
+        db.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark Table Assigner
+Membandingkan alokasi best-fit batch dengan first-fit berurutan (memilih
+meja pertama yang muat sesuai nomor meja) pada ribuan permintaan simulasi.
+Tidak membutuhkan server database.
+
+Cara menjalankan:
+    python -m benchmarks.bench_assignment --permintaan 5000 --malam 30
+"""
+
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from services.assignment import TableAssigner, total_tamu_duduk
+from services.availability import AvailabilityIndex
+from benchmarks.common import Timer
+
+
+KAPASITAS_MEJA = [2] * 8 + [4] * 10 + [6] * 4 + [8] * 2
+UKURAN_ROMBONGAN = [1, 2, 2, 2, 3, 4, 4, 5, 6, 7, 8]
+
+
+def buat_meja():
+    """Membuat denah meja simulasi dengan nomor acak terhadap kapasitas."""
+    kapasitas = KAPASITAS_MEJA[:]
+    random.Random(1).shuffle(kapasitas)
+    return [{'id': i, 'nomor_meja': i, 'kapasitas': k}
+            for i, k in enumerate(kapasitas, start=1)]
+
+
+def buat_permintaan(jumlah: int, malam: int, seed: int = 42):
+    """Membuat permintaan acak jam 17:00-21:30 dalam sejumlah malam."""
+    rng = random.Random(seed)
+    awal = datetime(2025, 12, 1)
+    return [{'jumlah_orang': rng.choice(UKURAN_ROMBONGAN),
+             'tanggal_pemesanan': awal + timedelta(days=rng.randrange(malam),
+                                                   hours=17, minutes=30 * rng.randint(0, 9))}
+            for _ in range(jumlah)]
+
+
+def first_fit(meja_list, permintaan):
+    """Alokasi naif: sesuai urutan datang, meja pertama (nomor terkecil) yang muat."""
+    index = AvailabilityIndex()
+    alokasi = []
+    for n, p in enumerate(permintaan):
+        pilihan = None
+        for meja in meja_list:
+            if meja['kapasitas'] >= p['jumlah_orang'] and \
+                    index.is_bebas(meja['id'], p['tanggal_pemesanan']):
+                pilihan = meja
+                index.tambah(n, meja['id'], p['tanggal_pemesanan'])
+                break
+        alokasi.append((p, pilihan))
+    return alokasi
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark best-fit table assignment")
+    parser.add_argument('--permintaan', type=int, default=5000)
+    parser.add_argument('--malam', type=int, default=30)
+    args = parser.parse_args()
+    
+    meja_list = buat_meja()
+    permintaan = buat_permintaan(args.permintaan, args.malam)
+    total_diminta = sum(p['jumlah_orang'] for p in permintaan)
+    
+    with Timer() as t_naif:
+        naif = first_fit(meja_list, permintaan)
+    with Timer() as t_best:
+        best = TableAssigner(meja_list).alokasi_batch(permintaan)
+    
+    for nama, alokasi, t in (("first-fit", naif, t_naif), ("best-fit batch", best, t_best)):
+        duduk = total_tamu_duduk(alokasi)
+        print(f"{nama:<15}: {duduk}/{total_diminta} tamu duduk "
+              f"({duduk / args.malam:.1f} per malam), "
+              f"{t.elapsed * 1000:.1f} ms ({t.elapsed / len(permintaan) * 1e6:.1f} µs/permintaan)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+Benchmark API Async
+Mengukur throughput request campuran (cek meja tersedia, buat pemesanan,
+laporan harian) yang dilayani:
+  - sinkron, satu request setelah yang lain (seperti loop console)
+  - async, banyak klien bersamaan lewat AsyncDatabaseManager
+
+Database lokal (SQLite) dipakai sebagai stand-in; --latensi-ms menambahkan
+jeda per peminjaman koneksi untuk meniru round trip ke server database.
+
+Cara menjalankan:
+    RESTAURANT_DB_BACKEND=sqlite python -m benchmarks.bench_async --request 500 --klien 32
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from database.async_manager import AsyncDatabaseManager
+from database.db_manager import DatabaseManager
+from services import async_service
+from services.restaurant_service import (tambah_pemesanan, lihat_meja_tersedia,
+                                         generate_laporan_pemesanan)
+from benchmarks.common import buat_database, reset_tables, ringkasan_latensi, Timer
+
+
+AWAL = datetime(2025, 12, 1, 17, 0)
+
+
+def tambah_latensi(db: DatabaseManager, detik: float):
+    """Menambahkan jeda setiap kali koneksi dipinjam (meniru latensi jaringan)."""
+    asli = db._connection
+
+    @contextmanager
+    def _connection():
+        time.sleep(detik)
+        with asli() as conn:
+            yield conn
+
+    db._connection = _connection
+
+
+def siapkan(db: DatabaseManager, jumlah_meja: int) -> tuple:
+    """Membuat pelanggan dan meja; mengembalikan (pelanggan_id, list meja_id)."""
+    reset_tables(db)
+    db.bulk_create_pelanggan([(f"Pelanggan {i}", f"08{i:010d}", "") for i in range(100)])
+    db.bulk_create_meja([(i, 4, 'tersedia') for i in range(1, jumlah_meja + 1)])
+    pelanggan = [r['id'] for r in db.execute_query("SELECT id FROM pelanggan", fetch=True)]
+    meja = [r['id'] for r in db.execute_query("SELECT id FROM meja", fetch=True)]
+    return pelanggan, meja
+
+
+def buat_request(jumlah: int, pelanggan: list, meja: list) -> list:
+    """Membuat daftar request campuran: 60% cek meja, 30% pemesanan, 10% laporan."""
+    rng = random.Random(42)
+    requests = []
+    for _ in range(jumlah):
+        x = rng.random()
+        if x < 0.6:
+            requests.append(('meja_tersedia', ()))
+        elif x < 0.9:
+            waktu = AWAL + timedelta(minutes=15 * rng.randrange(100))
+            requests.append(('pemesanan', (rng.choice(pelanggan), rng.choice(meja),
+                                           waktu.strftime('%Y-%m-%d %H:%M:%S'),
+                                           rng.randint(1, 4))))
+        else:
+            requests.append(('laporan', ()))
+    return requests
+
+
+SINKRON = {
+    'meja_tersedia': lambda db: lihat_meja_tersedia(db),
+    'pemesanan': lambda db, *args: tambah_pemesanan(db, *args),
+    'laporan': lambda db: generate_laporan_pemesanan(db, tanggal_mulai="2025-12-01",
+                                                     tanggal_akhir="2025-12-01"),
+}
+
+ASYNC = {
+    'meja_tersedia': lambda adb: async_service.lihat_meja_tersedia(adb),
+    'pemesanan': lambda adb, *args: async_service.tambah_pemesanan(adb, *args),
+    'laporan': lambda adb: async_service.generate_laporan_pemesanan(
+        adb, tanggal_mulai="2025-12-01", tanggal_akhir="2025-12-01"),
+}
+
+
+def jalankan_sinkron(db: DatabaseManager, requests: list) -> tuple:
+    """Melayani request satu per satu; mengembalikan (durasi, latensi)."""
+    latencies = []
+    with Timer() as total:
+        for jenis, args in requests:
+            with Timer() as t:
+                SINKRON[jenis](db, *args)
+            latencies.append(t.elapsed)
+    return total.elapsed, latencies
+
+
+async def jalankan_async(adb: AsyncDatabaseManager, requests: list, klien: int) -> tuple:
+    """Melayani request dengan `klien` coroutine bersamaan; mengembalikan (durasi, latensi)."""
+    antrian = list(reversed(requests))
+    latencies = []
+
+    async def klien_loop():
+        while antrian:
+            jenis, args = antrian.pop()
+            mulai = time.perf_counter()
+            await ASYNC[jenis](adb, *args)
+            latencies.append(time.perf_counter() - mulai)
+
+    with Timer() as total:
+        await asyncio.gather(*[klien_loop() for _ in range(klien)])
+    return total.elapsed, latencies
+
+
+def cetak(nama: str, durasi: float, latencies: list):
+    """Mencetak satu baris hasil."""
+    r = ringkasan_latensi(latencies)
+    print(f"  {nama:<22}: {len(latencies) / durasi:8.1f} req/s | "
+          f"p50={r['p50_ms']:.2f} p95={r['p95_ms']:.2f} p99={r['p99_ms']:.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API async")
+    parser.add_argument('--request', type=int, default=500)
+    parser.add_argument('--klien', type=int, default=32, help="Request bersamaan (async)")
+    parser.add_argument('--pool', type=int, default=8, help="Ukuran connection pool")
+    parser.add_argument('--meja', type=int, default=50)
+    parser.add_argument('--latensi-ms', type=float, default=1.0,
+                        help="Jeda tambahan per peminjaman koneksi")
+    args = parser.parse_args()
+
+    db = buat_database(pool_size=args.pool)
+    if not db.connect() or not db.create_tables():
+        print("✗ Gagal menyiapkan database benchmark")
+        return
+    if args.latensi_ms:
+        tambah_latensi(db, args.latensi_ms / 1000)
+
+    try:
+        print(f"{args.request} request, pool {args.pool}, latensi {args.latensi_ms} ms:")
+        with contextlib.redirect_stdout(io.StringIO()):
+            pelanggan, meja = siapkan(db, args.meja)
+            durasi, lat = jalankan_sinkron(db, buat_request(args.request, pelanggan, meja))
+        cetak("sinkron", durasi, lat)
+
+        adb = AsyncDatabaseManager(db)
+        with contextlib.redirect_stdout(io.StringIO()):
+            pelanggan, meja = siapkan(db, args.meja)
+            durasi, lat = asyncio.run(jalankan_async(adb, buat_request(args.request, pelanggan, meja),
+                                                     args.klien))
+        cetak(f"async ({args.klien} klien)", durasi, lat)
+        print(f"  Facade: {adb.stats()}")
+    finally:
+        db.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Benchmark Availability Index
+Mengukur waktu query meja kosong pada index berisi pemesanan berbulan-bulan.
+Tidak membutuhkan server database.
+
+Cara menjalankan:
+    python -m benchmarks.bench_availability --meja 60 --hari 180
+"""
+
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from services.availability import AvailabilityIndex
+from benchmarks.common import Timer
+
+
+def bangun_index(jumlah_meja: int, hari: int, seed: int = 42) -> AvailabilityIndex:
+    """
+    Membuat index berisi pemesanan simulasi: setiap meja 1-4 pemesanan per
+    malam antara jam 17:00 dan 22:00.
+    """
+    rng = random.Random(seed)
+    index = AvailabilityIndex()
+    awal = datetime(2025, 1, 1)
+    pemesanan_id = 0
+    for d in range(hari):
+        tanggal = awal + timedelta(days=d)
+        for meja_id in range(1, jumlah_meja + 1):
+            jam = 17
+            for _ in range(rng.randint(1, 4)):
+                if jam > 22:
+                    break
+                pemesanan_id += 1
+                index.tambah(pemesanan_id, meja_id, tanggal + timedelta(hours=jam))
+                jam += 2 + rng.randint(0, 1)
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark availability index")
+    parser.add_argument('--meja', type=int, default=60)
+    parser.add_argument('--hari', type=int, default=180)
+    parser.add_argument('--query', type=int, default=20000)
+    args = parser.parse_args()
+    
+    with Timer() as t_build:
+        index = bangun_index(args.meja, args.hari)
+    print(f"Index    : {len(index)} pemesanan, {args.meja} meja, {args.hari} hari "
+          f"(dibangun dalam {t_build.elapsed:.2f} s)")
+    
+    rng = random.Random(7)
+    meja_ids = list(range(1, args.meja + 1))
+    awal = datetime(2025, 1, 1)
+    waktu = [awal + timedelta(days=rng.randrange(args.hari), hours=rng.randint(17, 22),
+                              minutes=rng.choice((0, 30)))
+             for _ in range(args.query)]
+    
+    with Timer() as t_is:
+        for w in waktu:
+            index.is_bebas(rng.choice(meja_ids), w)
+    with Timer() as t_semua:
+        for w in waktu:
+            index.meja_bebas(meja_ids, w)
+    
+    print(f"is_bebas : {t_is.elapsed / args.query * 1e6:.2f} µs/query")
+    print(f"meja_bebas ({args.meja} meja): {t_semua.elapsed / args.query * 1e6:.2f} µs/query")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark Impor Massal
+Membandingkan throughput insert satu per satu (create_pelanggan) dengan
+bulk insert (tambah_pelanggan_bulk) dalam baris per detik.
+
+Cara menjalankan (MySQL/MariaDB atau SQLite, lihat benchmarks/common.py):
+    python -m benchmarks.bench_bulk_insert --baris 20000 --chunk 500 1000 5000
+"""
+
+import argparse
+import contextlib
+import io
+
+from services.restaurant_service import tambah_pelanggan_bulk
+from benchmarks.common import buat_database, reset_tables, Timer
+
+
+def buat_data(jumlah: int):
+    """Membuat data pelanggan sintetis yang lolos validasi."""
+    huruf = "abcdefghijklmnopqrstuvwxyz"
+    data = []
+    for i in range(jumlah):
+        nama = "Pelanggan " + "".join(huruf[(i // 26 ** k) % 26] for k in range(4))
+        data.append({'nama': nama.title(), 'telepon': f"08{i:010d}",
+                     'email': f"pelanggan{i}@example.com"})
+    return data
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark bulk insert pelanggan")
+    parser.add_argument('--baris', type=int, default=20000)
+    parser.add_argument('--baris-satuan', type=int, default=2000,
+                        help="Jumlah baris untuk mode satu per satu")
+    parser.add_argument('--chunk', type=int, nargs='+', default=[500, 1000, 5000])
+    args = parser.parse_args()
+    
+    db = buat_database()
+    if not db.connect() or not db.create_tables():
+        print("✗ Gagal menyiapkan database benchmark")
+        return
+    
+    data = buat_data(args.baris)
+    try:
+        reset_tables(db)
+        with Timer() as t:
+            for d in data[:args.baris_satuan]:
+                db.create_pelanggan(d['nama'], d['telepon'], d['email'])
+        print(f"{'satu per satu':<16}: {args.baris_satuan / t.elapsed:10.0f} baris/detik")
+        
+        for chunk in args.chunk:
+            reset_tables(db)
+            with Timer() as t, contextlib.redirect_stdout(io.StringIO()):
+                hasil = tambah_pelanggan_bulk(db, data, chunk_size=chunk)
+            print(f"{'bulk chunk ' + str(chunk):<16}: {hasil['berhasil'] / t.elapsed:10.0f} baris/detik "
+                  f"({hasil['berhasil']} baris, {len(hasil['gagal'])} gagal)")
+    finally:
+        reset_tables(db)
+        db.disconnect()
+
+
+if __name__ == '__main__':
+    main()
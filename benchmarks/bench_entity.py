@@ -0,0 +1,84 @@
+"""
+Benchmark Entity vs Dictionary
+Mengukur waktu dan memori memuat pemesanan sebagai:
+  - dict dari cursor dictionary (cara lama, read_pemesanan/execute_query)
+  - entitas __slots__ dari cursor tuple (read_entities / Pemesanan.from_rows)
+
+Selain lewat database, hidrasi juga diukur di memori (tuple -> dict vs
+tuple -> entitas) agar biaya driver tidak menutupi perbedaannya.
+
+Cara menjalankan (MySQL/MariaDB atau SQLite, lihat benchmarks/common.py):
+    python -m benchmarks.bench_entity --baris 1000000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from models import Pemesanan
+from benchmarks.bench_laporan_tanggal import isi_data
+from benchmarks.common import buat_database, Timer
+
+
+def ukur(fungsi) -> tuple:
+    """
+    Menjalankan fungsi dan mengukur memori hasilnya.
+
+    Returns:
+        tuple: (durasi detik, memori yang ditahan hasil (MB), puncak memori (MB), hasil)
+    """
+    gc.collect()
+    tracemalloc.start()
+    with Timer() as t:
+        hasil = fungsi()
+    ditahan, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return t.elapsed, ditahan / 2**20, puncak / 2**20, hasil
+
+
+def cetak(nama: str, durasi: float, ditahan: float, puncak: float, jumlah: int):
+    print(f"  {nama:<26}: {durasi * 1000:9.1f} ms | ditahan {ditahan:8.1f} MB | "
+          f"puncak {puncak:8.1f} MB | {ditahan * 2**20 / max(jumlah, 1):6.0f} B/baris")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark entitas __slots__ vs dict")
+    parser.add_argument('--baris', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    db = buat_database()
+    if not db.connect() or not db.create_tables():
+        print("✗ Gagal menyiapkan database benchmark")
+        return
+
+    try:
+        isi_data(db, args.baris)
+        query = f"SELECT {', '.join(Pemesanan.KOLOM)} FROM pemesanan LIMIT %s"
+        print(f"Memuat {args.baris} pemesanan dari database ({db.DIALEK}):")
+
+        durasi, ditahan, puncak, rows = ukur(
+            lambda: db.execute_query(query, (args.baris,), fetch=True))
+        cetak("dict (cursor dictionary)", durasi, ditahan, puncak, len(rows))
+        del rows
+
+        durasi, ditahan, puncak, entitas = ukur(
+            lambda: db.read_entities(Pemesanan, "LIMIT %s", (args.baris,)))
+        cetak("entitas (cursor tuple)", durasi, ditahan, puncak, len(entitas))
+        del entitas
+
+        print("Hidrasi di memori (dari tuple yang sudah diambil):")
+        tuples = db.execute_query(query, (args.baris,), fetch=True, dictionary=False)
+        kolom = Pemesanan.KOLOM
+
+        durasi, ditahan, puncak, rows = ukur(lambda: [dict(zip(kolom, r)) for r in tuples])
+        cetak("tuple -> dict", durasi, ditahan, puncak, len(rows))
+        del rows
+
+        durasi, ditahan, puncak, entitas = ukur(lambda: Pemesanan.from_rows(tuples))
+        cetak("tuple -> entitas", durasi, ditahan, puncak, len(entitas))
+    finally:
+        db.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark Laporan per Rentang Tanggal
+Membandingkan latensi laporan dengan filter DATE(kolom) (lama, full scan)
+dan filter rentang datetime setengah terbuka (baru, memakai idx_tanggal)
+pada tabel pemesanan berukuran besar.
+
+Cara menjalankan (MySQL/MariaDB atau SQLite, lihat benchmarks/common.py):
+    python -m benchmarks.bench_laporan_tanggal --baris 5000000 --hari 7
+"""
+
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from database.db_manager import DatabaseManager
+from benchmarks.common import buat_database, reset_tables, Timer
+
+
+STATUS = ('pending', 'confirmed', 'completed', 'cancelled')
+AWAL = datetime(2022, 1, 1)
+RENTANG_HARI = 4 * 365
+
+
+def isi_data(db: DatabaseManager, jumlah: int, chunk: int = 10000):
+    """
+    Mengisi tabel pemesanan sampai berisi `jumlah` baris tersebar selama empat tahun.
+    """
+    ada = db.execute_query("SELECT COUNT(*) AS n FROM pemesanan", fetch=True)[0]['n']
+    if ada >= jumlah:
+        return
+    
+    reset_tables(db)
+    db.bulk_create_pelanggan([(f"Pelanggan {chr(65 + i % 26)}", f"08{i:010d}", "")
+                              for i in range(1000)])
+    db.bulk_create_meja([(i, 4, 'tersedia') for i in range(1, 51)])
+    pelanggan = [r['id'] for r in db.execute_query("SELECT id FROM pelanggan", fetch=True)]
+    meja = [r['id'] for r in db.execute_query("SELECT id FROM meja", fetch=True)]
+    
+    rng = random.Random(42)
+    for awal in range(0, jumlah, chunk):
+        rows = [(rng.choice(pelanggan), rng.choice(meja),
+                 AWAL + timedelta(minutes=rng.randrange(RENTANG_HARI * 24 * 60)),
+                 rng.randint(1, 8), rng.choice(STATUS), "")
+                for _ in range(min(chunk, jumlah - awal))]
+        db.bulk_create_pemesanan(rows, chunk_size=chunk)
+        print(f"\r  mengisi data: {awal + len(rows)}/{jumlah}", end="", flush=True)
+    print()
+
+
+def ukur(db: DatabaseManager, query: str, params: tuple, ulang: int) -> tuple:
+    """Menjalankan query beberapa kali; mengembalikan (latensi terbaik, jumlah baris)."""
+    terbaik = float('inf')
+    jumlah = 0
+    for _ in range(ulang):
+        with Timer() as t:
+            jumlah = sum(1 for _ in db.iter_query(query, params))
+        terbaik = min(terbaik, t.elapsed)
+    return terbaik, jumlah
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark laporan rentang tanggal")
+    parser.add_argument('--baris', type=int, default=5_000_000)
+    parser.add_argument('--hari', type=int, default=7, help="Panjang rentang laporan")
+    parser.add_argument('--ulang', type=int, default=3)
+    args = parser.parse_args()
+    
+    db = buat_database()
+    if not db.connect() or not db.create_tables():
+        print("✗ Gagal menyiapkan database benchmark")
+        return
+    
+    try:
+        isi_data(db, args.baris)
+        mulai = (AWAL + timedelta(days=RENTANG_HARI // 2)).date()
+        akhir = mulai + timedelta(days=args.hari - 1)
+        
+        query_lama = """
+            SELECT p.*, pel.nama as nama_pelanggan, pel.telepon, m.nomor_meja, m.kapasitas
+            FROM pemesanan p
+            JOIN pelanggan pel ON p.pelanggan_id = pel.id
+            JOIN meja m ON p.meja_id = m.id
+            WHERE DATE(p.tanggal_pemesanan) >= %s AND DATE(p.tanggal_pemesanan) <= %s
+            ORDER BY p.tanggal_pemesanan DESC"""
+        query_baru, params_baru = db._query_laporan(None, mulai, akhir)
+        
+        t_lama, n_lama = ukur(db, query_lama, (str(mulai), str(akhir)), args.ulang)
+        t_baru, n_baru = ukur(db, query_baru, params_baru, args.ulang)
+        
+        print(f"Rentang {mulai} s/d {akhir} pada {args.baris} baris pemesanan")
+        print(f"DATE(kolom) (lama) : {t_lama * 1000:9.1f} ms, {n_lama} baris")
+        print(f"rentang (baru)     : {t_baru * 1000:9.1f} ms, {n_baru} baris")
+        print(f"Percepatan         : {t_lama / t_baru:.1f}x")
+    finally:
+        db.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark Backend Analisis NumPy
+Membandingkan analisis_laporan dan analisis_operasional jalur Python
+dengan backend NumPy pada laporan besar (default 1 juta baris):
+  - python baris : ReportAggregator per baris dict (cara lama)
+  - python kolom : Counter/sum per kolom (result_format FORMAT_KOLOM)
+  - numpy        : LaporanArray dari dict kolom, termasuk konversi ke array
+  - numpy array  : hanya perhitungan vektor atas LaporanArray yang sudah dimuat
+
+Secara default laporan dibuat di memori dengan bentuk baris
+get_laporan_pemesanan; dengan --database laporan diambil dari database
+(lihat benchmarks/common.py).
+
+Cara menjalankan (numpy wajib terinstall):
+    python -m benchmarks.bench_numpy --baris 1000000
+    python -m benchmarks.bench_numpy --baris 1000000 --database
+"""
+
+import argparse
+import gc
+import random
+import sys
+from datetime import datetime, timedelta
+
+from database.db_manager import DatabaseManager
+from services import numpy_analytics
+from services.restaurant_service import analisis_laporan, analisis_operasional
+from benchmarks.bench_laporan_tanggal import isi_data
+from benchmarks.common import buat_database, Timer
+
+
+def buat_kolom(jumlah: int) -> dict:
+    """Membuat laporan berbentuk kolom: 50 meja, 5000 pelanggan, 4 tahun."""
+    rng = random.Random(42)
+    awal = datetime(2022, 1, 1)
+    meja = [rng.randint(1, 50) for _ in range(jumlah)]
+    pelanggan = [rng.randint(1, 5000) for _ in range(jumlah)]
+    status = ['pending', 'confirmed', 'completed', 'cancelled']
+    return {
+        'id': list(range(jumlah, 0, -1)),
+        'pelanggan_id': pelanggan,
+        'meja_id': meja,
+        'tanggal_pemesanan': [awal + timedelta(minutes=rng.randrange(4 * 525600))
+                              for _ in range(jumlah)],
+        'jumlah_orang': [rng.randint(1, 12) for _ in range(jumlah)],
+        'status': [rng.choice(status) for _ in range(jumlah)],
+        'catatan': [''] * jumlah,
+        'nama_pelanggan': [f"Pelanggan {chr(65 + p % 26)}{p}" for p in pelanggan],
+        'telepon': ['081234567890'] * jumlah,
+        'nomor_meja': meja,
+        'kapasitas': [4] * jumlah,
+    }
+
+
+def waktu_terbaik(fungsi, ulang: int) -> tuple:
+    """
+    Menjalankan fungsi `ulang` kali.
+
+    Returns:
+        tuple: (durasi terbaik detik, hasil terakhir)
+    """
+    terbaik = float('inf')
+    for _ in range(ulang):
+        gc.collect()
+        with Timer() as t:
+            hasil = fungsi()
+        terbaik = min(terbaik, t.elapsed)
+    return terbaik, hasil
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark backend analisis NumPy")
+    parser.add_argument('--baris', type=int, default=1_000_000)
+    parser.add_argument('--ulang', type=int, default=3)
+    parser.add_argument('--database', action='store_true',
+                        help="Ambil laporan dari database, bukan data di memori")
+    args = parser.parse_args()
+
+    if not numpy_analytics.NUMPY_TERSEDIA:
+        print("✗ NumPy belum terinstall (pip install numpy)")
+        sys.exit(2)
+
+    if args.database:
+        db = buat_database()
+        if not db.connect() or not db.create_tables():
+            print("✗ Gagal menyiapkan database benchmark")
+            sys.exit(2)
+        try:
+            isi_data(db, args.baris)
+            kolom = db.get_laporan_pemesanan(result_format=DatabaseManager.FORMAT_KOLOM)
+        finally:
+            db.disconnect()
+    else:
+        kolom = buat_kolom(args.baris)
+    nama = list(kolom)
+    baris = [dict(zip(nama, nilai)) for nilai in zip(*kolom.values())]
+    print(f"Analisis {len(baris):,} baris laporan (waktu terbaik dari {args.ulang}x):")
+
+    for judul, fungsi, fungsi_numpy in (
+            ('analisis_laporan', analisis_laporan, numpy_analytics.analisis),
+            ('analisis_operasional', analisis_operasional, numpy_analytics.analisis_operasional)):
+        data = numpy_analytics.LaporanArray(kolom)
+        fungsi_numpy(data)  # memuat array yang dipakai
+        cara = {
+            'python baris': lambda: fungsi(baris),
+            'python kolom': lambda: fungsi(kolom),
+            'numpy': lambda: fungsi(kolom, backend='numpy'),
+            'numpy array': lambda: fungsi_numpy(data),
+        }
+
+        print(f"  {judul}:")
+        hasil = {}
+        for nama_cara, jalankan in cara.items():
+            durasi, hasil[nama_cara] = waktu_terbaik(jalankan, args.ulang)
+            print(f"    {nama_cara:<14}: {durasi * 1000:9.1f} ms | "
+                  f"{len(baris) / durasi:14,.0f} baris/s")
+        identik = all(h == hasil['python baris'] for h in hasil.values())
+        print(f"    {'hasil identik':<14}: {'✓' if identik else '✗'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark Pagination
+Membandingkan latensi membaca satu halaman daftar pemesanan pada
+kedalaman halaman yang berbeda: LIMIT/OFFSET (memindai semua baris yang
+dilewati) vs keyset pagination read_pemesanan_page (memakai idx_tanggal).
+
+Cara menjalankan (MySQL/MariaDB atau SQLite, lihat benchmarks/common.py):
+    python -m benchmarks.bench_pagination --baris 1000000 --halaman 20
+"""
+
+import argparse
+
+from benchmarks.bench_laporan_tanggal import isi_data
+from benchmarks.common import buat_database, Timer
+
+
+QUERY_OFFSET = """
+    SELECT p.*, pel.nama as nama_pelanggan, pel.telepon, m.nomor_meja, m.kapasitas
+    FROM pemesanan p
+    JOIN pelanggan pel ON p.pelanggan_id = pel.id
+    JOIN meja m ON p.meja_id = m.id
+    ORDER BY p.tanggal_pemesanan DESC, p.id DESC
+    LIMIT %s OFFSET %s"""
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pagination daftar pemesanan")
+    parser.add_argument('--baris', type=int, default=1_000_000)
+    parser.add_argument('--halaman', type=int, default=20, help="Ukuran halaman")
+    parser.add_argument('--ulang', type=int, default=5)
+    args = parser.parse_args()
+    
+    db = buat_database()
+    if not db.connect() or not db.create_tables():
+        print("✗ Gagal menyiapkan database benchmark")
+        return
+    
+    try:
+        isi_data(db, args.baris)
+        print(f"{'Offset':>10} {'OFFSET (ms)':>12} {'keyset (ms)':>12}")
+        
+        for offset in (0, 1_000, 10_000, 100_000, args.baris // 2):
+            # Kursor keyset = baris terakhir sebelum offset
+            kursor = None
+            if offset:
+                kursor = db.execute_query(QUERY_OFFSET, (1, offset - 1), fetch=True)[0]
+            
+            t_offset = t_keyset = float('inf')
+            for _ in range(args.ulang):
+                with Timer() as t:
+                    db.execute_query(QUERY_OFFSET, (args.halaman, offset), fetch=True)
+                t_offset = min(t_offset, t.elapsed)
+                with Timer() as t:
+                    db.read_pemesanan_page(kursor and kursor['tanggal_pemesanan'],
+                                           kursor and kursor['id'], args.halaman)
+                t_keyset = min(t_keyset, t.elapsed)
+            
+            print(f"{offset:>10} {t_offset * 1000:>12.2f} {t_keyset * 1000:>12.2f}")
+    finally:
+        db.disconnect()
+
+
+if __name__ == '__main__':
+    main()
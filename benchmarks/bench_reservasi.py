@@ -0,0 +1,113 @@
+"""
+Benchmark Reservasi Meja
+Mengukur throughput reservasi atomik di bawah kontensi: banyak thread
+(host) berebut sejumlah kecil meja secara bersamaan.
+
+Cara menjalankan (MySQL/MariaDB atau SQLite, lihat benchmarks/common.py):
+    python -m benchmarks.bench_reservasi --threads 16 --meja 10 --percobaan 2000
+"""
+
+import argparse
+import random
+import threading
+from collections import Counter
+
+from database.db_manager import DatabaseManager
+from benchmarks.common import buat_database, reset_tables, ringkasan_latensi, Timer
+
+
+def siapkan_data(db: DatabaseManager, jumlah_meja: int) -> tuple:
+    """
+    Membuat satu pelanggan dan sejumlah meja kosong untuk benchmark.
+    
+    Returns:
+        tuple: (pelanggan_id, list meja_id)
+    """
+    reset_tables(db)
+    pelanggan_id = db.create_pelanggan("Benchmark", "081234567890", "")
+    meja_ids = [db.create_meja(i, 4) for i in range(1, jumlah_meja + 1)]
+    return pelanggan_id, meja_ids
+
+
+def jalankan(db: DatabaseManager, threads: int, jumlah_meja: int, percobaan: int) -> dict:
+    """
+    Menjalankan benchmark reservasi bersamaan.
+    
+    Setiap percobaan memilih meja acak; setelah berhasil, pemesanan dibatalkan
+    lagi oleh thread yang sama agar kontensi tetap tinggi.
+    
+    Returns:
+        dict: Throughput, latensi, dan jumlah hasil per jenis
+    """
+    pelanggan_id, meja_ids = siapkan_data(db, jumlah_meja)
+    hasil = Counter()
+    latencies = []
+    lock = threading.Lock()
+    per_thread = percobaan // threads
+    
+    def worker():
+        rng = random.Random()
+        lokal = Counter()
+        lat = []
+        for _ in range(per_thread):
+            meja_id = rng.choice(meja_ids)
+            with Timer() as t:
+                r = db.reservasi_meja(pelanggan_id, meja_id, '2025-12-24 19:00:00', 2)
+            lat.append(t.elapsed)
+            lokal[r['hasil']] += 1
+            if r['hasil'] == DatabaseManager.RESERVASI_BERHASIL:
+                # Batalkan pemesanan (bukan hanya flag meja) agar slotnya bebas lagi
+                db.transisi_pemesanan(r['pemesanan_id'], 'cancelled', ('pending',),
+                                      status_meja='tersedia')
+        with lock:
+            hasil.update(lokal)
+            latencies.extend(lat)
+    
+    with Timer() as total:
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+    
+    ringkasan = ringkasan_latensi(latencies)
+    ringkasan.update({
+        'threads': threads,
+        'meja': jumlah_meja,
+        'durasi_s': total.elapsed,
+        'reservasi_per_detik': hasil[DatabaseManager.RESERVASI_BERHASIL] / total.elapsed,
+        'percobaan_per_detik': sum(hasil.values()) / total.elapsed,
+        'hasil': dict(hasil),
+        'pool': db.get_pool_stats()
+    })
+    return ringkasan
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reservasi meja atomik")
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--meja', type=int, default=10)
+    parser.add_argument('--percobaan', type=int, default=2000)
+    args = parser.parse_args()
+    
+    db = buat_database(pool_size=args.threads)
+    if not db.connect() or not db.create_tables():
+        print("✗ Gagal menyiapkan database benchmark")
+        return
+    
+    try:
+        r = jalankan(db, args.threads, args.meja, args.percobaan)
+    finally:
+        db.disconnect()
+    
+    print(f"Threads            : {r['threads']} | Meja: {r['meja']}")
+    print(f"Durasi             : {r['durasi_s']:.2f} s")
+    print(f"Reservasi berhasil : {r['reservasi_per_detik']:.1f} /detik")
+    print(f"Percobaan total    : {r['percobaan_per_detik']:.1f} /detik")
+    print(f"Latensi (ms)       : p50={r['p50_ms']:.2f} p95={r['p95_ms']:.2f} p99={r['p99_ms']:.2f}")
+    print(f"Hasil              : {r['hasil']}")
+    print(f"Pool               : {r['pool']}")
+
+
+if __name__ == '__main__':
+    main()
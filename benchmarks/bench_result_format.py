@@ -0,0 +1,104 @@
+"""
+Benchmark Result Format Laporan
+Mengukur get_laporan_pemesanan untuk setiap result_format (dict, tuple,
+namedtuple, kolom): waktu fetch terbaik, memori yang ditahan hasil, dan
+puncak memori selama fetch. Untuk bentuk yang bisa langsung dipakai
+laporan (dict dan kolom) juga diukur analisis_laporan dan print_laporan.
+
+Waktu diukur tanpa tracemalloc; memori diukur pada run terpisah karena
+tracemalloc memperlambat alokasi.
+
+Cara menjalankan (MySQL/MariaDB atau SQLite, lihat benchmarks/common.py):
+    python -m benchmarks.bench_result_format --baris 1000000
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import tracemalloc
+
+from database.db_manager import DatabaseManager
+from services.restaurant_service import analisis_laporan, print_laporan
+from benchmarks.bench_laporan_tanggal import isi_data
+from benchmarks.common import buat_database, Timer
+
+
+def waktu_terbaik(fungsi, ulang: int) -> float:
+    """Menjalankan fungsi `ulang` kali dan mengembalikan durasi terbaik (detik)."""
+    terbaik = float('inf')
+    for _ in range(ulang):
+        gc.collect()
+        with Timer() as t:
+            fungsi()
+        terbaik = min(terbaik, t.elapsed)
+    return terbaik
+
+
+def memori(fungsi) -> tuple:
+    """
+    Mengukur memori yang ditahan hasil fungsi dan puncaknya.
+
+    Returns:
+        tuple: (ditahan MB, puncak MB)
+    """
+    gc.collect()
+    tracemalloc.start()
+    hasil = fungsi()
+    ditahan, puncak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del hasil
+    return ditahan / 2**20, puncak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark result_format laporan")
+    parser.add_argument('--baris', type=int, default=1_000_000)
+    parser.add_argument('--ulang', type=int, default=3)
+    parser.add_argument('--cetak', type=int, default=10_000,
+                        help="Jumlah baris untuk print_laporan")
+    args = parser.parse_args()
+
+    db = buat_database()
+    if not db.connect() or not db.create_tables():
+        print("✗ Gagal menyiapkan database benchmark")
+        return
+
+    try:
+        isi_data(db, args.baris)
+        print(f"get_laporan_pemesanan {args.baris:,} baris ({db.DIALEK}, terbaik dari {args.ulang}x):")
+        for result_format in DatabaseManager.FORMAT_HASIL:
+            def ambil():
+                return db.get_laporan_pemesanan(result_format=result_format)
+            durasi = waktu_terbaik(ambil, args.ulang)
+            ditahan, puncak = memori(ambil)
+            print(f"  {result_format:<12}: {durasi * 1000:9.1f} ms | ditahan {ditahan:8.1f} MB | "
+                  f"puncak {puncak:8.1f} MB")
+
+        print("analisis_laporan / print_laporan:")
+        laporan = {
+            'dict': db.get_laporan_pemesanan(),
+            'kolom': db.get_laporan_pemesanan(result_format=DatabaseManager.FORMAT_KOLOM),
+        }
+        sebagian = {
+            'dict': laporan['dict'][:args.cetak],
+            'kolom': {k: v[:args.cetak] for k, v in laporan['kolom'].items()},
+        }
+        hasil = {}
+        for nama, data in laporan.items():
+            hasil[nama] = analisis_laporan(data)
+            analisis = waktu_terbaik(lambda: analisis_laporan(data), args.ulang)
+
+            def cetak():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    print_laporan(sebagian[nama])
+            durasi_cetak = waktu_terbaik(cetak, args.ulang)
+            print(f"  {nama:<12}: analisis {analisis * 1000:8.1f} ms | "
+                  f"print {args.cetak:,} baris {durasi_cetak * 1000:8.1f} ms")
+        print(f"  Hasil analisis identik: {'✓' if hasil['dict'] == hasil['kolom'] else '✗'}")
+    finally:
+        db.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark Parsing Tanggal Pemesanan
+Mengukur biaya parsing tanggal 'YYYY-MM-DD HH:MM:SS' (default 1 juta
+pemesanan):
+  - strptime     : datetime.strptime per nilai (validasi lama)
+  - parse_tanggal: fromisoformat dengan pemeriksaan bentuk baku per nilai
+  - batch        : parse_tanggal_many untuk impor
+  - pemesanan    : Pemesanan(tanggal_pemesanan=teks) + validate_data
+  - default      : tanggal default, lama (now().strftime) vs sekarang
+                   (now() tanpa mikrodetik)
+
+Cara menjalankan:
+    python -m benchmarks.bench_tanggal --baris 1000000
+"""
+
+import argparse
+import random
+from datetime import datetime, timedelta
+
+from models import Pemesanan
+from models.tanggal import FORMAT_TANGGAL, parse_tanggal, parse_tanggal_many
+from benchmarks.common import Timer
+
+
+def buat_data(jumlah: int) -> list:
+    """Membuat teks tanggal pemesanan acak selama 4 tahun."""
+    rng = random.Random(42)
+    awal = datetime(2022, 1, 1)
+    return [(awal + timedelta(minutes=rng.randrange(4 * 365 * 24 * 60))).strftime(FORMAT_TANGGAL)
+            for _ in range(jumlah)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark parsing tanggal pemesanan")
+    parser.add_argument('--baris', type=int, default=1_000_000)
+    parser.add_argument('--ulang', type=int, default=3)
+    args = parser.parse_args()
+
+    data = buat_data(args.baris)
+    per_juta = 1_000_000 / args.baris
+    cara = {
+        'strptime': lambda: [datetime.strptime(t, FORMAT_TANGGAL) for t in data],
+        'parse_tanggal': lambda: [parse_tanggal(t) for t in data],
+        'parse_tanggal_many': lambda: parse_tanggal_many(data),
+        'pemesanan + validasi': lambda: [Pemesanan(pelanggan_id=1, meja_id=1,
+                                                   tanggal_pemesanan=t).validate_data()
+                                         for t in data],
+        'default lama': lambda: [datetime.now().strftime(FORMAT_TANGGAL) for _ in data],
+        'default sekarang': lambda: [datetime.now().replace(microsecond=0) for _ in data],
+    }
+
+    print(f"Parsing {args.baris:,} tanggal pemesanan (waktu terbaik dari {args.ulang}x):")
+    hasil = {}
+    for nama, fungsi in cara.items():
+        terbaik = float('inf')
+        for _ in range(args.ulang):
+            with Timer() as t:
+                keluaran = fungsi()
+            terbaik = min(terbaik, t.elapsed)
+        hasil[nama] = keluaran
+        print(f"  {nama:<20}: {terbaik * per_juta:7.3f} s/juta | "
+              f"{terbaik / args.baris * 1e9:7.0f} ns/nilai")
+
+    sama = hasil['strptime'] == hasil['parse_tanggal'] == hasil['parse_tanggal_many']
+    print(f"  Hasil identik       : {'✓' if sama else '✗'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark Transisi Status
+Mengukur waktu menutup N pemesanan confirmed di akhir shift dengan:
+  - jalur lama: read_pemesanan (JOIN 3 tabel) + update status + update meja per ID
+  - transisi_pemesanan per ID (satu transaksi per pemesanan)
+  - transisi_pemesanan_banyak (satu transaksi untuk semua ID)
+  - transisi_pemesanan_sebelum (tutup hari: satu transaksi berdasarkan waktu)
+
+Cara menjalankan (MySQL/MariaDB atau SQLite, lihat benchmarks/common.py):
+    python -m benchmarks.bench_transisi --jumlah 300
+"""
+
+import argparse
+from datetime import datetime, timedelta
+
+from database.db_manager import DatabaseManager
+from benchmarks.common import buat_database, reset_tables, Timer
+
+
+def siapkan(db: DatabaseManager, jumlah: int) -> list:
+    """Membuat `jumlah` pemesanan confirmed dan mengembalikan ID-nya."""
+    reset_tables(db)
+    db.bulk_create_pelanggan([("Pelanggan Shift", "081200000000", "")])
+    db.bulk_create_meja([(i, 4, 'terisi') for i in range(1, 51)])
+    pelanggan_id = db.execute_query("SELECT id FROM pelanggan", fetch=True)[0]['id']
+    meja = [r['id'] for r in db.execute_query("SELECT id FROM meja", fetch=True)]
+    
+    awal = datetime(2025, 12, 1, 17, 0)
+    db.bulk_create_pemesanan([(pelanggan_id, meja[i % len(meja)], awal + timedelta(minutes=i),
+                               2, 'confirmed', "") for i in range(jumlah)])
+    return [r['id'] for r in db.execute_query("SELECT id FROM pemesanan ORDER BY id", fetch=True)]
+
+
+def jalur_lama(db: DatabaseManager, ids: list):
+    """Pola selesaikan_pemesanan sebelum ada API transisi."""
+    for pemesanan_id in ids:
+        pemesanan = db.read_pemesanan(pemesanan_id)
+        if db.update_pemesanan_status(pemesanan_id, 'completed'):
+            db.update_meja_status(pemesanan[0]['meja_id'], 'tersedia')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark transisi status pemesanan")
+    parser.add_argument('--jumlah', type=int, default=300)
+    args = parser.parse_args()
+    
+    db = buat_database()
+    if not db.connect() or not db.create_tables():
+        print("✗ Gagal menyiapkan database benchmark")
+        return
+    
+    try:
+        hasil = {}
+        
+        ids = siapkan(db, args.jumlah)
+        with Timer() as t:
+            jalur_lama(db, ids)
+        hasil['lama (3 statement/ID)'] = t.elapsed
+        
+        ids = siapkan(db, args.jumlah)
+        with Timer() as t:
+            for pemesanan_id in ids:
+                db.transisi_pemesanan(pemesanan_id, 'completed', ('confirmed',), 'tersedia')
+        hasil['transisi per ID'] = t.elapsed
+        
+        ids = siapkan(db, args.jumlah)
+        with Timer() as t:
+            db.transisi_pemesanan_banyak(ids, 'completed', ('confirmed',), 'tersedia')
+        hasil['transisi banyak'] = t.elapsed
+        
+        siapkan(db, args.jumlah)
+        with Timer() as t:
+            db.transisi_pemesanan_sebelum(datetime(2025, 12, 2), 'completed',
+                                          ('confirmed',), 'tersedia')
+        hasil['tutup hari (sebelum)'] = t.elapsed
+        
+        print(f"Menutup {args.jumlah} pemesanan:")
+        for nama, detik in hasil.items():
+            print(f"  {nama:<24}: {detik * 1000:9.1f} ms")
+    finally:
+        db.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark Validasi Pelanggan
+Mengukur throughput validasi data impor pelanggan (default 200 ribu baris):
+  - lama        : implementasi validate_data sebelumnya (regex string per
+                  panggilan, pemeriksaan email berulang), disalin di sini
+                  sebagai pembanding
+  - objek       : Pelanggan(...).validate_data() per baris (mesin baru)
+  - batch       : validate_many, kode error per baris tanpa objek
+
+Cara menjalankan:
+    python -m benchmarks.bench_validasi --baris 200000
+"""
+
+import argparse
+import random
+import re
+
+from models.pelanggan import Pelanggan
+from models.validasi import validate_many, PESAN
+from benchmarks.common import Timer
+
+
+def validasi_lama(nama: str, telepon: str, email: str) -> tuple:
+    """Salinan validate_data sebelum memakai models/validasi.py (sebagai pembanding)."""
+    if not nama or len(nama.strip()) == 0:
+        return False, "Nama pelanggan tidak boleh kosong"
+    if re.search(r'\d', nama):
+        return False, "Nama pelanggan tidak boleh mengandung angka"
+    if len(nama.strip()) < 2:
+        return False, "Nama pelanggan minimal 2 karakter"
+    if not telepon or len(telepon.strip()) == 0:
+        return False, "Nomor telepon tidak boleh kosong"
+    telepon_clean = re.sub(r'[\s\-\(\)]', '', telepon)
+    if not (telepon_clean.startswith('628') or
+            telepon_clean.startswith('08') or
+            telepon_clean.startswith('+628')):
+        return False, "Nomor telepon harus dimulai dengan 628, 08, atau +628"
+    telepon_digits = telepon_clean.replace('+', '')
+    if not telepon_digits.isdigit():
+        return False, "Nomor telepon hanya boleh berisi angka"
+    if len(telepon_digits) < 10 or len(telepon_digits) > 15:
+        return False, "Nomor telepon harus antara 10-15 digit"
+    if email and len(email.strip()) > 0:
+        if '@' not in email or '.' not in email:
+            return False, "Email harus mengandung karakter @ dan . (titik)"
+        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+        if not re.match(email_pattern, email):
+            return False, "Format email tidak valid (contoh: nama@domain.com)"
+        if email.startswith('@') or email.endswith('@'):
+            return False, "Karakter @ tidak boleh di awal atau akhir email"
+        if email.count('@') != 1:
+            return False, "Email hanya boleh mengandung satu karakter @"
+        email_parts = email.split('@')
+        if len(email_parts) == 2 and '.' not in email_parts[1]:
+            return False, "Domain email harus mengandung titik (.)"
+    return True, ""
+
+
+def buat_data(jumlah: int) -> list:
+    """Membuat data impor campuran: sebagian besar valid, sebagian salah."""
+    rng = random.Random(42)
+    nama = ["Budi Santoso", "Siti Aminah", "Andi", "Dewi Lestari", "Rudi 2", "A"]
+    telepon = ["0812{:08d}", "+62 812-{:04d}-{:04d}", "628{:010d}", "0812{:02d}"]
+    email = ["", "user{}@email.com", "user{}@mail.co.id", "user{}email.com", "user{}@domain"]
+    rows = []
+    for i in range(jumlah):
+        t = rng.choice(telepon)
+        rows.append((rng.choice(nama),
+                     t.format(i % 10000, i % 10000) if t.count('{') == 2 else t.format(i),
+                     rng.choice(email).format(i)))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark validasi pelanggan")
+    parser.add_argument('--baris', type=int, default=200_000)
+    parser.add_argument('--ulang', type=int, default=3)
+    args = parser.parse_args()
+
+    rows = buat_data(args.baris)
+    hasil = {}
+    cara = {
+        'lama (regex per panggilan)': lambda: [validasi_lama(*r) for r in rows],
+        'objek (validate_data)': lambda: [Pelanggan(nama=n, telepon=t, email=e).validate_data()
+                                          for n, t, e in rows],
+        'batch (validate_many)': lambda: validate_many(rows),
+    }
+    for nama, fungsi in cara.items():
+        terbaik = float('inf')
+        for _ in range(args.ulang):
+            with Timer() as t:
+                keluaran = fungsi()
+            terbaik = min(terbaik, t.elapsed)
+        hasil[nama] = keluaran
+        print(f"  {nama:<28}: {terbaik * 1000:8.1f} ms | {args.baris / terbaik:12,.0f} baris/s")
+
+    lama, objek, batch = hasil.values()
+    sama = lama == objek == [(k == 0, PESAN[k]) for k in batch]
+    print(f"  Hasil identik               : {'✓' if sama else '✗'} "
+          f"({sum(1 for v, _ in lama if not v)} baris tidak valid)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark Common Module
+Fungsi bantu yang dipakai bersama oleh script benchmark.
+"""
+
+import math
+import os
+import statistics
+import time
+from typing import Dict, List
+
+from database.db_manager import DatabaseManager
+from database.sqlite_manager import SQLiteDatabaseManager
+
+
+def db_config_from_env(**extra) -> Dict:
+    """
+    Membaca konfigurasi database benchmark dari environment variable
+    RESTAURANT_DB_HOST, RESTAURANT_DB_NAME, RESTAURANT_DB_USER, RESTAURANT_DB_PASSWORD.
+    
+    Args:
+        **extra: Opsi tambahan untuk DatabaseManager (misal pool_size)
+    
+    Returns:
+        dict: Konfigurasi untuk DatabaseManager
+    """
+    config = {
+        'host': os.environ.get('RESTAURANT_DB_HOST', 'localhost'),
+        'database': os.environ.get('RESTAURANT_DB_NAME', 'restaurant_bench'),
+        'user': os.environ.get('RESTAURANT_DB_USER', 'root'),
+        'password': os.environ.get('RESTAURANT_DB_PASSWORD', '')
+    }
+    config.update(extra)
+    return config
+
+
+def buat_database(**extra) -> DatabaseManager:
+    """
+    Membuat DatabaseManager benchmark sesuai RESTAURANT_DB_BACKEND:
+    'mysql' (default, lihat db_config_from_env) atau 'sqlite' dengan file
+    RESTAURANT_DB_PATH (default 'restaurant_bench.db'), sehingga benchmark
+    bisa dijalankan tanpa server MySQL.
+    
+    Args:
+        **extra: Opsi tambahan untuk DatabaseManager (misal pool_size)
+    
+    Returns:
+        DatabaseManager: Instance yang belum terkoneksi
+    """
+    if os.environ.get('RESTAURANT_DB_BACKEND', 'mysql') == 'sqlite':
+        return SQLiteDatabaseManager(os.environ.get('RESTAURANT_DB_PATH', 'restaurant_bench.db'),
+                                     **extra)
+    return DatabaseManager(**db_config_from_env(**extra))
+
+
+def reset_tables(db):
+    """
+    Mengosongkan tabel benchmark agar setiap run dimulai dari kondisi bersih.
+    
+    Args:
+        db (DatabaseManager): Instance database manager yang sudah terkoneksi
+    """
+    with db.transaction() as cursor:
+        cursor.execute("DELETE FROM pemesanan")
+        cursor.execute("DELETE FROM meja")
+        cursor.execute("DELETE FROM pelanggan")
+        cursor.execute("DELETE FROM pemesanan_harian")
+        cursor.execute("UPDATE rollup_state SET id_terakhir = 0")
+
+
+def percentile(values: List[float], p: float) -> float:
+    """
+    Menghitung persentil (nearest-rank) dari daftar nilai.
+    
+    Args:
+        values (list): Daftar nilai
+        p (float): Persentil 0-100
+    
+    Returns:
+        float: Nilai persentil, atau 0.0 jika kosong
+    """
+    if not values:
+        return 0.0
+    urut = sorted(values)
+    k = max(0, min(len(urut) - 1, math.ceil(p / 100 * len(urut)) - 1))
+    return urut[k]
+
+
+def ringkasan_latensi(latencies: List[float]) -> Dict:
+    """
+    Membuat ringkasan latensi dalam milidetik.
+    
+    Args:
+        latencies (list): Daftar latensi dalam detik
+    
+    Returns:
+        dict: count, mean, p50, p95, p99, max (ms)
+    """
+    ms = [x * 1000 for x in latencies]
+    return {
+        'count': len(ms),
+        'mean_ms': statistics.fmean(ms) if ms else 0.0,
+        'p50_ms': percentile(ms, 50),
+        'p95_ms': percentile(ms, 95),
+        'p99_ms': percentile(ms, 99),
+        'max_ms': max(ms) if ms else 0.0
+    }
+
+
+class Timer:
+    """
+    Context manager sederhana untuk mengukur durasi blok kode.
+    
+    Attributes:
+        elapsed (float): Durasi dalam detik setelah blok selesai
+    """
+    
+    def __enter__(self):
+        self.elapsed = 0.0
+        self._mulai = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self._mulai
+        return False
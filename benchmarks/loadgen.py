@@ -0,0 +1,428 @@
+"""
+Load Generator Jam Makan Malam
+Mensimulasikan lalu lintas booking saat jam sibuk untuk memperkirakan
+kebutuhan hardware: pelanggan baru, pemesanan, transisi status, dan laporan
+dijalankan bersamaan lewat fungsi service, lalu dilaporkan per operasi:
+throughput, latensi p50/p95/p99, serta rasio konflik dan error.
+
+Dua mode kedatangan:
+  - open loop (--rate N): request datang mengikuti proses Poisson N/detik
+    selama --durasi detik, terlepas dari kecepatan server. Latensi diukur
+    dari jadwal kedatangan, jadi waktu antre saat worker penuh ikut terhitung.
+  - closed loop (--rate 0): setiap worker langsung mengirim request berikutnya
+    sampai --operasi request selesai (throughput maksimum).
+
+Profil 'rush' membagi durasi menjadi 25% sepi (0.5x rate), 50% puncak (1.5x),
+dan 25% sepi (0.5x); rata-ratanya tetap --rate.
+
+Hasil operasi:
+  - ok      : service berhasil (laporan kosong juga ok)
+  - konflik : ditolak aturan bisnis (meja sudah dipesan, kapasitas kurang,
+              status pemesanan tidak sesuai)
+  - error   : kesalahan database ('Error ...') atau '✗ Gagal ...'
+
+Cara menjalankan (MySQL/MariaDB atau SQLite, lihat benchmarks/common.py):
+    python -m benchmarks.loadgen --rate 200 --durasi 30 --konkurensi 16 --meja 40
+    python -m benchmarks.loadgen --rate 0 --operasi 5000 --mix pemesanan=70,laporan=30
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from database.db_manager import DatabaseManager
+from server import PenangkapPesan
+from services import restaurant_service as service
+from benchmarks.common import buat_database, reset_tables, ringkasan_latensi, Timer
+
+
+OK, KONFLIK, ERROR = 'ok', 'konflik', 'error'
+
+# Bobot default campuran operasi saat jam sibuk
+MIX_DEFAULT = {
+    'pelanggan': 5,
+    'pemesanan': 45,
+    'meja_tersedia': 20,
+    'konfirmasi': 12,
+    'selesaikan': 8,
+    'batalkan': 4,
+    'laporan': 4,
+    'statistik': 2,
+}
+
+KAPASITAS_MEJA = (2, 2, 4, 4, 4, 6, 8)
+
+
+def parse_mix(teks: str) -> Dict[str, int]:
+    """
+    Membaca campuran operasi dari format 'pemesanan=50,laporan=10'.
+
+    Args:
+        teks (str): Daftar nama=bobot dipisah koma
+
+    Returns:
+        dict: Bobot per operasi
+    """
+    mix = {}
+    for bagian in teks.split(','):
+        nama, _, bobot = bagian.partition('=')
+        nama = nama.strip()
+        if nama not in MIX_DEFAULT:
+            raise argparse.ArgumentTypeError(f"operasi tidak dikenal: {nama}")
+        mix[nama] = int(bobot)
+    return mix
+
+
+def nama_dari_nomor(nomor: int) -> str:
+    """Mengubah nomor menjadi huruf (1 -> 'A', 27 -> 'AA'), karena nama tidak boleh berisi angka."""
+    huruf = ""
+    while nomor > 0:
+        nomor, sisa = divmod(nomor - 1, 26)
+        huruf = chr(ord('A') + sisa) + huruf
+    return huruf
+
+
+def jadwal_kedatangan(rate: float, durasi: float, profil: str, rng: random.Random) -> List[float]:
+    """
+    Membuat jadwal kedatangan Poisson (detik sejak mulai).
+
+    Args:
+        rate (float): Rata-rata kedatangan per detik
+        durasi (float): Lama simulasi dalam detik
+        profil (str): 'datar' atau 'rush'
+        rng (random.Random): Sumber angka acak
+
+    Returns:
+        list: Waktu kedatangan terurut
+    """
+    def rate_pada(t: float) -> float:
+        if profil == 'rush':
+            return rate * (1.5 if durasi * 0.25 <= t < durasi * 0.75 else 0.5)
+        return rate
+
+    jadwal = []
+    t = rng.expovariate(rate_pada(0))
+    while t < durasi:
+        jadwal.append(t)
+        t += rng.expovariate(rate_pada(t))
+    return jadwal
+
+
+class LoadGenerator:
+    """
+    Menjalankan campuran operasi service terhadap satu DatabaseManager
+    dan mencatat hasil serta latensi per operasi.
+
+    Attributes:
+        db (DatabaseManager): Database target (sebaiknya dengan pool_size = konkurensi)
+        mix (dict): Bobot per operasi
+        hasil (dict): {operasi: {'ok', 'konflik', 'error': jumlah}}
+        latensi (dict): {operasi: list latensi (detik)}
+    """
+
+    def __init__(self, db: DatabaseManager, mix: Dict[str, int], pelanggan: List[int],
+                 meja: List[Tuple[int, int]], hari: int = 7, seed: int = 42):
+        """
+        Inisialisasi load generator.
+
+        Args:
+            db (DatabaseManager): Database yang sudah terkoneksi
+            mix (dict): Bobot per operasi
+            pelanggan (list): ID pelanggan awal
+            meja (list): Tuple (meja_id, kapasitas)
+            hari (int, optional): Rentang tanggal booking mulai besok. Default 7.
+            seed (int, optional): Seed angka acak. Default 42.
+        """
+        self.db = db
+        self.mix = {k: v for k, v in mix.items() if v > 0}
+        self.pelanggan = list(pelanggan)
+        self.meja = list(meja)
+        self.hari = hari
+        self.seed = seed
+        self.besok = (datetime.now() + timedelta(days=1)).replace(hour=0, minute=0,
+                                                                  second=0, microsecond=0)
+        self.hasil = defaultdict(lambda: {OK: 0, KONFLIK: 0, ERROR: 0})
+        self.latensi = defaultdict(list)
+        self._pending = []
+        self._confirmed = []
+        self._lock = threading.Lock()
+        self._nomor_telepon = 0
+        self._penangkap = PenangkapPesan(sys.stdout)
+
+    # ---------- Operasi ----------
+
+    def _waktu_booking(self, rng: random.Random) -> str:
+        # Slot makan malam 17:00 - 21:30 setiap 30 menit
+        waktu = self.besok + timedelta(days=rng.randrange(self.hari),
+                                       minutes=17 * 60 + 30 * rng.randrange(10))
+        return waktu.strftime('%Y-%m-%d %H:%M:%S')
+
+    def _ambil(self, daftar: list, rng: random.Random):
+        with self._lock:
+            if not daftar:
+                return None
+            i = rng.randrange(len(daftar))
+            daftar[i], daftar[-1] = daftar[-1], daftar[i]
+            return daftar.pop()
+
+    def op_pelanggan(self, rng: random.Random):
+        with self._lock:
+            self._nomor_telepon += 1
+            nomor = self._nomor_telepon
+        pelanggan_id = service.tambah_pelanggan(self.db, f"Tamu {nama_dari_nomor(nomor)}",
+                                                f"089{nomor:09d}")
+        if pelanggan_id:
+            with self._lock:
+                self.pelanggan.append(pelanggan_id)
+        return pelanggan_id
+
+    def op_pemesanan(self, rng: random.Random):
+        meja_id, kapasitas = rng.choice(self.meja)
+        pemesanan_id = service.tambah_pemesanan(self.db, rng.choice(self.pelanggan), meja_id,
+                                                 self._waktu_booking(rng),
+                                                 rng.randint(1, min(kapasitas + 1, 8)))
+        if pemesanan_id:
+            with self._lock:
+                self._pending.append(pemesanan_id)
+        return pemesanan_id
+
+    def op_meja_tersedia(self, rng: random.Random):
+        # Daftar kosong saat semua meja terpakai tetap dianggap berhasil
+        return service.lihat_meja_tersedia(self.db) or []
+
+    def _transisi(self, pemesanan_id: int, fungsi, tujuan: list = None):
+        berhasil = fungsi(self.db, pemesanan_id)
+        if berhasil and tujuan is not None:
+            with self._lock:
+                tujuan.append(pemesanan_id)
+        return berhasil
+
+    def op_konfirmasi(self, rng: random.Random, pemesanan_id: int):
+        return self._transisi(pemesanan_id, service.konfirmasi_pemesanan, self._confirmed)
+
+    def op_selesaikan(self, rng: random.Random, pemesanan_id: int):
+        return self._transisi(pemesanan_id, service.selesaikan_pemesanan)
+
+    def op_batalkan(self, rng: random.Random, pemesanan_id: int):
+        return self._transisi(pemesanan_id, service.batalkan_pemesanan)
+
+    def op_laporan(self, rng: random.Random):
+        tanggal = (self.besok + timedelta(days=rng.randrange(self.hari))).strftime('%Y-%m-%d')
+        return service.generate_laporan_pemesanan(self.db, tanggal_mulai=tanggal,
+                                                  tanggal_akhir=tanggal) or []
+
+    def op_statistik(self, rng: random.Random):
+        return service.analisis_laporan_harian(self.db) or {}
+
+    # ---------- Eksekusi ----------
+
+    def jalankan_satu(self, operasi: str, rng: random.Random, dijadwalkan: float = None):
+        """
+        Menjalankan satu operasi dan mencatat hasil serta latensinya.
+
+        Args:
+            operasi (str): Nama operasi (kunci MIX_DEFAULT)
+            rng (random.Random): Sumber angka acak milik worker
+            dijadwalkan (float, optional): perf_counter jadwal kedatangan; latensi
+                dihitung dari sini (termasuk waktu antre). Default None (sekarang).
+        """
+        mulai = dijadwalkan if dijadwalkan is not None else time.perf_counter()
+        args = ()
+        if operasi in ('konfirmasi', 'batalkan', 'selesaikan'):
+            # Transisi butuh pemesanan dengan status asal yang sesuai; jika
+            # belum ada, kedatangan ini dilayani sebagai pemesanan baru
+            sumber = self._confirmed if operasi == 'selesaikan' else self._pending
+            pemesanan_id = self._ambil(sumber, rng)
+            if pemesanan_id is None:
+                operasi = 'pemesanan'
+            else:
+                args = (pemesanan_id,)
+        self._penangkap.mulai()
+        try:
+            berhasil = getattr(self, f"op_{operasi}")(rng, *args)
+        except Exception as e:
+            print(f"Error pada operasi {operasi}: {e}")
+            berhasil = None
+        finally:
+            pesan = self._penangkap.selesai()
+        latensi = time.perf_counter() - mulai
+
+        if berhasil is None or berhasil is False:
+            gagal = any(p.startswith(('Error', '✗ Gagal')) for p in pesan)
+            status = ERROR if gagal or not pesan else KONFLIK
+        else:
+            status = OK
+        with self._lock:
+            self.hasil[operasi][status] += 1
+            self.latensi[operasi].append(latensi)
+
+    def _pilih(self, rng: random.Random) -> str:
+        return rng.choices(list(self.mix), weights=list(self.mix.values()))[0]
+
+    def jalankan(self, konkurensi: int, rate: float = 0, durasi: float = 10,
+                 operasi: int = 1000, profil: str = 'datar') -> float:
+        """
+        Menjalankan beban dengan `konkurensi` worker thread.
+
+        Args:
+            konkurensi (int): Jumlah worker (request yang berjalan bersamaan)
+            rate (float, optional): Kedatangan per detik; 0 = closed loop. Default 0.
+            durasi (float, optional): Lama open loop dalam detik. Default 10.
+            operasi (int, optional): Jumlah operasi closed loop. Default 1000.
+            profil (str, optional): Profil kedatangan 'datar' atau 'rush'. Default 'datar'.
+
+        Returns:
+            float: Durasi total dalam detik
+        """
+        rng = random.Random(self.seed)
+        if rate > 0:
+            antrian = [(t, self._pilih(rng)) for t in jadwal_kedatangan(rate, durasi, profil, rng)]
+        else:
+            antrian = [(None, self._pilih(rng)) for _ in range(operasi)]
+        antrian.reverse()
+        asli, sys.stdout = sys.stdout, self._penangkap
+        self._penangkap.asli = asli
+
+        def worker(nomor: int):
+            rng_worker = random.Random(self.seed * 1000 + nomor)
+            while True:
+                with self._lock:
+                    if not antrian:
+                        return
+                    jadwal, nama = antrian.pop()
+                dijadwalkan = None
+                if jadwal is not None:
+                    dijadwalkan = mulai + jadwal
+                    tunggu = dijadwalkan - time.perf_counter()
+                    if tunggu > 0:
+                        time.sleep(tunggu)
+                self.jalankan_satu(nama, rng_worker, dijadwalkan)
+
+        try:
+            with Timer() as total:
+                mulai = time.perf_counter()
+                threads = [threading.Thread(target=worker, args=(i,)) for i in range(konkurensi)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+        finally:
+            sys.stdout = asli
+        return total.elapsed
+
+    def ringkasan(self, durasi: float) -> Dict:
+        """
+        Membuat ringkasan per operasi dan total.
+
+        Args:
+            durasi (float): Durasi run dalam detik
+
+        Returns:
+            dict: {operasi: count, ok, konflik, error, rasio_konflik, rasio_error,
+                   per_detik, p50_ms, p95_ms, p99_ms, ...}, dengan key 'total'
+        """
+        ringkasan = {}
+        semua = []
+        total = {OK: 0, KONFLIK: 0, ERROR: 0}
+        for operasi in sorted(self.latensi):
+            semua.extend(self.latensi[operasi])
+            for k, v in self.hasil[operasi].items():
+                total[k] += v
+            ringkasan[operasi] = self._baris(self.latensi[operasi], self.hasil[operasi], durasi)
+        ringkasan['total'] = self._baris(semua, total, durasi)
+        return ringkasan
+
+    @staticmethod
+    def _baris(latensi: List[float], hasil: Dict, durasi: float) -> Dict:
+        baris = ringkasan_latensi(latensi)
+        n = baris['count'] or 1
+        baris.update(hasil)
+        baris.update({
+            'per_detik': baris['count'] / durasi if durasi else 0.0,
+            'rasio_konflik': hasil[KONFLIK] / n,
+            'rasio_error': hasil[ERROR] / n,
+        })
+        return baris
+
+
+def siapkan(db: DatabaseManager, jumlah_pelanggan: int, jumlah_meja: int) -> tuple:
+    """
+    Mengosongkan tabel lalu membuat pelanggan dan meja awal.
+
+    Returns:
+        tuple: (list pelanggan_id, list (meja_id, kapasitas))
+    """
+    reset_tables(db)
+    db.bulk_create_pelanggan([(f"Pelanggan {nama_dari_nomor(i)}", f"08{i:010d}", "")
+                              for i in range(1, jumlah_pelanggan + 1)])
+    db.bulk_create_meja([(i, KAPASITAS_MEJA[i % len(KAPASITAS_MEJA)], 'tersedia')
+                         for i in range(1, jumlah_meja + 1)])
+    pelanggan = [r['id'] for r in db.execute_query("SELECT id FROM pelanggan", fetch=True)]
+    meja = [(r['id'], r['kapasitas'])
+            for r in db.execute_query("SELECT id, kapasitas FROM meja", fetch=True)]
+    return pelanggan, meja
+
+
+def cetak(ringkasan: Dict, durasi: float):
+    """Mencetak tabel hasil per operasi."""
+    print(f"{'operasi':<14}{'jumlah':>8}{'op/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}"
+          f"{'konflik':>9}{'error':>8}")
+    for operasi, r in ringkasan.items():
+        if operasi == 'total':
+            print("-" * 75)
+        print(f"{operasi:<14}{r['count']:>8}{r['per_detik']:>9.1f}{r['p50_ms']:>9.2f}"
+              f"{r['p95_ms']:>9.2f}{r['p99_ms']:>9.2f}{r['rasio_konflik']:>8.1%}"
+              f"{r['rasio_error']:>8.1%}")
+    print(f"Durasi: {durasi:.2f} s (latensi dalam ms)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator jam makan malam")
+    parser.add_argument('--konkurensi', type=int, default=16,
+                        help="Worker bersamaan (juga ukuran connection pool)")
+    parser.add_argument('--rate', type=float, default=100,
+                        help="Kedatangan per detik (0 = closed loop)")
+    parser.add_argument('--durasi', type=float, default=10, help="Detik (open loop)")
+    parser.add_argument('--operasi', type=int, default=2000, help="Jumlah operasi (closed loop)")
+    parser.add_argument('--profil', choices=['datar', 'rush'], default='rush')
+    parser.add_argument('--meja', type=int, default=40)
+    parser.add_argument('--pelanggan', type=int, default=1000)
+    parser.add_argument('--hari', type=int, default=7, help="Rentang tanggal booking")
+    parser.add_argument('--mix', type=parse_mix, default=MIX_DEFAULT,
+                        help="Bobot operasi, misal pemesanan=50,laporan=10")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', help="Simpan ringkasan ke file JSON")
+    args = parser.parse_args()
+
+    db = buat_database(pool_size=args.konkurensi)
+    if not db.connect() or not db.create_tables():
+        print("✗ Gagal menyiapkan database benchmark")
+        return
+
+    try:
+        pelanggan, meja = siapkan(db, args.pelanggan, args.meja)
+        generator = LoadGenerator(db, args.mix, pelanggan, meja, args.hari, args.seed)
+        mode = f"open loop {args.rate:g}/s ({args.profil})" if args.rate > 0 else "closed loop"
+        print(f"{mode}, {args.konkurensi} worker, {args.meja} meja:")
+        durasi = generator.jalankan(args.konkurensi, args.rate, args.durasi, args.operasi,
+                                    args.profil)
+        ringkasan = generator.ringkasan(durasi)
+    finally:
+        db.disconnect()
+
+    cetak(ringkasan, durasi)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'argumen': {k: v for k, v in vars(args).items() if k != 'json'},
+                       'durasi_s': durasi, 'operasi': ringkasan}, f, indent=2)
+        print(f"✓ Ringkasan disimpan ke {args.json}")
+
+
+if __name__ == '__main__':
+    main()
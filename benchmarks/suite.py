@@ -0,0 +1,291 @@
+"""
+Benchmark Suite
+Kumpulan benchmark yang bisa diulang untuk model, DatabaseManager, dan
+laporan, dengan baseline tersimpan dan mode perbandingan regresi.
+
+Grup:
+  - model   : Pelanggan.validate_data, Pemesanan.validate_data
+  - crud    : round trip create/read/update/delete pelanggan dan pemesanan
+  - laporan : get_laporan_pemesanan, analisis_laporan, dan print_laporan
+              untuk setiap ukuran tabel di --baris (baris dict dan bentuk
+              kolom result_format FORMAT_KOLOM)
+
+Setiap kasus dijalankan sekali untuk pemanasan lalu --ulang kali. Yang
+dibandingkan dengan baseline adalah waktu terbaik (min), yang paling
+tidak terpengaruh noise mesin.
+
+Cara menjalankan (MySQL/MariaDB atau SQLite, lihat benchmarks/common.py):
+    python -m benchmarks.suite --simpan baseline.json
+    python -m benchmarks.suite --bandingkan baseline.json --toleransi 0.15
+    python -m benchmarks.suite --grup model,laporan --baris 10000,100000,1000000
+
+Dengan --bandingkan, exit code 1 jika ada kasus yang lebih lambat dari
+baseline melebihi toleransi, sehingga bisa dipakai di CI.
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+from datetime import datetime
+from typing import Callable, Dict, Iterator, Tuple
+
+from database.db_manager import DatabaseManager
+from models import Pelanggan, Pemesanan
+from services.restaurant_service import analisis_laporan, print_laporan
+from benchmarks.bench_laporan_tanggal import isi_data
+from benchmarks.common import buat_database, reset_tables, Timer
+
+
+# (nama kasus, fungsi tanpa argumen yang diukur, jumlah operasi per pemanggilan)
+Kasus = Tuple[str, Callable[[], object], int]
+
+# Jumlah baris laporan yang dicetak pada kasus print_laporan
+BARIS_PRINT = 10_000
+
+
+def label_baris(n: int) -> str:
+    """Membuat label ukuran: 10000 -> '10k', 1000000 -> '1m'."""
+    if n >= 1_000_000 and n % 1_000_000 == 0:
+        return f"{n // 1_000_000}m"
+    if n >= 1000 and n % 1000 == 0:
+        return f"{n // 1000}k"
+    return str(n)
+
+
+# ========== GRUP KASUS ==========
+
+def kasus_model(db: DatabaseManager, args) -> Iterator[Kasus]:
+    """Validasi model di memori (tanpa database)."""
+    pelanggan = [Pelanggan(nama="Budi Santoso", telepon="081234567890",
+                           email="budi.santoso@email.com"),
+                 Pelanggan(nama="Siti", telepon="+62 812-9876-5432", email=""),
+                 Pelanggan(nama="Andi 99", telepon="0812", email="andi@@email"),
+                 Pelanggan(nama="Dewi Lestari", telepon="08123456789012345", email="dewi@email")]
+    pelanggan = pelanggan * 2500
+    yield ('model.pelanggan_validate',
+           lambda: [p.validate_data() for p in pelanggan], len(pelanggan))
+
+    pemesanan = [Pemesanan(pelanggan_id=1, meja_id=2, tanggal_pemesanan="2025-12-24 19:00:00",
+                           jumlah_orang=4),
+                 Pemesanan(pelanggan_id=1, meja_id=2, tanggal_pemesanan="24-12-2025 19:00",
+                           jumlah_orang=4),
+                 Pemesanan(pelanggan_id=None, meja_id=2, tanggal_pemesanan="2025-12-24 19:00:00",
+                           jumlah_orang=0),
+                 Pemesanan(pelanggan_id=3, meja_id=5, tanggal_pemesanan="2025-12-31 23:30:00",
+                           jumlah_orang=2, status='confirmed')]
+    pemesanan = pemesanan * 2500
+    yield ('model.pemesanan_validate',
+           lambda: [p.validate_data() for p in pemesanan], len(pemesanan))
+
+
+def kasus_crud(db: DatabaseManager, args) -> Iterator[Kasus]:
+    """Round trip DatabaseManager: satu operasi = create + read + update + delete."""
+    reset_tables(db)
+    jumlah = args.crud
+
+    def pelanggan():
+        for i in range(jumlah):
+            pelanggan_id = db.create_pelanggan("Budi", f"08{i:010d}", "budi@email.com")
+            db.read_pelanggan(pelanggan_id)
+            db.update_pelanggan(pelanggan_id, "Budi Santoso", f"08{i:010d}", "")
+            db.delete_pelanggan(pelanggan_id)
+
+    yield 'crud.pelanggan', pelanggan, jumlah
+
+    pelanggan_id = db.create_pelanggan("Siti", "081298765432", "")
+    meja_id = db.create_meja(1, 4)
+
+    def pemesanan():
+        for _ in range(jumlah):
+            pemesanan_id = db.create_pemesanan(pelanggan_id, meja_id, "2025-12-24 19:00:00", 2)
+            db.read_pemesanan(pemesanan_id)
+            db.update_pemesanan_status(pemesanan_id, 'confirmed')
+            db.delete_pemesanan(pemesanan_id)
+
+    yield 'crud.pemesanan', pemesanan, jumlah
+
+
+def kasus_laporan(db: DatabaseManager, args) -> Iterator[Kasus]:
+    """Laporan, analisis, dan cetak laporan untuk setiap ukuran tabel."""
+    for n in sorted(args.baris):
+        label = label_baris(n)
+        ada = db.execute_query("SELECT COUNT(*) AS n FROM pemesanan", fetch=True)[0]['n']
+        if ada != n:
+            reset_tables(db)
+            isi_data(db, n)
+
+        yield f'laporan.get_{label}', lambda: db.get_laporan_pemesanan(), n
+
+        laporan = db.get_laporan_pemesanan()
+        yield f'laporan.analisis_{label}', lambda data=laporan: analisis_laporan(data), n
+        
+        kolom = DatabaseManager.FORMAT_KOLOM
+        yield (f'laporan.get_kolom_{label}',
+               lambda: db.get_laporan_pemesanan(result_format=kolom), n)
+        
+        laporan_kolom = db.get_laporan_pemesanan(result_format=kolom)
+        yield (f'laporan.analisis_kolom_{label}',
+               lambda data=laporan_kolom: analisis_laporan(data), n)
+        del laporan_kolom
+
+        if n == min(args.baris):
+            sebagian = laporan[:BARIS_PRINT]
+
+            def cetak():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    print_laporan(sebagian)
+
+            yield f'laporan.print_{label_baris(len(sebagian))}', cetak, len(sebagian)
+        del laporan
+
+
+GRUP = {
+    'model': kasus_model,
+    'crud': kasus_crud,
+    'laporan': kasus_laporan,
+}
+
+
+# ========== EKSEKUSI DAN BASELINE ==========
+
+def ukur(fungsi: Callable, n: int, ulang: int) -> Dict:
+    """
+    Menjalankan fungsi sekali untuk pemanasan lalu `ulang` kali. Seperti
+    timeit, garbage collector dimatikan selama pengukuran agar hasil stabil.
+
+    Returns:
+        dict: n, min_s, median_s, per_op_us (dari waktu terbaik)
+    """
+    fungsi()
+    waktu = []
+    for _ in range(ulang):
+        gc.collect()
+        gc.disable()
+        try:
+            with Timer() as t:
+                fungsi()
+        finally:
+            gc.enable()
+        waktu.append(t.elapsed)
+    return {
+        'n': n,
+        'min_s': min(waktu),
+        'median_s': statistics.median(waktu),
+        'per_op_us': min(waktu) / n * 1e6
+    }
+
+
+def jalankan_suite(db: DatabaseManager, args) -> Dict:
+    """
+    Menjalankan grup yang dipilih.
+
+    Returns:
+        dict: {'meta': info lingkungan, 'hasil': {nama kasus: hasil ukur}}
+    """
+    hasil = {}
+    for grup in args.grup:
+        for nama, fungsi, n in GRUP[grup](db, args):
+            hasil[nama] = ukur(fungsi, n, args.ulang)
+            r = hasil[nama]
+            print(f"  {nama:<28} {r['min_s'] * 1000:10.2f} ms  {r['per_op_us']:10.3f} µs/op")
+    return {
+        'meta': {
+            'tanggal': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'backend': db.DIALEK,
+            'ulang': args.ulang,
+        },
+        'hasil': hasil
+    }
+
+
+def bandingkan(sekarang: Dict, baseline: Dict, toleransi: float) -> list:
+    """
+    Membandingkan hasil dengan baseline berdasarkan waktu terbaik.
+
+    Args:
+        sekarang (dict): Hasil jalankan_suite
+        baseline (dict): Hasil tersimpan
+        toleransi (float): Rasio perlambatan yang masih diterima (0.1 = 10%)
+
+    Returns:
+        list: Nama kasus yang mengalami regresi
+    """
+    regresi = []
+    print(f"\n{'kasus':<28}{'baseline':>12}{'sekarang':>12}{'rasio':>8}")
+    for nama, r in sekarang['hasil'].items():
+        dasar = baseline['hasil'].get(nama)
+        if dasar is None:
+            print(f"{nama:<28}{'-':>12}{r['per_op_us']:>12.3f}{'baru':>8}")
+            continue
+        rasio = r['per_op_us'] / dasar['per_op_us']
+        if rasio > 1 + toleransi:
+            tanda = "  ✗ REGRESI"
+            regresi.append(nama)
+        elif rasio < 1 - toleransi:
+            tanda = "  ✓ lebih cepat"
+        else:
+            tanda = ""
+        print(f"{nama:<28}{dasar['per_op_us']:>12.3f}{r['per_op_us']:>12.3f}"
+              f"{rasio:>7.2f}x{tanda}")
+    print("(µs per operasi, waktu terbaik)")
+    return regresi
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite dengan baseline")
+    parser.add_argument('--grup', type=lambda s: s.split(','), default=list(GRUP),
+                        help=f"Grup yang dijalankan, dipisah koma ({','.join(GRUP)})")
+    parser.add_argument('--baris', type=lambda s: [int(x) for x in s.split(',')],
+                        default=[10_000, 100_000],
+                        help="Ukuran tabel laporan, misal 10000,100000,1000000")
+    parser.add_argument('--crud', type=int, default=200, help="Round trip CRUD per pengulangan")
+    parser.add_argument('--ulang', type=int, default=5)
+    parser.add_argument('--simpan', help="Simpan hasil sebagai baseline JSON")
+    parser.add_argument('--bandingkan', help="Bandingkan dengan baseline JSON")
+    parser.add_argument('--toleransi', type=float, default=0.10,
+                        help="Perlambatan yang masih diterima (0.10 = 10%%)")
+    args = parser.parse_args()
+
+    tidak_dikenal = set(args.grup) - set(GRUP)
+    if tidak_dikenal:
+        parser.error(f"grup tidak dikenal: {', '.join(sorted(tidak_dikenal))}")
+    if args.bandingkan and not os.path.exists(args.bandingkan):
+        parser.error(f"baseline {args.bandingkan} tidak ditemukan")
+
+    db = buat_database()
+    if not db.connect() or not db.create_tables():
+        print("✗ Gagal menyiapkan database benchmark")
+        sys.exit(2)
+
+    try:
+        print(f"Benchmark suite ({db.DIALEK}, {args.ulang}x):")
+        hasil = jalankan_suite(db, args)
+    finally:
+        db.disconnect()
+
+    if args.simpan:
+        with open(args.simpan, 'w') as f:
+            json.dump(hasil, f, indent=2)
+        print(f"✓ Baseline disimpan ke {args.simpan}")
+
+    if args.bandingkan:
+        with open(args.bandingkan) as f:
+            baseline = json.load(f)
+        regresi = bandingkan(hasil, baseline, args.toleransi)
+        if regresi:
+            print(f"✗ {len(regresi)} kasus lebih lambat dari baseline "
+                  f"(> {args.toleransi:.0%}): {', '.join(regresi)}")
+            sys.exit(1)
+        print("✓ Tidak ada regresi")
+
+
+if __name__ == '__main__':
+    main()
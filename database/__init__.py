@@ -4,5 +4,12 @@ Berisi modul untuk mengelola database.
 """
 
 from .db_manager import DatabaseManager
+from .connection_pool import ConnectionPool, PoolExhaustedError
+from .cache import LRUCache, CachedDatabaseManager
+from .sqlite_manager import SQLiteDatabaseManager, CachedSQLiteDatabaseManager
+from .async_manager import AsyncDatabaseManager
 
-__all__ = ['DatabaseManager']
+__all__ = ['DatabaseManager', 'ConnectionPool', 'PoolExhaustedError',
+           'LRUCache', 'CachedDatabaseManager',
+           'SQLiteDatabaseManager', 'CachedSQLiteDatabaseManager',
+           'AsyncDatabaseManager']
@@ -0,0 +1,124 @@
+"""
+Async Manager Module
+Module ini berisi facade asyncio untuk DatabaseManager.
+
+Driver database yang dipakai (mysql-connector, sqlite3) bersifat blocking,
+jadi setiap pemanggilan dijalankan di thread pool berukuran tetap yang
+sama dengan ukuran connection pool. Coroutine yang menunggu tidak memakan
+thread: ribuan request bisa menunggu bersamaan, sementara query yang
+benar-benar berjalan dibatasi sejumlah koneksi yang tersedia.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+
+from .db_manager import DatabaseManager
+
+
+class AsyncDatabaseManager:
+    """
+    Facade asyncio di atas DatabaseManager.
+
+    Semua method publik DatabaseManager dapat dipanggil dengan await, misal
+    ``await adb.read_meja()``. Fungsi sinkron lain yang menerima db (misal
+    fungsi service) dijalankan dengan ``await adb.jalankan(fungsi, adb.db, ...)``.
+
+    Attributes:
+        db (DatabaseManager): DatabaseManager sinkron yang dibungkus
+        max_workers (int): Jumlah thread (= query yang berjalan bersamaan)
+    """
+
+    def __init__(self, db: DatabaseManager, max_workers: int = None):
+        """
+        Inisialisasi AsyncDatabaseManager.
+
+        Args:
+            db (DatabaseManager): DatabaseManager yang akan dibungkus
+            max_workers (int, optional): Jumlah thread. Default None (pool_size
+                db, atau 1 jika db memakai satu koneksi bersama).
+        """
+        self.db = db
+        # Tanpa pool, koneksi bersama tidak boleh dipakai dua thread sekaligus
+        self.max_workers = max_workers or db.pool_size or 1
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                            thread_name_prefix="async-db")
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._in_flight = 0
+        self._max_in_flight = 0
+
+    async def jalankan(self, fungsi: Callable, *args, **kwargs) -> Any:
+        """
+        Menjalankan fungsi blocking di thread pool database dan menunggu hasilnya.
+
+        Args:
+            fungsi (callable): Fungsi sinkron
+            *args, **kwargs: Argumen untuk fungsi
+
+        Returns:
+            Any: Hasil fungsi
+        """
+        with self._lock:
+            self._calls += 1
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor,
+                                              functools.partial(fungsi, *args, **kwargs))
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def __getattr__(self, nama: str):
+        # Hanya dipanggil jika atribut tidak ditemukan di facade
+        if nama.startswith('_'):
+            raise AttributeError(nama)
+        atribut = getattr(self.db, nama)
+        if not callable(atribut):
+            return atribut
+
+        @functools.wraps(atribut)
+        async def versi_async(*args, **kwargs):
+            return await self.jalankan(atribut, *args, **kwargs)
+        return versi_async
+
+    async def connect(self) -> bool:
+        """
+        Membuat koneksi (atau pool) database.
+
+        Returns:
+            bool: True jika berhasil terhubung
+        """
+        return await self.jalankan(self.db.connect)
+
+    async def close(self):
+        """Menutup koneksi database lalu menghentikan thread pool."""
+        await self.jalankan(self.db.disconnect)
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+        return False
+
+    def stats(self) -> Dict:
+        """
+        Mendapatkan metrik facade.
+
+        Returns:
+            dict: max_workers, calls, in_flight, max_in_flight (jumlah pemanggilan
+                  yang menunggu atau berjalan bersamaan)
+        """
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'calls': self._calls,
+                'in_flight': self._in_flight,
+                'max_in_flight': self._max_in_flight
+            }
@@ -0,0 +1,296 @@
+"""
+Cache Module
+Module ini berisi cache read-through di depan DatabaseManager.
+
+Tabel meja yang kecil dan sering dibaca, serta pelanggan yang baru
+diakses, disimpan di memori dengan batas ukuran (LRU) dan umur (TTL).
+Setiap method tulis (create/update/delete, reservasi) menghapus entri
+yang terdampak sehingga pembacaan berikutnya mengambil data terbaru.
+Keputusan penting (misal reservasi meja) tetap diperiksa di database,
+jadi data cache yang sedikit basi tidak bisa menyebabkan double booking.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .db_manager import DatabaseManager
+
+
+class LRUCache:
+    """
+    Cache key-value dengan eviksi LRU dan masa berlaku (TTL), thread-safe.
+
+    Key berupa tuple yang diawali nama namespace (misal ('meja', 1)),
+    sehingga satu namespace bisa diinvalidasi sekaligus.
+
+    Attributes:
+        maxsize (int): Jumlah entri maksimum
+        ttl (float): Umur entri dalam detik (None = tanpa batas waktu)
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: Optional[float] = 30.0,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Inisialisasi LRUCache kosong.
+
+        Args:
+            maxsize (int, optional): Jumlah entri maksimum. Default 256.
+            ttl (float, optional): Umur entri dalam detik. Default 30.0.
+            clock (callable, optional): Sumber waktu. Default time.monotonic.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        # namespace -> versi; naik setiap invalidasi namespace
+        self._versi: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expired = 0
+        self._invalidations = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key: Tuple, default=None) -> Any:
+        """
+        Mengambil nilai dari cache dan menandainya sebagai baru dipakai.
+
+        Args:
+            key (tuple): Key cache
+            default (Any, optional): Nilai jika tidak ada/kedaluwarsa. Default None.
+
+        Returns:
+            Any: Nilai tersimpan, atau default
+        """
+        with self._lock:
+            entri = self._data.get(key)
+            if entri is None:
+                self._misses += 1
+                return default
+            kedaluwarsa, nilai = entri
+            if kedaluwarsa is not None and self._clock() >= kedaluwarsa:
+                del self._data[key]
+                self._expired += 1
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return nilai
+
+    def versi(self, namespace: Hashable) -> int:
+        """
+        Mendapatkan versi namespace, dipakai bersama set(versi=...) agar
+        nilai yang dimuat sebelum invalidasi tidak tersimpan.
+
+        Args:
+            namespace (hashable): Nama namespace
+
+        Returns:
+            int: Versi namespace saat ini
+        """
+        with self._lock:
+            return self._versi.get(namespace, 0)
+
+    def set(self, key: Tuple, value: Any, versi: int = None) -> bool:
+        """
+        Menyimpan nilai ke cache, mengeluarkan entri terlama jika penuh.
+
+        Args:
+            key (tuple): Key cache
+            value (Any): Nilai
+            versi (int, optional): Versi namespace saat nilai mulai dimuat.
+                Jika namespace sudah diinvalidasi sejak itu, nilai tidak disimpan.
+
+        Returns:
+            bool: True jika nilai disimpan
+        """
+        with self._lock:
+            if versi is not None and versi != self._versi.get(key[0], 0):
+                return False
+            kedaluwarsa = self._clock() + self.ttl if self.ttl is not None else None
+            self._data[key] = (kedaluwarsa, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self._evictions += 1
+            return True
+
+    def invalidate(self, key: Tuple):
+        """
+        Menghapus satu entri dan menaikkan versi namespace-nya.
+
+        Args:
+            key (tuple): Key cache
+        """
+        with self._lock:
+            self._versi[key[0]] = self._versi.get(key[0], 0) + 1
+            if self._data.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def invalidate_namespace(self, namespace: Hashable):
+        """
+        Menghapus semua entri dalam satu namespace.
+
+        Args:
+            namespace (hashable): Nama namespace (elemen pertama key)
+        """
+        with self._lock:
+            self._versi[namespace] = self._versi.get(namespace, 0) + 1
+            for key in [k for k in self._data if k[0] == namespace]:
+                del self._data[key]
+                self._invalidations += 1
+
+    def clear(self):
+        """Mengosongkan cache (statistik tidak direset)."""
+        with self._lock:
+            for namespace in {k[0] for k in self._data}:
+                self._versi[namespace] = self._versi.get(namespace, 0) + 1
+            self._data.clear()
+
+    def stats(self) -> Dict:
+        """
+        Mendapatkan metrik cache.
+
+        Returns:
+            dict: size, maxsize, hits, misses, hit_rate, evictions, expired, invalidations
+        """
+        with self._lock:
+            total = self._hits + self._misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self._hits,
+                'misses': self._misses,
+                'hit_rate': self._hits / total if total else 0.0,
+                'evictions': self._evictions,
+                'expired': self._expired,
+                'invalidations': self._invalidations
+            }
+
+
+class CachedDatabaseManager(DatabaseManager):
+    """
+    DatabaseManager dengan cache read-through untuk meja dan pelanggan.
+
+    Semua pembacaan meja (per ID, per status, semua) dan pembacaan pelanggan
+    per ID dilayani dari cache. Method tulis (termasuk transisi status
+    pemesanan yang mengubah meja) menginvalidasi namespace meja atau entri
+    pelanggan yang terdampak setelah query dijalankan.
+    """
+
+    def __init__(self, *args, cache_size: int = 256, cache_ttl: Optional[float] = 30.0,
+                 **kwargs):
+        """
+        Inisialisasi CachedDatabaseManager.
+
+        Args:
+            *args, **kwargs: Diteruskan ke DatabaseManager
+            cache_size (int, optional): Jumlah entri cache maksimum. Default 256.
+            cache_ttl (float, optional): Umur entri dalam detik. Default 30.0.
+        """
+        super().__init__(*args, **kwargs)
+        self.cache = LRUCache(cache_size, cache_ttl)
+
+    def _cached(self, key: Tuple, loader: Callable[[], Optional[List[dict]]]) -> Optional[List[dict]]:
+        """Mengambil hasil dari cache, atau memuatnya lewat loader lalu menyimpannya."""
+        rows = self.cache.get(key)
+        if rows is None:
+            versi = self.cache.versi(key[0])
+            rows = loader()
+            if rows is None:
+                return None
+            self.cache.set(key, rows, versi=versi)
+        # Salinan agar pemanggil tidak mengubah isi cache
+        return [dict(row) for row in rows]
+
+    def get_cache_stats(self) -> Dict:
+        """
+        Mendapatkan metrik cache (hit/miss, eviksi, invalidasi).
+
+        Returns:
+            dict: Metrik cache
+        """
+        return self.cache.stats()
+
+    # ========== PELANGGAN ==========
+
+    def read_pelanggan(self, pelanggan_id: int = None) -> Optional[List[dict]]:
+        if not pelanggan_id:
+            return super().read_pelanggan()
+        return self._cached(('pelanggan', pelanggan_id),
+                            lambda: super(CachedDatabaseManager, self).read_pelanggan(pelanggan_id))
+
+    def update_pelanggan(self, pelanggan_id: int, nama: str, telepon: str, email: str) -> bool:
+        try:
+            return super().update_pelanggan(pelanggan_id, nama, telepon, email)
+        finally:
+            self.cache.invalidate(('pelanggan', pelanggan_id))
+
+    def delete_pelanggan(self, pelanggan_id: int) -> bool:
+        try:
+            return super().delete_pelanggan(pelanggan_id)
+        finally:
+            self.cache.invalidate(('pelanggan', pelanggan_id))
+
+    # ========== MEJA ==========
+
+    def read_meja(self, meja_id: int = None, status: str = None) -> Optional[List[dict]]:
+        return self._cached(('meja', meja_id, status),
+                            lambda: super(CachedDatabaseManager, self).read_meja(meja_id, status))
+
+    def create_meja(self, nomor_meja: int, kapasitas: int, status: str = 'tersedia') -> Optional[int]:
+        try:
+            return super().create_meja(nomor_meja, kapasitas, status)
+        finally:
+            self.cache.invalidate_namespace('meja')
+
+    def bulk_create_meja(self, rows: List[Tuple], chunk_size: int = 1000) -> Dict:
+        try:
+            return super().bulk_create_meja(rows, chunk_size)
+        finally:
+            self.cache.invalidate_namespace('meja')
+
+    def update_meja(self, meja_id: int, nomor_meja: int, kapasitas: int, status: str) -> bool:
+        try:
+            return super().update_meja(meja_id, nomor_meja, kapasitas, status)
+        finally:
+            self.cache.invalidate_namespace('meja')
+
+    def update_meja_status(self, meja_id: int, status: str) -> bool:
+        try:
+            return super().update_meja_status(meja_id, status)
+        finally:
+            self.cache.invalidate_namespace('meja')
+
+    def delete_meja(self, meja_id: int) -> bool:
+        try:
+            return super().delete_meja(meja_id)
+        finally:
+            self.cache.invalidate_namespace('meja')
+
+    def reservasi_meja(self, pelanggan_id: int, meja_id: int, tanggal_pemesanan: str,
+                       jumlah_orang: int, catatan: str = "", durasi: timedelta = None) -> Dict:
+        try:
+            return super().reservasi_meja(pelanggan_id, meja_id, tanggal_pemesanan,
+                                          jumlah_orang, catatan, durasi)
+        finally:
+            # Hanya mode flag status yang mengubah meja.status
+            if durasi is None:
+                self.cache.invalidate_namespace('meja')
+
+    def _transisi(self, kondisi: str, params: Tuple, status_baru: str,
+                  status_asal: Tuple[str, ...], status_meja: str = None,
+                  limit: int = None) -> List[dict]:
+        try:
+            return super()._transisi(kondisi, params, status_baru, status_asal,
+                                     status_meja, limit)
+        finally:
+            if status_meja:
+                self.cache.invalidate_namespace('meja')
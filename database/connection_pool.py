@@ -0,0 +1,228 @@
+"""
+Connection Pool Module
+Module ini berisi pool koneksi database yang thread-safe.
+Setiap pemanggilan meminjam (checkout) satu koneksi lalu mengembalikannya,
+sehingga beberapa terminal/website dapat dilayani dalam satu proses.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Optional
+
+
+class PoolExhaustedError(Exception):
+    """
+    Exception yang dilempar jika tidak ada koneksi yang bisa dipinjam
+    sampai batas waktu tunggu habis.
+    """
+
+
+class ConnectionPool:
+    """
+    Pool koneksi dengan ukuran tetap.
+
+    Koneksi dibuat secara lazy sampai batas `size`. Setiap koneksi yang
+    dipinjam diperiksa terlebih dahulu (health check); koneksi yang mati
+    dibuang dan diganti dengan koneksi baru.
+
+    Attributes:
+        size (int): Jumlah maksimal koneksi dalam pool
+        timeout (float): Batas waktu tunggu checkout dalam detik
+    """
+
+    def __init__(self, factory: Callable[[], Any], size: int = 5,
+                 timeout: float = 10.0,
+                 health_check: Optional[Callable[[Any], bool]] = None):
+        """
+        Inisialisasi ConnectionPool.
+
+        Args:
+            factory (callable): Fungsi tanpa argumen yang membuat koneksi baru
+            size (int, optional): Ukuran pool. Default 5.
+            timeout (float, optional): Batas waktu tunggu checkout (detik). Default 10.0.
+            health_check (callable, optional): Fungsi yang menerima koneksi dan
+                mengembalikan True jika koneksi masih sehat. Default None (tanpa cek).
+        """
+        if size < 1:
+            raise ValueError("Ukuran pool minimal 1")
+
+        self.size = size
+        self.timeout = timeout
+        self._factory = factory
+        self._health_check = health_check
+        self._idle = deque()
+        self._in_use = 0
+        self._created = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        # Metrik pool
+        self._checkout_count = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._exhausted_count = 0
+        self._timeout_count = 0
+        self._health_fail_count = 0
+
+    def checkout(self, timeout: float = None) -> Any:
+        """
+        Meminjam satu koneksi dari pool.
+
+        Args:
+            timeout (float, optional): Batas waktu tunggu. Default None (pakai self.timeout).
+
+        Returns:
+            Any: Koneksi yang sehat dan siap dipakai
+
+        Raises:
+            PoolExhaustedError: Jika tidak ada koneksi tersedia sampai timeout
+        """
+        timeout = self.timeout if timeout is None else timeout
+        mulai = time.perf_counter()
+        batas = mulai + timeout
+
+        with self._cond:
+            if self._closed:
+                raise PoolExhaustedError("Pool sudah ditutup")
+
+            if not self._idle and self._created >= self.size:
+                self._exhausted_count += 1
+
+            while not self._idle and self._created >= self.size:
+                sisa = batas - time.perf_counter()
+                if sisa <= 0 or not self._cond.wait(sisa):
+                    if not self._idle and self._created >= self.size:
+                        self._timeout_count += 1
+                        raise PoolExhaustedError(
+                            f"Tidak ada koneksi tersedia setelah {timeout:.1f} detik")
+
+            if self._idle:
+                conn = self._idle.pop()
+            else:
+                conn = None
+                self._created += 1
+            self._in_use += 1
+
+        # Buat/cek koneksi di luar lock agar thread lain tidak tertahan
+        try:
+            if conn is not None and not self._is_healthy(conn):
+                self._close_quietly(conn)
+                with self._cond:
+                    self._health_fail_count += 1
+                conn = None
+            if conn is None:
+                conn = self._factory()
+        except Exception:
+            with self._cond:
+                self._in_use -= 1
+                self._created -= 1
+                self._cond.notify()
+            raise
+
+        tunggu = time.perf_counter() - mulai
+        with self._cond:
+            self._checkout_count += 1
+            self._total_wait += tunggu
+            self._max_wait = max(self._max_wait, tunggu)
+        return conn
+
+    def release(self, conn: Any, discard: bool = False):
+        """
+        Mengembalikan koneksi ke pool.
+
+        Args:
+            conn (Any): Koneksi yang dipinjam dari checkout()
+            discard (bool, optional): Buang koneksi (misal setelah error). Default False.
+        """
+        with self._cond:
+            self._in_use -= 1
+            if discard or self._closed:
+                self._created -= 1
+            else:
+                self._idle.append(conn)
+            self._cond.notify()
+
+        if discard or self._closed:
+            self._close_quietly(conn)
+
+    @contextmanager
+    def connection(self, timeout: float = None):
+        """
+        Context manager untuk meminjam koneksi dan mengembalikannya otomatis.
+
+        Args:
+            timeout (float, optional): Batas waktu tunggu. Default None.
+
+        Yields:
+            Any: Koneksi yang dipinjam
+        """
+        conn = self.checkout(timeout)
+        sehat = True
+        try:
+            yield conn
+        except BaseException:
+            # Termasuk GeneratorExit (generator streaming ditutup lebih awal)
+            # dan KeyboardInterrupt; koneksi tetap harus dikembalikan
+            sehat = self._is_healthy(conn)
+            raise
+        finally:
+            self.release(conn, discard=not sehat)
+
+    def close_all(self):
+        """
+        Menutup semua koneksi idle dan menandai pool sebagai tertutup.
+        Koneksi yang masih dipinjam akan ditutup saat dikembalikan.
+        """
+        with self._cond:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._created -= len(idle)
+            self._cond.notify_all()
+
+        for conn in idle:
+            self._close_quietly(conn)
+
+    def stats(self) -> Dict:
+        """
+        Mendapatkan metrik pool.
+
+        Returns:
+            dict: Ukuran pool, koneksi terpakai/idle, jumlah checkout,
+                  waktu tunggu (total, rata-rata, maksimal dalam ms),
+                  jumlah pool habis, timeout, dan health check gagal
+        """
+        with self._cond:
+            avg_wait = self._total_wait / self._checkout_count if self._checkout_count else 0.0
+            return {
+                'size': self.size,
+                'created': self._created,
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'checkouts': self._checkout_count,
+                'wait_total_ms': self._total_wait * 1000,
+                'wait_avg_ms': avg_wait * 1000,
+                'wait_max_ms': self._max_wait * 1000,
+                'exhausted': self._exhausted_count,
+                'timeouts': self._timeout_count,
+                'health_check_failed': self._health_fail_count
+            }
+
+    def _is_healthy(self, conn: Any) -> bool:
+        """Menjalankan health check; exception dianggap koneksi mati."""
+        if self._health_check is None:
+            return True
+        try:
+            return bool(self._health_check(conn))
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_quietly(conn: Any):
+        """Menutup koneksi tanpa melempar exception."""
+        try:
+            conn.close()
+        except Exception:
+            pass
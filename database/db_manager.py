@@ -1,22 +1,79 @@
 """
 Database Manager Module
 Module ini menangani koneksi database dan operasi CRUD.
-Menggunakan MySQL/MariaDB dengan library mysql-connector-python.
+Menggunakan MySQL/MariaDB dengan library mysql-connector-python; backend
+SQLite tersedia di sqlite_manager.SQLiteDatabaseManager.
 """
 
-import mysql.connector
-from mysql.connector import Error
-from typing import Optional, List, Tuple, Any
+import sqlite3
+from collections import namedtuple
+from contextlib import contextmanager
+from itertools import islice
+from datetime import date, datetime, timedelta
+from typing import Optional, List, Tuple, Any, Dict, Iterator
+from .connection_pool import ConnectionPool, PoolExhaustedError
+from . import migrations
+
+try:
+    import mysql.connector
+    from mysql.connector import Error
+except ImportError:  # mysql-connector opsional jika hanya memakai backend SQLite
+    mysql = None
+    
+    class Error(Exception):
+        """Pengganti mysql.connector.Error saat library tidak terinstall."""
+
+# Error query dari semua backend yang didukung
+SQL_ERRORS = (Error, sqlite3.Error)
+# Ditambah pool habis, untuk operasi yang meminjam koneksi
+DB_ERRORS = SQL_ERRORS + (PoolExhaustedError,)
 
 
 class DatabaseManager:
     """
     Kelas untuk mengelola koneksi dan operasi database.
     Menyediakan fungsi-fungsi CRUD untuk semua entitas.
+    
+    Bagian yang bergantung pada engine database (backend) dipisah ke method
+    _new_connection, _ping, _begin, _create_tables, dan _rollup_delta serta
+    atribut DIALEK; backend lain cukup meng-override bagian tersebut
+    (lihat SQLiteDatabaseManager).
     """
     
+    # Dialek SQL backend, dipakai untuk memilih variant langkah migrasi
+    DIALEK = 'mysql'
+    
+    # Hasil reservasi meja
+    RESERVASI_BERHASIL = 'berhasil'
+    RESERVASI_MEJA_TIDAK_DITEMUKAN = 'meja_tidak_ditemukan'
+    RESERVASI_MEJA_TIDAK_TERSEDIA = 'meja_tidak_tersedia'
+    RESERVASI_MELEBIHI_KAPASITAS = 'melebihi_kapasitas'
+    RESERVASI_SLOT_TERISI = 'slot_terisi'
+    RESERVASI_GAGAL = 'gagal'
+    
+    # Rentang bentrok mode flag dengan pemesanan slot waktu; sama dengan
+    # durasi default AvailabilityIndex
+    DURASI_RESERVASI = timedelta(hours=2)
+    
+    # Hasil transisi status pemesanan
+    TRANSISI_BERHASIL = 'berhasil'
+    TRANSISI_TIDAK_DITEMUKAN = 'tidak_ditemukan'
+    TRANSISI_TIDAK_VALID = 'tidak_valid'
+    TRANSISI_GAGAL = 'gagal'
+    
+    # Nama baris high-water mark ringkasan harian di tabel rollup_state
+    ROLLUP_HARIAN = 'pemesanan_harian'
+    
+    # Bentuk hasil execute_query/iter_query (parameter result_format)
+    FORMAT_DICT = 'dict'
+    FORMAT_TUPLE = 'tuple'
+    FORMAT_NAMEDTUPLE = 'namedtuple'
+    FORMAT_KOLOM = 'kolom'
+    FORMAT_HASIL = (FORMAT_DICT, FORMAT_TUPLE, FORMAT_NAMEDTUPLE, FORMAT_KOLOM)
+    
     def __init__(self, host='localhost', database='restaurant_db', 
-                 user='root', password=''):
+                 user='root', password='', pool_size: int = None,
+                 pool_timeout: float = 10.0):
         """
         Inisialisasi DatabaseManager dengan kredensial database.
         
@@ -25,54 +82,212 @@ class DatabaseManager:
             database (str): Nama database. Default 'restaurant_db'.
             user (str): Username database. Default 'root'.
             password (str): Password database. Default ''.
+            pool_size (int, optional): Ukuran connection pool. Default None
+                (satu koneksi bersama, tanpa pool).
+            pool_timeout (float, optional): Batas waktu tunggu koneksi dari pool
+                dalam detik. Default 10.0.
         """
         self.host = host
         self.database = database
         self.user = user
         self.password = password
+        self.pool_size = pool_size
+        self.pool_timeout = pool_timeout
         self.connection = None
+        self.pool = None
+        self._listeners = []
+    
+    def _new_connection(self):
+        """
+        Membuat satu koneksi baru ke database MySQL/MariaDB.
+        
+        Returns:
+            MySQLConnection: Koneksi baru
+        
+        Raises:
+            Error: Jika koneksi gagal atau mysql-connector tidak terinstall
+        """
+        if mysql is None:
+            raise Error("mysql-connector-python belum terinstall")
+        return mysql.connector.connect(
+            host=self.host,
+            database=self.database,
+            user=self.user,
+            password=self.password
+        )
+    
+    @staticmethod
+    def _ping(conn) -> bool:
+        """
+        Health check koneksi sebelum dipinjam dari pool.
+        
+        Returns:
+            bool: True jika koneksi masih hidup
+        """
+        conn.ping(reconnect=False)
+        return True
     
     def connect(self):
         """
         Membuat koneksi ke database MySQL/MariaDB.
+        Jika pool_size diisi, membuat connection pool dan memastikan
+        minimal satu koneksi dapat dibuat.
         
         Returns:
             bool: True jika berhasil terhubung, False jika gagal
         """
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                database=self.database,
-                user=self.user,
-                password=self.password
-            )
+            if self.pool_size:
+                self.pool = ConnectionPool(self._new_connection, size=self.pool_size,
+                                           timeout=self.pool_timeout,
+                                           health_check=self._ping)
+                with self.pool.connection() as conn:
+                    return conn.is_connected()
+            
+            self.connection = self._new_connection()
             
             if self.connection.is_connected():
                 return True
             return False
             
-        except Error as e:
+        except SQL_ERRORS as e:
             print(f"Error saat koneksi ke database: {e}")
             return False
     
     def disconnect(self):
         """
-        Menutup koneksi database.
+        Menutup koneksi database (atau semua koneksi di pool).
         """
+        if self.pool:
+            self.pool.close_all()
         if self.connection and self.connection.is_connected():
             self.connection.close()
     
+    @contextmanager
+    def _connection(self):
+        """
+        Meminjam koneksi untuk satu pemanggilan.
+        Mode pool: checkout dari pool lalu dikembalikan setelah selesai.
+        Mode biasa: memakai koneksi bersama self.connection.
+        
+        Yields:
+            MySQLConnection: Koneksi database
+        """
+        if self.pool:
+            with self.pool.connection() as conn:
+                try:
+                    yield conn
+                finally:
+                    # Akhiri snapshot transaksi baca agar peminjam berikutnya
+                    # melihat data terbaru
+                    if conn.in_transaction:
+                        conn.rollback()
+        else:
+            yield self.connection
+    
+    def _begin(self, conn):
+        """
+        Memulai transaksi eksplisit pada koneksi. MySQL memulai transaksi
+        secara implisit (autocommit mati), jadi tidak ada yang perlu dilakukan.
+        
+        Args:
+            conn: Koneksi database
+        """
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Menjalankan beberapa statement dalam satu transaksi.
+        Commit jika blok selesai tanpa error, rollback jika terjadi exception.
+        
+        Yields:
+            MySQLCursor: Cursor dictionary yang terikat ke transaksi
+        """
+        with self._connection() as conn:
+            self._begin(conn)
+            cursor = conn.cursor(dictionary=True, buffered=True)
+            try:
+                yield cursor
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+    
+    def add_listener(self, callback):
+        """
+        Mendaftarkan callback yang dipanggil setiap kali data pemesanan/meja
+        berubah, misal untuk menjaga index ketersediaan tetap konsisten.
+        
+        Args:
+            callback (callable): Fungsi callback(event: str, data: dict)
+        """
+        self._listeners.append(callback)
+    
+    def remove_listener(self, callback):
+        """
+        Menghapus callback yang sebelumnya didaftarkan.
+        
+        Args:
+            callback (callable): Callback yang akan dihapus
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    def _notify(self, event: str, **data):
+        """
+        Memberi tahu semua listener tentang perubahan data.
+        Error pada listener dicetak dan tidak menggagalkan operasi database.
+        
+        Args:
+            event (str): Nama event, misal 'pemesanan_dibuat'
+            **data: Data perubahan
+        """
+        for callback in list(self._listeners):
+            try:
+                callback(event, data)
+            except Exception as e:
+                print(f"Error pada listener {event}: {e}")
+    
+    def get_pool_stats(self) -> Optional[Dict]:
+        """
+        Mendapatkan metrik connection pool (waktu tunggu, koneksi terpakai,
+        jumlah pool habis).
+        
+        Returns:
+            dict: Metrik pool, atau None jika tidak memakai pool
+        """
+        return self.pool.stats() if self.pool else None
+    
     def create_tables(self):
         """
-        Membuat tabel-tabel yang diperlukan dalam database.
+        Membuat tabel-tabel yang diperlukan dalam database, lalu menjalankan
+        migrasi skema (index, dsb.) yang belum diterapkan.
         Tabel: pelanggan, meja, pemesanan.
         
         Returns:
             bool: True jika berhasil, False jika gagal
         """
         try:
-            cursor = self.connection.cursor()
+            with self._connection() as conn:
+                self._create_tables(conn)
+                migrations.jalankan_migrasi(conn, dialek=self.DIALEK)
+            return True
             
+        except DB_ERRORS as e:
+            print(f"Error saat membuat tabel: {e}")
+            return False
+    
+    def _create_tables(self, conn):
+        """
+        Menjalankan DDL pembuatan tabel pada koneksi yang diberikan.
+        
+        Args:
+            conn (MySQLConnection): Koneksi database
+        """
+        cursor = conn.cursor()
+        try:
             # Tabel pelanggan
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS pelanggan (
@@ -111,15 +326,83 @@ class DatabaseManager:
                 )
             """)
             
-            self.connection.commit()
+            conn.commit()
+        finally:
             cursor.close()
-            return True
-            
-        except Error as e:
-            print(f"Error saat membuat tabel: {e}")
-            return False
     
-    def execute_query(self, query: str, params: Tuple = None, fetch: bool = False) -> Any:
+    def migrate(self, sampai: int = None) -> Optional[List[int]]:
+        """
+        Menjalankan migrasi skema yang belum diterapkan.
+        
+        Args:
+            sampai (int, optional): Versi target. Default None (versi terbaru).
+        
+        Returns:
+            list: Versi yang baru diterapkan, atau None jika gagal
+        """
+        try:
+            with self._connection() as conn:
+                return migrations.jalankan_migrasi(conn, sampai, dialek=self.DIALEK)
+        except DB_ERRORS as e:
+            print(f"Error saat migrasi skema: {e}")
+            return None
+    
+    def get_schema_version(self) -> Optional[int]:
+        """
+        Mendapatkan versi skema database yang sudah diterapkan.
+        
+        Returns:
+            int: Versi skema (0 jika belum ada migrasi), atau None jika gagal
+        """
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor(buffered=True)
+                try:
+                    migrations.buat_tabel_versi(cursor)
+                    return migrations.versi_sekarang(cursor)
+                finally:
+                    cursor.close()
+        except DB_ERRORS as e:
+            print(f"Error saat membaca versi skema: {e}")
+            return None
+    
+    def _format_hasil(self, dictionary: bool, result_format: Optional[str]) -> str:
+        """Menentukan bentuk hasil dari parameter dictionary dan result_format."""
+        if result_format is None:
+            return self.FORMAT_DICT if dictionary else self.FORMAT_TUPLE
+        if result_format not in self.FORMAT_HASIL:
+            raise ValueError(f"result_format harus salah satu dari: {', '.join(self.FORMAT_HASIL)}")
+        return result_format
+    
+    @staticmethod
+    def _kelas_namedtuple(cursor) -> type:
+        """Membuat kelas namedtuple dari nama kolom hasil query."""
+        # rename=True untuk nama kolom yang bukan identifier, misal COUNT(*)
+        return namedtuple('Baris', [kolom[0] for kolom in cursor.description], rename=True)
+    
+    @staticmethod
+    def _fetch_kolom(cursor, batch_size: int = 10000) -> Dict[str, list]:
+        """
+        Mengambil semua hasil sebagai satu list per kolom.
+        
+        Baris diambil per batch dan langsung dipindahkan ke list kolom, sehingga
+        tuple baris tidak pernah ditahan semuanya sekaligus.
+        
+        Returns:
+            dict: {nama kolom: list nilai} sesuai urutan baris
+        """
+        nama = [kolom[0] for kolom in cursor.description]
+        kolom = [[] for _ in nama]
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for daftar, nilai in zip(kolom, zip(*rows)):
+                daftar.extend(nilai)
+        return dict(zip(nama, kolom))
+    
+    def execute_query(self, query: str, params: Tuple = None, fetch: bool = False,
+                      dictionary: bool = True, result_format: str = None) -> Any:
         """
         Mengeksekusi query SQL.
         
@@ -127,32 +410,208 @@ class DatabaseManager:
             query (str): Query SQL yang akan dieksekusi
             params (tuple, optional): Parameter untuk query. Default None.
             fetch (bool, optional): Apakah perlu fetch hasil. Default False.
+            dictionary (bool, optional): Baris berupa dict; False untuk tuple. Default True.
+            result_format (str, optional): Bentuk hasil fetch, menggantikan dictionary:
+                FORMAT_DICT, FORMAT_TUPLE, FORMAT_NAMEDTUPLE, atau FORMAT_KOLOM
+                (dict {nama kolom: list nilai}). Default None.
         
         Returns:
             Any: Hasil query jika fetch=True, None jika fetch=False atau error
+        
+        Raises:
+            ValueError: Jika result_format tidak dikenal
         """
+        format_hasil = self._format_hasil(dictionary, result_format)
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            
-            if fetch:
-                result = cursor.fetchall()
-                cursor.close()
-                return result
-            else:
-                self.connection.commit()
-                last_id = cursor.lastrowid
-                cursor.close()
-                return last_id
+            with self._connection() as conn:
+                cursor = conn.cursor(dictionary=format_hasil == self.FORMAT_DICT)
+                try:
+                    if params:
+                        cursor.execute(query, params)
+                    else:
+                        cursor.execute(query)
+                    
+                    if fetch:
+                        if format_hasil == self.FORMAT_KOLOM:
+                            return self._fetch_kolom(cursor)
+                        if format_hasil == self.FORMAT_NAMEDTUPLE:
+                            return list(map(self._kelas_namedtuple(cursor)._make,
+                                            cursor.fetchall()))
+                        return cursor.fetchall()
+                    else:
+                        conn.commit()
+                        return cursor.lastrowid
+                finally:
+                    cursor.close()
                 
-        except Error as e:
+        except DB_ERRORS as e:
             print(f"Error saat eksekusi query: {e}")
             return None
     
+    def _bulk_insert(self, table: str, columns: Tuple[str, ...], rows: List[Tuple],
+                     chunk_size: int = 1000, sebelum=None) -> Dict:
+        """
+        Insert banyak baris sekaligus dalam satu transaksi.
+        
+        Baris dikirim per chunk dengan executemany (multi-row VALUES). Jika satu
+        chunk gagal, baris pada chunk itu diulang satu per satu agar baris yang
+        bermasalah bisa dilaporkan tanpa membatalkan baris lain.
+        
+        Args:
+            table (str): Nama tabel
+            columns (tuple): Nama kolom sesuai urutan nilai di setiap baris
+            rows (list): List tuple nilai
+            chunk_size (int, optional): Jumlah baris per executemany. Default 1000.
+            sebelum (callable, optional): Fungsi (cursor) yang dijalankan di awal
+                transaksi, misal untuk mengambil lock. Default None.
+        
+        Returns:
+            dict: {'berhasil': jumlah baris tersimpan,
+                   'gagal': list tuple (indeks baris, pesan error)}
+        """
+        query = (f"INSERT INTO {table} ({', '.join(columns)}) "
+                 f"VALUES ({', '.join(['%s'] * len(columns))})")
+        berhasil = 0
+        gagal = []
+        
+        try:
+            with self.transaction() as cursor:
+                if sebelum:
+                    sebelum(cursor)
+                for awal in range(0, len(rows), chunk_size):
+                    chunk = rows[awal:awal + chunk_size]
+                    try:
+                        cursor.executemany(query, chunk)
+                        berhasil += len(chunk)
+                        continue
+                    except SQL_ERRORS:
+                        pass
+                    
+                    # Cari baris yang gagal di dalam chunk
+                    for i, row in enumerate(chunk, start=awal):
+                        try:
+                            cursor.execute(query, row)
+                            berhasil += 1
+                        except SQL_ERRORS as e:
+                            gagal.append((i, str(e)))
+                            
+        except DB_ERRORS as e:
+            print(f"Error saat bulk insert {table}: {e}")
+            return {'berhasil': 0, 'gagal': [(i, str(e)) for i in range(len(rows))]}
+        
+        return {'berhasil': berhasil, 'gagal': gagal}
+    
+    def iter_query(self, query: str, params: Tuple = None,
+                   batch_size: int = 1000, dictionary: bool = True,
+                   result_format: str = None) -> Iterator[dict]:
+        """
+        Mengeksekusi query SELECT dan mengalirkan hasilnya baris per baris.
+        
+        Memakai cursor unbuffered dan fetchmany sehingga hanya satu batch yang
+        berada di memori, berapa pun jumlah baris hasilnya. Koneksi dipakai
+        selama generator berjalan; pada mode tanpa pool, jangan menjalankan
+        query lain sebelum generator habis atau ditutup.
+        
+        Args:
+            query (str): Query SQL SELECT
+            params (tuple, optional): Parameter untuk query. Default None.
+            batch_size (int, optional): Jumlah baris per fetchmany. Default 1000.
+            dictionary (bool, optional): Baris berupa dict; False untuk tuple. Default True.
+            result_format (str, optional): Bentuk hasil seperti pada execute_query;
+                FORMAT_KOLOM menghasilkan satu dict kolom per batch. Default None.
+        
+        Yields:
+            dict: Satu baris hasil query (atau satu batch untuk FORMAT_KOLOM)
+        
+        Raises:
+            ValueError: Jika result_format tidak dikenal
+            DB_ERRORS: Jika query gagal, termasuk di tengah aliran; baris yang
+                sudah dihasilkan bukan hasil lengkap
+        """
+        format_hasil = self._format_hasil(dictionary, result_format)
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor(dictionary=format_hasil == self.FORMAT_DICT, buffered=False)
+                try:
+                    cursor.execute(query, params)
+                    if format_hasil == self.FORMAT_KOLOM:
+                        nama = [kolom[0] for kolom in cursor.description]
+                    elif format_hasil == self.FORMAT_NAMEDTUPLE:
+                        baris = self._kelas_namedtuple(cursor)._make
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        if format_hasil == self.FORMAT_KOLOM:
+                            yield dict(zip(nama, map(list, zip(*rows))))
+                        elif format_hasil == self.FORMAT_NAMEDTUPLE:
+                            yield from map(baris, rows)
+                        else:
+                            yield from rows
+                finally:
+                    # Sisa hasil harus dibuang agar koneksi bisa dipakai lagi
+                    if getattr(conn, 'unread_result', False):
+                        conn.consume_results()
+                    cursor.close()
+                    
+        except DB_ERRORS as e:
+            # Berbeda dengan execute_query, error diteruskan: generator yang
+            # berhenti diam-diam tidak bisa dibedakan dari hasil yang lengkap
+            print(f"Error saat eksekusi query: {e}")
+            raise
+    
+    # ========== ENTITY ==========
+    
+    @staticmethod
+    def _query_entity(kelas, where: str) -> str:
+        return f"SELECT {', '.join(kelas.KOLOM)} FROM {kelas.TABEL} {where}"
+    
+    def read_entities(self, kelas, where: str = "", params: Tuple = None) -> Optional[List]:
+        """
+        Membaca baris tabel sebagai objek entitas (Pelanggan, Meja, Pemesanan).
+        
+        Baris diambil dengan cursor tuple lalu dibangun dengan kelas.from_rows,
+        tanpa dict per baris.
+        
+        Args:
+            kelas (type): Kelas entitas dengan TABEL dan KOLOM
+            where (str, optional): Klausa tambahan, misal "WHERE status = %s ORDER BY id".
+                Default "".
+            params (tuple, optional): Parameter untuk klausa. Default None.
+        
+        Returns:
+            list: List objek entitas, atau None jika gagal
+        """
+        rows = self.execute_query(self._query_entity(kelas, where), params, fetch=True,
+                                  dictionary=False)
+        return None if rows is None else kelas.from_rows(rows)
+    
+    def iter_entities(self, kelas, where: str = "", params: Tuple = None,
+                      batch_size: int = 1000) -> Iterator:
+        """
+        Sama seperti read_entities, tetapi objek dialirkan per batch
+        dengan memori konstan (lihat iter_query).
+        
+        Args:
+            kelas (type): Kelas entitas dengan TABEL dan KOLOM
+            where (str, optional): Klausa tambahan. Default "".
+            params (tuple, optional): Parameter untuk klausa. Default None.
+            batch_size (int, optional): Jumlah baris per batch. Default 1000.
+        
+        Yields:
+            BaseEntity: Satu objek entitas
+        
+        Raises:
+            DB_ERRORS: Jika query gagal (lihat iter_query)
+        """
+        rows = self.iter_query(self._query_entity(kelas, where), params, batch_size,
+                               dictionary=False)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            yield from kelas.from_rows(batch)
+    
     # ========== CRUD PELANGGAN ==========
     
     def create_pelanggan(self, nama: str, telepon: str, email: str = "") -> Optional[int]:
@@ -170,6 +629,19 @@ class DatabaseManager:
         query = "INSERT INTO pelanggan (nama, telepon, email) VALUES (%s, %s, %s)"
         return self.execute_query(query, (nama, telepon, email))
     
+    def bulk_create_pelanggan(self, rows: List[Tuple], chunk_size: int = 1000) -> Dict:
+        """
+        Menambahkan banyak pelanggan sekaligus dalam satu transaksi.
+        
+        Args:
+            rows (list): List tuple (nama, telepon, email)
+            chunk_size (int, optional): Jumlah baris per batch. Default 1000.
+        
+        Returns:
+            dict: {'berhasil': int, 'gagal': list tuple (indeks, pesan error)}
+        """
+        return self._bulk_insert('pelanggan', ('nama', 'telepon', 'email'), rows, chunk_size)
+    
     def read_pelanggan(self, pelanggan_id: int = None) -> Optional[List[dict]]:
         """
         Membaca data pelanggan dari database.
@@ -187,6 +659,26 @@ class DatabaseManager:
             query = "SELECT * FROM pelanggan ORDER BY id DESC"
             return self.execute_query(query, fetch=True)
     
+    def read_pelanggan_page(self, after_id: int = None, page_size: int = 20) -> Optional[List[dict]]:
+        """
+        Membaca satu halaman pelanggan dengan keyset pagination (id menurun).
+        
+        Halaman berikutnya diminta dengan after_id = id baris terakhir,
+        sehingga biaya query tidak bertambah seiring jumlah halaman.
+        
+        Args:
+            after_id (int, optional): ID terakhir halaman sebelumnya. Default None (halaman pertama).
+            page_size (int, optional): Jumlah baris per halaman. Default 20.
+        
+        Returns:
+            list: List dictionary berisi data pelanggan, atau None jika gagal
+        """
+        if after_id is not None:
+            query = "SELECT * FROM pelanggan WHERE id < %s ORDER BY id DESC LIMIT %s"
+            return self.execute_query(query, (after_id, page_size), fetch=True)
+        query = "SELECT * FROM pelanggan ORDER BY id DESC LIMIT %s"
+        return self.execute_query(query, (page_size,), fetch=True)
+    
     def update_pelanggan(self, pelanggan_id: int, nama: str, telepon: str, email: str) -> bool:
         """
         Mengupdate data pelanggan.
@@ -214,9 +706,12 @@ class DatabaseManager:
         Returns:
             bool: True jika berhasil, False jika gagal
         """
+        # Pemesanan pelanggan ikut terhapus (ON DELETE CASCADE)
         query = "DELETE FROM pelanggan WHERE id = %s"
-        result = self.execute_query(query, (pelanggan_id,))
-        return result is not None
+        result = self._ubah_pemesanan("pelanggan_id = %s", (pelanggan_id,), query, (pelanggan_id,))
+        if result:
+            self._notify('pelanggan_dihapus', pelanggan_id=pelanggan_id)
+        return result
     
     # ========== CRUD MEJA ==========
     
@@ -235,6 +730,19 @@ class DatabaseManager:
         query = "INSERT INTO meja (nomor_meja, kapasitas, status) VALUES (%s, %s, %s)"
         return self.execute_query(query, (nomor_meja, kapasitas, status))
     
+    def bulk_create_meja(self, rows: List[Tuple], chunk_size: int = 1000) -> Dict:
+        """
+        Menambahkan banyak meja sekaligus dalam satu transaksi.
+        
+        Args:
+            rows (list): List tuple (nomor_meja, kapasitas, status)
+            chunk_size (int, optional): Jumlah baris per batch. Default 1000.
+        
+        Returns:
+            dict: {'berhasil': int, 'gagal': list tuple (indeks, pesan error)}
+        """
+        return self._bulk_insert('meja', ('nomor_meja', 'kapasitas', 'status'), rows, chunk_size)
+    
     def read_meja(self, meja_id: int = None, status: str = None) -> Optional[List[dict]]:
         """
         Membaca data meja dari database.
@@ -298,9 +806,12 @@ class DatabaseManager:
         Returns:
             bool: True jika berhasil, False jika gagal
         """
+        # Pemesanan di meja ini ikut terhapus (ON DELETE CASCADE)
         query = "DELETE FROM meja WHERE id = %s"
-        result = self.execute_query(query, (meja_id,))
-        return result is not None
+        result = self._ubah_pemesanan("meja_id = %s", (meja_id,), query, (meja_id,))
+        if result:
+            self._notify('meja_dihapus', meja_id=meja_id)
+        return result
     
     # ========== CRUD PEMESANAN ==========
     
@@ -324,8 +835,135 @@ class DatabaseManager:
         query = """INSERT INTO pemesanan 
                    (pelanggan_id, meja_id, tanggal_pemesanan, jumlah_orang, status, catatan) 
                    VALUES (%s, %s, %s, %s, %s, %s)"""
-        return self.execute_query(query, (pelanggan_id, meja_id, tanggal_pemesanan, 
-                                         jumlah_orang, status, catatan))
+        try:
+            with self.transaction() as cursor:
+                self._id_rollup(cursor)
+                cursor.execute(query, (pelanggan_id, meja_id, tanggal_pemesanan,
+                                       jumlah_orang, status, catatan))
+                pemesanan_id = cursor.lastrowid
+        except DB_ERRORS as e:
+            print(f"Error saat eksekusi query: {e}")
+            return None
+        
+        if pemesanan_id:
+            self._notify('pemesanan_dibuat', pemesanan_id=pemesanan_id,
+                         pelanggan_id=pelanggan_id, meja_id=meja_id,
+                         tanggal_pemesanan=tanggal_pemesanan, status=status)
+        return pemesanan_id
+    
+    def bulk_create_pemesanan(self, rows: List[Tuple], chunk_size: int = 1000) -> Dict:
+        """
+        Menambahkan banyak pemesanan sekaligus dalam satu transaksi.
+        Listener tidak diberi tahu per baris; index di memori (misal
+        AvailabilityIndex) perlu dimuat ulang setelah impor. Ringkasan
+        harian diperbarui sekali setelah impor.
+        
+        Args:
+            rows (list): List tuple (pelanggan_id, meja_id, tanggal_pemesanan,
+                jumlah_orang, status, catatan)
+            chunk_size (int, optional): Jumlah baris per batch. Default 1000.
+        
+        Returns:
+            dict: {'berhasil': int, 'gagal': list tuple (indeks, pesan error)}
+        """
+        columns = ('pelanggan_id', 'meja_id', 'tanggal_pemesanan',
+                   'jumlah_orang', 'status', 'catatan')
+        hasil = self._bulk_insert('pemesanan', columns, rows, chunk_size,
+                                  sebelum=self._id_rollup)
+        if hasil['berhasil']:
+            self.refresh_rollup()
+        return hasil
+    
+    def reservasi_meja(self, pelanggan_id: int, meja_id: int,
+                       tanggal_pemesanan: str, jumlah_orang: int,
+                       catatan: str = "", durasi: timedelta = None) -> Dict:
+        """
+        Memesan meja secara atomik dalam satu transaksi.
+        
+        Baris meja dikunci dengan SELECT ... FOR UPDATE, diperiksa, lalu
+        pemesanan di-insert pada transaksi yang sama, sehingga dua host yang
+        memesan meja yang sama bersamaan tidak bisa sama-sama berhasil.
+        
+        Mode flag (durasi None) mensyaratkan meja.status 'tersedia' lalu
+        menandainya 'reserved'. Kedua mode menolak bentrok dengan pemesanan
+        aktif lain di meja tersebut (mode flag memakai DURASI_RESERVASI),
+        sehingga pemesanan slot waktu yang tidak mengubah meja.status tetap
+        terlihat oleh mode flag.
+        
+        Args:
+            pelanggan_id (int): ID pelanggan
+            meja_id (int): ID meja
+            tanggal_pemesanan (str): Tanggal dan waktu pemesanan
+            jumlah_orang (int): Jumlah orang
+            catatan (str, optional): Catatan tambahan. Default "".
+            durasi (timedelta, optional): Lama makan untuk mode slot waktu.
+                Default None (mode flag meja.status).
+        
+        Returns:
+            dict: {'hasil': salah satu konstanta RESERVASI_*,
+                   'pemesanan_id': ID pemesanan baru atau None,
+                   'meja': data meja saat konflik atau None}
+        """
+        try:
+            with self.transaction() as cursor:
+                self._id_rollup(cursor)
+                konflik = self._kunci_slot_meja(cursor, meja_id, tanggal_pemesanan,
+                                                jumlah_orang, durasi or self.DURASI_RESERVASI,
+                                                cek_status=durasi is None)
+                if konflik:
+                    return konflik
+                if durasi is None:
+                    cursor.execute("UPDATE meja SET status = 'reserved' WHERE id = %s",
+                                   (meja_id,))
+                
+                cursor.execute(
+                    """INSERT INTO pemesanan 
+                       (pelanggan_id, meja_id, tanggal_pemesanan, jumlah_orang, status, catatan) 
+                       VALUES (%s, %s, %s, %s, 'pending', %s)""",
+                    (pelanggan_id, meja_id, tanggal_pemesanan, jumlah_orang, catatan))
+                pemesanan_id = cursor.lastrowid
+                
+        except DB_ERRORS + (ValueError,) as e:
+            # ValueError: tanggal_pemesanan bukan format tanggal yang valid
+            print(f"Error saat reservasi meja: {e}")
+            return {'hasil': self.RESERVASI_GAGAL, 'pemesanan_id': None, 'meja': None}
+        
+        self._notify('pemesanan_dibuat', pemesanan_id=pemesanan_id,
+                     pelanggan_id=pelanggan_id, meja_id=meja_id,
+                     tanggal_pemesanan=tanggal_pemesanan, status='pending')
+        return {'hasil': self.RESERVASI_BERHASIL, 'pemesanan_id': pemesanan_id, 'meja': None}
+    
+    def _kunci_slot_meja(self, cursor, meja_id: int, tanggal_pemesanan,
+                         jumlah_orang: int, durasi: timedelta,
+                         cek_status: bool = False) -> Optional[Dict]:
+        """
+        Mengunci baris meja lalu memeriksa status (mode flag), kapasitas,
+        dan bentrok slot waktu untuk reservasi_meja.
+        
+        Returns:
+            dict: Hasil konflik untuk reservasi_meja, atau None jika slot bebas
+        """
+        cursor.execute("SELECT * FROM meja WHERE id = %s FOR UPDATE", (meja_id,))
+        meja = cursor.fetchone()
+        if not meja:
+            return {'hasil': self.RESERVASI_MEJA_TIDAK_DITEMUKAN, 'pemesanan_id': None, 'meja': None}
+        if cek_status and meja['status'] != 'tersedia':
+            return {'hasil': self.RESERVASI_MEJA_TIDAK_TERSEDIA, 'pemesanan_id': None, 'meja': meja}
+        if meja['kapasitas'] < jumlah_orang:
+            return {'hasil': self.RESERVASI_MELEBIHI_KAPASITAS, 'pemesanan_id': None, 'meja': meja}
+        
+        mulai = tanggal_pemesanan
+        if not isinstance(mulai, datetime):
+            mulai = datetime.fromisoformat(str(mulai))
+        cursor.execute(
+            """SELECT id FROM pemesanan
+               WHERE meja_id = %s AND status IN ('pending', 'confirmed')
+                 AND tanggal_pemesanan > %s AND tanggal_pemesanan < %s
+               LIMIT 1""",
+            (meja_id, mulai - durasi, mulai + durasi))
+        if cursor.fetchone():
+            return {'hasil': self.RESERVASI_SLOT_TERISI, 'pemesanan_id': None, 'meja': meja}
+        return None
     
     def read_pemesanan(self, pemesanan_id: int = None, status: str = None) -> Optional[List[dict]]:
         """
@@ -356,6 +994,68 @@ class DatabaseManager:
             query = base_query + " ORDER BY p.tanggal_pemesanan DESC"
             return self.execute_query(query, fetch=True)
     
+    def read_pemesanan_ringkas(self, pemesanan_id: int) -> Optional[List[dict]]:
+        """
+        Membaca kolom inti satu pemesanan tanpa JOIN (untuk perubahan status
+        yang hanya butuh meja_id dan status).
+        
+        Args:
+            pemesanan_id (int): ID pemesanan
+        
+        Returns:
+            list: List berisi satu dictionary pemesanan (kosong jika tidak ada),
+                  atau None jika gagal
+        """
+        query = """SELECT id, pelanggan_id, meja_id, tanggal_pemesanan, jumlah_orang, status
+                   FROM pemesanan WHERE id = %s"""
+        return self.execute_query(query, (pemesanan_id,), fetch=True)
+    
+    def read_pemesanan_page(self, after_date=None, after_id: int = None,
+                            page_size: int = 20, status: str = None) -> Optional[List[dict]]:
+        """
+        Membaca satu halaman pemesanan dengan keyset pagination
+        (tanggal_pemesanan, id) menurun.
+        
+        Kursor (after_date, after_id) adalah tanggal dan ID baris terakhir
+        halaman sebelumnya; id dipakai sebagai pemecah seri untuk tanggal
+        yang sama. Urutan ini dilayani idx_tanggal / idx_status_tanggal.
+        
+        Args:
+            after_date (datetime | str, optional): Tanggal baris terakhir. Default None (halaman pertama).
+            after_id (int, optional): ID baris terakhir. Default None.
+            page_size (int, optional): Jumlah baris per halaman. Default 20.
+            status (str, optional): Filter berdasarkan status. Default None.
+        
+        Returns:
+            list: List dictionary berisi data pemesanan, atau None jika gagal
+        """
+        query = """
+            SELECT p.*, pel.nama as nama_pelanggan, pel.telepon, 
+                   m.nomor_meja, m.kapasitas
+            FROM pemesanan p
+            JOIN pelanggan pel ON p.pelanggan_id = pel.id
+            JOIN meja m ON p.meja_id = m.id
+        """
+        conditions = []
+        params = []
+        
+        if status:
+            conditions.append("p.status = %s")
+            params.append(status)
+        
+        if after_date is not None and after_id is not None:
+            conditions.append("(p.tanggal_pemesanan < %s OR "
+                              "(p.tanggal_pemesanan = %s AND p.id < %s))")
+            params.extend([after_date, after_date, after_id])
+        
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        
+        query += " ORDER BY p.tanggal_pemesanan DESC, p.id DESC LIMIT %s"
+        params.append(page_size)
+        
+        return self.execute_query(query, tuple(params), fetch=True)
+    
     def update_pemesanan(self, pemesanan_id: int, pelanggan_id: int, meja_id: int,
                         tanggal_pemesanan: str, jumlah_orang: int, 
                         status: str, catatan: str) -> bool:
@@ -378,9 +1078,14 @@ class DatabaseManager:
                    SET pelanggan_id = %s, meja_id = %s, tanggal_pemesanan = %s,
                        jumlah_orang = %s, status = %s, catatan = %s
                    WHERE id = %s"""
-        result = self.execute_query(query, (pelanggan_id, meja_id, tanggal_pemesanan,
-                                           jumlah_orang, status, catatan, pemesanan_id))
-        return result is not None
+        result = self._ubah_pemesanan("id = %s", (pemesanan_id,), query,
+                                      (pelanggan_id, meja_id, tanggal_pemesanan,
+                                       jumlah_orang, status, catatan, pemesanan_id))
+        if result:
+            self._notify('pemesanan_diupdate', pemesanan_id=pemesanan_id,
+                         pelanggan_id=pelanggan_id, meja_id=meja_id,
+                         tanggal_pemesanan=tanggal_pemesanan, status=status)
+        return result
     
     def update_pemesanan_status(self, pemesanan_id: int, status: str) -> bool:
         """
@@ -394,8 +1099,164 @@ class DatabaseManager:
             bool: True jika berhasil, False jika gagal
         """
         query = "UPDATE pemesanan SET status = %s WHERE id = %s"
-        result = self.execute_query(query, (status, pemesanan_id))
-        return result is not None
+        result = self._ubah_pemesanan("id = %s", (pemesanan_id,), query, (status, pemesanan_id))
+        if result:
+            self._notify('pemesanan_status', pemesanan_id=pemesanan_id, status=status)
+        return result
+    
+    def _transisi(self, kondisi: str, params: Tuple, status_baru: str,
+                  status_asal: Tuple[str, ...], status_meja: str = None,
+                  limit: int = None) -> List[dict]:
+        """
+        Mengubah status semua pemesanan yang memenuhi kondisi dan berstatus
+        salah satu dari status_asal, dalam satu transaksi set-based.
+        
+        Baris yang memenuhi syarat dikunci (SELECT ... FOR UPDATE tanpa JOIN),
+        status diubah dengan satu UPDATE bersyarat, meja terkait diubah ke
+        status_meja dengan satu UPDATE, dan ringkasan harian disesuaikan;
+        semuanya di-commit sekali. Listener diberi tahu setelah commit.
+        Meja tidak dibebaskan jika masih ada pemesanan confirmed lain di sana.
+        
+        Args:
+            kondisi (str): Klausa WHERE atas tabel pemesanan
+            params (tuple): Parameter untuk kondisi
+            status_baru (str): Status tujuan
+            status_asal (tuple): Status asal yang diizinkan
+            status_meja (str, optional): Status meja setelah transisi. Default None
+                (meja tidak diubah).
+            limit (int, optional): Jumlah maksimum baris, terlama lebih dulu.
+                Default None (semua).
+        
+        Returns:
+            list: Baris yang berubah (id, meja_id, status lama)
+        
+        Raises:
+            Error: Jika query gagal (transaksi di-rollback)
+        """
+        asal = ", ".join(["%s"] * len(status_asal))
+        with self.transaction() as cursor:
+            batas = self._id_rollup(cursor)
+            urutan = f" ORDER BY tanggal_pemesanan, id LIMIT {int(limit)}" if limit else ""
+            cursor.execute(
+                f"""SELECT id, meja_id, status FROM pemesanan
+                    WHERE ({kondisi}) AND status IN ({asal}){urutan} FOR UPDATE""",
+                tuple(params) + tuple(status_asal))
+            rows = cursor.fetchall()
+            if not rows:
+                return []
+            
+            ids = tuple(row['id'] for row in rows)
+            kondisi_ids = f"id IN ({', '.join(['%s'] * len(ids))})"
+            self._rollup_delta(cursor, f"id <= %s AND {kondisi_ids}", (batas,) + ids, -1)
+            cursor.execute(
+                f"UPDATE pemesanan SET status = %s WHERE {kondisi_ids} AND status IN ({asal})",
+                (status_baru,) + ids + tuple(status_asal))
+            self._rollup_delta(cursor, f"id <= %s AND {kondisi_ids}", (batas,) + ids, 1)
+            
+            if status_meja:
+                meja_ids = tuple(sorted({row['meja_id'] for row in rows}))
+                query_meja = (f"UPDATE meja SET status = %s "
+                              f"WHERE id IN ({', '.join(['%s'] * len(meja_ids))})")
+                if status_meja == 'tersedia':
+                    # Jangan bebaskan meja yang masih ditempati pemesanan confirmed lain
+                    query_meja += """ AND NOT EXISTS (
+                        SELECT 1 FROM pemesanan p
+                        WHERE p.meja_id = meja.id AND p.status = 'confirmed')"""
+                cursor.execute(query_meja, (status_meja,) + meja_ids)
+        
+        for row in rows:
+            self._notify('pemesanan_status', pemesanan_id=row['id'], status=status_baru)
+        return rows
+    
+    def transisi_pemesanan(self, pemesanan_id: int, status_baru: str,
+                           status_asal: Tuple[str, ...], status_meja: str = None) -> Dict:
+        """
+        Mengubah status satu pemesanan sesuai mesin status dalam satu transaksi
+        (lihat Pemesanan.TRANSISI), sekaligus mengubah status mejanya.
+        
+        Args:
+            pemesanan_id (int): ID pemesanan
+            status_baru (str): Status tujuan
+            status_asal (tuple): Status asal yang diizinkan
+            status_meja (str, optional): Status meja setelah transisi. Default None.
+        
+        Returns:
+            dict: {'hasil': salah satu konstanta TRANSISI_*,
+                   'status': status pemesanan sekarang (None jika tidak ditemukan),
+                   'meja_id': ID meja pemesanan (None jika tidak ditemukan)}
+        """
+        try:
+            rows = self._transisi("id = %s", (pemesanan_id,), status_baru, status_asal, status_meja)
+        except DB_ERRORS as e:
+            print(f"Error saat mengubah status pemesanan: {e}")
+            return {'hasil': self.TRANSISI_GAGAL, 'status': None, 'meja_id': None}
+        
+        if rows:
+            return {'hasil': self.TRANSISI_BERHASIL, 'status': status_baru,
+                    'meja_id': rows[0]['meja_id']}
+        
+        # Tidak ada baris yang berubah, cari tahu penyebabnya
+        sekarang = self.read_pemesanan_ringkas(pemesanan_id)
+        if not sekarang:
+            return {'hasil': self.TRANSISI_TIDAK_DITEMUKAN, 'status': None, 'meja_id': None}
+        return {'hasil': self.TRANSISI_TIDAK_VALID, 'status': sekarang[0]['status'],
+                'meja_id': sekarang[0]['meja_id']}
+    
+    def transisi_pemesanan_banyak(self, pemesanan_ids: List[int], status_baru: str,
+                                  status_asal: Tuple[str, ...],
+                                  status_meja: str = None) -> Optional[List[int]]:
+        """
+        Seperti transisi_pemesanan, tetapi untuk banyak ID sekaligus dalam satu
+        transaksi (misal menutup semua pemesanan di akhir shift).
+        ID yang tidak ada atau statusnya tidak memenuhi syarat dilewati.
+        
+        Args:
+            pemesanan_ids (list): Daftar ID pemesanan
+            status_baru (str): Status tujuan
+            status_asal (tuple): Status asal yang diizinkan
+            status_meja (str, optional): Status meja setelah transisi. Default None.
+        
+        Returns:
+            list: ID pemesanan yang berubah, atau None jika gagal
+        """
+        if not pemesanan_ids:
+            return []
+        kondisi = f"id IN ({', '.join(['%s'] * len(pemesanan_ids))})"
+        try:
+            rows = self._transisi(kondisi, tuple(pemesanan_ids), status_baru,
+                                  status_asal, status_meja)
+        except DB_ERRORS as e:
+            print(f"Error saat mengubah status pemesanan: {e}")
+            return None
+        return [row['id'] for row in rows]
+    
+    def transisi_pemesanan_sebelum(self, batas_waktu, status_baru: str,
+                                   status_asal: Tuple[str, ...], status_meja: str = None,
+                                   limit: int = None) -> Optional[List[int]]:
+        """
+        Mengubah status semua pemesanan dengan tanggal_pemesanan sebelum
+        batas_waktu dan status salah satu dari status_asal, dalam satu transaksi
+        set-based (memakai idx_status_tanggal). Dipakai untuk tutup hari dan
+        penyapu no-show.
+        
+        Args:
+            batas_waktu (datetime | str): Batas eksklusif tanggal_pemesanan
+            status_baru (str): Status tujuan
+            status_asal (tuple): Status asal yang diizinkan
+            status_meja (str, optional): Status meja setelah transisi. Default None.
+            limit (int, optional): Jumlah maksimum pemesanan per panggilan
+                (pemesanan terlama lebih dulu). Default None (semua).
+        
+        Returns:
+            list: ID pemesanan yang berubah, atau None jika gagal
+        """
+        try:
+            rows = self._transisi("tanggal_pemesanan < %s", (batas_waktu,), status_baru,
+                                  status_asal, status_meja, limit)
+        except DB_ERRORS as e:
+            print(f"Error saat mengubah status pemesanan: {e}")
+            return None
+        return [row['id'] for row in rows]
     
     def delete_pemesanan(self, pemesanan_id: int) -> bool:
         """
@@ -408,15 +1269,365 @@ class DatabaseManager:
             bool: True jika berhasil, False jika gagal
         """
         query = "DELETE FROM pemesanan WHERE id = %s"
-        result = self.execute_query(query, (pemesanan_id,))
-        return result is not None
+        result = self._ubah_pemesanan("id = %s", (pemesanan_id,), query, (pemesanan_id,))
+        if result:
+            self._notify('pemesanan_dihapus', pemesanan_id=pemesanan_id)
+        return result
+    
+    # ========== RINGKASAN HARIAN ==========
+    
+    def _id_rollup(self, cursor, eksklusif: bool = False) -> int:
+        """
+        Membaca high-water mark ringkasan harian sambil mengunci barisnya.
+        
+        Penulis pemesanan mengambil lock bersama (bisa berjalan bersamaan),
+        refresh_rollup mengambil lock eksklusif. Dengan begitu refresh tidak
+        pernah memajukan high-water mark melewati insert yang belum di-commit,
+        dan perubahan baris tidak terhitung dua kali. Refresh tidak berjalan
+        di jalur tulis, sehingga penulis hanya menunggu refresh yang sedang
+        dijalankan pembaca ringkasan.
+        
+        Args:
+            cursor: Cursor transaksi (dictionary)
+            eksklusif (bool, optional): Ambil lock eksklusif. Default False.
+        
+        Returns:
+            int: ID pemesanan terakhir yang sudah masuk ringkasan
+        """
+        cursor.execute("SELECT id_terakhir FROM rollup_state WHERE nama = %s "
+                       + ("FOR UPDATE" if eksklusif else "LOCK IN SHARE MODE"),
+                       (self.ROLLUP_HARIAN,))
+        row = cursor.fetchone()
+        return row['id_terakhir'] if row else 0
+    
+    @staticmethod
+    def _rollup_delta(cursor, kondisi: str, params: Tuple, tanda: int):
+        """
+        Menambahkan (tanda=1) atau mengurangkan (tanda=-1) baris pemesanan yang
+        memenuhi kondisi ke tabel pemesanan_harian, dikelompokkan per
+        tanggal/status/meja.
+        
+        Args:
+            cursor: Cursor transaksi
+            kondisi (str): Klausa WHERE atas tabel pemesanan
+            params (tuple): Parameter untuk kondisi
+            tanda (int): 1 atau -1
+        """
+        cursor.execute(f"""
+            INSERT INTO pemesanan_harian (tanggal, status, meja_id, jumlah_pemesanan, jumlah_orang)
+            SELECT tgl, st, mid, n, orang FROM (
+                SELECT DATE(tanggal_pemesanan) AS tgl, status AS st, meja_id AS mid,
+                       {int(tanda)} * COUNT(*) AS n, {int(tanda)} * SUM(jumlah_orang) AS orang
+                FROM pemesanan WHERE {kondisi}
+                GROUP BY DATE(tanggal_pemesanan), status, meja_id
+            ) AS delta
+            ON DUPLICATE KEY UPDATE
+                jumlah_pemesanan = pemesanan_harian.jumlah_pemesanan + VALUES(jumlah_pemesanan),
+                jumlah_orang = pemesanan_harian.jumlah_orang + VALUES(jumlah_orang)
+        """, params)
+    
+    @contextmanager
+    def _perubahan_pemesanan(self, kondisi: str, params: Tuple):
+        """
+        Transaksi untuk mengubah/menghapus pemesanan yang memenuhi kondisi
+        sambil menjaga ringkasan harian tetap konsisten.
+        
+        Baris dikunci, kontribusi lamanya dikurangkan dari ringkasan, lalu
+        setelah blok selesai kontribusi barunya ditambahkan (baris yang
+        terhapus tidak ditambahkan lagi). Hanya baris dengan id <= high-water
+        mark yang disesuaikan; sisanya akan dihitung oleh refresh_rollup.
+        
+        Args:
+            kondisi (str): Klausa WHERE atas tabel pemesanan
+            params (tuple): Parameter untuk kondisi
+        
+        Yields:
+            cursor: Cursor transaksi (dictionary)
+        """
+        with self.transaction() as cursor:
+            batas = self._id_rollup(cursor)
+            cursor.execute(f"SELECT id FROM pemesanan WHERE {kondisi} FOR UPDATE", params)
+            cursor.fetchall()
+            
+            kondisi_rollup = f"id <= %s AND ({kondisi})"
+            self._rollup_delta(cursor, kondisi_rollup, (batas,) + tuple(params), -1)
+            yield cursor
+            self._rollup_delta(cursor, kondisi_rollup, (batas,) + tuple(params), 1)
+    
+    def _ubah_pemesanan(self, kondisi: str, params: Tuple, query: str, query_params: Tuple) -> bool:
+        """
+        Menjalankan satu query perubahan di dalam _perubahan_pemesanan.
+        
+        Args:
+            kondisi (str): Klausa WHERE pemesanan yang terdampak
+            params (tuple): Parameter untuk kondisi
+            query (str): Query UPDATE/DELETE yang dijalankan
+            query_params (tuple): Parameter untuk query
+        
+        Returns:
+            bool: True jika berhasil, False jika gagal
+        """
+        try:
+            with self._perubahan_pemesanan(kondisi, params) as cursor:
+                cursor.execute(query, query_params)
+            return True
+        except DB_ERRORS as e:
+            print(f"Error saat eksekusi query: {e}")
+            return False
+    
+    def refresh_rollup(self, batch_size: int = 50000) -> Optional[int]:
+        """
+        Job catch-up: memasukkan pemesanan baru (id > high-water mark) ke
+        tabel pemesanan_harian lalu memajukan high-water mark.
+        
+        Dipanggil otomatis sebelum ringkasan dibaca (get_ringkasan_harian,
+        get_statistik_harian) dan setelah bulk_create_pemesanan, bukan per
+        insert, agar pemesanan dan transisi status tidak antre di belakang
+        lock eksklusif rollup_state. Aman dijalankan kapan saja. Jika tidak
+        ada pemesanan baru, tidak ada lock yang diambil. Data besar diproses
+        per batch id agar setiap transaksi tetap pendek.
+        
+        Args:
+            batch_size (int, optional): Rentang id per transaksi. Default 50000.
+        
+        Returns:
+            int: High-water mark terbaru, atau None jika gagal
+        """
+        try:
+            # Pemeriksaan tanpa lock: pembaca ringkasan yang sudah up to date
+            # tidak menahan penulis
+            with self.transaction() as cursor:
+                cursor.execute("""SELECT (SELECT id_terakhir FROM rollup_state WHERE nama = %s)
+                                         AS id_terakhir,
+                                         (SELECT MAX(id) FROM pemesanan) AS id_maks""",
+                               (self.ROLLUP_HARIAN,))
+                row = cursor.fetchone()
+            if (row['id_maks'] or 0) <= (row['id_terakhir'] or 0):
+                return row['id_terakhir'] or 0
+            
+            while True:
+                with self.transaction() as cursor:
+                    dari = self._id_rollup(cursor, eksklusif=True)
+                    cursor.execute("SELECT MAX(id) AS id_maks FROM pemesanan")
+                    maks = cursor.fetchone()['id_maks'] or 0
+                    if maks <= dari:
+                        return dari
+                    
+                    sampai = min(maks, dari + batch_size)
+                    self._rollup_delta(cursor, "id > %s AND id <= %s", (dari, sampai), 1)
+                    cursor.execute("UPDATE rollup_state SET id_terakhir = %s WHERE nama = %s",
+                                   (sampai, self.ROLLUP_HARIAN))
+        except DB_ERRORS as e:
+            print(f"Error saat refresh ringkasan harian: {e}")
+            return None
+    
+    def rebuild_rollup(self) -> Optional[int]:
+        """
+        Mengosongkan dan menghitung ulang seluruh tabel pemesanan_harian.
+        
+        Returns:
+            int: High-water mark terbaru, atau None jika gagal
+        """
+        try:
+            with self.transaction() as cursor:
+                self._id_rollup(cursor, eksklusif=True)
+                cursor.execute("DELETE FROM pemesanan_harian")
+                cursor.execute("UPDATE rollup_state SET id_terakhir = 0 WHERE nama = %s",
+                               (self.ROLLUP_HARIAN,))
+        except DB_ERRORS as e:
+            print(f"Error saat rebuild ringkasan harian: {e}")
+            return None
+        return self.refresh_rollup()
+    
+    def _filter_harian(self, status: str = None, tanggal_mulai: str = None,
+                       tanggal_akhir: str = None) -> Tuple[str, list]:
+        """
+        Menyusun klausa WHERE atas pemesanan_harian (alias h) beserta parameternya.
+        
+        Args:
+            status (str, optional): Filter status pemesanan. Default None.
+            tanggal_mulai (str, optional): Filter tanggal mulai (YYYY-MM-DD). Default None.
+            tanggal_akhir (str, optional): Filter tanggal akhir (YYYY-MM-DD). Default None.
+        
+        Returns:
+            tuple: (klausa WHERE, list params)
+        """
+        where = " WHERE h.jumlah_pemesanan > 0"
+        params = []
+        
+        if status:
+            where += " AND h.status = %s"
+            params.append(status)
+        
+        mulai, akhir = self._rentang_tanggal(tanggal_mulai, tanggal_akhir)
+        if mulai:
+            where += " AND h.tanggal >= %s"
+            params.append(mulai.date())
+        
+        if akhir:
+            where += " AND h.tanggal < %s"
+            params.append(akhir.date())
+        
+        return where, params
+    
+    def get_ringkasan_harian(self, status: str = None, tanggal_mulai: str = None,
+                             tanggal_akhir: str = None) -> Optional[List[dict]]:
+        """
+        Mendapatkan jumlah pemesanan dan tamu per hari dari tabel ringkasan
+        (disusul dengan refresh_rollup lebih dulu).
+        
+        Args:
+            status (str, optional): Filter status pemesanan. Default None.
+            tanggal_mulai (str, optional): Filter tanggal mulai (YYYY-MM-DD). Default None.
+            tanggal_akhir (str, optional): Filter tanggal akhir (YYYY-MM-DD). Default None.
+        
+        Returns:
+            list: List dictionary (tanggal, jumlah_pemesanan, jumlah_orang) terurut
+                  tanggal, atau None jika gagal
+        """
+        self.refresh_rollup()
+        try:
+            where, params = self._filter_harian(status, tanggal_mulai, tanggal_akhir)
+        except ValueError:
+            print("Error: format tanggal tidak valid (gunakan: YYYY-MM-DD)")
+            return None
+        
+        query = """SELECT h.tanggal, CAST(SUM(h.jumlah_pemesanan) AS SIGNED) AS jumlah_pemesanan,
+                          CAST(SUM(h.jumlah_orang) AS SIGNED) AS jumlah_orang
+                   FROM pemesanan_harian h""" + where + """
+                   GROUP BY h.tanggal ORDER BY h.tanggal"""
+        return self.execute_query(query, tuple(params), fetch=True)
+    
+    def get_statistik_harian(self, status: str = None, tanggal_mulai: str = None,
+                             tanggal_akhir: str = None,
+                             dengan_pelanggan: bool = True) -> Optional[Dict]:
+        """
+        Sama seperti get_statistik_pemesanan, tetapi total, status, dan meja
+        terpopuler dibaca dari tabel pemesanan_harian sehingga biayanya
+        sebanding dengan jumlah hari, bukan jumlah pemesanan.
+        
+        Ringkasan tidak menyimpan pelanggan; pelanggan_setia dihitung dari
+        tabel pemesanan jika dengan_pelanggan True, selain itu (None, 0).
+        Ringkasan disusul (refresh_rollup) lebih dulu.
+        
+        Args:
+            status (str, optional): Filter status pemesanan. Default None.
+            tanggal_mulai (str, optional): Filter tanggal mulai (YYYY-MM-DD). Default None.
+            tanggal_akhir (str, optional): Filter tanggal akhir (YYYY-MM-DD). Default None.
+            dengan_pelanggan (bool, optional): Hitung pelanggan_setia. Default True.
+        
+        Returns:
+            dict: Statistik dengan bentuk yang sama seperti analisis_laporan,
+                  atau None jika kosong/gagal
+        """
+        self.refresh_rollup()
+        try:
+            where, params = self._filter_harian(status, tanggal_mulai, tanggal_akhir)
+            where_pemesanan, params_pemesanan = self._filter_laporan(status, tanggal_mulai,
+                                                                     tanggal_akhir)
+        except ValueError:
+            print("Error: format tanggal tidak valid (gunakan: YYYY-MM-DD)")
+            return None
+        params = tuple(params)
+        
+        try:
+            with self.transaction() as cursor:
+                cursor.execute(
+                    """SELECT h.status, SUM(h.jumlah_pemesanan) AS jumlah, SUM(h.jumlah_orang) AS orang
+                       FROM pemesanan_harian h""" + where + """
+                       GROUP BY h.status ORDER BY jumlah DESC""", params)
+                per_status = cursor.fetchall()
+                if not per_status:
+                    return None
+                
+                cursor.execute(
+                    """SELECT m.nomor_meja AS nama, SUM(h.jumlah_pemesanan) AS jumlah
+                       FROM pemesanan_harian h JOIN meja m ON h.meja_id = m.id""" + where + """
+                       GROUP BY h.meja_id, m.nomor_meja
+                       ORDER BY jumlah DESC, MAX(h.tanggal) DESC LIMIT 1""", params)
+                meja = cursor.fetchone()
+                
+                pelanggan = None
+                if dengan_pelanggan:
+                    pelanggan = self._top_pelanggan(cursor, where_pemesanan,
+                                                    tuple(params_pemesanan))
+        except DB_ERRORS as e:
+            print(f"Error saat membaca ringkasan harian: {e}")
+            return None
+        
+        return self._bentuk_statistik(per_status, meja, pelanggan)
     
     # ========== LAPORAN ==========
     
-    def get_laporan_pemesanan(self, status: str = None, tanggal_mulai: str = None, 
-                              tanggal_akhir: str = None) -> Optional[List[dict]]:
+    @staticmethod
+    def _rentang_tanggal(tanggal_mulai=None, tanggal_akhir=None) -> Tuple[Optional[datetime], Optional[datetime]]:
         """
-        Mendapatkan laporan pemesanan dengan filter.
+        Mengubah filter tanggal inklusif (YYYY-MM-DD) menjadi batas datetime
+        setengah terbuka [mulai, akhir) yang bisa memakai index kolom DATETIME.
+        
+        Args:
+            tanggal_mulai (str | date, optional): Tanggal mulai (inklusif). Default None.
+            tanggal_akhir (str | date, optional): Tanggal akhir (inklusif). Default None.
+        
+        Returns:
+            tuple: (datetime mulai atau None, datetime akhir eksklusif atau None)
+        
+        Raises:
+            ValueError: Jika format tanggal tidak valid
+        """
+        def ke_date(nilai):
+            if isinstance(nilai, datetime):
+                return nilai.date()
+            if isinstance(nilai, date):
+                return nilai
+            return date.fromisoformat(str(nilai).strip()[:10])
+        
+        mulai = akhir = None
+        if tanggal_mulai:
+            mulai = datetime.combine(ke_date(tanggal_mulai), datetime.min.time())
+        if tanggal_akhir:
+            akhir = datetime.combine(ke_date(tanggal_akhir) + timedelta(days=1),
+                                     datetime.min.time())
+        return mulai, akhir
+    
+    def _filter_laporan(self, status: str = None, tanggal_mulai: str = None,
+                        tanggal_akhir: str = None) -> Tuple[str, list]:
+        """
+        Menyusun klausa WHERE laporan pemesanan (alias tabel p) beserta parameternya.
+        
+        Args:
+            status (str, optional): Filter status pemesanan. Default None.
+            tanggal_mulai (str, optional): Filter tanggal mulai (YYYY-MM-DD). Default None.
+            tanggal_akhir (str, optional): Filter tanggal akhir (YYYY-MM-DD). Default None.
+        
+        Returns:
+            tuple: (klausa WHERE, list params)
+        """
+        where = " WHERE 1=1"
+        params = []
+        
+        # Tambahkan filter status jika ada
+        if status:
+            where += " AND p.status = %s"
+            params.append(status)
+        
+        # Tambahkan filter tanggal sebagai rentang setengah terbuka
+        # [mulai 00:00, akhir+1 hari 00:00) agar idx_tanggal bisa dipakai
+        mulai, akhir = self._rentang_tanggal(tanggal_mulai, tanggal_akhir)
+        if mulai:
+            where += " AND p.tanggal_pemesanan >= %s"
+            params.append(mulai)
+        
+        if akhir:
+            where += " AND p.tanggal_pemesanan < %s"
+            params.append(akhir)
+        
+        return where, params
+    
+    def _query_laporan(self, status: str = None, tanggal_mulai: str = None,
+                       tanggal_akhir: str = None) -> Tuple[str, tuple]:
+        """
+        Menyusun query laporan pemesanan beserta parameternya.
         
         Args:
             status (str, optional): Filter status pemesanan. Default None.
@@ -424,36 +1635,143 @@ class DatabaseManager:
             tanggal_akhir (str, optional): Filter tanggal akhir (YYYY-MM-DD). Default None.
         
         Returns:
-            list: List dictionary berisi data laporan, atau None jika gagal
+            tuple: (query, params)
         """
+        where, params = self._filter_laporan(status, tanggal_mulai, tanggal_akhir)
         query = """
             SELECT p.*, pel.nama as nama_pelanggan, pel.telepon, 
                    m.nomor_meja, m.kapasitas
             FROM pemesanan p
             JOIN pelanggan pel ON p.pelanggan_id = pel.id
             JOIN meja m ON p.meja_id = m.id
-            WHERE 1=1
+        """ + where + " ORDER BY p.tanggal_pemesanan DESC"
+        return query, tuple(params)
+    
+    def get_laporan_pemesanan(self, status: str = None, tanggal_mulai: str = None, 
+                              tanggal_akhir: str = None,
+                              result_format: str = None) -> Optional[List[dict]]:
         """
+        Mendapatkan laporan pemesanan dengan filter.
         
-        params = []
+        Args:
+            status (str, optional): Filter status pemesanan. Default None.
+            tanggal_mulai (str, optional): Filter tanggal mulai (YYYY-MM-DD). Default None.
+            tanggal_akhir (str, optional): Filter tanggal akhir (YYYY-MM-DD). Default None.
+            result_format (str, optional): Bentuk hasil (lihat execute_query), misal
+                FORMAT_KOLOM untuk analisis_laporan/print_laporan. Default None (dict).
         
-        # Tambahkan filter status jika ada
-        if status:
-            query += " AND p.status = %s"
-            params.append(status)
+        Returns:
+            list: List dictionary berisi data laporan (atau bentuk sesuai
+                  result_format), atau None jika gagal
+        """
+        try:
+            query, params = self._query_laporan(status, tanggal_mulai, tanggal_akhir)
+        except ValueError:
+            print("Error: format tanggal tidak valid (gunakan: YYYY-MM-DD)")
+            return None
         
-        # Tambahkan filter tanggal jika ada
-        if tanggal_mulai:
-            query += " AND DATE(p.tanggal_pemesanan) >= %s"
-            params.append(tanggal_mulai)
+        return self.execute_query(query, params or None, fetch=True, result_format=result_format)
+    
+    def iter_laporan_pemesanan(self, status: str = None, tanggal_mulai: str = None,
+                               tanggal_akhir: str = None,
+                               batch_size: int = 1000,
+                               result_format: str = None) -> Iterator[dict]:
+        """
+        Sama seperti get_laporan_pemesanan, tetapi baris dialirkan satu per satu
+        dengan memori konstan (lihat iter_query).
         
-        if tanggal_akhir:
-            query += " AND DATE(p.tanggal_pemesanan) <= %s"
-            params.append(tanggal_akhir)
+        Args:
+            status (str, optional): Filter status pemesanan. Default None.
+            tanggal_mulai (str, optional): Filter tanggal mulai (YYYY-MM-DD). Default None.
+            tanggal_akhir (str, optional): Filter tanggal akhir (YYYY-MM-DD). Default None.
+            batch_size (int, optional): Jumlah baris per fetchmany. Default 1000.
+            result_format (str, optional): Bentuk hasil (lihat iter_query). Default None.
         
-        query += " ORDER BY p.tanggal_pemesanan DESC"
+        Yields:
+            dict: Satu baris laporan (atau satu batch kolom untuk FORMAT_KOLOM)
         
-        if params:
-            return self.execute_query(query, tuple(params), fetch=True)
-        else:
-            return self.execute_query(query, fetch=True)
+        Raises:
+            DB_ERRORS: Jika query gagal (lihat iter_query)
+        """
+        try:
+            query, params = self._query_laporan(status, tanggal_mulai, tanggal_akhir)
+        except ValueError:
+            print("Error: format tanggal tidak valid (gunakan: YYYY-MM-DD)")
+            return iter(())
+        return self.iter_query(query, params or None, batch_size, result_format=result_format)
+    
+    def get_statistik_pemesanan(self, status: str = None, tanggal_mulai: str = None,
+                                tanggal_akhir: str = None) -> Optional[Dict]:
+        """
+        Menghitung statistik laporan pemesanan langsung di database
+        (GROUP BY + SUM), tanpa mengirim setiap baris ke aplikasi.
+        
+        Hasilnya berbentuk sama dengan analisis_laporan. Ketiga query
+        dijalankan dalam satu transaksi agar membaca snapshot yang sama.
+        Jika jumlah pemesanan seri, meja/pelanggan dengan pemesanan terbaru
+        yang dipilih (sama seperti analisis_laporan atas laporan terurut).
+        
+        Args:
+            status (str, optional): Filter status pemesanan. Default None.
+            tanggal_mulai (str, optional): Filter tanggal mulai (YYYY-MM-DD). Default None.
+            tanggal_akhir (str, optional): Filter tanggal akhir (YYYY-MM-DD). Default None.
+        
+        Returns:
+            dict: Statistik (total_pemesanan, total_orang, avg_orang, status_count,
+                  meja_populer, pelanggan_setia), atau None jika kosong/gagal
+        """
+        try:
+            where, params = self._filter_laporan(status, tanggal_mulai, tanggal_akhir)
+        except ValueError:
+            print("Error: format tanggal tidak valid (gunakan: YYYY-MM-DD)")
+            return None
+        params = tuple(params)
+        
+        try:
+            with self.transaction() as cursor:
+                cursor.execute(
+                    """SELECT p.status, COUNT(*) AS jumlah, SUM(p.jumlah_orang) AS orang
+                       FROM pemesanan p""" + where + """
+                       GROUP BY p.status ORDER BY jumlah DESC""", params)
+                per_status = cursor.fetchall()
+                if not per_status:
+                    return None
+                
+                cursor.execute(
+                    """SELECT m.nomor_meja AS nama, COUNT(*) AS jumlah
+                       FROM pemesanan p JOIN meja m ON p.meja_id = m.id""" + where + """
+                       GROUP BY p.meja_id, m.nomor_meja
+                       ORDER BY jumlah DESC, MAX(p.tanggal_pemesanan) DESC LIMIT 1""", params)
+                meja = cursor.fetchone()
+                
+                pelanggan = self._top_pelanggan(cursor, where, params)
+        except DB_ERRORS as e:
+            print(f"Error saat menghitung statistik: {e}")
+            return None
+        
+        return self._bentuk_statistik(per_status, meja, pelanggan)
+    
+    @staticmethod
+    def _top_pelanggan(cursor, where: str, params: Tuple) -> Optional[dict]:
+        """Mencari pelanggan dengan pemesanan terbanyak (seri: pemesanan terbaru)."""
+        cursor.execute(
+            """SELECT pel.nama AS nama, COUNT(*) AS jumlah
+               FROM pemesanan p JOIN pelanggan pel ON p.pelanggan_id = pel.id""" + where + """
+               GROUP BY p.pelanggan_id, pel.nama
+               ORDER BY jumlah DESC, MAX(p.tanggal_pemesanan) DESC LIMIT 1""", params)
+        return cursor.fetchone()
+    
+    @staticmethod
+    def _bentuk_statistik(per_status: List[dict], meja: Optional[dict],
+                          pelanggan: Optional[dict]) -> Dict:
+        """Menyusun hasil query agregat ke bentuk dict analisis_laporan."""
+        total_pemesanan = int(sum(row['jumlah'] for row in per_status))
+        total_orang = int(sum(row['orang'] or 0 for row in per_status))
+        return {
+            'total_pemesanan': total_pemesanan,
+            'total_orang': total_orang,
+            'avg_orang': total_orang / total_pemesanan,
+            'status_count': {row['status']: int(row['jumlah']) for row in per_status},
+            'meja_populer': (meja['nama'], int(meja['jumlah'])) if meja else (None, 0),
+            'pelanggan_setia': (pelanggan['nama'], int(pelanggan['jumlah'])) if pelanggan else (None, 0)
+        }
@@ -0,0 +1,168 @@
+"""
+Migrations Module
+Module ini berisi migrasi skema database yang berversi.
+
+Setiap migrasi memiliki nomor versi, deskripsi, dan daftar langkah.
+Versi yang sudah dijalankan dicatat di tabel schema_version sehingga
+create_tables() dapat membawa database lama ke layout terbaru.
+Langkah bersifat idempotent (index dicek dulu sebelum dibuat), jadi aman
+dijalankan ulang pada database yang dibuat dari setup.sql.
+
+Migrasi ditulis untuk MySQL. Untuk dialek 'sqlite', langkah SQL memakai
+variant sqlite-nya jika ada, dan nama index diawali nama tabel karena
+nama index SQLite berlaku untuk seluruh database.
+"""
+
+from collections import namedtuple
+from typing import List
+
+
+# Langkah migrasi: membuat index jika belum ada
+Index = namedtuple('Index', ['tabel', 'nama', 'kolom'])
+
+# Langkah migrasi: menjalankan SQL apa adanya (sqlite: variant untuk SQLite)
+SQL = namedtuple('SQL', ['query', 'sqlite'], defaults=(None,))
+
+Migrasi = namedtuple('Migrasi', ['versi', 'deskripsi', 'langkah'])
+
+
+MIGRASI: List[Migrasi] = [
+    Migrasi(1, "Index dasar sesuai setup.sql", [
+        Index('pelanggan', 'idx_nama', ('nama',)),
+        Index('pelanggan', 'idx_telepon', ('telepon',)),
+        Index('meja', 'idx_status', ('status',)),
+        Index('meja', 'idx_nomor_meja', ('nomor_meja',)),
+        Index('pemesanan', 'idx_status', ('status',)),
+        Index('pemesanan', 'idx_tanggal', ('tanggal_pemesanan',)),
+        Index('pemesanan', 'idx_pelanggan', ('pelanggan_id',)),
+        Index('pemesanan', 'idx_meja', ('meja_id',)),
+    ]),
+    Migrasi(2, "Index komposit untuk pola query laporan dan reservasi", [
+        # Laporan by status + rentang tanggal, penyapu no-show
+        Index('pemesanan', 'idx_status_tanggal', ('status', 'tanggal_pemesanan')),
+        # Cek bentrok slot meja pada reservasi mode slot waktu
+        Index('pemesanan', 'idx_meja_status_tanggal', ('meja_id', 'status', 'tanggal_pemesanan')),
+        # Riwayat pemesanan per pelanggan
+        Index('pemesanan', 'idx_pelanggan_tanggal', ('pelanggan_id', 'tanggal_pemesanan')),
+    ]),
+    Migrasi(3, "Tabel ringkasan harian pemesanan_harian", [
+        SQL("""
+            CREATE TABLE IF NOT EXISTS pemesanan_harian (
+                tanggal DATE NOT NULL,
+                status VARCHAR(20) NOT NULL,
+                meja_id INT NOT NULL,
+                jumlah_pemesanan INT NOT NULL DEFAULT 0,
+                jumlah_orang INT NOT NULL DEFAULT 0,
+                PRIMARY KEY (tanggal, status, meja_id)
+            )
+        """),
+        # High-water mark: pemesanan dengan id <= id_terakhir sudah masuk ringkasan
+        SQL("""
+            CREATE TABLE IF NOT EXISTS rollup_state (
+                nama VARCHAR(50) PRIMARY KEY,
+                id_terakhir INT NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            )
+        """, sqlite="""
+            CREATE TABLE IF NOT EXISTS rollup_state (
+                nama VARCHAR(50) PRIMARY KEY,
+                id_terakhir INT NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """),
+        SQL("INSERT IGNORE INTO rollup_state (nama, id_terakhir) VALUES ('pemesanan_harian', 0)",
+            sqlite="INSERT OR IGNORE INTO rollup_state (nama, id_terakhir) "
+                   "VALUES ('pemesanan_harian', 0)"),
+    ]),
+]
+
+VERSI_TERBARU = MIGRASI[-1].versi
+
+
+def buat_tabel_versi(cursor):
+    """
+    Membuat tabel schema_version jika belum ada.
+
+    Args:
+        cursor: Cursor database
+    """
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS schema_version (
+            versi INT PRIMARY KEY,
+            deskripsi VARCHAR(200) NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+
+def versi_sekarang(cursor) -> int:
+    """
+    Membaca versi skema yang sudah diterapkan.
+
+    Args:
+        cursor: Cursor database
+
+    Returns:
+        int: Versi tertinggi di schema_version, 0 jika belum ada
+    """
+    cursor.execute("SELECT MAX(versi) FROM schema_version")
+    row = cursor.fetchone()
+    return (row[0] if row else None) or 0
+
+
+def _index_ada(cursor, tabel: str, nama: str) -> bool:
+    """Memeriksa apakah index sudah ada pada tabel."""
+    cursor.execute(
+        """SELECT 1 FROM information_schema.statistics
+           WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s
+           LIMIT 1""",
+        (tabel, nama))
+    return cursor.fetchone() is not None
+
+
+def _jalankan_langkah(cursor, langkah, dialek: str = 'mysql'):
+    """Menjalankan satu langkah migrasi."""
+    if isinstance(langkah, Index):
+        kolom = ', '.join(langkah.kolom)
+        if dialek == 'sqlite':
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {langkah.tabel}_{langkah.nama} "
+                           f"ON {langkah.tabel} ({kolom})")
+        elif not _index_ada(cursor, langkah.tabel, langkah.nama):
+            cursor.execute(f"CREATE INDEX {langkah.nama} ON {langkah.tabel} ({kolom})")
+    elif dialek == 'sqlite' and langkah.sqlite:
+        cursor.execute(langkah.sqlite)
+    else:
+        cursor.execute(langkah.query)
+
+
+def jalankan_migrasi(conn, sampai: int = None, dialek: str = 'mysql') -> List[int]:
+    """
+    Menjalankan semua migrasi yang belum diterapkan secara berurutan.
+
+    Args:
+        conn: Koneksi database
+        sampai (int, optional): Versi target. Default None (versi terbaru).
+        dialek (str, optional): 'mysql' atau 'sqlite'. Default 'mysql'.
+
+    Returns:
+        list: Nomor versi yang baru saja diterapkan
+    """
+    sampai = VERSI_TERBARU if sampai is None else sampai
+    diterapkan = []
+    cursor = conn.cursor(buffered=True)
+    try:
+        buat_tabel_versi(cursor)
+        sekarang = versi_sekarang(cursor)
+
+        for migrasi in MIGRASI:
+            if migrasi.versi <= sekarang or migrasi.versi > sampai:
+                continue
+            for langkah in migrasi.langkah:
+                _jalankan_langkah(cursor, langkah, dialek)
+            cursor.execute("INSERT INTO schema_version (versi, deskripsi) VALUES (%s, %s)",
+                           (migrasi.versi, migrasi.deskripsi))
+            conn.commit()
+            diterapkan.append(migrasi.versi)
+    finally:
+        cursor.close()
+    return diterapkan
@@ -43,10 +43,34 @@ CREATE TABLE IF NOT EXISTS pemesanan (
     INDEX idx_status (status),
     INDEX idx_tanggal (tanggal_pemesanan),
     INDEX idx_pelanggan (pelanggan_id),
-    INDEX idx_meja (meja_id)
+    INDEX idx_meja (meja_id),
+    INDEX idx_status_tanggal (status, tanggal_pemesanan),
+    INDEX idx_meja_status_tanggal (meja_id, status, tanggal_pemesanan),
+    INDEX idx_pelanggan_tanggal (pelanggan_id, tanggal_pemesanan)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
 
-# 6. Insert data sample untuk testing (opsional)
+# 6. Buat tabel ringkasan harian (diisi oleh DatabaseManager.refresh_rollup())
+CREATE TABLE IF NOT EXISTS pemesanan_harian (
+    tanggal DATE NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    meja_id INT NOT NULL,
+    jumlah_pemesanan INT NOT NULL DEFAULT 0,
+    jumlah_orang INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (tanggal, status, meja_id)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+CREATE TABLE IF NOT EXISTS rollup_state (
+    nama VARCHAR(50) PRIMARY KEY,
+    id_terakhir INT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4;
+
+INSERT IGNORE INTO rollup_state (nama, id_terakhir) VALUES ('pemesanan_harian', 0);
+
+-- Versi skema dicatat otomatis oleh DatabaseManager.create_tables()
+-- (lihat database/migrations.py) saat aplikasi pertama kali dijalankan
+
+# 7. Insert data sample untuk testing (opsional)
 
 -- Sample pelanggan
 INSERT INTO pelanggan (nama, telepon, email) VALUES 
@@ -69,7 +93,7 @@ INSERT INTO pemesanan (pelanggan_id, meja_id, tanggal_pemesanan, jumlah_orang, s
 (2, 4, '2025-12-01 20:00:00', 6, 'pending', 'Ulang tahun'),
 (3, 1, '2025-12-02 18:00:00', 2, 'confirmed', '');
 
-# 7. Verifikasi data
+# 8. Verifikasi data
 SELECT 'Pelanggan:' as Info;
 SELECT * FROM pelanggan;
 
@@ -82,7 +106,7 @@ FROM pemesanan p
 JOIN pelanggan pel ON p.pelanggan_id = pel.id
 JOIN meja m ON p.meja_id = m.id;
 
-# 8. Query utility
+# 9. Query utility
 
 -- Lihat meja tersedia
 SELECT * FROM meja WHERE status = 'tersedia';
@@ -0,0 +1,316 @@
+"""
+SQLite Manager Module
+Module ini berisi backend SQLite untuk DatabaseManager.
+
+SQLite tidak butuh server, sehingga cocok untuk kiosk cabang yang berjalan
+offline, test, demo, dan benchmark di mesin mana pun. Koneksi sqlite3
+dibungkus adapter dengan antarmuka yang dipakai DatabaseManager
+(cursor(dictionary=...), commit, rollback, ping, is_connected), dan query
+bergaya MySQL diterjemahkan: placeholder %s menjadi ?, serta klausa
+FOR UPDATE / LOCK IN SHARE MODE dibuang karena SQLite mengunci seluruh
+database (transaksi dimulai dengan BEGIN IMMEDIATE).
+"""
+
+import re
+import sqlite3
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+from .db_manager import DatabaseManager
+from .cache import CachedDatabaseManager
+
+
+_KUNCI_BARIS = re.compile(r"\s+(FOR\s+UPDATE|LOCK\s+IN\s+SHARE\s+MODE)\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def terjemahkan_query(query: str) -> str:
+    """
+    Menerjemahkan query bergaya MySQL ke SQLite.
+
+    Args:
+        query (str): Query dengan placeholder %s
+
+    Returns:
+        str: Query dengan placeholder ? tanpa klausa lock baris
+    """
+    return _KUNCI_BARIS.sub("", query).replace("%s", "?")
+
+
+def _nilai_param(nilai):
+    """Mengubah datetime/date ke teks dengan format yang sama seperti MySQL."""
+    if isinstance(nilai, datetime):
+        return nilai.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(nilai, date):
+        return nilai.isoformat()
+    return nilai
+
+
+def _params(params: Optional[Iterable]) -> Tuple:
+    """Menyiapkan parameter query untuk sqlite3."""
+    if not params:
+        return ()
+    return tuple(_nilai_param(nilai) for nilai in params)
+
+
+def _ke_datetime(nilai: bytes):
+    """Converter kolom DATETIME/TIMESTAMP; teks yang tidak valid dikembalikan apa adanya."""
+    teks = nilai.decode()
+    try:
+        return datetime.fromisoformat(teks)
+    except ValueError:
+        return teks
+
+
+def _ke_date(nilai: bytes):
+    """Converter kolom DATE."""
+    teks = nilai.decode()
+    try:
+        return date.fromisoformat(teks[:10])
+    except ValueError:
+        return teks
+
+
+# Kolom tanggal dibaca sebagai datetime/date, sama seperti mysql-connector
+sqlite3.register_converter("DATETIME", _ke_datetime)
+sqlite3.register_converter("TIMESTAMP", _ke_datetime)
+sqlite3.register_converter("DATE", _ke_date)
+
+
+def _baris_dict(cursor, row) -> dict:
+    """Row factory untuk cursor dictionary."""
+    return {kolom[0]: nilai for kolom, nilai in zip(cursor.description, row)}
+
+
+class SQLiteCursor:
+    """
+    Pembungkus sqlite3.Cursor dengan antarmuka cursor mysql-connector.
+    """
+
+    def __init__(self, cursor: sqlite3.Cursor, dictionary: bool = False):
+        """
+        Inisialisasi SQLiteCursor.
+
+        Args:
+            cursor (sqlite3.Cursor): Cursor asli
+            dictionary (bool, optional): Kembalikan baris sebagai dict. Default False.
+        """
+        self._cursor = cursor
+        if dictionary:
+            cursor.row_factory = _baris_dict
+
+    def execute(self, query: str, params: Tuple = None):
+        self._cursor.execute(terjemahkan_query(query), _params(params))
+
+    def executemany(self, query: str, rows: Iterable[Tuple]):
+        # Baris sebelum baris yang gagal dibatalkan, seperti multi-row INSERT MySQL
+        self._cursor.execute("SAVEPOINT executemany")
+        try:
+            self._cursor.executemany(terjemahkan_query(query), [_params(row) for row in rows])
+        except sqlite3.Error:
+            self._cursor.execute("ROLLBACK TO executemany")
+            raise
+        finally:
+            self._cursor.execute("RELEASE executemany")
+
+    def fetchone(self):
+        return self._cursor.fetchone()
+
+    def fetchall(self):
+        return self._cursor.fetchall()
+
+    def fetchmany(self, size: int = 1):
+        return self._cursor.fetchmany(size)
+
+    @property
+    def lastrowid(self) -> int:
+        # mysql-connector mengembalikan 0 untuk statement selain INSERT
+        return self._cursor.lastrowid or 0
+
+    @property
+    def rowcount(self) -> int:
+        return self._cursor.rowcount
+
+    @property
+    def description(self):
+        return self._cursor.description
+
+    def close(self):
+        self._cursor.close()
+
+
+class SQLiteConnection:
+    """
+    Pembungkus sqlite3.Connection (mode autocommit) dengan antarmuka
+    koneksi mysql-connector yang dipakai DatabaseManager.
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        """
+        Inisialisasi SQLiteConnection.
+
+        Args:
+            conn (sqlite3.Connection): Koneksi asli dengan isolation_level=None
+        """
+        self._conn = conn
+        self._tertutup = False
+
+    def cursor(self, dictionary: bool = False, buffered: bool = None) -> SQLiteCursor:
+        # Hasil sqlite3 selalu dibaca bertahap dari file lokal; buffered diabaikan
+        return SQLiteCursor(self._conn.cursor(), dictionary)
+
+    def begin(self):
+        """Memulai transaksi dengan lock tulis agar setara SELECT ... FOR UPDATE."""
+        self._conn.execute("BEGIN IMMEDIATE")
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    @property
+    def in_transaction(self) -> bool:
+        return self._conn.in_transaction
+
+    def ping(self, reconnect: bool = False):
+        self._conn.execute("SELECT 1")
+
+    def is_connected(self) -> bool:
+        return not self._tertutup
+
+    def close(self):
+        self._conn.close()
+        self._tertutup = True
+
+
+class SQLiteDatabaseManager(DatabaseManager):
+    """
+    DatabaseManager dengan backend SQLite (file atau ':memory:').
+
+    Semua method CRUD, reservasi, transisi status, ringkasan harian, dan
+    laporan dipakai apa adanya dari DatabaseManager; hanya DDL, upsert
+    ringkasan harian, dan pembuatan koneksi yang berbeda.
+    File database memakai WAL agar pembaca tidak diblokir penulis.
+    """
+
+    DIALEK = 'sqlite'
+
+    def __init__(self, path: str = 'restaurant.db', pool_size: int = None,
+                 pool_timeout: float = 10.0, wal: bool = True):
+        """
+        Inisialisasi SQLiteDatabaseManager.
+
+        Args:
+            path (str, optional): Path file database atau ':memory:'.
+                Default 'restaurant.db'.
+            pool_size (int, optional): Ukuran connection pool. Default None
+                (satu koneksi bersama). Diabaikan untuk ':memory:' karena
+                setiap koneksi memori adalah database terpisah.
+            pool_timeout (float, optional): Batas waktu tunggu koneksi dari pool
+                dan tunggu lock database dalam detik. Default 10.0.
+            wal (bool, optional): Aktifkan journal_mode=WAL. Default True.
+        """
+        if path == ':memory:':
+            pool_size = None
+        super().__init__(database=path, pool_size=pool_size, pool_timeout=pool_timeout)
+        self.path = path
+        self.wal = wal
+
+    def _new_connection(self) -> SQLiteConnection:
+        """
+        Membuat satu koneksi SQLite baru dengan foreign key dan WAL aktif.
+
+        Returns:
+            SQLiteConnection: Koneksi baru
+        """
+        conn = sqlite3.connect(self.path, timeout=self.pool_timeout,
+                               detect_types=sqlite3.PARSE_DECLTYPES,
+                               isolation_level=None, check_same_thread=False)
+        # ON DELETE CASCADE hanya berlaku jika foreign_keys aktif
+        conn.execute("PRAGMA foreign_keys = ON")
+        if self.wal and self.path != ':memory:':
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+        return SQLiteConnection(conn)
+
+    def _begin(self, conn):
+        conn.begin()
+
+    def _create_tables(self, conn):
+        """
+        Menjalankan DDL pembuatan tabel versi SQLite.
+
+        ENUM diganti CHECK, dan AUTOINCREMENT dipakai agar id tidak pernah
+        dipakai ulang (high-water mark ringkasan harian bergantung pada id
+        yang selalu naik).
+
+        Args:
+            conn (SQLiteConnection): Koneksi database
+        """
+        cursor = conn.cursor()
+        try:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS pelanggan (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    nama VARCHAR(100) NOT NULL,
+                    telepon VARCHAR(20) NOT NULL,
+                    email VARCHAR(100),
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS meja (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    nomor_meja INT NOT NULL UNIQUE,
+                    kapasitas INT NOT NULL,
+                    status VARCHAR(20) DEFAULT 'tersedia'
+                        CHECK (status IN ('tersedia', 'terisi', 'reserved')),
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS pemesanan (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    pelanggan_id INT NOT NULL,
+                    meja_id INT NOT NULL,
+                    tanggal_pemesanan DATETIME NOT NULL,
+                    jumlah_orang INT NOT NULL,
+                    status VARCHAR(20) DEFAULT 'pending'
+                        CHECK (status IN ('pending', 'confirmed', 'completed', 'cancelled')),
+                    catatan TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (pelanggan_id) REFERENCES pelanggan(id) ON DELETE CASCADE,
+                    FOREIGN KEY (meja_id) REFERENCES meja(id) ON DELETE CASCADE
+                )
+            """)
+
+            conn.commit()
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _rollup_delta(cursor, kondisi: str, params: Tuple, tanda: int):
+        """
+        Versi SQLite dari DatabaseManager._rollup_delta (upsert ON CONFLICT).
+        """
+        cursor.execute(f"""
+            INSERT INTO pemesanan_harian (tanggal, status, meja_id, jumlah_pemesanan, jumlah_orang)
+            SELECT DATE(tanggal_pemesanan), status, meja_id,
+                   {int(tanda)} * COUNT(*), {int(tanda)} * SUM(jumlah_orang)
+            FROM pemesanan WHERE {kondisi}
+            GROUP BY DATE(tanggal_pemesanan), status, meja_id
+            ON CONFLICT (tanggal, status, meja_id) DO UPDATE SET
+                jumlah_pemesanan = jumlah_pemesanan + excluded.jumlah_pemesanan,
+                jumlah_orang = jumlah_orang + excluded.jumlah_orang
+        """, params)
+
+
+class CachedSQLiteDatabaseManager(CachedDatabaseManager, SQLiteDatabaseManager):
+    """
+    SQLiteDatabaseManager dengan cache read-through meja dan pelanggan
+    (lihat CachedDatabaseManager).
+    """
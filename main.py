@@ -8,7 +8,7 @@ Date: December 2025
 
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timedelta
 from services.restaurant_service import *
 from database.db_manager import DatabaseManager
 
@@ -19,11 +19,43 @@ class RestaurantApp:
     Mengelola user interface dan alur program.
     """
     
+    # Jumlah baris per halaman pada tampilan daftar
+    UKURAN_HALAMAN = 20
+    
     def __init__(self):
         """Inisialisasi aplikasi."""
         self.db = None
+        self.availability = None
         self.running = True
     
+    def tampilkan_per_halaman(self, ambil_halaman, cetak, pesan_kosong: str):
+        """
+        Menampilkan data per halaman sampai habis atau pengguna berhenti.
+        
+        Args:
+            ambil_halaman (callable): Fungsi (halaman sebelumnya atau None) -> dict halaman
+            cetak (callable): Fungsi untuk mencetak list baris satu halaman
+            pesan_kosong (str): Pesan jika halaman pertama kosong
+        """
+        halaman = ambil_halaman(None)
+        nomor = 1
+        
+        if halaman is not None and not halaman['data']:
+            print(pesan_kosong)
+        
+        while halaman and halaman['data']:
+            cetak(halaman['data'])
+            print(f"\n📄 Halaman {nomor}")
+            
+            if halaman['after_id'] is None:
+                break
+            if input("⏎ Enter untuk halaman berikutnya, 'q' untuk berhenti: ").strip().lower() == 'q':
+                return
+            halaman = ambil_halaman(halaman)
+            nomor += 1
+        
+        input("\n⏎ Tekan Enter untuk melanjutkan...")
+    
     def clear_screen(self):
         """Membersihkan layar console."""
         os.system('cls' if os.name == 'nt' else 'clear')
@@ -85,6 +117,7 @@ class RestaurantApp:
         print("5. 🎉 Selesaikan Pemesanan")
         print("6. ❌ Batalkan Pemesanan")
         print("7. 🗑️  Hapus Pemesanan")
+        print("8. 🌙 Tutup Hari / Batalkan No-Show")
         print("0. ⬅️  Kembali")
         print("-"*60)
     
@@ -120,15 +153,16 @@ class RestaurantApp:
     def handle_lihat_pelanggan(self):
         """Handler untuk melihat semua pelanggan."""
         print("\n📋 --- DAFTAR PELANGGAN ---")
-        pelanggan_list = lihat_pelanggan(self.db)
         
-        if pelanggan_list:
+        def cetak(pelanggan_list):
             print(f"\n{'ID':<5} {'👤 Nama':<27} {'📱 Telepon':<17} {'📧 Email':<30}")
             print("-"*79)
             for p in pelanggan_list:
                 print(f"{p['id']:<5} {p['nama']:<27} {p['telepon']:<17} {p['email'] or '-':<30}")
         
-        input("\n⏎ Tekan Enter untuk melanjutkan...")
+        self.tampilkan_per_halaman(
+            lambda h: lihat_pelanggan_halaman(self.db, h and h['after_id'], self.UKURAN_HALAMAN),
+            cetak, "✗ Tidak ada data pelanggan")
     
     def handle_cari_pelanggan(self):
         """Handler untuk mencari pelanggan by ID."""
@@ -225,7 +259,19 @@ class RestaurantApp:
     def handle_lihat_meja_tersedia(self):
         """Handler untuk melihat meja tersedia."""
         print("\n✅ --- MEJA TERSEDIA ---")
-        meja_list = lihat_meja_tersedia(self.db)
+        print("Kosongkan waktu untuk melihat status meja saat ini.")
+        waktu = input("Waktu (YYYY-MM-DD HH:MM:SS): ").strip()
+        
+        if waktu:
+            try:
+                durasi_jam = float(input("Lama makan dalam jam (default 2): ").strip() or 2)
+                meja_list = lihat_meja_tersedia(self.db, waktu, timedelta(hours=durasi_jam),
+                                                index=self.availability)
+            except ValueError:
+                print("✗ Format waktu atau durasi tidak valid")
+                meja_list = None
+        else:
+            meja_list = lihat_meja_tersedia(self.db)
         
         if meja_list:
             print(f"\n{'ID':<5} {'🪑 Nomor Meja':<14} {'👥 Kapasitas':<14}")
@@ -284,21 +330,26 @@ class RestaurantApp:
         
         try:
             pelanggan_id = int(input("ID Pelanggan: "))
-            meja_id = int(input("ID Meja: "))
+            meja_input = input("ID Meja (kosongkan untuk pilih otomatis): ").strip()
+            meja_id = int(meja_input) if meja_input else None
             
             print("\nTanggal Pemesanan (kosongkan untuk hari ini):")
             tanggal_input = input("Format: YYYY-MM-DD HH:MM:SS atau kosongkan: ").strip()
             
             if not tanggal_input:
-                tanggal_pemesanan = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                tanggal_pemesanan = datetime.now().replace(microsecond=0)
             else:
                 tanggal_pemesanan = tanggal_input
             
             jumlah_orang = int(input("Jumlah Orang (1-20): "))
             catatan = input("Catatan (opsional, max 500 karakter): ").strip()
             
-            tambah_pemesanan(self.db, pelanggan_id, meja_id, tanggal_pemesanan, 
-                           jumlah_orang, catatan)
+            if meja_id is None:
+                tambah_pemesanan_otomatis(self.db, pelanggan_id, tanggal_pemesanan,
+                                          jumlah_orang, catatan, index=self.availability)
+            else:
+                tambah_pemesanan(self.db, pelanggan_id, meja_id, tanggal_pemesanan, 
+                               jumlah_orang, catatan)
         except ValueError:
             print("✗ Input ID dan jumlah orang harus berupa angka")
         
@@ -307,9 +358,8 @@ class RestaurantApp:
     def handle_lihat_pemesanan(self):
         """Handler untuk melihat semua pemesanan."""
         print("\n--- DAFTAR PEMESANAN ---")
-        pemesanan_list = lihat_pemesanan(self.db)
         
-        if pemesanan_list:
+        def cetak(pemesanan_list):
             print(f"\n{'ID':<5} {'Pelanggan':<20} {'Meja':<6} {'Tanggal':<20} {'Orang':<7} {'Status':<12}")
             print("-"*70)
             for p in pemesanan_list:
@@ -317,7 +367,10 @@ class RestaurantApp:
                       f"#{p['nomor_meja']:<5} {str(p['tanggal_pemesanan'])[:19]:<20} "
                       f"{p['jumlah_orang']:<7} {p['status']:<12}")
         
-        input("\nTekan Enter untuk melanjutkan...")
+        self.tampilkan_per_halaman(
+            lambda h: lihat_pemesanan_halaman(self.db, h and h['after_date'], h and h['after_id'],
+                                              self.UKURAN_HALAMAN),
+            cetak, "✗ Tidak ada data pemesanan")
     
     def handle_lihat_pemesanan_by_status(self):
         """Handler untuk melihat pemesanan by status."""
@@ -338,9 +391,7 @@ class RestaurantApp:
             input("\nTekan Enter untuk melanjutkan...")
             return
         
-        pemesanan_list = lihat_pemesanan(self.db, status=status)
-        
-        if pemesanan_list:
+        def cetak(pemesanan_list):
             print(f"\n{'ID':<5} {'Pelanggan':<20} {'Meja':<6} {'Tanggal':<20} {'Orang':<7}")
             print("-"*58)
             for p in pemesanan_list:
@@ -348,7 +399,10 @@ class RestaurantApp:
                       f"#{p['nomor_meja']:<5} {str(p['tanggal_pemesanan'])[:19]:<20} "
                       f"{p['jumlah_orang']:<7}")
         
-        input("\nTekan Enter untuk melanjutkan...")
+        self.tampilkan_per_halaman(
+            lambda h: lihat_pemesanan_halaman(self.db, h and h['after_date'], h and h['after_id'],
+                                              self.UKURAN_HALAMAN, status),
+            cetak, f"✗ Tidak ada pemesanan dengan status {status}")
     
     def handle_konfirmasi_pemesanan(self):
         """Handler untuk konfirmasi pemesanan."""
@@ -365,8 +419,12 @@ class RestaurantApp:
         """Handler untuk menyelesaikan pemesanan."""
         print("\n--- SELESAIKAN PEMESANAN ---")
         try:
-            pemesanan_id = int(input("Masukkan ID Pemesanan: "))
-            selesaikan_pemesanan(self.db, pemesanan_id)
+            masukan = input("Masukkan ID Pemesanan (pisahkan dengan koma untuk beberapa): ")
+            pemesanan_ids = [int(x) for x in masukan.split(',') if x.strip()]
+            if len(pemesanan_ids) == 1:
+                selesaikan_pemesanan(self.db, pemesanan_ids[0])
+            elif pemesanan_ids:
+                selesaikan_pemesanan_banyak(self.db, pemesanan_ids)
         except ValueError:
             print("✗ ID harus berupa angka")
         
@@ -400,15 +458,34 @@ class RestaurantApp:
         
         input("\nTekan Enter untuk melanjutkan...")
     
+    def handle_tutup_hari(self):
+        """Handler untuk tutup hari dan pembatalan pemesanan no-show."""
+        print("\n--- TUTUP HARI / NO-SHOW ---")
+        try:
+            menit = input("Toleransi keterlambatan no-show (menit) [30]: ").strip()
+            batalkan_no_show(self.db, timedelta(minutes=int(menit) if menit else 30))
+            
+            jam_tutup = input("Jam tutup (HH:MM), kosongkan untuk sekarang: ").strip()
+            sekarang = datetime.now()
+            if jam_tutup:
+                batas = datetime.combine(sekarang.date(),
+                                         datetime.strptime(jam_tutup, "%H:%M").time())
+            else:
+                batas = sekarang
+            konfirmasi = input(f"Selesaikan semua pemesanan confirmed sebelum {batas}? (y/n): ")
+            if konfirmasi.lower() == 'y':
+                tutup_hari(self.db, batas)
+        except ValueError:
+            print("✗ Format input tidak valid")
+        
+        input("\nTekan Enter untuk melanjutkan...")
+    
     # ========== HANDLER LAPORAN ==========
     
     def handle_laporan_semua(self):
         """Handler untuk laporan semua pemesanan."""
         print("\n--- LAPORAN SEMUA PEMESANAN ---")
-        laporan = generate_laporan_pemesanan(self.db)
-        
-        if laporan:
-            print_laporan(laporan)
+        print_laporan(generate_laporan_stream(self.db))
         
         input("\nTekan Enter untuk melanjutkan...")
     
@@ -431,10 +508,7 @@ class RestaurantApp:
             input("\nTekan Enter untuk melanjutkan...")
             return
         
-        laporan = generate_laporan_pemesanan(self.db, status=status)
-        
-        if laporan:
-            print_laporan(laporan)
+        print_laporan(generate_laporan_stream(self.db, status=status))
         
         input("\nTekan Enter untuk melanjutkan...")
     
@@ -444,12 +518,17 @@ class RestaurantApp:
         tanggal_mulai = input("Tanggal Mulai (YYYY-MM-DD): ").strip()
         tanggal_akhir = input("Tanggal Akhir (YYYY-MM-DD): ").strip()
         
-        laporan = generate_laporan_pemesanan(self.db, 
-                                            tanggal_mulai=tanggal_mulai, 
-                                            tanggal_akhir=tanggal_akhir)
+        print_laporan(generate_laporan_stream(self.db,
+                                             tanggal_mulai=tanggal_mulai,
+                                             tanggal_akhir=tanggal_akhir))
         
-        if laporan:
-            print_laporan(laporan)
+        ringkasan = ringkasan_harian(self.db, tanggal_mulai=tanggal_mulai,
+                                     tanggal_akhir=tanggal_akhir)
+        if ringkasan:
+            print("\n📅 RINGKASAN PER HARI:")
+            print(f"   {'Tanggal':<12} {'Pemesanan':>10} {'Tamu':>8}")
+            for r in ringkasan:
+                print(f"   {str(r['tanggal']):<12} {r['jumlah_pemesanan']:>10} {r['jumlah_orang']:>8}")
         
         input("\nTekan Enter untuk melanjutkan...")
     
@@ -519,6 +598,8 @@ class RestaurantApp:
                 self.handle_batalkan_pemesanan()
             elif pilihan == '7':
                 self.handle_hapus_pemesanan()
+            elif pilihan == '8':
+                self.handle_tutup_hari()
             elif pilihan == '0':
                 break
             else:
@@ -529,17 +610,14 @@ class RestaurantApp:
         """Handler untuk menampilkan analisis statistik lengkap."""
         print("\n📈 --- ANALISIS STATISTIK LENGKAP ---\n")
         
-        # Ambil semua data pemesanan
-        from services.restaurant_service import analisis_laporan
-        laporan = generate_laporan_pemesanan(self.db)
+        # Statistik dibaca dari tabel ringkasan harian
+        analisis = analisis_laporan_harian(self.db)
         
-        if not laporan:
+        if not analisis:
             print("❌ Tidak ada data untuk dianalisis")
             input("\n⏎ Tekan Enter untuk melanjutkan...")
             return
         
-        analisis = analisis_laporan(laporan)
-        
         if analisis:
             print("="*70)
             print("📊 DASHBOARD STATISTIK RESTORAN")
@@ -635,26 +713,37 @@ class RestaurantApp:
         print("="*60 + "\n")
         
         print("Konfigurasi Database:")
-        host = input("Host (default: localhost): ").strip() or 'localhost'
-        database = input("Database (default: restaurant_db): ").strip() or 'restaurant_db'
-        user = input("User (default: root): ").strip() or 'root'
-        password = input("Password: ").strip()
-        
-        db_config = {
-            'host': host,
-            'database': database,
-            'user': user,
-            'password': password
-        }
+        backend = input("Backend mysql/sqlite (default: mysql): ").strip().lower() or 'mysql'
+        
+        if backend == 'sqlite':
+            # Mode offline: satu file database lokal, tanpa server
+            path = input("File database (default: restaurant.db): ").strip() or 'restaurant.db'
+            db_config = {'backend': 'sqlite', 'path': path}
+        else:
+            host = input("Host (default: localhost): ").strip() or 'localhost'
+            database = input("Database (default: restaurant_db): ").strip() or 'restaurant_db'
+            user = input("User (default: root): ").strip() or 'root'
+            password = input("Password: ").strip()
+            
+            db_config = {
+                'host': host,
+                'database': database,
+                'user': user,
+                'password': password
+            }
         
-        self.db = init_database(db_config)
+        self.db = init_database(db_config, cache=True)
         
         if not self.db:
             print("\n✗ Gagal menginisialisasi database!")
-            print("Pastikan MySQL/MariaDB sudah running dan kredensial benar.")
+            print("Pastikan MySQL/MariaDB sudah running dan kredensial benar "
+                  "(atau pilih backend sqlite).")
             input("\nTekan Enter untuk keluar...")
             return
         
+        # Index slot waktu untuk pencarian meja kosong per jam
+        self.availability = AvailabilityIndex.dari_database(self.db)
+        
         print("\n✓ Sistem siap digunakan!")
         input("\nTekan Enter untuk melanjutkan...")
         
@@ -3,17 +3,30 @@ Base Entity Module
 Module ini berisi kelas dasar untuk semua entitas dalam sistem.
 """
 
+from typing import Iterable, List, Sequence
+
 
 class BaseEntity:
     """
     Kelas dasar untuk semua entitas dalam sistem.
     Menyediakan atribut dan metode umum yang dapat diwarisi.
     
+    Entitas memakai __slots__ (tanpa __dict__ per objek) sehingga jutaan
+    baris yang dimuat sebagai objek jauh lebih hemat memori daripada dict.
+    Setiap kelas turunan mendeklarasikan atributnya sendiri di __slots__.
+    
     Attributes:
         id (int): ID unik untuk entitas
         created_at (str): Waktu pembuatan entitas
     """
     
+    __slots__ = ('id', 'created_at')
+    
+    # Nama tabel dan urutan kolom tabel (sama dengan SELECT *), dipakai
+    # from_row/from_rows untuk baris tuple dan DatabaseManager.read_entities
+    TABEL = None
+    KOLOM = ('id', 'created_at')
+    
     def __init__(self, id=None):
         """
         Inisialisasi BaseEntity.
@@ -51,3 +64,74 @@ class BaseEntity:
             str: Informasi entitas
         """
         return f"Entity ID: {self.id}"
+    
+    def _isi(self, row: Sequence):
+        """
+        Mengisi atribut dari tuple berurutan sesuai KOLOM.
+        Di-override kelas turunan dengan satu assignment unpacking (jalur cepat).
+        """
+        for nama, nilai in zip(self.KOLOM, row):
+            setattr(self, nama, nilai)
+    
+    @classmethod
+    def from_row(cls, row, kolom: Sequence[str] = None):
+        """
+        Membuat entitas dari satu baris database tanpa melalui __init__.
+        
+        Args:
+            row (tuple | dict): Baris dari cursor tuple atau cursor dictionary
+            kolom (sequence, optional): Nama kolom untuk baris tuple. Default None
+                (KOLOM kelas, misal hasil SELECT * dari tabelnya). Kolom yang
+                bukan atribut entitas (misal hasil JOIN) diabaikan.
+        
+        Returns:
+            BaseEntity: Objek entitas
+        """
+        obj = cls.__new__(cls)
+        if isinstance(row, dict):
+            for nama in cls.KOLOM:
+                setattr(obj, nama, row.get(nama))
+        elif kolom is None:
+            obj._isi(row)
+        else:
+            for nama, nilai in zip(kolom, row):
+                if nama in cls.KOLOM:
+                    setattr(obj, nama, nilai)
+        return obj
+    
+    @classmethod
+    def from_rows(cls, rows: Iterable, kolom: Sequence[str] = None) -> List:
+        """
+        Membuat list entitas dari banyak baris (lihat from_row).
+        
+        Args:
+            rows (iterable): Baris tuple (atau dict) dari cursor
+            kolom (sequence, optional): Nama kolom untuk baris tuple. Default None (KOLOM).
+        
+        Returns:
+            list: List objek entitas
+        """
+        if kolom is not None and tuple(kolom) != cls.KOLOM:
+            return [cls.from_row(row, kolom) for row in rows]
+        
+        # Jalur cepat: tanpa lookup per kolom, satu unpacking per baris
+        baru = cls.__new__
+        isi = cls._isi
+        hasil = []
+        for row in rows:
+            if isinstance(row, dict):
+                hasil.append(cls.from_row(row))
+                continue
+            obj = baru(cls)
+            isi(obj, row)
+            hasil.append(obj)
+        return hasil
+    
+    def to_dict(self) -> dict:
+        """
+        Mengubah entitas menjadi dictionary dengan key sesuai KOLOM.
+        
+        Returns:
+            dict: Data entitas (atribut yang belum diisi bernilai None)
+        """
+        return {nama: getattr(self, nama, None) for nama in self.KOLOM}
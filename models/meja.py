@@ -17,6 +17,11 @@ class Meja(BaseEntity):
         status (str): Status meja ('tersedia', 'terisi', 'reserved')
     """
     
+    __slots__ = ('nomor_meja', 'kapasitas', 'status')
+    
+    TABEL = 'meja'
+    KOLOM = ('id', 'nomor_meja', 'kapasitas', 'status', 'created_at')
+    
     # Konstanta untuk status meja
     STATUS_TERSEDIA = 'tersedia'
     STATUS_TERISI = 'terisi'
@@ -37,6 +42,10 @@ class Meja(BaseEntity):
         self.kapasitas = kapasitas
         self.status = status
     
+    def _isi(self, row):
+        """Jalur cepat from_row: satu unpacking sesuai KOLOM."""
+        self.id, self.nomor_meja, self.kapasitas, self.status, self.created_at = row
+    
     def display_info(self):
         """
         Override method dari BaseEntity untuk menampilkan info meja.
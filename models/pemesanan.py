@@ -4,6 +4,7 @@ Module ini berisi kelas Pemesanan yang mewarisi dari BaseEntity.
 """
 
 from .base_entity import BaseEntity
+from .tanggal import parse_tanggal
 from datetime import datetime
 
 
@@ -15,18 +16,31 @@ class Pemesanan(BaseEntity):
     Attributes:
         pelanggan_id (int): ID pelanggan yang melakukan pemesanan
         meja_id (int): ID meja yang dipesan
-        tanggal_pemesanan (str): Tanggal dan waktu pemesanan
+        tanggal_pemesanan (datetime): Tanggal dan waktu pemesanan
         jumlah_orang (int): Jumlah orang yang akan datang
         status (str): Status pemesanan ('pending', 'confirmed', 'completed', 'cancelled')
         catatan (str): Catatan tambahan untuk pemesanan
     """
     
+    __slots__ = ('pelanggan_id', 'meja_id', 'tanggal_pemesanan', 'jumlah_orang', 'status', 'catatan')
+    
+    TABEL = 'pemesanan'
+    KOLOM = ('id', 'pelanggan_id', 'meja_id', 'tanggal_pemesanan', 'jumlah_orang',
+             'status', 'catatan', 'created_at')
+    
     # Konstanta untuk status pemesanan
     STATUS_PENDING = 'pending'
     STATUS_CONFIRMED = 'confirmed'
     STATUS_COMPLETED = 'completed'
     STATUS_CANCELLED = 'cancelled'
     
+    # Mesin status: status tujuan -> status asal yang diizinkan
+    TRANSISI = {
+        STATUS_CONFIRMED: (STATUS_PENDING,),
+        STATUS_COMPLETED: (STATUS_CONFIRMED,),
+        STATUS_CANCELLED: (STATUS_PENDING, STATUS_CONFIRMED),
+    }
+    
     def __init__(self, id=None, pelanggan_id=None, meja_id=None, 
                  tanggal_pemesanan=None, jumlah_orang=1, 
                  status=STATUS_PENDING, catatan=""):
@@ -37,7 +51,8 @@ class Pemesanan(BaseEntity):
             id (int, optional): ID pemesanan. Default None.
             pelanggan_id (int, optional): ID pelanggan. Default None.
             meja_id (int, optional): ID meja. Default None.
-            tanggal_pemesanan (str, optional): Tanggal pemesanan. Default None.
+            tanggal_pemesanan (datetime | str, optional): Tanggal pemesanan; teks
+                'YYYY-MM-DD HH:MM:SS' diubah ke datetime. Default None (sekarang).
             jumlah_orang (int, optional): Jumlah orang. Default 1.
             status (str, optional): Status pemesanan. Default 'pending'.
             catatan (str, optional): Catatan tambahan. Default "".
@@ -45,11 +60,20 @@ class Pemesanan(BaseEntity):
         super().__init__(id)
         self.pelanggan_id = pelanggan_id
         self.meja_id = meja_id
-        self.tanggal_pemesanan = tanggal_pemesanan or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        if tanggal_pemesanan:
+            # Teks yang tidak valid disimpan apa adanya agar dilaporkan validate_data
+            self.tanggal_pemesanan = parse_tanggal(tanggal_pemesanan) or tanggal_pemesanan
+        else:
+            self.tanggal_pemesanan = datetime.now().replace(microsecond=0)
         self.jumlah_orang = jumlah_orang
         self.status = status
         self.catatan = catatan
     
+    def _isi(self, row):
+        """Jalur cepat from_row: satu unpacking sesuai KOLOM."""
+        (self.id, self.pelanggan_id, self.meja_id, self.tanggal_pemesanan,
+         self.jumlah_orang, self.status, self.catatan, self.created_at) = row
+    
     def display_info(self):
         """
         Override method dari BaseEntity untuk menampilkan info pemesanan.
@@ -83,6 +107,21 @@ class Pemesanan(BaseEntity):
             return True
         return False
     
+    @classmethod
+    def bisa_transisi(cls, status_asal, status_tujuan):
+        """
+        Memeriksa apakah perubahan status diizinkan mesin status
+        (pending -> confirmed -> completed, pending/confirmed -> cancelled).
+        
+        Args:
+            status_asal (str): Status saat ini
+            status_tujuan (str): Status yang diinginkan
+        
+        Returns:
+            bool: True jika transisi diizinkan
+        """
+        return status_asal in cls.TRANSISI.get(status_tujuan, ())
+    
     def validate_data(self):
         """
         Validasi data pemesanan dengan exception handling.
@@ -110,12 +149,9 @@ class Pemesanan(BaseEntity):
             return False, "Jumlah orang tidak boleh lebih dari 20"
         
         # Validasi format tanggal pemesanan
-        if self.tanggal_pemesanan:
-            try:
-                # Coba parse tanggal untuk memastikan formatnya valid
-                datetime.strptime(str(self.tanggal_pemesanan), '%Y-%m-%d %H:%M:%S')
-            except ValueError:
-                return False, "Format tanggal tidak valid (gunakan: YYYY-MM-DD HH:MM:SS)"
+        if (self.tanggal_pemesanan and not isinstance(self.tanggal_pemesanan, datetime)
+                and parse_tanggal(self.tanggal_pemesanan) is None):
+            return False, "Format tanggal tidak valid (gunakan: YYYY-MM-DD HH:MM:SS)"
         
         # Validasi status harus valid
         valid_status = [self.STATUS_PENDING, self.STATUS_CONFIRMED, 
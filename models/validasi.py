@@ -0,0 +1,110 @@
+"""
+Validasi Module
+Module ini berisi mesin validasi data pelanggan yang dipakai
+Pelanggan.validate_data dan impor massal.
+
+Pola regex dikompilasi sekali saat module dimuat, nilai dinormalisasi
+(strip, pembersihan telepon) satu kali per baris, dan pemeriksaan email
+yang sudah dijamin oleh regex tidak diulang. Hasilnya berupa kode error
+(int) sehingga validate_many bisa memvalidasi ratusan ribu baris tanpa
+membuat string pesan untuk setiap baris; pesan diambil dari PESAN.
+"""
+
+import re
+from typing import Iterable, List
+
+# ========== KODE ERROR ==========
+VALID = 0
+NAMA_KOSONG = 1
+NAMA_MENGANDUNG_ANGKA = 2
+NAMA_TERLALU_PENDEK = 3
+TELEPON_KOSONG = 4
+TELEPON_AWALAN = 5
+TELEPON_BUKAN_ANGKA = 6
+TELEPON_PANJANG = 7
+EMAIL_TANPA_AT_TITIK = 8
+EMAIL_FORMAT = 9
+
+PESAN = {
+    VALID: "",
+    NAMA_KOSONG: "Nama pelanggan tidak boleh kosong",
+    NAMA_MENGANDUNG_ANGKA: "Nama pelanggan tidak boleh mengandung angka",
+    NAMA_TERLALU_PENDEK: "Nama pelanggan minimal 2 karakter",
+    TELEPON_KOSONG: "Nomor telepon tidak boleh kosong",
+    TELEPON_AWALAN: "Nomor telepon harus dimulai dengan 628, 08, atau +628",
+    TELEPON_BUKAN_ANGKA: "Nomor telepon hanya boleh berisi angka",
+    TELEPON_PANJANG: "Nomor telepon harus antara 10-15 digit",
+    EMAIL_TANPA_AT_TITIK: "Email harus mengandung karakter @ dan . (titik)",
+    EMAIL_FORMAT: "Format email tidak valid (contoh: nama@domain.com)",
+}
+
+_ANGKA = re.compile(r'\d')
+_PEMISAH_TELEPON = re.compile(r'[\s\-\(\)]')
+# Regex ini sekaligus menjamin tepat satu @, @ tidak di awal/akhir, dan ada
+# titik setelah @ (pemeriksaan terpisah versi lama tidak pernah tercapai)
+_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_AWALAN_TELEPON = ('628', '08', '+628')
+
+
+def validasi_pelanggan(nama: str, telepon: str, email: str = "") -> int:
+    """
+    Memvalidasi satu data pelanggan.
+
+    Args:
+        nama (str): Nama pelanggan
+        telepon (str): Nomor telepon
+        email (str, optional): Email (opsional). Default "".
+
+    Returns:
+        int: VALID (0) atau kode error pertama yang ditemukan (lihat PESAN)
+    """
+    if not nama:
+        return NAMA_KOSONG
+    nama_bersih = nama.strip()
+    if not nama_bersih:
+        return NAMA_KOSONG
+    if _ANGKA.search(nama):
+        return NAMA_MENGANDUNG_ANGKA
+    if len(nama_bersih) < 2:
+        return NAMA_TERLALU_PENDEK
+
+    if not telepon or not telepon.strip():
+        return TELEPON_KOSONG
+    telepon_bersih = _PEMISAH_TELEPON.sub('', telepon)
+    if not telepon_bersih.startswith(_AWALAN_TELEPON):
+        return TELEPON_AWALAN
+    digit = telepon_bersih.replace('+', '')
+    if not digit.isdigit():
+        return TELEPON_BUKAN_ANGKA
+    if not 10 <= len(digit) <= 15:
+        return TELEPON_PANJANG
+
+    if email and email.strip():
+        if '@' not in email or '.' not in email:
+            return EMAIL_TANPA_AT_TITIK
+        if not _EMAIL.match(email):
+            return EMAIL_FORMAT
+
+    return VALID
+
+
+def validate_many(rows: Iterable) -> List[int]:
+    """
+    Memvalidasi banyak data pelanggan sekaligus (misal impor 200 ribu baris).
+
+    Args:
+        rows (iterable): Tuple (nama, telepon[, email]) atau dictionary dengan
+            key 'nama', 'telepon', dan opsional 'email'
+
+    Returns:
+        list: Kode per baris sesuai urutan input (VALID = 0)
+    """
+    validasi = validasi_pelanggan
+    hasil = []
+    for row in rows:
+        if isinstance(row, dict):
+            hasil.append(validasi(row.get('nama', ""), row.get('telepon', ""),
+                                  row.get('email') or ""))
+        else:
+            hasil.append(validasi(*row))
+    return hasil
@@ -0,0 +1,762 @@
+"""
+Server HTTP JSON Sistem Pemesanan Restoran
+Membuka fungsi service pelanggan, meja, pemesanan, dan laporan lewat HTTP
+untuk widget booking online dan aplikasi tablet.
+
+Satu proses melayani banyak klien:
+  - request dilayani thread pool berukuran tetap (bukan satu thread per koneksi)
+  - koneksi database dipinjam dari connection pool dan tetap terbuka
+  - koneksi HTTP/1.1 keep-alive dipakai ulang oleh klien; koneksi yang diam
+    menunggu di selector, bukan di thread worker
+  - laporan besar dialirkan dengan chunked transfer encoding sehingga
+    memori server tidak bergantung pada jumlah baris
+
+Cara menjalankan:
+    python server.py --backend sqlite --path restaurant.db --port 8080
+
+Endpoint:
+    GET    /pelanggan?after_id=&page_size=     GET /pelanggan/<id>
+    POST   /pelanggan                          PUT /pelanggan/<id>   DELETE /pelanggan/<id>
+    GET    /meja?status=                       GET /meja/<id>
+    GET    /meja/tersedia?waktu=&durasi_menit=
+    POST   /meja                               PUT /meja/<id>        DELETE /meja/<id>
+    GET    /pemesanan?status=&after_date=&after_id=&page_size=
+    GET    /pemesanan/<id>                     POST /pemesanan       DELETE /pemesanan/<id>
+    POST   /pemesanan/<id>/konfirmasi|selesaikan|batalkan
+    GET    /laporan?status=&tanggal_mulai=&tanggal_akhir=   (streaming)
+    GET    /laporan/statistik?...&sumber=harian
+    GET    /laporan/harian?...
+"""
+
+import argparse
+import io
+import json
+import os
+import queue
+import re
+import selectors
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Callable, Dict, Iterator, List, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from database.db_manager import DatabaseManager, DB_ERRORS
+from services import restaurant_service as service
+
+
+class ApiError(Exception):
+    """
+    Kesalahan request yang dikirim ke klien sebagai {"error": pesan}.
+
+    Attributes:
+        status (int): Kode status HTTP
+        pesan (str): Pesan kesalahan
+    """
+
+    def __init__(self, status: int, pesan: str):
+        super().__init__(pesan)
+        self.status = status
+        self.pesan = pesan
+
+
+class PenangkapPesan(io.TextIOBase):
+    """
+    Pengganti sys.stdout yang menampung pesan print milik thread yang sedang
+    menangkap, sehingga pesan '✗ ...' dari fungsi service bisa dikirim ke klien.
+    Thread lain tetap menulis ke stdout asli.
+    """
+
+    def __init__(self, asli):
+        self.asli = asli
+        self._lokal = threading.local()
+
+    def write(self, teks: str) -> int:
+        buffer = getattr(self._lokal, 'buffer', None)
+        if buffer is None:
+            return self.asli.write(teks)
+        buffer.append(teks)
+        return len(teks)
+
+    def flush(self):
+        self.asli.flush()
+
+    def mulai(self):
+        """Mulai menampung pesan untuk thread ini."""
+        self._lokal.buffer = []
+
+    def selesai(self) -> List[str]:
+        """
+        Berhenti menampung dan mengembalikan baris pesan yang tertampung.
+
+        Returns:
+            list: Baris pesan tidak kosong, sesuai urutan
+        """
+        buffer, self._lokal.buffer = self._lokal.buffer or [], None
+        return [baris.strip() for baris in "".join(buffer).splitlines() if baris.strip()]
+
+
+def ke_json(nilai):
+    """Mengubah tipe dari database (datetime, date, Decimal) ke tipe JSON."""
+    if isinstance(nilai, (datetime, date)):
+        return nilai.isoformat(sep=' ') if isinstance(nilai, datetime) else nilai.isoformat()
+    if isinstance(nilai, Decimal):
+        return float(nilai)
+    raise TypeError(f"Tipe {type(nilai).__name__} tidak bisa dijadikan JSON")
+
+
+def _encode(data) -> bytes:
+    return json.dumps(data, default=ke_json, ensure_ascii=False).encode('utf-8')
+
+
+# ========== ROUTING ==========
+
+# List (method, regex path, fungsi endpoint); diisi oleh dekorator rute
+RUTE: List[Tuple[str, re.Pattern, Callable]] = []
+
+
+def rute(method: str, pola: str):
+    """
+    Mendaftarkan fungsi endpoint.
+
+    Fungsi endpoint dipanggil dengan (request, *grup_regex) dan mengembalikan
+    (status, data), atau iterator baris untuk respons streaming.
+    """
+    def daftar(fungsi):
+        RUTE.append((method, re.compile(pola + r'/?$'), fungsi))
+        return fungsi
+    return daftar
+
+
+class Request:
+    """
+    Data satu request untuk fungsi endpoint.
+
+    Attributes:
+        db (DatabaseManager): Database bersama milik server
+        query (dict): Parameter query string (nilai terakhir per key)
+        body (dict): Body JSON, atau {} jika kosong
+    """
+
+    def __init__(self, db: DatabaseManager, query: Dict, body: Dict, penangkap: PenangkapPesan):
+        self.db = db
+        self.query = query
+        self.body = body
+        self._penangkap = penangkap
+
+    def param(self, nama: str, tipe=str, default=None):
+        """Mengambil parameter query string dengan konversi tipe."""
+        return self._konversi(self.query.get(nama), nama, tipe, default)
+
+    def field(self, nama: str, tipe=str, default=None, wajib: bool = False):
+        """Mengambil field body JSON dengan konversi tipe."""
+        nilai = self.body.get(nama)
+        if nilai is None and wajib:
+            raise ApiError(400, f"Field '{nama}' wajib diisi")
+        return self._konversi(nilai, nama, tipe, default)
+
+    @staticmethod
+    def _konversi(nilai, nama: str, tipe, default):
+        if nilai is None or nilai == "":
+            return default
+        try:
+            return tipe(nilai)
+        except (TypeError, ValueError):
+            raise ApiError(400, f"Nilai '{nama}' tidak valid")
+
+    def panggil(self, fungsi: Callable, *args, gagal_status: int = 400,
+                boleh_kosong: bool = False, **kwargs):
+        """
+        Memanggil fungsi service dan mengubah hasil None/False menjadi ApiError
+        dengan pesan '✗ ...' terakhir yang dicetak fungsi tersebut.
+
+        Args:
+            fungsi (callable): Fungsi service yang menerima db sebagai argumen pertama
+            gagal_status (int, optional): Status HTTP jika gagal. Default 400.
+                Pesan validasi selalu 400 dan pesan 'tidak ditemukan' selalu 404.
+            boleh_kosong (bool, optional): Hasil None bukan kesalahan (misal
+                daftar kosong). Default False.
+
+        Returns:
+            Any: Hasil fungsi service
+        """
+        self._penangkap.mulai()
+        try:
+            hasil = fungsi(self.db, *args, **kwargs)
+        finally:
+            pesan = self._penangkap.selesai()
+        if (hasil is None and not boleh_kosong) or hasil is False:
+            teks = next((p for p in reversed(pesan) if p.startswith('✗')),
+                        pesan[-1] if pesan else "✗ Gagal memproses request")
+            teks = teks.lstrip('✗ ').strip()
+            if teks.startswith("Validasi gagal"):
+                gagal_status = 400
+            elif "tidak ditemukan" in teks:
+                gagal_status = 404
+            raise ApiError(gagal_status, teks)
+        return hasil
+
+
+# ---------- Pelanggan ----------
+
+@rute('GET', r'/pelanggan')
+def daftar_pelanggan(req: Request):
+    return 200, req.panggil(service.lihat_pelanggan_halaman, req.param('after_id', int),
+                            req.param('page_size', int, 20))
+
+
+@rute('GET', r'/pelanggan/(\d+)')
+def detail_pelanggan(req: Request, pelanggan_id: str):
+    return 200, req.panggil(service.lihat_pelanggan, int(pelanggan_id))[0]
+
+
+@rute('POST', r'/pelanggan')
+def buat_pelanggan(req: Request):
+    pelanggan_id = req.panggil(service.tambah_pelanggan, req.field('nama', default=""),
+                               req.field('telepon', default=""), req.field('email', default=""))
+    return 201, {'id': pelanggan_id}
+
+
+@rute('PUT', r'/pelanggan/(\d+)')
+def ubah_pelanggan(req: Request, pelanggan_id: str):
+    req.panggil(service.update_pelanggan, int(pelanggan_id), req.field('nama', default=""),
+                req.field('telepon', default=""), req.field('email', default=""))
+    return 200, {'id': int(pelanggan_id)}
+
+
+@rute('DELETE', r'/pelanggan/(\d+)')
+def hapus_pelanggan(req: Request, pelanggan_id: str):
+    req.panggil(service.hapus_pelanggan, int(pelanggan_id), gagal_status=404)
+    return 200, {'id': int(pelanggan_id)}
+
+
+# ---------- Meja ----------
+
+@rute('GET', r'/meja')
+def daftar_meja(req: Request):
+    # Daftar kosong bukan kesalahan bagi klien
+    return 200, req.db.read_meja(status=req.param('status')) or []
+
+
+@rute('GET', r'/meja/tersedia')
+def meja_tersedia(req: Request):
+    durasi = req.param('durasi_menit', int)
+    try:
+        meja = req.panggil(service.lihat_meja_tersedia, req.param('waktu'),
+                           timedelta(minutes=durasi) if durasi else None, boleh_kosong=True)
+    except ValueError:
+        raise ApiError(400, "Format waktu tidak valid (gunakan: YYYY-MM-DD HH:MM:SS)")
+    return 200, meja or []
+
+
+@rute('GET', r'/meja/(\d+)')
+def detail_meja(req: Request, meja_id: str):
+    return 200, req.panggil(service.lihat_meja, int(meja_id))[0]
+
+
+@rute('POST', r'/meja')
+def buat_meja(req: Request):
+    meja_id = req.panggil(service.tambah_meja, req.field('nomor_meja', int, wajib=True),
+                          req.field('kapasitas', int, wajib=True),
+                          req.field('status', default='tersedia'))
+    return 201, {'id': meja_id}
+
+
+@rute('PUT', r'/meja/(\d+)')
+def ubah_meja(req: Request, meja_id: str):
+    req.panggil(service.update_meja, int(meja_id), req.field('nomor_meja', int, wajib=True),
+                req.field('kapasitas', int, wajib=True), req.field('status', default='tersedia'))
+    return 200, {'id': int(meja_id)}
+
+
+@rute('DELETE', r'/meja/(\d+)')
+def hapus_meja(req: Request, meja_id: str):
+    req.panggil(service.hapus_meja, int(meja_id), gagal_status=404)
+    return 200, {'id': int(meja_id)}
+
+
+# ---------- Pemesanan ----------
+
+@rute('GET', r'/pemesanan')
+def daftar_pemesanan(req: Request):
+    return 200, req.panggil(service.lihat_pemesanan_halaman, req.param('after_date'),
+                            req.param('after_id', int), req.param('page_size', int, 20),
+                            req.param('status'))
+
+
+@rute('GET', r'/pemesanan/(\d+)')
+def detail_pemesanan(req: Request, pemesanan_id: str):
+    return 200, req.panggil(service.lihat_pemesanan, int(pemesanan_id))[0]
+
+
+@rute('POST', r'/pemesanan')
+def buat_pemesanan(req: Request):
+    """Tanpa meja_id, meja terkecil yang cukup dipilih otomatis."""
+    pelanggan_id = req.field('pelanggan_id', int, wajib=True)
+    tanggal = req.field('tanggal_pemesanan', wajib=True)
+    jumlah_orang = req.field('jumlah_orang', int, wajib=True)
+    catatan = req.field('catatan', default="")
+    meja_id = req.field('meja_id', int)
+
+    if meja_id is None:
+        pemesanan_id = req.panggil(service.tambah_pemesanan_otomatis, pelanggan_id, tanggal,
+                                   jumlah_orang, catatan, gagal_status=409)
+    else:
+        pemesanan_id = req.panggil(service.tambah_pemesanan, pelanggan_id, meja_id, tanggal,
+                                   jumlah_orang, catatan, gagal_status=409)
+    return 201, {'id': pemesanan_id}
+
+
+AKSI_PEMESANAN = {
+    'konfirmasi': service.konfirmasi_pemesanan,
+    'selesaikan': service.selesaikan_pemesanan,
+    'batalkan': service.batalkan_pemesanan,
+}
+
+
+@rute('POST', r'/pemesanan/(\d+)/(konfirmasi|selesaikan|batalkan)')
+def aksi_pemesanan(req: Request, pemesanan_id: str, aksi: str):
+    req.panggil(AKSI_PEMESANAN[aksi], int(pemesanan_id), gagal_status=409)
+    return 200, req.db.read_pemesanan(int(pemesanan_id))[0]
+
+
+@rute('DELETE', r'/pemesanan/(\d+)')
+def hapus_pemesanan(req: Request, pemesanan_id: str):
+    req.panggil(service.hapus_pemesanan, int(pemesanan_id), gagal_status=404)
+    return 200, {'id': int(pemesanan_id)}
+
+
+# ---------- Laporan ----------
+
+def _filter_laporan(req: Request) -> Dict:
+    return {'status': req.param('status'), 'tanggal_mulai': req.param('tanggal_mulai'),
+            'tanggal_akhir': req.param('tanggal_akhir')}
+
+
+@rute('GET', r'/laporan')
+def laporan(req: Request):
+    """Baris laporan dialirkan; tidak pernah dimuat semuanya ke memori."""
+    return service.generate_laporan_stream(req.db, batch_size=req.param('batch_size', int, 1000),
+                                           **_filter_laporan(req))
+
+
+@rute('GET', r'/laporan/statistik')
+def statistik(req: Request):
+    fungsi = (service.analisis_laporan_harian if req.param('sumber') == 'harian'
+              else service.analisis_laporan_db)
+    return 200, req.panggil(fungsi, gagal_status=404, **_filter_laporan(req))
+
+
+@rute('GET', r'/laporan/harian')
+def laporan_harian(req: Request):
+    return 200, req.panggil(service.ringkasan_harian, gagal_status=404, **_filter_laporan(req))
+
+
+# ========== SERVER ==========
+
+class RestaurantRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handler HTTP: mencocokkan rute, menjalankan endpoint, dan menulis JSON.
+    """
+
+    # HTTP/1.1 agar klien bisa memakai ulang koneksi (keep-alive)
+    protocol_version = "HTTP/1.1"
+    server_version = "RestaurantAPI/1.0"
+    # Kesalahan dari http.server sendiri (method tidak dikenal, request rusak) juga JSON
+    error_content_type = 'application/json; charset=utf-8'
+    error_message_format = '{"error": "%(message)s"}'
+    # Batas waktu membaca request dan lama koneksi keep-alive boleh diam (detik)
+    timeout = 30
+    # Jumlah baris laporan per chunk HTTP
+    BARIS_PER_CHUNK = 200
+
+    def handle(self):
+        """
+        Melayani request selama request berikutnya sudah tersedia di koneksi.
+
+        Jika koneksi keep-alive masih terbuka tetapi belum ada request baru,
+        handler ditandai `parkir` dan kembali tanpa menunggu, sehingga worker
+        bebas melayani koneksi lain. Server memantau koneksi yang diparkir dan
+        memanggil handle() lagi saat request berikutnya bisa dibaca.
+        """
+        self.parkir = False
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection:
+            if not self._ada_request():
+                self.parkir = True
+                return
+            self.handle_one_request()
+
+    def _ada_request(self) -> bool:
+        """Memeriksa tanpa menunggu apakah ada data request di buffer atau socket."""
+        self.connection.setblocking(False)
+        try:
+            return bool(self.rfile.peek(1))
+        except OSError:
+            # Koneksi bermasalah; biarkan handle_one_request berikutnya menanganinya
+            return True
+        finally:
+            self.connection.settimeout(self.timeout)
+
+    def finish(self):
+        if getattr(self, 'parkir', False):
+            # Stream tetap terbuka untuk request berikutnya di koneksi ini
+            self.wfile.flush()
+            return
+        super().finish()
+
+    def do_GET(self):
+        self._layani('GET')
+
+    def do_POST(self):
+        self._layani('POST')
+
+    def do_PUT(self):
+        self._layani('PUT')
+
+    def do_DELETE(self):
+        self._layani('DELETE')
+
+    def _layani(self, method: str):
+        url = urlsplit(self.path)
+        try:
+            endpoint, grup = self._cari_rute(method, url.path)
+            query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+            req = Request(self.server.db, query, self._baca_body(), self.server.penangkap)
+            hasil = endpoint(req, *grup)
+        except ApiError as e:
+            self._kirim_json(e.status, {'error': e.pesan})
+            return
+        except Exception as e:
+            self.log_error("Error pada %s %s: %r", method, self.path, e)
+            self._kirim_json(500, {'error': "Kesalahan internal server"})
+            return
+
+        if isinstance(hasil, tuple):
+            self._kirim_json(*hasil)
+        else:
+            self._kirim_stream(hasil)
+
+    def _cari_rute(self, method: str, path: str) -> Tuple[Callable, tuple]:
+        path_cocok = False
+        for method_rute, pola, endpoint in RUTE:
+            cocok = pola.match(path)
+            if cocok:
+                if method_rute == method:
+                    return endpoint, cocok.groups()
+                path_cocok = True
+        if path_cocok:
+            raise ApiError(405, f"Method {method} tidak didukung untuk {path}")
+        raise ApiError(404, f"Endpoint {path} tidak ditemukan")
+
+    def _baca_body(self) -> Dict:
+        panjang = int(self.headers.get('Content-Length') or 0)
+        if not panjang:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(panjang))
+        except ValueError:
+            raise ApiError(400, "Body bukan JSON yang valid")
+        if not isinstance(body, dict):
+            raise ApiError(400, "Body harus berupa objek JSON")
+        return body
+
+    def _kirim_json(self, status: int, data):
+        isi = _encode(data)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(isi)))
+        self.end_headers()
+        self.wfile.write(isi)
+
+    def _kirim_stream(self, rows: Iterator[Dict]):
+        """
+        Mengirim baris sebagai array JSON dengan chunked transfer encoding
+        (HTTP/1.0: tanpa chunk, koneksi ditutup di akhir respons).
+
+        Query gagal sebelum baris pertama menghasilkan respons 500. Jika gagal
+        di tengah aliran, status 200 sudah terkirim; koneksi diputus tanpa
+        penutup array dan chunk terakhir sehingga klien mendapat respons yang
+        tidak lengkap, bukan laporan terpotong yang tampak valid.
+        """
+        rows = iter(rows)
+        try:
+            self._tulis_stream(rows)
+        except ConnectionError as e:
+            # BrokenPipe/ConnectionReset: klien putus di tengah aliran
+            self.log_error("Klien putus saat laporan %s dikirim: %r", self.path, e)
+            self.close_connection = True
+        finally:
+            # Generator ditutup agar koneksi database kembali ke pool
+            close = getattr(rows, 'close', None)
+            if close is not None:
+                close()
+
+    def _tulis_stream(self, rows: Iterator[Dict]):
+        try:
+            # Query baru dijalankan saat baris pertama diminta
+            pertama = next(rows, None)
+        except DB_ERRORS as e:
+            self.log_error("Error pada laporan %s: %r", self.path, e)
+            self._kirim_json(500, {'error': "Gagal membaca data laporan"})
+            return
+
+        chunked = self.request_version == 'HTTP/1.1'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        if chunked:
+            self.send_header('Transfer-Encoding', 'chunked')
+        else:
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        self.end_headers()
+
+        def tulis(isi: bytes):
+            if chunked:
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(isi), isi))
+            else:
+                self.wfile.write(isi)
+
+        batch = [b"["]
+        if pertama is not None:
+            batch.append(_encode(pertama))
+            try:
+                for row in rows:
+                    batch.append(b"," + _encode(row))
+                    if len(batch) >= self.BARIS_PER_CHUNK:
+                        tulis(b"".join(batch))
+                        batch = []
+            except DB_ERRORS as e:
+                self.log_error("Laporan %s terhenti di tengah aliran: %r", self.path, e)
+                self.close_connection = True
+                return
+        batch.append(b"]")
+        tulis(b"".join(batch))
+        if chunked:
+            self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format: str, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+class RestaurantHTTPServer(HTTPServer):
+    """
+    HTTPServer yang melayani koneksi di thread pool berukuran tetap.
+
+    Berbeda dengan ThreadingHTTPServer (satu thread baru per koneksi), jumlah
+    request yang berjalan bersamaan dibatasi `workers`; koneksi lain menunggu
+    di antrian. Sebaiknya workers sama dengan pool_size database.
+
+    Koneksi keep-alive yang diam tidak menahan worker: koneksi tersebut
+    diparkir di satu thread selector dan baru dikirim lagi ke thread pool saat
+    request berikutnya bisa dibaca. Koneksi yang diam lebih lama dari
+    RestaurantRequestHandler.timeout ditutup.
+
+    Attributes:
+        db (DatabaseManager): Database bersama untuk semua request
+        workers (int): Jumlah thread worker
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, alamat: Tuple[str, int], db: DatabaseManager, workers: int = 8,
+                 quiet: bool = False):
+        """
+        Inisialisasi server.
+
+        Args:
+            alamat (tuple): (host, port); port 0 memilih port bebas
+            db (DatabaseManager): Database yang sudah terkoneksi
+            workers (int, optional): Jumlah thread worker. Default 8.
+            quiet (bool, optional): Matikan log akses. Default False.
+        """
+        super().__init__(alamat, RestaurantRequestHandler)
+        self.db = db
+        self.workers = workers
+        self.quiet = quiet
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="http-worker")
+        self._stdout_asli = sys.stdout
+        self.penangkap = PenangkapPesan(sys.stdout)
+        sys.stdout = self.penangkap
+
+        # Koneksi keep-alive yang diam; hanya thread selector yang mengubah selector
+        self._selector = selectors.DefaultSelector()
+        self._parkir_baru = queue.SimpleQueue()
+        self._lock_parkir = threading.Lock()
+        self._berhenti = False
+        self._bangun_baca, self._bangun_tulis = socket.socketpair()
+        self._bangun_baca.setblocking(False)
+        self._selector.register(self._bangun_baca, selectors.EVENT_READ)
+        self._thread_parkir = threading.Thread(target=self._awasi_parkir,
+                                               name="http-keepalive", daemon=True)
+        self._thread_parkir.start()
+
+    def process_request(self, request, client_address):
+        self._executor.submit(self._proses, request, client_address)
+
+    def _proses(self, request, client_address):
+        try:
+            handler = self.RequestHandlerClass(request, client_address, self)
+        except Exception:
+            self.handle_error(request, client_address)
+            self.shutdown_request(request)
+            return
+        self._selesai(handler)
+
+    def _lanjut(self, handler: RestaurantRequestHandler):
+        """Melayani request berikutnya pada koneksi keep-alive yang diparkir."""
+        try:
+            try:
+                handler.handle()
+            finally:
+                handler.finish()
+        except Exception:
+            handler.parkir = False
+            self.handle_error(handler.request, handler.client_address)
+        self._selesai(handler)
+
+    def _selesai(self, handler: RestaurantRequestHandler):
+        """Memarkir koneksi keep-alive yang masih terbuka, atau menutupnya."""
+        with self._lock_parkir:
+            if handler.parkir and not self._berhenti:
+                self._parkir_baru.put(handler)
+                self._bangun_tulis.send(b"\0")
+                return
+        self.shutdown_request(handler.request)
+
+    def _tutup_parkir(self, handler: RestaurantRequestHandler):
+        handler.parkir = False
+        try:
+            handler.finish()
+        except OSError:
+            pass
+        self.shutdown_request(handler.request)
+
+    def _awasi_parkir(self):
+        """
+        Loop thread selector: mendaftarkan koneksi yang baru diparkir, mengirim
+        koneksi yang sudah bisa dibaca ke thread pool, dan menutup koneksi yang
+        diam melewati batas waktu.
+        """
+        diam_sejak: Dict[RestaurantRequestHandler, float] = {}
+        while not self._berhenti:
+            while True:
+                try:
+                    handler = self._parkir_baru.get_nowait()
+                except queue.Empty:
+                    break
+                self._selector.register(handler.connection, selectors.EVENT_READ, handler)
+                diam_sejak[handler] = time.monotonic()
+
+            for key, _ in self._selector.select(timeout=1.0):
+                if key.fileobj is self._bangun_baca:
+                    try:
+                        self._bangun_baca.recv(4096)
+                    except BlockingIOError:
+                        pass
+                    continue
+                self._selector.unregister(key.fileobj)
+                del diam_sejak[key.data]
+                self._executor.submit(self._lanjut, key.data)
+
+            sekarang = time.monotonic()
+            for handler, sejak in list(diam_sejak.items()):
+                if sekarang - sejak > handler.timeout:
+                    self._selector.unregister(handler.connection)
+                    del diam_sejak[handler]
+                    self._tutup_parkir(handler)
+
+        # Server berhenti: tutup semua koneksi yang masih diparkir
+        with self._lock_parkir:
+            while True:
+                try:
+                    diam_sejak[self._parkir_baru.get_nowait()] = 0.0
+                except queue.Empty:
+                    break
+        for handler in diam_sejak:
+            self._tutup_parkir(handler)
+        self._selector.close()
+
+    def server_close(self):
+        super().server_close()
+        with self._lock_parkir:
+            self._berhenti = True
+            self._bangun_tulis.send(b"\0")
+        self._thread_parkir.join()
+        self._executor.shutdown(wait=True)
+        self._bangun_baca.close()
+        self._bangun_tulis.close()
+        if sys.stdout is self.penangkap:
+            sys.stdout = self._stdout_asli
+
+
+def buat_server(db: DatabaseManager, host: str = '127.0.0.1', port: int = 8080,
+                workers: int = None, quiet: bool = False) -> RestaurantHTTPServer:
+    """
+    Membuat server HTTP untuk database yang sudah terkoneksi.
+
+    Args:
+        db (DatabaseManager): Database yang sudah terkoneksi
+        host (str, optional): Alamat bind. Default '127.0.0.1'.
+        port (int, optional): Port. Default 8080.
+        workers (int, optional): Jumlah thread worker. Default None (pool_size db).
+            Selalu 1 jika db memakai satu koneksi bersama (tanpa pool, misal
+            SQLite ':memory:').
+        quiet (bool, optional): Matikan log akses. Default False.
+
+    Returns:
+        RestaurantHTTPServer: Server yang siap serve_forever()
+    """
+    # Tanpa pool, koneksi bersama tidak boleh dipakai dua thread sekaligus
+    workers = (workers or db.pool_size) if db.pool else 1
+    return RestaurantHTTPServer((host, port), db, workers, quiet)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Server HTTP JSON pemesanan restoran")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=8,
+                        help="Thread worker sekaligus ukuran connection pool")
+    parser.add_argument('--backend', choices=['mysql', 'sqlite'], default='mysql')
+    parser.add_argument('--path', default='restaurant.db', help="File database SQLite")
+    parser.add_argument('--db-host', default=os.environ.get('RESTAURANT_DB_HOST', 'localhost'))
+    parser.add_argument('--db-name', default=os.environ.get('RESTAURANT_DB_NAME', 'restaurant_db'))
+    parser.add_argument('--db-user', default=os.environ.get('RESTAURANT_DB_USER', 'root'))
+    parser.add_argument('--cache', action='store_true', help="Cache meja dan pelanggan")
+    parser.add_argument('--quiet', action='store_true')
+    args = parser.parse_args()
+
+    if args.backend == 'sqlite':
+        db_config = {'backend': 'sqlite', 'path': args.path}
+    else:
+        db_config = {'host': args.db_host, 'database': args.db_name, 'user': args.db_user,
+                     'password': os.environ.get('RESTAURANT_DB_PASSWORD', '')}
+    db_config['pool_size'] = args.workers
+
+    db = service.init_database(db_config, cache=args.cache)
+    if not db:
+        sys.exit(1)
+
+    server = buat_server(db, args.host, args.port, args.workers, args.quiet)
+    print(f"✓ Server berjalan di http://{args.host}:{server.server_port} "
+          f"({server.workers} worker)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Server dihentikan")
+    finally:
+        server.server_close()
+        db.disconnect()
+
+
+if __name__ == '__main__':
+    main()
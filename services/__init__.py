@@ -4,12 +4,23 @@ Berisi modul untuk logika bisnis aplikasi.
 """
 
 from .restaurant_service import *
+from .aggregation import agregasi_paralel
+from .sweeper import NoShowSweeper
 
 __all__ = [
     'init_database',
+    'tambah_pelanggan_bulk', 'tambah_meja_bulk', 'tambah_pemesanan_bulk',
     'tambah_pelanggan', 'lihat_pelanggan', 'update_pelanggan', 'hapus_pelanggan',
+    'lihat_pelanggan_halaman',
     'tambah_meja', 'lihat_meja', 'update_meja', 'hapus_meja', 'lihat_meja_tersedia',
-    'tambah_pemesanan', 'lihat_pemesanan', 'konfirmasi_pemesanan', 
+    'tambah_pemesanan', 'tambah_pemesanan_otomatis', 'tambah_pemesanan_batch',
+    'lihat_pemesanan', 'lihat_pemesanan_halaman', 'konfirmasi_pemesanan', 
     'selesaikan_pemesanan', 'batalkan_pemesanan', 'hapus_pemesanan',
-    'generate_laporan_pemesanan', 'print_laporan'
+    'selesaikan_pemesanan_banyak', 'tutup_hari', 'batalkan_no_show',
+    'generate_laporan_pemesanan', 'generate_laporan_stream',
+    'analisis_laporan', 'analisis_laporan_db', 'analisis_laporan_harian',
+    'analisis_operasional',
+    'ringkasan_harian', 'print_laporan',
+    'AvailabilityIndex', 'TableAssigner', 'ReportAggregator', 'agregasi_paralel',
+    'NoShowSweeper'
 ]
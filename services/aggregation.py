@@ -0,0 +1,223 @@
+"""
+Aggregation Module
+Module ini berisi agregator statistik pemesanan satu kali jalan.
+
+Agregator menerima baris dari sumber apa pun (cursor database, file CSV
+ekspor, log replay) dan hanya menyimpan penghitung, sehingga memori
+bergantung pada jumlah status/meja/pelanggan yang berbeda, bukan jumlah
+baris. Hasil parsial dari beberapa shard (misal satu file per hari) dapat
+dihitung paralel lalu digabung dengan gabung().
+"""
+
+import heapq
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class ReportAggregator:
+    """
+    Penghitung statistik pemesanan yang dapat digabung.
+
+    Attributes:
+        total_pemesanan (int): Jumlah baris yang sudah dihitung
+        total_orang (int): Total jumlah orang
+        min_orang (int): Jumlah orang terkecil per pemesanan
+        max_orang (int): Jumlah orang terbesar per pemesanan
+        status_count (dict): Jumlah pemesanan per status
+        meja_count (dict): Jumlah pemesanan per meja
+        pelanggan_count (dict): Jumlah pemesanan per pelanggan
+    """
+
+    def __init__(self, kunci_meja: str = 'nomor_meja',
+                 kunci_pelanggan: str = 'nama_pelanggan'):
+        """
+        Inisialisasi ReportAggregator kosong.
+
+        Args:
+            kunci_meja (str, optional): Kolom pengenal meja. Default 'nomor_meja'.
+            kunci_pelanggan (str, optional): Kolom pengenal pelanggan. Default 'nama_pelanggan'.
+        """
+        self.kunci_meja = kunci_meja
+        self.kunci_pelanggan = kunci_pelanggan
+        self.total_pemesanan = 0
+        self.total_orang = 0
+        self.min_orang = None
+        self.max_orang = None
+        self.status_count: Dict[str, int] = {}
+        self.meja_count: Dict = {}
+        self.pelanggan_count: Dict = {}
+
+    def __len__(self):
+        return self.total_pemesanan
+
+    def tambah(self, item: Dict):
+        """
+        Menghitung satu baris pemesanan.
+
+        Args:
+            item (dict): Baris dengan jumlah_orang, status, dan kolom kunci
+                meja/pelanggan (nilai string dari CSV juga diterima)
+        """
+        orang = int(item['jumlah_orang'])
+        self.total_pemesanan += 1
+        self.total_orang += orang
+        if self.min_orang is None or orang < self.min_orang:
+            self.min_orang = orang
+        if self.max_orang is None or orang > self.max_orang:
+            self.max_orang = orang
+
+        status = item['status']
+        self.status_count[status] = self.status_count.get(status, 0) + 1
+        meja = item[self.kunci_meja]
+        self.meja_count[meja] = self.meja_count.get(meja, 0) + 1
+        pelanggan = item[self.kunci_pelanggan]
+        self.pelanggan_count[pelanggan] = self.pelanggan_count.get(pelanggan, 0) + 1
+
+    def tambah_semua(self, rows: Iterable[Dict]) -> 'ReportAggregator':
+        """
+        Menghitung semua baris dari iterable dalam satu kali loop.
+
+        Args:
+            rows (iterable): List atau iterator baris pemesanan
+
+        Returns:
+            ReportAggregator: self, agar bisa dirangkai
+        """
+        for item in rows:
+            self.tambah(item)
+        return self
+
+    def tambah_kolom(self, kolom: Dict[str, list]) -> 'ReportAggregator':
+        """
+        Menghitung baris dalam bentuk kolom (result_format FORMAT_KOLOM).
+
+        Setiap statistik dihitung per kolom dengan sum/min/max/Counter tanpa
+        membuat dict per baris. Counter menyimpan urutan kemunculan pertama,
+        sehingga hasilnya sama dengan tambah_semua atas baris yang sama.
+
+        Args:
+            kolom (dict): {nama kolom: list nilai}, minimal jumlah_orang, status,
+                dan kolom kunci meja/pelanggan
+
+        Returns:
+            ReportAggregator: self, agar bisa dirangkai
+        """
+        orang = list(map(int, kolom['jumlah_orang']))
+        if not orang:
+            return self
+
+        lain = ReportAggregator(self.kunci_meja, self.kunci_pelanggan)
+        lain.total_pemesanan = len(orang)
+        lain.total_orang = sum(orang)
+        lain.min_orang = min(orang)
+        lain.max_orang = max(orang)
+        lain.status_count = Counter(kolom['status'])
+        lain.meja_count = Counter(kolom[self.kunci_meja])
+        lain.pelanggan_count = Counter(kolom[self.kunci_pelanggan])
+        return self.gabung(lain)
+
+    def gabung(self, lain: 'ReportAggregator') -> 'ReportAggregator':
+        """
+        Menggabungkan hasil parsial agregator lain ke agregator ini.
+
+        Urutan kemunculan kunci agregator ini didahulukan, sehingga
+        menggabungkan shard sesuai urutan waktu memberi hasil yang sama
+        dengan menghitung semua baris sekaligus.
+
+        Args:
+            lain (ReportAggregator): Agregator shard lain
+
+        Returns:
+            ReportAggregator: self, agar bisa dirangkai
+        """
+        self.total_pemesanan += lain.total_pemesanan
+        self.total_orang += lain.total_orang
+        if lain.min_orang is not None:
+            self.min_orang = lain.min_orang if self.min_orang is None else min(self.min_orang, lain.min_orang)
+            self.max_orang = lain.max_orang if self.max_orang is None else max(self.max_orang, lain.max_orang)
+
+        for tujuan, sumber in ((self.status_count, lain.status_count),
+                               (self.meja_count, lain.meja_count),
+                               (self.pelanggan_count, lain.pelanggan_count)):
+            for kunci, jumlah in sumber.items():
+                tujuan[kunci] = tujuan.get(kunci, 0) + jumlah
+        return self
+
+    @staticmethod
+    def _top(count: Dict, k: int) -> List[Tuple]:
+        """Mengambil k kunci dengan jumlah terbesar (seri: yang muncul lebih dulu)."""
+        # nlargest stabil, jadi kunci yang lebih dulu muncul menang saat seri
+        return heapq.nlargest(k, count.items(), key=lambda x: x[1])
+
+    def top_meja(self, k: int = 5) -> List[Tuple]:
+        """
+        Mendapatkan k meja terpopuler.
+
+        Args:
+            k (int, optional): Jumlah meja. Default 5.
+
+        Returns:
+            list: List tuple (meja, jumlah pemesanan) menurun
+        """
+        return self._top(self.meja_count, k)
+
+    def top_pelanggan(self, k: int = 5) -> List[Tuple]:
+        """
+        Mendapatkan k pelanggan dengan pemesanan terbanyak.
+
+        Args:
+            k (int, optional): Jumlah pelanggan. Default 5.
+
+        Returns:
+            list: List tuple (pelanggan, jumlah pemesanan) menurun
+        """
+        return self._top(self.pelanggan_count, k)
+
+    def hasil(self) -> Optional[Dict]:
+        """
+        Menghasilkan statistik dengan bentuk yang sama seperti analisis_laporan.
+
+        Returns:
+            dict: Statistik (total_pemesanan, total_orang, avg_orang, status_count,
+                  meja_populer, pelanggan_setia), atau None jika belum ada baris
+        """
+        if self.total_pemesanan == 0:
+            return None
+
+        meja = self.top_meja(1)
+        pelanggan = self.top_pelanggan(1)
+        return {
+            'total_pemesanan': self.total_pemesanan,
+            'total_orang': self.total_orang,
+            'avg_orang': self.total_orang / self.total_pemesanan,
+            'status_count': dict(self.status_count),
+            'meja_populer': meja[0] if meja else (None, 0),
+            'pelanggan_setia': pelanggan[0] if pelanggan else (None, 0)
+        }
+
+
+def agregasi_paralel(sumber_list: List[Iterable[Dict]], max_workers: int = 4,
+                     **opsi) -> ReportAggregator:
+    """
+    Menghitung beberapa sumber baris (shard) secara paralel lalu menggabungkannya.
+
+    Cocok untuk sumber yang dominan I/O seperti cursor database atau file
+    per hari. Hasil digabung sesuai urutan sumber_list.
+
+    Args:
+        sumber_list (list): List iterable baris, satu per shard
+        max_workers (int, optional): Jumlah thread. Default 4.
+        **opsi: Argumen untuk ReportAggregator (kunci_meja, kunci_pelanggan)
+
+    Returns:
+        ReportAggregator: Agregator hasil gabungan semua shard
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        parsial = list(executor.map(lambda rows: ReportAggregator(**opsi).tambah_semua(rows),
+                                    sumber_list))
+
+    total = ReportAggregator(**opsi)
+    for agregator in parsial:
+        total.gabung(agregator)
+    return total
@@ -0,0 +1,128 @@
+"""
+Assignment Module
+Module ini berisi pemilihan meja otomatis (best-fit) berdasarkan jumlah orang.
+
+Meja disimpan terurut berdasarkan kapasitas sehingga meja terkecil yang
+masih muat ditemukan dengan binary search. Untuk sekumpulan permintaan,
+rombongan terbesar ditempatkan lebih dulu agar meja besar tidak habis
+dipakai rombongan kecil.
+"""
+
+from bisect import bisect_left
+from datetime import timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from services.availability import AvailabilityIndex, ke_datetime
+
+
+class TableAssigner:
+    """
+    Index meja terurut kapasitas untuk memilih meja best-fit.
+
+    Attributes:
+        index (AvailabilityIndex): Index ketersediaan slot waktu
+    """
+
+    def __init__(self, meja_list: Iterable[Dict], index: AvailabilityIndex = None):
+        """
+        Inisialisasi TableAssigner.
+
+        Args:
+            meja_list (iterable): List dictionary meja (id, nomor_meja, kapasitas)
+            index (AvailabilityIndex, optional): Index ketersediaan. Default None
+                (index kosong, semua meja dianggap bebas).
+        """
+        self.index = index if index is not None else AvailabilityIndex()
+        self._meja = {}
+        self._urut: List[Tuple[int, int, int]] = []
+        for meja in meja_list:
+            self._meja[meja['id']] = meja
+            self._urut.append((meja['kapasitas'], meja['nomor_meja'], meja['id']))
+        self._urut.sort()
+        self._kapasitas = [k for k, _, _ in self._urut]
+
+    def kandidat(self, jumlah_orang: int) -> List[Dict]:
+        """
+        Mendapatkan semua meja yang muat, dari kapasitas terkecil.
+
+        Args:
+            jumlah_orang (int): Jumlah orang dalam rombongan
+
+        Returns:
+            list: List dictionary meja terurut best-fit
+        """
+        i = bisect_left(self._kapasitas, jumlah_orang)
+        return [self._meja[mid] for _, _, mid in self._urut[i:]]
+
+    def pilih_meja(self, jumlah_orang: int, waktu, durasi: timedelta = None,
+                   index: AvailabilityIndex = None) -> Optional[Dict]:
+        """
+        Memilih meja terkecil yang muat dan kosong pada waktu tertentu.
+
+        Args:
+            jumlah_orang (int): Jumlah orang dalam rombongan
+            waktu (datetime | str): Waktu mulai pemesanan
+            durasi (timedelta, optional): Lama makan. Default None (durasi index).
+            index (AvailabilityIndex, optional): Index tambahan (misal alokasi
+                sementara dalam satu batch). Default None.
+
+        Returns:
+            dict: Data meja terpilih, atau None jika tidak ada yang muat
+        """
+        waktu = ke_datetime(waktu)
+        i = bisect_left(self._kapasitas, jumlah_orang)
+        for _, _, meja_id in self._urut[i:]:
+            if not self.index.is_bebas(meja_id, waktu, durasi):
+                continue
+            if index is not None and not index.is_bebas(meja_id, waktu, durasi):
+                continue
+            return self._meja[meja_id]
+        return None
+
+    def alokasi_batch(self, permintaan: List[Dict],
+                      durasi: timedelta = None) -> List[Tuple[Dict, Optional[Dict]]]:
+        """
+        Menempatkan sekumpulan permintaan sekaligus untuk memaksimalkan
+        jumlah tamu yang mendapat meja.
+
+        Permintaan diproses dari rombongan terbesar (lalu waktu terawal);
+        setiap permintaan mendapat meja best-fit yang belum terpakai oleh
+        pemesanan lain maupun alokasi sebelumnya dalam batch ini.
+        Index utama tidak diubah.
+
+        Args:
+            permintaan (list): List dictionary dengan key 'jumlah_orang' dan
+                'tanggal_pemesanan' (key lain diteruskan apa adanya)
+            durasi (timedelta, optional): Lama makan. Default None (durasi index).
+
+        Returns:
+            list: List tuple (permintaan, meja atau None) sesuai urutan input
+        """
+        sementara = AvailabilityIndex(durasi or self.index.durasi)
+        urutan = sorted(range(len(permintaan)),
+                        key=lambda i: (-permintaan[i]['jumlah_orang'],
+                                       ke_datetime(permintaan[i]['tanggal_pemesanan'])))
+        hasil: List[Optional[Dict]] = [None] * len(permintaan)
+
+        for n, i in enumerate(urutan):
+            p = permintaan[i]
+            meja = self.pilih_meja(p['jumlah_orang'], p['tanggal_pemesanan'],
+                                   durasi, index=sementara)
+            if meja is not None:
+                sementara.tambah(-(n + 1), meja['id'], p['tanggal_pemesanan'])
+                hasil[i] = meja
+
+        return list(zip(permintaan, hasil))
+
+
+def total_tamu_duduk(alokasi: List[Tuple[Dict, Optional[Dict]]]) -> int:
+    """
+    Menghitung jumlah tamu yang mendapat meja dari hasil alokasi.
+
+    Args:
+        alokasi (list): Hasil TableAssigner.alokasi_batch
+
+    Returns:
+        int: Total jumlah orang yang mendapat meja
+    """
+    return sum(p['jumlah_orang'] for p, meja in alokasi if meja is not None)
@@ -0,0 +1,66 @@
+"""
+Async Service Module
+Module ini berisi versi asyncio dari fungsi-fungsi service untuk front end async.
+
+Setiap fungsi menerima AsyncDatabaseManager dan menjalankan fungsi service
+sinkron dengan nama yang sama di thread pool database, sehingga validasi,
+aturan bisnis, dan hasilnya identik dengan restaurant_service.
+"""
+
+import asyncio
+import functools
+from typing import Dict, Optional
+
+from database.async_manager import AsyncDatabaseManager
+from services import restaurant_service
+
+
+def _versi_async(fungsi):
+    """Membuat versi async dari fungsi service sinkron yang menerima db sebagai argumen pertama."""
+    @functools.wraps(fungsi)
+    async def versi_async(adb: AsyncDatabaseManager, *args, **kwargs):
+        return await adb.jalankan(fungsi, adb.db, *args, **kwargs)
+    return versi_async
+
+
+async def init_database_async(db_config: Dict = None, cache: bool = False,
+                              max_workers: int = None) -> Optional[AsyncDatabaseManager]:
+    """
+    Versi async init_database: koneksi, pembuatan tabel, dan migrasi
+    dijalankan di thread lalu DatabaseManager dibungkus AsyncDatabaseManager.
+
+    Args:
+        db_config (dict, optional): Konfigurasi database (lihat init_database).
+            Isi pool_size agar beberapa query bisa berjalan bersamaan. Default None.
+        cache (bool, optional): Pakai cache meja dan pelanggan. Default False.
+        max_workers (int, optional): Jumlah thread. Default None (pool_size).
+
+    Returns:
+        AsyncDatabaseManager: Facade async yang sudah terkoneksi, atau None jika gagal
+    """
+    db = await asyncio.to_thread(restaurant_service.init_database, db_config, cache)
+    return AsyncDatabaseManager(db, max_workers) if db else None
+
+
+# ========== PELANGGAN ==========
+tambah_pelanggan = _versi_async(restaurant_service.tambah_pelanggan)
+lihat_pelanggan = _versi_async(restaurant_service.lihat_pelanggan)
+lihat_pelanggan_halaman = _versi_async(restaurant_service.lihat_pelanggan_halaman)
+
+# ========== MEJA ==========
+lihat_meja = _versi_async(restaurant_service.lihat_meja)
+lihat_meja_tersedia = _versi_async(restaurant_service.lihat_meja_tersedia)
+
+# ========== PEMESANAN ==========
+tambah_pemesanan = _versi_async(restaurant_service.tambah_pemesanan)
+tambah_pemesanan_otomatis = _versi_async(restaurant_service.tambah_pemesanan_otomatis)
+lihat_pemesanan = _versi_async(restaurant_service.lihat_pemesanan)
+lihat_pemesanan_halaman = _versi_async(restaurant_service.lihat_pemesanan_halaman)
+konfirmasi_pemesanan = _versi_async(restaurant_service.konfirmasi_pemesanan)
+selesaikan_pemesanan = _versi_async(restaurant_service.selesaikan_pemesanan)
+batalkan_pemesanan = _versi_async(restaurant_service.batalkan_pemesanan)
+
+# ========== LAPORAN ==========
+generate_laporan_pemesanan = _versi_async(restaurant_service.generate_laporan_pemesanan)
+analisis_laporan_db = _versi_async(restaurant_service.analisis_laporan_db)
+analisis_laporan_harian = _versi_async(restaurant_service.analisis_laporan_harian)
@@ -0,0 +1,277 @@
+"""
+Availability Module
+Module ini berisi index ketersediaan meja berbasis slot waktu.
+
+Setiap meja memiliki daftar interval pemesanan aktif (pending/confirmed)
+yang terurut berdasarkan waktu mulai, sehingga pertanyaan seperti
+"meja mana yang kosong jam 19:30 selama 2 jam" dijawab dengan binary
+search, bukan dengan flag meja.status yang berlaku sepanjang hari.
+"""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Status pemesanan yang menempati slot meja
+STATUS_AKTIF = ('pending', 'confirmed')
+
+# Lama makan default untuk satu pemesanan
+DURASI_DEFAULT = timedelta(hours=2)
+
+
+def ke_datetime(nilai) -> datetime:
+    """
+    Mengubah nilai tanggal (datetime atau string 'YYYY-MM-DD HH:MM:SS') ke datetime.
+
+    Args:
+        nilai (datetime | str): Nilai tanggal
+
+    Returns:
+        datetime: Nilai sebagai datetime
+    """
+    if isinstance(nilai, datetime):
+        return nilai
+    return datetime.fromisoformat(str(nilai))
+
+
+class AvailabilityIndex:
+    """
+    Index interval pemesanan per meja di memori.
+
+    Attributes:
+        durasi (timedelta): Lama makan default per pemesanan
+    """
+
+    def __init__(self, durasi: timedelta = DURASI_DEFAULT):
+        """
+        Inisialisasi AvailabilityIndex kosong.
+
+        Args:
+            durasi (timedelta, optional): Lama makan default. Default 2 jam.
+        """
+        self.durasi = durasi
+        # meja_id -> list terurut (mulai, selesai, pemesanan_id)
+        self._interval: Dict[int, List[Tuple[datetime, datetime, int]]] = {}
+        # meja_id -> durasi terpanjang di meja tsb (batas bawah pencarian)
+        self._durasi_max: Dict[int, timedelta] = {}
+        # pemesanan_id -> (meja_id, mulai, selesai, pelanggan_id)
+        self._pemesanan: Dict[int, Tuple[int, datetime, datetime, Optional[int]]] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self._pemesanan)
+
+    # ========== PEMBARUAN INDEX ==========
+
+    def tambah(self, pemesanan_id: int, meja_id: int, mulai,
+               pelanggan_id: int = None, durasi: timedelta = None):
+        """
+        Menambahkan (atau mengganti) interval pemesanan ke index.
+
+        Args:
+            pemesanan_id (int): ID pemesanan
+            meja_id (int): ID meja
+            mulai (datetime | str): Waktu mulai pemesanan
+            pelanggan_id (int, optional): ID pelanggan. Default None.
+            durasi (timedelta, optional): Lama makan. Default None (durasi index).
+        """
+        mulai = ke_datetime(mulai)
+        durasi = durasi or self.durasi
+        with self._lock:
+            self.hapus(pemesanan_id)
+            insort(self._interval.setdefault(meja_id, []),
+                   (mulai, mulai + durasi, pemesanan_id))
+            if durasi > self._durasi_max.get(meja_id, timedelta(0)):
+                self._durasi_max[meja_id] = durasi
+            self._pemesanan[pemesanan_id] = (meja_id, mulai, mulai + durasi, pelanggan_id)
+
+    def hapus(self, pemesanan_id: int) -> bool:
+        """
+        Menghapus interval pemesanan dari index.
+
+        Args:
+            pemesanan_id (int): ID pemesanan
+
+        Returns:
+            bool: True jika pemesanan ada di index
+        """
+        with self._lock:
+            data = self._pemesanan.pop(pemesanan_id, None)
+            if data is None:
+                return False
+            meja_id, mulai, selesai, _ = data
+            daftar = self._interval[meja_id]
+            i = bisect_left(daftar, (mulai, selesai, pemesanan_id))
+            if i < len(daftar) and daftar[i][2] == pemesanan_id:
+                del daftar[i]
+            return True
+
+    def hapus_meja(self, meja_id: int):
+        """
+        Menghapus semua interval milik satu meja.
+
+        Args:
+            meja_id (int): ID meja
+        """
+        with self._lock:
+            for _, _, pemesanan_id in self._interval.pop(meja_id, []):
+                self._pemesanan.pop(pemesanan_id, None)
+            self._durasi_max.pop(meja_id, None)
+
+    def hapus_pelanggan(self, pelanggan_id: int):
+        """
+        Menghapus semua interval milik satu pelanggan (ON DELETE CASCADE).
+
+        Args:
+            pelanggan_id (int): ID pelanggan
+        """
+        with self._lock:
+            ids = [pid for pid, data in self._pemesanan.items() if data[3] == pelanggan_id]
+            for pemesanan_id in ids:
+                self.hapus(pemesanan_id)
+
+    def on_perubahan(self, event: str, data: Dict):
+        """
+        Listener untuk DatabaseManager.add_listener agar index selalu
+        konsisten dengan perubahan pemesanan di database.
+
+        Args:
+            event (str): Nama event dari DatabaseManager
+            data (dict): Data perubahan
+        """
+        if event in ('pemesanan_dibuat', 'pemesanan_diupdate'):
+            if data['status'] in STATUS_AKTIF:
+                self.tambah(data['pemesanan_id'], data['meja_id'],
+                            data['tanggal_pemesanan'], data.get('pelanggan_id'))
+            else:
+                self.hapus(data['pemesanan_id'])
+        elif event == 'pemesanan_status':
+            if data['status'] not in STATUS_AKTIF:
+                self.hapus(data['pemesanan_id'])
+        elif event == 'pemesanan_dihapus':
+            self.hapus(data['pemesanan_id'])
+        elif event == 'meja_dihapus':
+            self.hapus_meja(data['meja_id'])
+        elif event == 'pelanggan_dihapus':
+            self.hapus_pelanggan(data['pelanggan_id'])
+
+    # ========== QUERY KETERSEDIAAN ==========
+
+    def _bentrok(self, meja_id: int, mulai: datetime, selesai: datetime) -> List[int]:
+        """Mencari ID pemesanan di meja yang beririsan dengan [mulai, selesai)."""
+        daftar = self._interval.get(meja_id)
+        if not daftar:
+            return []
+        # Interval yang beririsan pasti dimulai setelah (mulai - durasi terpanjang)
+        lo = bisect_right(daftar, (mulai - self._durasi_max[meja_id],))
+        hi = bisect_left(daftar, (selesai,))
+        return [pid for m, s, pid in daftar[lo:hi] if s > mulai]
+
+    def is_bebas(self, meja_id: int, mulai, durasi: timedelta = None) -> bool:
+        """
+        Memeriksa apakah meja kosong pada rentang waktu tertentu.
+
+        Args:
+            meja_id (int): ID meja
+            mulai (datetime | str): Waktu mulai
+            durasi (timedelta, optional): Lama makan. Default None (durasi index).
+
+        Returns:
+            bool: True jika tidak ada pemesanan aktif yang beririsan
+        """
+        mulai = ke_datetime(mulai)
+        with self._lock:
+            return not self._bentrok(meja_id, mulai, mulai + (durasi or self.durasi))
+
+    def meja_bebas(self, meja_ids: Iterable[int], mulai,
+                   durasi: timedelta = None) -> List[int]:
+        """
+        Menyaring daftar meja yang kosong pada rentang waktu tertentu.
+
+        Args:
+            meja_ids (iterable): ID meja yang akan diperiksa
+            mulai (datetime | str): Waktu mulai
+            durasi (timedelta, optional): Lama makan. Default None (durasi index).
+
+        Returns:
+            list: ID meja yang kosong, urutan sama dengan input
+        """
+        mulai = ke_datetime(mulai)
+        selesai = mulai + (durasi or self.durasi)
+        with self._lock:
+            return [mid for mid in meja_ids if not self._bentrok(mid, mulai, selesai)]
+
+    def slot_bebas(self, meja_id: int, dari, sampai) -> List[Tuple[datetime, datetime]]:
+        """
+        Mendapatkan celah waktu kosong sebuah meja dalam rentang [dari, sampai).
+
+        Args:
+            meja_id (int): ID meja
+            dari (datetime | str): Awal rentang
+            sampai (datetime | str): Akhir rentang
+
+        Returns:
+            list: List tuple (mulai, selesai) celah kosong
+        """
+        dari, sampai = ke_datetime(dari), ke_datetime(sampai)
+        celah = []
+        kursor = dari
+        with self._lock:
+            daftar = self._interval.get(meja_id, [])
+            lo = bisect_right(daftar, (dari - self._durasi_max.get(meja_id, timedelta(0)),))
+            hi = bisect_left(daftar, (sampai,))
+            for mulai, selesai, _ in daftar[lo:hi]:
+                if selesai <= kursor:
+                    continue
+                if mulai > kursor:
+                    celah.append((kursor, mulai))
+                kursor = max(kursor, selesai)
+        if kursor < sampai:
+            celah.append((kursor, sampai))
+        return celah
+
+    # ========== SINKRONISASI DATABASE ==========
+
+    def muat(self, rows: Iterable[Dict]):
+        """
+        Mengisi index dari baris pemesanan (dict dengan id, meja_id,
+        tanggal_pemesanan, status, dan opsional pelanggan_id).
+
+        Args:
+            rows (iterable): Baris pemesanan
+        """
+        with self._lock:
+            for row in rows:
+                if row['status'] in STATUS_AKTIF:
+                    self.tambah(row['id'], row['meja_id'], row['tanggal_pemesanan'],
+                                row.get('pelanggan_id'))
+
+    @classmethod
+    def dari_database(cls, db, durasi: timedelta = DURASI_DEFAULT,
+                      sejak=None) -> 'AvailabilityIndex':
+        """
+        Membangun index dari tabel pemesanan lalu mendaftarkannya sebagai
+        listener DatabaseManager agar tetap konsisten.
+
+        Args:
+            db (DatabaseManager): Instance database manager
+            durasi (timedelta, optional): Lama makan default. Default 2 jam.
+            sejak (datetime | str, optional): Hanya muat pemesanan mulai waktu ini.
+                Default None (semua pemesanan aktif).
+
+        Returns:
+            AvailabilityIndex: Index yang sudah terisi
+        """
+        index = cls(durasi)
+        query = """SELECT id, pelanggan_id, meja_id, tanggal_pemesanan, status
+                   FROM pemesanan WHERE status IN (%s, %s)"""
+        params = list(STATUS_AKTIF)
+        if sejak:
+            query += " AND tanggal_pemesanan >= %s"
+            params.append(ke_datetime(sejak) - durasi)
+
+        db.add_listener(index.on_perubahan)
+        index.muat(db.execute_query(query, tuple(params), fetch=True) or [])
+        return index
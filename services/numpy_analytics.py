@@ -0,0 +1,254 @@
+"""
+NumPy Analytics Module
+Module ini berisi backend analisis laporan berbasis NumPy (opsional).
+
+Kolom laporan dimuat sekali ke array bertipe (jumlah_orang int64, kode
+status/meja/pelanggan int32, waktu datetime64[s]) lalu statistik dihitung
+dengan operasi vektor: sum, bincount, dan argmax. Kunci diberi kode sesuai
+urutan kemunculan pertama, sehingga argmax atas bincount memilih pemenang
+seri yang sama dengan ReportAggregator dan hasilnya identik dengan jalur
+Python.
+
+Jika numpy tidak terinstall, NUMPY_TERSEDIA bernilai False dan service
+analisis tetap memakai jalur Python.
+"""
+
+from datetime import datetime
+from functools import cached_property
+from operator import attrgetter, itemgetter
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy opsional; tanpa numpy analisis memakai jalur Python
+    np = None
+
+from models.tanggal import parse_tanggal_many
+
+NUMPY_TERSEDIA = np is not None
+
+# Selisih hari antara date.toordinal() dan epoch 1970-01-01
+_ORDINAL_EPOCH = 719163
+
+# Kolom kunci yang merupakan atribut sebuah id (hasil JOIN laporan, jadi satu
+# id selalu berlabel sama). Dikodekan lewat id yang lebih murah di-hash
+# daripada teks, lalu digabung per label bila ada label kembar
+_KOLOM_ID = {'nomor_meja': 'meja_id', 'nama_pelanggan': 'pelanggan_id'}
+
+
+class _Kode(dict):
+    """Pemberi kode bilangan bulat sesuai urutan kemunculan pertama."""
+
+    def __missing__(self, kunci):
+        kode = self[kunci] = len(self)
+        return kode
+
+
+def _kodekan(nilai: List) -> Tuple:
+    """
+    Mengubah list nilai menjadi array kode int32.
+
+    Returns:
+        tuple: (array kode, list label sesuai kode)
+    """
+    kode = _Kode()
+    array = np.fromiter(map(kode.__getitem__, nilai), dtype=np.int32, count=len(nilai))
+    return array, list(kode)
+
+
+class LaporanArray:
+    """
+    Kolom laporan pemesanan sebagai array NumPy bertipe.
+
+    Setiap array dimuat saat pertama kali dipakai, sehingga analisis yang
+    tidak memakai tanggal tidak membayar konversinya.
+
+    Attributes:
+        kunci_meja (str): Kolom pengenal meja
+        kunci_pelanggan (str): Kolom pengenal pelanggan
+    """
+
+    def __init__(self, laporan, kunci_meja: str = 'nomor_meja',
+                 kunci_pelanggan: str = 'nama_pelanggan'):
+        """
+        Inisialisasi LaporanArray.
+
+        Args:
+            laporan (dict | iterable): Dict kolom (result_format FORMAT_KOLOM)
+                atau list/iterator dictionary baris laporan
+            kunci_meja (str, optional): Kolom pengenal meja. Default 'nomor_meja'.
+            kunci_pelanggan (str, optional): Kolom pengenal pelanggan. Default 'nama_pelanggan'.
+
+        Raises:
+            ImportError: Jika numpy belum terinstall
+        """
+        if np is None:
+            raise ImportError("numpy belum terinstall")
+        self.kunci_meja = kunci_meja
+        self.kunci_pelanggan = kunci_pelanggan
+        if isinstance(laporan, dict):
+            self._kolom = laporan
+            self._rows = None
+        else:
+            self._kolom = {}
+            self._rows = list(laporan or [])
+
+    def _ambil(self, nama: str) -> List:
+        """Mengambil satu kolom sebagai list (dari dict kolom atau baris)."""
+        if self._rows is not None and nama not in self._kolom:
+            self._kolom[nama] = list(map(itemgetter(nama), self._rows))
+        return self._kolom[nama]
+
+    def _ada(self, nama: str) -> bool:
+        if self._rows is None:
+            return nama in self._kolom
+        return bool(self._rows) and nama in self._rows[0]
+
+    def _kunci(self, kolom_label: str) -> Tuple:
+        """Kode dan label untuk kolom kunci meja/pelanggan."""
+        kolom_id = _KOLOM_ID.get(kolom_label)
+        if kolom_id is None or not self._ada(kolom_id):
+            return _kodekan(self._ambil(kolom_label))
+        kode, _ = _kodekan(self._ambil(kolom_id))
+        # Kode diberikan sesuai urutan kemunculan, jadi maksimum kumulatif naik
+        # tepat di baris pertama setiap kode
+        pertama = np.flatnonzero(np.diff(np.maximum.accumulate(kode), prepend=-1))
+        label = self._ambil(kolom_label)
+        return kode, [label[i] for i in pertama.tolist()]
+
+    def __len__(self):
+        if self._rows is not None:
+            return len(self._rows)
+        return len(next(iter(self._kolom.values()), ()))
+
+    @cached_property
+    def jumlah_orang(self) -> 'np.ndarray':
+        """Jumlah orang per pemesanan (int64); teks dari CSV juga diterima."""
+        nilai = self._ambil('jumlah_orang')
+        if set(map(type, nilai)) <= {int}:
+            return np.array(nilai, dtype=np.int64)
+        return np.fromiter(map(int, nilai), dtype=np.int64, count=len(nilai))
+
+    @cached_property
+    def status(self) -> Tuple:
+        """Kode status per pemesanan beserta label (kode, label)."""
+        return _kodekan(self._ambil('status'))
+
+    @cached_property
+    def meja(self) -> Tuple:
+        """Kode meja per pemesanan beserta label (kode, label)."""
+        return self._kunci(self.kunci_meja)
+
+    @cached_property
+    def pelanggan(self) -> Tuple:
+        """Kode pelanggan per pemesanan beserta label (kode, label)."""
+        return self._kunci(self.kunci_pelanggan)
+
+    @cached_property
+    def _tanggal(self) -> List[datetime]:
+        tanggal = self._ambil('tanggal_pemesanan')
+        if set(map(type, tanggal)) - {datetime}:
+            tanggal = parse_tanggal_many(tanggal)
+        return tanggal
+
+    def _komponen(self, nama: str) -> 'np.ndarray':
+        """Satu atribut datetime (misal 'hour') untuk semua baris, lewat map di C."""
+        return np.fromiter(map(attrgetter(nama), self._tanggal), np.int64, len(self._tanggal))
+
+    @cached_property
+    def waktu(self) -> 'np.ndarray':
+        """Tanggal pemesanan sebagai datetime64[s]."""
+        # Konversi objek datetime langsung oleh numpy lambat (~µs per nilai);
+        # komponen diambil terpisah lalu dijumlah sebagai detik epoch
+        tanggal = self._tanggal
+        detik = (np.fromiter(map(datetime.toordinal, tanggal), np.int64, len(tanggal))
+                 - _ORDINAL_EPOCH) * 86400
+        detik += self.jam * 3600 + self._komponen('minute') * 60 + self._komponen('second')
+        return detik.astype('datetime64[s]')
+
+    @cached_property
+    def jam(self) -> 'np.ndarray':
+        """Jam pemesanan (0-23) per pemesanan."""
+        return self._komponen('hour')
+
+
+def _top(kode: 'np.ndarray', label: List) -> Tuple:
+    """Kunci dengan jumlah terbesar (seri: yang muncul lebih dulu) beserta jumlahnya."""
+    jumlah = np.bincount(kode, minlength=len(label))
+    if len(set(label)) < len(label):
+        # Beberapa id berlabel sama (misal nama pelanggan kembar): gabung per label.
+        # Label disisipkan sesuai urutan kode, yaitu urutan kemunculan pertama
+        per_label = {}
+        for nilai, n in zip(label, jumlah.tolist()):
+            per_label[nilai] = per_label.get(nilai, 0) + n
+        return max(per_label.items(), key=itemgetter(1))
+    i = int(jumlah.argmax())
+    return label[i], int(jumlah[i])
+
+
+def _jumlah_status(data: LaporanArray) -> Dict[str, int]:
+    """Jumlah pemesanan per status sesuai urutan kemunculan pertama."""
+    kode, label = data.status
+    return dict(zip(label, np.bincount(kode, minlength=len(label)).tolist()))
+
+
+def _sebagai_array(laporan, **opsi) -> LaporanArray:
+    """Memakai LaporanArray yang sudah dimuat, atau memuat laporan."""
+    return laporan if isinstance(laporan, LaporanArray) else LaporanArray(laporan, **opsi)
+
+
+def analisis(laporan, kunci_meja: str = 'nomor_meja',
+             kunci_pelanggan: str = 'nama_pelanggan') -> Optional[Dict]:
+    """
+    Versi vektor analisis_laporan dengan hasil yang identik.
+
+    Args:
+        laporan (LaporanArray | dict | iterable): Data laporan
+        kunci_meja (str, optional): Kolom pengenal meja. Default 'nomor_meja'.
+        kunci_pelanggan (str, optional): Kolom pengenal pelanggan. Default 'nama_pelanggan'.
+
+    Returns:
+        dict: Statistik (total_pemesanan, total_orang, avg_orang, status_count,
+              meja_populer, pelanggan_setia), atau None jika kosong
+    """
+    data = _sebagai_array(laporan, kunci_meja=kunci_meja, kunci_pelanggan=kunci_pelanggan)
+    total = len(data)
+    if total == 0:
+        return None
+
+    total_orang = int(data.jumlah_orang.sum())
+    return {
+        'total_pemesanan': total,
+        'total_orang': total_orang,
+        'avg_orang': total_orang / total,
+        'status_count': _jumlah_status(data),
+        'meja_populer': _top(*data.meja),
+        'pelanggan_setia': _top(*data.pelanggan)
+    }
+
+
+def analisis_operasional(laporan) -> Optional[Dict]:
+    """
+    Versi vektor analisis_operasional dengan hasil yang identik.
+
+    Args:
+        laporan (LaporanArray | dict | iterable): Data laporan
+
+    Returns:
+        dict: per_jam, jam_tersibuk, tingkat_keberhasilan (lihat
+              restaurant_service.analisis_operasional), atau None jika kosong
+    """
+    data = _sebagai_array(laporan)
+    if len(data) == 0:
+        return None
+
+    per_jam = np.bincount(data.jam, minlength=24)
+    jam = int(per_jam.argmax())
+    status = _jumlah_status(data)
+    selesai = status.get('completed', 0)
+    batal = status.get('cancelled', 0)
+    return {
+        'per_jam': per_jam.tolist(),
+        'jam_tersibuk': (jam, int(per_jam[jam])),
+        'tingkat_keberhasilan': selesai / (selesai + batal) if selesai + batal else None
+    }
@@ -3,35 +3,51 @@ Restaurant Service Module
 Module ini berisi fungsi-fungsi untuk operasi bisnis restoran.
 """
 
-from database.db_manager import DatabaseManager
+from database.db_manager import DatabaseManager, DB_ERRORS
+from database.cache import CachedDatabaseManager
+from database.sqlite_manager import SQLiteDatabaseManager, CachedSQLiteDatabaseManager
 from models.pelanggan import Pelanggan
 from models.meja import Meja
 from models.pemesanan import Pemesanan
-from typing import Optional, List, Dict
+from models.validasi import validate_many, VALID, PESAN
+from models.tanggal import parse_tanggal, parse_tanggal_many
+from services.availability import AvailabilityIndex
+from services.assignment import TableAssigner
+from services.aggregation import ReportAggregator
+from services import numpy_analytics
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Iterable, Iterator
+import itertools
 
 
-def init_database(db_config: Dict = None) -> DatabaseManager:
+def init_database(db_config: Dict = None, cache: bool = False) -> DatabaseManager:
     """
     Inisialisasi koneksi database dan buat tabel jika belum ada.
     
     Args:
-        db_config (dict, optional): Konfigurasi database. Default None.
+        db_config (dict, optional): Konfigurasi database. Key 'backend' memilih
+            engine: 'mysql' (default) atau 'sqlite' (key lain: path, pool_size).
+            Default None.
+        cache (bool, optional): Pakai CachedDatabaseManager (cache meja dan
+            pelanggan di memori). Default False.
     
     Returns:
         DatabaseManager: Instance database manager yang sudah terkoneksi
     """
-    if db_config:
-        db = DatabaseManager(**db_config)
+    # Tanpa db_config, konfigurasi default MySQL dipakai
+    config = dict(db_config or {})
+    if config.pop('backend', 'mysql') == 'sqlite':
+        kelas = CachedSQLiteDatabaseManager if cache else SQLiteDatabaseManager
     else:
-        # Gunakan konfigurasi default
-        db = DatabaseManager()
+        kelas = CachedDatabaseManager if cache else DatabaseManager
+    db = kelas(**config)
     
     # Coba koneksi ke database
     if db.connect():
         print("✓ Berhasil terhubung ke database")
         # Buat tabel jika belum ada
         if db.create_tables():
-            print("✓ Tabel database siap digunakan")
+            print(f"✓ Tabel database siap digunakan (skema versi {db.get_schema_version()})")
         return db
     else:
         print("✗ Gagal terhubung ke database")
@@ -95,6 +111,35 @@ def lihat_pelanggan(db: DatabaseManager, pelanggan_id: int = None) -> Optional[L
         return None
 
 
+def lihat_pelanggan_halaman(db: DatabaseManager, after_id: int = None,
+                            page_size: int = 20) -> Optional[Dict]:
+    """
+    Melihat data pelanggan per halaman (keyset pagination).
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        after_id (int, optional): Kursor dari halaman sebelumnya. Default None (halaman pertama).
+        page_size (int, optional): Jumlah baris per halaman. Default 20.
+    
+    Returns:
+        dict: {'data': list pelanggan, 'after_id': kursor halaman berikutnya
+              atau None jika sudah halaman terakhir}, atau None jika gagal
+    """
+    # Ambil satu baris ekstra untuk mengetahui apakah masih ada halaman berikutnya
+    pelanggan_list = db.read_pelanggan_page(after_id, page_size + 1)
+    
+    if pelanggan_list is None:
+        print("✗ Gagal membaca data pelanggan")
+        return None
+    
+    ada_lagi = len(pelanggan_list) > page_size
+    pelanggan_list = pelanggan_list[:page_size]
+    return {
+        'data': pelanggan_list,
+        'after_id': pelanggan_list[-1]['id'] if ada_lagi else None
+    }
+
+
 def update_pelanggan(db: DatabaseManager, pelanggan_id: int, nama: str, 
                     telepon: str, email: str) -> bool:
     """
@@ -256,17 +301,56 @@ def hapus_meja(db: DatabaseManager, meja_id: int) -> bool:
         return False
 
 
-def lihat_meja_tersedia(db: DatabaseManager) -> Optional[List[Dict]]:
+def lihat_meja_tersedia(db: DatabaseManager, waktu=None, durasi: timedelta = None,
+                        index: AvailabilityIndex = None) -> Optional[List[Dict]]:
     """
     Melihat daftar meja yang tersedia.
     
+    Tanpa waktu, memakai flag meja.status seperti biasa. Dengan waktu,
+    memakai index slot waktu sehingga meja yang dipesan jam 21:00 tetap
+    terlihat kosong untuk jam 17:00.
+    
     Args:
         db (DatabaseManager): Instance database manager
+        waktu (datetime | str, optional): Waktu mulai yang dicari. Default None.
+        durasi (timedelta, optional): Lama makan. Default None (durasi index, 2 jam).
+        index (AvailabilityIndex, optional): Index ketersediaan yang sudah dibangun.
+            Default None (dibangun dari database).
     
     Returns:
         list: List dictionary meja tersedia, atau None jika tidak ada
     """
-    return lihat_meja(db, status='tersedia')
+    if waktu is None:
+        return lihat_meja(db, status='tersedia')
+    
+    if index is None:
+        index = _index_sementara(db, waktu)
+    
+    meja_list = db.read_meja() or []
+    bebas = set(index.meja_bebas([m['id'] for m in meja_list], waktu, durasi))
+    meja_tersedia = [m for m in meja_list if m['id'] in bebas]
+    
+    if meja_tersedia:
+        return meja_tersedia
+    else:
+        print(f"✗ Tidak ada meja tersedia pada {waktu}")
+        return None
+
+
+def _index_sementara(db: DatabaseManager, sejak) -> AvailabilityIndex:
+    """
+    Membangun index ketersediaan sekali pakai (tidak terdaftar sebagai listener).
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        sejak (datetime | str): Hanya muat pemesanan di sekitar waktu ini
+    
+    Returns:
+        AvailabilityIndex: Index ketersediaan
+    """
+    index = AvailabilityIndex.dari_database(db, sejak=sejak)
+    db.remove_listener(index.on_perubahan)
+    return index
 
 
 # ========== FUNGSI PEMESANAN ==========
@@ -281,7 +365,7 @@ def tambah_pemesanan(db: DatabaseManager, pelanggan_id: int, meja_id: int,
         db (DatabaseManager): Instance database manager
         pelanggan_id (int): ID pelanggan
         meja_id (int): ID meja
-        tanggal_pemesanan (str): Tanggal dan waktu pemesanan
+        tanggal_pemesanan (datetime | str): Tanggal dan waktu pemesanan
         jumlah_orang (int): Jumlah orang
         catatan (str, optional): Catatan tambahan. Default "".
     
@@ -298,33 +382,167 @@ def tambah_pemesanan(db: DatabaseManager, pelanggan_id: int, meja_id: int,
         print(f"✗ Validasi gagal: {error_msg}")
         return None
     
-    # Cek apakah meja tersedia
-    meja = db.read_meja(meja_id)
-    if not meja or len(meja) == 0:
+    # Kunci meja dan simpan pemesanan dalam satu transaksi
+    reservasi = db.reservasi_meja(pelanggan_id, meja_id, pemesanan.tanggal_pemesanan,
+                                  jumlah_orang, catatan)
+    hasil = reservasi['hasil']
+    meja = reservasi['meja']
+    
+    if hasil == DatabaseManager.RESERVASI_BERHASIL:
+        pemesanan_id = reservasi['pemesanan_id']
+        print(f"✓ Pemesanan berhasil dibuat dengan ID: {pemesanan_id}")
+        return pemesanan_id
+    elif hasil == DatabaseManager.RESERVASI_MEJA_TIDAK_DITEMUKAN:
         print(f"✗ Meja dengan ID {meja_id} tidak ditemukan")
-        return None
+    elif hasil == DatabaseManager.RESERVASI_MEJA_TIDAK_TERSEDIA:
+        print(f"✗ Meja nomor {meja['nomor_meja']} tidak tersedia (status: {meja['status']})")
+    elif hasil == DatabaseManager.RESERVASI_MELEBIHI_KAPASITAS:
+        print(f"✗ Jumlah orang ({jumlah_orang}) melebihi kapasitas meja ({meja['kapasitas']})")
+    elif hasil == DatabaseManager.RESERVASI_SLOT_TERISI:
+        print(f"✗ Meja nomor {meja['nomor_meja']} sudah dipesan pada waktu tersebut")
+    else:
+        print("✗ Gagal membuat pemesanan")
+    return None
+
+
+def tambah_pemesanan_otomatis(db: DatabaseManager, pelanggan_id: int,
+                              tanggal_pemesanan: str, jumlah_orang: int,
+                              catatan: str = "",
+                              index: AvailabilityIndex = None) -> Optional[int]:
+    """
+    Menambahkan pemesanan dengan memilih meja otomatis (best-fit):
+    meja terkecil yang muat dan kosong pada waktu pemesanan.
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        pelanggan_id (int): ID pelanggan
+        tanggal_pemesanan (datetime | str): Tanggal dan waktu pemesanan
+        jumlah_orang (int): Jumlah orang
+        catatan (str, optional): Catatan tambahan. Default "".
+        index (AvailabilityIndex, optional): Index ketersediaan. Default None
+            (dibangun dari database).
+    
+    Returns:
+        int: ID pemesanan baru, atau None jika gagal
+    """
+    assigner = TableAssigner(db.read_meja() or [])
+    kandidat = assigner.kandidat(jumlah_orang)
+    
+    # Validasi input dengan kandidat pertama sebagai meja
+    pemesanan = Pemesanan(pelanggan_id=pelanggan_id,
+                         meja_id=kandidat[0]['id'] if kandidat else None,
+                         tanggal_pemesanan=tanggal_pemesanan,
+                         jumlah_orang=jumlah_orang, catatan=catatan)
+    is_valid, error_msg = pemesanan.validate_data()
     
-    if meja[0]['status'] != 'tersedia':
-        print(f"✗ Meja nomor {meja[0]['nomor_meja']} tidak tersedia (status: {meja[0]['status']})")
+    if not kandidat:
+        print(f"✗ Tidak ada meja dengan kapasitas untuk {jumlah_orang} orang")
         return None
     
-    # Cek kapasitas meja
-    if jumlah_orang > meja[0]['kapasitas']:
-        print(f"✗ Jumlah orang ({jumlah_orang}) melebihi kapasitas meja ({meja[0]['kapasitas']})")
+    if not is_valid:
+        print(f"✗ Validasi gagal: {error_msg}")
         return None
     
-    # Simpan pemesanan
-    pemesanan_id = db.create_pemesanan(pelanggan_id, meja_id, tanggal_pemesanan,
-                                       jumlah_orang, 'pending', catatan)
+    tanggal_pemesanan = pemesanan.tanggal_pemesanan
+    if index is None:
+        index = _index_sementara(db, tanggal_pemesanan)
+    
+    # Coba meja dari yang terkecil; meja yang keburu dipesan host lain dilewati
+    for meja in kandidat:
+        if not index.is_bebas(meja['id'], tanggal_pemesanan):
+            continue
+        reservasi = db.reservasi_meja(pelanggan_id, meja['id'], tanggal_pemesanan,
+                                      jumlah_orang, catatan, durasi=index.durasi)
+        if reservasi['hasil'] == DatabaseManager.RESERVASI_BERHASIL:
+            print(f"✓ Pemesanan berhasil dibuat dengan ID: {reservasi['pemesanan_id']} "
+                  f"(meja nomor {meja['nomor_meja']}, kapasitas {meja['kapasitas']})")
+            return reservasi['pemesanan_id']
+        if reservasi['hasil'] == DatabaseManager.RESERVASI_GAGAL:
+            break
+    
+    print(f"✗ Tidak ada meja kosong untuk {jumlah_orang} orang pada {tanggal_pemesanan}")
+    return None
+
+
+def tambah_pemesanan_batch(db: DatabaseManager, permintaan: List[Dict],
+                           index: AvailabilityIndex = None) -> List[Dict]:
+    """
+    Menempatkan sekumpulan permintaan pemesanan sekaligus agar jumlah tamu
+    yang mendapat meja semaksimal mungkin.
     
-    if pemesanan_id:
-        # Update status meja menjadi reserved
-        db.update_meja_status(meja_id, 'reserved')
-        print(f"✓ Pemesanan berhasil dibuat dengan ID: {pemesanan_id}")
-        return pemesanan_id
-    else:
-        print("✗ Gagal membuat pemesanan")
-        return None
+    Setiap permintaan divalidasi dengan Pemesanan.validate_data terlebih
+    dahulu; permintaan yang tidak valid tidak ikut dialokasikan dan dilaporkan
+    pada hasilnya.
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        permintaan (list): List dictionary dengan key 'pelanggan_id',
+            'tanggal_pemesanan', 'jumlah_orang', dan opsional 'catatan'
+        index (AvailabilityIndex, optional): Index ketersediaan. Default None
+            (dibangun dari database).
+    
+    Returns:
+        list: List dictionary hasil per permintaan (sesuai urutan input) dengan
+              key 'permintaan', 'meja_id', 'pemesanan_id' (None jika gagal),
+              'berhasil' (bool), dan 'pesan' (alasan jika gagal)
+    """
+    if not permintaan:
+        return []
+    
+    meja_list = db.read_meja() or []
+    hasil = [{'permintaan': p, 'meja_id': None, 'pemesanan_id': None,
+              'berhasil': False, 'pesan': ""} for p in permintaan]
+    
+    # Meja dipilih allocator; validasi memakai meja pertama sebagai pengganti
+    meja_pengganti = meja_list[0]['id'] if meja_list else None
+    valid = []
+    for i, p in enumerate(permintaan):
+        pemesanan = Pemesanan(pelanggan_id=p.get('pelanggan_id'), meja_id=meja_pengganti,
+                              tanggal_pemesanan=p.get('tanggal_pemesanan'),
+                              jumlah_orang=p.get('jumlah_orang'),
+                              status=p.get('status', Pemesanan.STATUS_PENDING),
+                              catatan=p.get('catatan', ""))
+        try:
+            is_valid, error_msg = pemesanan.validate_data()
+        except TypeError:
+            # Misal jumlah_orang kosong atau berupa teks
+            is_valid, error_msg = False, "Data pemesanan tidak lengkap atau tipenya salah"
+        if not meja_list:
+            is_valid, error_msg = False, "Belum ada data meja"
+        
+        if is_valid:
+            valid.append((i, dict(p, tanggal_pemesanan=pemesanan.tanggal_pemesanan)))
+        else:
+            hasil[i]['pesan'] = error_msg
+    
+    if valid:
+        if index is None:
+            index = _index_sementara(db, min(p['tanggal_pemesanan'] for _, p in valid))
+        
+        assigner = TableAssigner(meja_list, index)
+        alokasi = assigner.alokasi_batch([p for _, p in valid])
+        
+        for (i, _), (p, meja) in zip(valid, alokasi):
+            if meja is None:
+                hasil[i]['pesan'] = (f"Tidak ada meja kosong untuk {p['jumlah_orang']} orang "
+                                     f"pada {p['tanggal_pemesanan']}")
+                continue
+            reservasi = db.reservasi_meja(p['pelanggan_id'], meja['id'],
+                                          p['tanggal_pemesanan'], p['jumlah_orang'],
+                                          p.get('catatan', ""), durasi=index.durasi)
+            hasil[i]['meja_id'] = meja['id']
+            hasil[i]['pemesanan_id'] = reservasi['pemesanan_id']
+            hasil[i]['berhasil'] = reservasi['hasil'] == DatabaseManager.RESERVASI_BERHASIL
+            if not hasil[i]['berhasil']:
+                hasil[i]['pesan'] = f"Reservasi meja gagal: {reservasi['hasil']}"
+    
+    berhasil = [h for h in hasil if h['berhasil']]
+    total_tamu = sum(h['permintaan']['jumlah_orang'] for h in berhasil)
+    print(f"✓ {len(berhasil)} dari {len(permintaan)} permintaan mendapat meja ({total_tamu} tamu)")
+    for i, h in enumerate(hasil):
+        if not h['berhasil']:
+            print(f"✗ Permintaan #{i + 1}: {h['pesan']}")
+    return hasil
 
 
 def lihat_pemesanan(db: DatabaseManager, pemesanan_id: int = None, 
@@ -352,38 +570,91 @@ def lihat_pemesanan(db: DatabaseManager, pemesanan_id: int = None,
         return None
 
 
-def konfirmasi_pemesanan(db: DatabaseManager, pemesanan_id: int) -> bool:
+def lihat_pemesanan_halaman(db: DatabaseManager, after_date=None, after_id: int = None,
+                            page_size: int = 20, status: str = None) -> Optional[Dict]:
     """
-    Mengkonfirmasi pemesanan dan mengubah status meja menjadi terisi.
+    Melihat data pemesanan per halaman (keyset pagination), terbaru lebih dulu.
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        after_date (datetime | str, optional): Kursor tanggal dari halaman sebelumnya. Default None.
+        after_id (int, optional): Kursor ID dari halaman sebelumnya. Default None.
+        page_size (int, optional): Jumlah baris per halaman. Default 20.
+        status (str, optional): Filter status. Default None.
+    
+    Returns:
+        dict: {'data': list pemesanan, 'after_date', 'after_id': kursor halaman
+              berikutnya (None jika sudah halaman terakhir)}, atau None jika gagal
+    """
+    pemesanan_list = db.read_pemesanan_page(after_date, after_id, page_size + 1, status)
+    
+    if pemesanan_list is None:
+        print("✗ Gagal membaca data pemesanan")
+        return None
+    
+    ada_lagi = len(pemesanan_list) > page_size
+    pemesanan_list = pemesanan_list[:page_size]
+    terakhir = pemesanan_list[-1] if ada_lagi else None
+    return {
+        'data': pemesanan_list,
+        'after_date': terakhir['tanggal_pemesanan'] if terakhir else None,
+        'after_id': terakhir['id'] if terakhir else None
+    }
+
+
+def _ubah_status_pemesanan(db: DatabaseManager, pemesanan_id: int, status_baru: str,
+                           status_meja: str, aksi: str) -> Optional[Dict]:
+    """
+    Menjalankan transisi status satu pemesanan dan mencetak pesan kegagalannya.
     
     Args:
         db (DatabaseManager): Instance database manager
         pemesanan_id (int): ID pemesanan
+        status_baru (str): Status tujuan
+        status_meja (str): Status meja setelah transisi
+        aksi (str): Nama aksi untuk pesan gagal (misal 'mengkonfirmasi')
     
     Returns:
-        bool: True jika berhasil, False jika gagal
+        dict: Hasil transisi_pemesanan jika berhasil, atau None jika gagal
     """
-    # Ambil data pemesanan
-    pemesanan = db.read_pemesanan(pemesanan_id)
+    hasil = db.transisi_pemesanan(pemesanan_id, status_baru,
+                                  Pemesanan.TRANSISI[status_baru], status_meja)
     
-    if not pemesanan or len(pemesanan) == 0:
+    if hasil['hasil'] == DatabaseManager.TRANSISI_BERHASIL:
+        return hasil
+    elif hasil['hasil'] == DatabaseManager.TRANSISI_TIDAK_DITEMUKAN:
         print(f"✗ Pemesanan ID {pemesanan_id} tidak ditemukan")
-        return False
+    elif hasil['hasil'] == DatabaseManager.TRANSISI_TIDAK_VALID:
+        print(f"✗ Pemesanan ID {pemesanan_id} berstatus {hasil['status']}, "
+              f"tidak bisa diubah menjadi {status_baru}")
+    else:
+        print(f"✗ Gagal {aksi} pemesanan ID {pemesanan_id}")
+    return None
+
+
+def konfirmasi_pemesanan(db: DatabaseManager, pemesanan_id: int) -> bool:
+    """
+    Mengkonfirmasi pemesanan (pending -> confirmed) dan mengubah status meja
+    menjadi terisi dalam satu transaksi.
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        pemesanan_id (int): ID pemesanan
     
-    # Update status pemesanan
-    if db.update_pemesanan_status(pemesanan_id, 'confirmed'):
-        # Update status meja menjadi terisi
-        db.update_meja_status(pemesanan[0]['meja_id'], 'terisi')
+    Returns:
+        bool: True jika berhasil, False jika gagal
+    """
+    if _ubah_status_pemesanan(db, pemesanan_id, Pemesanan.STATUS_CONFIRMED,
+                              Meja.STATUS_TERISI, "mengkonfirmasi"):
         print(f"✓ Pemesanan ID {pemesanan_id} dikonfirmasi")
         return True
-    else:
-        print(f"✗ Gagal mengkonfirmasi pemesanan ID {pemesanan_id}")
-        return False
+    return False
 
 
 def selesaikan_pemesanan(db: DatabaseManager, pemesanan_id: int) -> bool:
     """
-    Menyelesaikan pemesanan dan membebaskan meja.
+    Menyelesaikan pemesanan (confirmed -> completed) dan membebaskan meja
+    dalam satu transaksi.
     
     Args:
         db (DatabaseManager): Instance database manager
@@ -392,27 +663,20 @@ def selesaikan_pemesanan(db: DatabaseManager, pemesanan_id: int) -> bool:
     Returns:
         bool: True jika berhasil, False jika gagal
     """
-    # Ambil data pemesanan
-    pemesanan = db.read_pemesanan(pemesanan_id)
-    
-    if not pemesanan or len(pemesanan) == 0:
-        print(f"✗ Pemesanan ID {pemesanan_id} tidak ditemukan")
-        return False
-    
-    # Update status pemesanan
-    if db.update_pemesanan_status(pemesanan_id, 'completed'):
-        # Bebaskan meja (ubah status menjadi tersedia)
-        db.update_meja_status(pemesanan[0]['meja_id'], 'tersedia')
-        print(f"✓ Pemesanan ID {pemesanan_id} selesai, meja nomor {pemesanan[0]['nomor_meja']} tersedia")
+    hasil = _ubah_status_pemesanan(db, pemesanan_id, Pemesanan.STATUS_COMPLETED,
+                                   Meja.STATUS_TERSEDIA, "menyelesaikan")
+    if hasil:
+        meja = db.read_meja(hasil['meja_id'])
+        nomor_meja = meja[0]['nomor_meja'] if meja else hasil['meja_id']
+        print(f"✓ Pemesanan ID {pemesanan_id} selesai, meja nomor {nomor_meja} tersedia")
         return True
-    else:
-        print(f"✗ Gagal menyelesaikan pemesanan ID {pemesanan_id}")
-        return False
+    return False
 
 
 def batalkan_pemesanan(db: DatabaseManager, pemesanan_id: int) -> bool:
     """
-    Membatalkan pemesanan dan membebaskan meja.
+    Membatalkan pemesanan (pending/confirmed -> cancelled) dan membebaskan
+    meja dalam satu transaksi.
     
     Args:
         db (DatabaseManager): Instance database manager
@@ -421,23 +685,91 @@ def batalkan_pemesanan(db: DatabaseManager, pemesanan_id: int) -> bool:
     Returns:
         bool: True jika berhasil, False jika gagal
     """
-    # Ambil data pemesanan
-    pemesanan = db.read_pemesanan(pemesanan_id)
-    
-    if not pemesanan or len(pemesanan) == 0:
-        print(f"✗ Pemesanan ID {pemesanan_id} tidak ditemukan")
-        return False
-    
-    # Update status pemesanan
-    if db.update_pemesanan_status(pemesanan_id, 'cancelled'):
-        # Bebaskan meja jika belum selesai
-        if pemesanan[0]['status'] != 'completed':
-            db.update_meja_status(pemesanan[0]['meja_id'], 'tersedia')
+    if _ubah_status_pemesanan(db, pemesanan_id, Pemesanan.STATUS_CANCELLED,
+                              Meja.STATUS_TERSEDIA, "membatalkan"):
         print(f"✓ Pemesanan ID {pemesanan_id} dibatalkan")
         return True
-    else:
-        print(f"✗ Gagal membatalkan pemesanan ID {pemesanan_id}")
-        return False
+    return False
+
+
+def selesaikan_pemesanan_banyak(db: DatabaseManager, pemesanan_ids: List[int]) -> Optional[List[int]]:
+    """
+    Menyelesaikan banyak pemesanan sekaligus (misal di akhir shift) dalam
+    satu transaksi. Pemesanan yang belum dikonfirmasi dilewati.
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        pemesanan_ids (list): Daftar ID pemesanan
+    
+    Returns:
+        list: ID pemesanan yang diselesaikan, atau None jika gagal
+    """
+    selesai = db.transisi_pemesanan_banyak(pemesanan_ids, Pemesanan.STATUS_COMPLETED,
+                                           Pemesanan.TRANSISI[Pemesanan.STATUS_COMPLETED],
+                                           Meja.STATUS_TERSEDIA)
+    if selesai is None:
+        print("✗ Gagal menyelesaikan pemesanan")
+        return None
+    
+    print(f"✓ {len(selesai)} dari {len(pemesanan_ids)} pemesanan diselesaikan")
+    dilewati = sorted(set(pemesanan_ids) - set(selesai))
+    if dilewati:
+        print(f"  Dilewati (tidak ditemukan/belum dikonfirmasi): {', '.join(map(str, dilewati))}")
+    return selesai
+
+
+def tutup_hari(db: DatabaseManager, batas=None, limit: int = None) -> Optional[List[int]]:
+    """
+    Menyelesaikan semua pemesanan confirmed sebelum batas waktu (tutup hari)
+    dan membebaskan mejanya dalam satu transaksi set-based.
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        batas (datetime | str, optional): Batas eksklusif tanggal_pemesanan.
+            Default None (waktu sekarang).
+        limit (int, optional): Jumlah maksimum pemesanan. Default None (semua).
+    
+    Returns:
+        list: ID pemesanan yang diselesaikan, atau None jika gagal
+    """
+    batas = batas if batas is not None else datetime.now()
+    selesai = db.transisi_pemesanan_sebelum(batas, Pemesanan.STATUS_COMPLETED,
+                                            Pemesanan.TRANSISI[Pemesanan.STATUS_COMPLETED],
+                                            Meja.STATUS_TERSEDIA, limit)
+    if selesai is None:
+        print("✗ Gagal menutup hari")
+        return None
+    
+    print(f"✓ {len(selesai)} pemesanan confirmed sebelum {batas} diselesaikan")
+    return selesai
+
+
+def batalkan_no_show(db: DatabaseManager, telat: timedelta = timedelta(minutes=30),
+                     sekarang=None, limit: int = None) -> Optional[List[int]]:
+    """
+    Membatalkan pemesanan pending yang sudah lewat lebih dari `telat` dari
+    tanggal_pemesanan (no-show) dan membebaskan mejanya dalam satu transaksi.
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        telat (timedelta, optional): Toleransi keterlambatan. Default 30 menit.
+        sekarang (datetime, optional): Waktu acuan. Default None (waktu sekarang).
+        limit (int, optional): Jumlah maksimum pemesanan. Default None (semua).
+    
+    Returns:
+        list: ID pemesanan yang dibatalkan, atau None jika gagal
+    """
+    sekarang = sekarang if sekarang is not None else datetime.now()
+    batal = db.transisi_pemesanan_sebelum(sekarang - telat, Pemesanan.STATUS_CANCELLED,
+                                          (Pemesanan.STATUS_PENDING,),
+                                          Meja.STATUS_TERSEDIA, limit)
+    if batal is None:
+        print("✗ Gagal membatalkan pemesanan no-show")
+        return None
+    
+    if batal:
+        print(f"✓ {len(batal)} pemesanan no-show dibatalkan: {', '.join(map(str, batal))}")
+    return batal
 
 
 def hapus_pemesanan(db: DatabaseManager, pemesanan_id: int) -> bool:
@@ -452,7 +784,7 @@ def hapus_pemesanan(db: DatabaseManager, pemesanan_id: int) -> bool:
         bool: True jika berhasil, False jika gagal
     """
     # Ambil data pemesanan terlebih dahulu untuk bebaskan meja jika perlu
-    pemesanan = db.read_pemesanan(pemesanan_id)
+    pemesanan = db.read_pemesanan_ringkas(pemesanan_id)
     
     if pemesanan and len(pemesanan) > 0:
         # Bebaskan meja jika pemesanan masih aktif
@@ -467,11 +799,154 @@ def hapus_pemesanan(db: DatabaseManager, pemesanan_id: int) -> bool:
         return False
 
 
+# ========== FUNGSI IMPOR MASSAL ==========
+
+def _impor_bulk(data: List[Dict], buat_entity, kolom: tuple, bulk_fn,
+                chunk_size: int, nama: str) -> Dict:
+    """
+    Memvalidasi setiap baris dengan validate_data milik model, lalu menyimpan
+    baris yang valid lewat fungsi bulk DatabaseManager.
+    
+    Args:
+        data (list): Data mentah, satu item per baris
+        buat_entity (callable): Fungsi item -> objek model
+        kolom (tuple): Atribut model yang disimpan, sesuai urutan kolom bulk
+        bulk_fn (callable): Fungsi bulk_create_* milik DatabaseManager
+        chunk_size (int): Jumlah baris per batch
+        nama (str): Nama entitas untuk pesan
+    
+    Returns:
+        dict: {'total', 'berhasil', 'gagal': list dict {'baris', 'pesan'}}
+    """
+    rows = []
+    asal = []
+    gagal = []
+    
+    for i, item in enumerate(data):
+        entity = buat_entity(item)
+        is_valid, error_msg = entity.validate_data()
+        if is_valid:
+            rows.append(tuple(getattr(entity, k) for k in kolom))
+            asal.append(i)
+        else:
+            gagal.append({'baris': i, 'pesan': error_msg})
+    
+    return _simpan_bulk(rows, asal, gagal, bulk_fn, chunk_size, nama, len(data))
+
+
+def _simpan_bulk(rows: List[tuple], asal: List[int], gagal: List[Dict], bulk_fn,
+                 chunk_size: int, nama: str, total: int) -> Dict:
+    """
+    Menyimpan baris yang sudah lolos validasi lewat fungsi bulk DatabaseManager
+    dan menggabungkan error validasi dengan error database.
+    
+    Args:
+        rows (list): Tuple baris valid
+        asal (list): Indeks asli setiap baris valid di data input
+        gagal (list): Error validasi, list dict {'baris', 'pesan'}
+        bulk_fn (callable): Fungsi bulk_create_* milik DatabaseManager
+        chunk_size (int): Jumlah baris per batch
+        nama (str): Nama entitas untuk pesan
+        total (int): Jumlah baris input
+    
+    Returns:
+        dict: {'total', 'berhasil', 'gagal': list dict {'baris', 'pesan'}}
+    """
+    hasil_db = bulk_fn(rows, chunk_size=chunk_size) if rows else {'berhasil': 0, 'gagal': []}
+    gagal.extend({'baris': asal[i], 'pesan': pesan} for i, pesan in hasil_db['gagal'])
+    gagal.sort(key=lambda g: g['baris'])
+    
+    print(f"✓ Impor {nama}: {hasil_db['berhasil']} berhasil, {len(gagal)} gagal "
+          f"dari {total} baris")
+    return {'total': total, 'berhasil': hasil_db['berhasil'], 'gagal': gagal}
+
+
+def tambah_pelanggan_bulk(db: DatabaseManager, data: List[Dict],
+                          chunk_size: int = 1000) -> Dict:
+    """
+    Mengimpor banyak pelanggan sekaligus (misal dari daftar loyalty POS lama).
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        data (list): List dictionary dengan key 'nama', 'telepon', dan opsional 'email'
+        chunk_size (int, optional): Jumlah baris per batch. Default 1000.
+    
+    Returns:
+        dict: {'total', 'berhasil', 'gagal': list dict {'baris', 'pesan'}}
+    """
+    # Validasi batch dengan kode error (tanpa objek Pelanggan per baris)
+    rows = [(d.get('nama', ""), d.get('telepon', ""), d.get('email') or "") for d in data]
+    asal = []
+    gagal = []
+    for i, kode in enumerate(validate_many(rows)):
+        if kode == VALID:
+            asal.append(i)
+        else:
+            gagal.append({'baris': i, 'pesan': PESAN[kode]})
+    
+    return _simpan_bulk([rows[i] for i in asal], asal, gagal, db.bulk_create_pelanggan,
+                        chunk_size, "pelanggan", len(data))
+
+
+def tambah_meja_bulk(db: DatabaseManager, data: List[Dict],
+                     chunk_size: int = 1000) -> Dict:
+    """
+    Mengimpor banyak meja sekaligus.
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        data (list): List dictionary dengan key 'nomor_meja', 'kapasitas',
+            dan opsional 'status'
+        chunk_size (int, optional): Jumlah baris per batch. Default 1000.
+    
+    Returns:
+        dict: {'total', 'berhasil', 'gagal': list dict {'baris', 'pesan'}}
+    """
+    return _impor_bulk(
+        data,
+        lambda d: Meja(nomor_meja=d.get('nomor_meja', 0), kapasitas=d.get('kapasitas', 0),
+                       status=d.get('status', Meja.STATUS_TERSEDIA)),
+        ('nomor_meja', 'kapasitas', 'status'), db.bulk_create_meja, chunk_size, "meja")
+
+
+def tambah_pemesanan_bulk(db: DatabaseManager, data: List[Dict],
+                          chunk_size: int = 1000) -> Dict:
+    """
+    Mengimpor banyak pemesanan sekaligus (misal riwayat dari POS lama).
+    Tidak memeriksa ketersediaan meja; dipakai untuk data historis.
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        data (list): List dictionary dengan key 'pelanggan_id', 'meja_id',
+            'tanggal_pemesanan', 'jumlah_orang', opsional 'status' dan 'catatan'
+        chunk_size (int, optional): Jumlah baris per batch. Default 1000.
+    
+    Returns:
+        dict: {'total', 'berhasil', 'gagal': list dict {'baris', 'pesan'}}
+    """
+    def buat_pemesanan(baris):
+        d, tanggal = baris
+        # Tanggal yang gagal diparse (None) diteruskan mentah agar dilaporkan validate_data
+        return Pemesanan(pelanggan_id=d.get('pelanggan_id'), meja_id=d.get('meja_id'),
+                         tanggal_pemesanan=tanggal or d.get('tanggal_pemesanan'),
+                         jumlah_orang=d.get('jumlah_orang', 0),
+                         status=d.get('status', Pemesanan.STATUS_PENDING),
+                         catatan=d.get('catatan') or "")
+    
+    # Semua tanggal diparse sekaligus sebelum validasi per baris
+    tanggal = parse_tanggal_many([d.get('tanggal_pemesanan') for d in data])
+    return _impor_bulk(
+        list(zip(data, tanggal)), buat_pemesanan,
+        ('pelanggan_id', 'meja_id', 'tanggal_pemesanan', 'jumlah_orang', 'status', 'catatan'),
+        db.bulk_create_pemesanan, chunk_size, "pemesanan")
+
+
 # ========== FUNGSI LAPORAN ==========
 
 def generate_laporan_pemesanan(db: DatabaseManager, status: str = None,
                                tanggal_mulai: str = None, 
-                               tanggal_akhir: str = None) -> Optional[List[Dict]]:
+                               tanggal_akhir: str = None,
+                               result_format: str = None) -> Optional[List[Dict]]:
     """
     Menghasilkan laporan pemesanan dengan filter.
     
@@ -480,80 +955,205 @@ def generate_laporan_pemesanan(db: DatabaseManager, status: str = None,
         status (str, optional): Filter status. Default None.
         tanggal_mulai (str, optional): Filter tanggal mulai. Default None.
         tanggal_akhir (str, optional): Filter tanggal akhir. Default None.
+        result_format (str, optional): Bentuk hasil, misal DatabaseManager.FORMAT_KOLOM
+            untuk dianalisis/dicetak langsung. Default None (list dictionary).
     
     Returns:
-        list: List dictionary laporan pemesanan, atau None jika gagal
+        list: List dictionary laporan pemesanan (atau bentuk sesuai result_format),
+              atau None jika gagal
     """
-    laporan = db.get_laporan_pemesanan(status, tanggal_mulai, tanggal_akhir)
+    laporan = db.get_laporan_pemesanan(status, tanggal_mulai, tanggal_akhir,
+                                       result_format=result_format)
     
-    if laporan:
-        print(f"✓ Laporan berhasil dihasilkan: {len(laporan)} record")
+    jumlah = len(laporan['id']) if isinstance(laporan, dict) else len(laporan or [])
+    if jumlah:
+        print(f"✓ Laporan berhasil dihasilkan: {jumlah} record")
         return laporan
     else:
         print("✗ Tidak ada data untuk laporan")
         return None
 
 
-def analisis_laporan(laporan: List[Dict]) -> Dict:
+def generate_laporan_stream(db: DatabaseManager, status: str = None,
+                            tanggal_mulai: str = None, tanggal_akhir: str = None,
+                            batch_size: int = 1000) -> Iterator[Dict]:
+    """
+    Menghasilkan laporan pemesanan sebagai iterator dengan memori konstan,
+    untuk laporan/analisis atas jutaan pemesanan.
+    
+    Args:
+        db (DatabaseManager): Instance database manager
+        status (str, optional): Filter status. Default None.
+        tanggal_mulai (str, optional): Filter tanggal mulai. Default None.
+        tanggal_akhir (str, optional): Filter tanggal akhir. Default None.
+        batch_size (int, optional): Jumlah baris per fetch. Default 1000.
+    
+    Returns:
+        iterator: Iterator dictionary laporan pemesanan; melempar DB_ERRORS
+                  jika query gagal, termasuk di tengah aliran
+    """
+    return db.iter_laporan_pemesanan(status, tanggal_mulai, tanggal_akhir, batch_size)
+
+
+def _pakai_numpy(backend: str) -> bool:
+    """Memeriksa apakah backend NumPy diminta dan tersedia."""
+    if backend != 'numpy':
+        return False
+    if not numpy_analytics.NUMPY_TERSEDIA:
+        print("✗ NumPy belum terinstall, analisis memakai jalur Python")
+        return False
+    return True
+
+
+def analisis_laporan(laporan: Iterable[Dict], backend: str = 'python') -> Dict:
     """
     Menganalisis data laporan pemesanan dan menghasilkan statistik.
+    Data dibaca dalam satu kali loop oleh ReportAggregator sehingga juga
+    bisa berupa iterator (misal dari generate_laporan_stream). Laporan
+    berbentuk kolom (result_format FORMAT_KOLOM) dihitung per kolom.
     
     Args:
-        laporan (list): List dictionary data pemesanan
+        laporan (iterable | dict): List atau iterator dictionary data pemesanan,
+            atau dict {nama kolom: list nilai}
+        backend (str, optional): 'python' atau 'numpy' (vektor, hasil identik;
+            kembali ke 'python' jika numpy tidak terinstall). Default 'python'.
     
     Returns:
         dict: Dictionary berisi statistik analisis
     """
-    if not laporan or len(laporan) == 0:
-        return None
+    if _pakai_numpy(backend):
+        return numpy_analytics.analisis(laporan)
+    if isinstance(laporan, dict):
+        return ReportAggregator().tambah_kolom(laporan).hasil()
+    return ReportAggregator().tambah_semua(laporan or []).hasil()
+
+
+def analisis_operasional(laporan: Iterable[Dict], backend: str = 'python') -> Optional[Dict]:
+    """
+    Menghitung distribusi pemesanan per jam dan tingkat keberhasilan
+    (completed dibanding completed + cancelled) dari data laporan.
+    
+    Args:
+        laporan (iterable | dict): List atau iterator dictionary data pemesanan,
+            atau dict {nama kolom: list nilai}
+        backend (str, optional): 'python' atau 'numpy'. Default 'python'.
+    
+    Returns:
+        dict: 'per_jam' (list 24 jumlah pemesanan, indeks = jam), 'jam_tersibuk'
+              (jam, jumlah; seri: jam terkecil), dan 'tingkat_keberhasilan'
+              (None jika belum ada yang selesai/batal), atau None jika kosong
+    """
+    if _pakai_numpy(backend):
+        return numpy_analytics.analisis_operasional(laporan)
     
-    # Hitung statistik
-    total_pemesanan = len(laporan)
-    total_orang = sum(item['jumlah_orang'] for item in laporan)
+    if isinstance(laporan, dict):
+        pasangan = zip(laporan['tanggal_pemesanan'], laporan['status'])
+    else:
+        pasangan = ((item['tanggal_pemesanan'], item['status']) for item in laporan or [])
+    
+    per_jam = [0] * 24
+    selesai = batal = 0
+    for tanggal, status in pasangan:
+        per_jam[parse_tanggal(tanggal).hour] += 1
+        if status == Pemesanan.STATUS_COMPLETED:
+            selesai += 1
+        elif status == Pemesanan.STATUS_CANCELLED:
+            batal += 1
+    
+    if not any(per_jam):
+        return None
+    jam = per_jam.index(max(per_jam))
+    return {
+        'per_jam': per_jam,
+        'jam_tersibuk': (jam, per_jam[jam]),
+        'tingkat_keberhasilan': selesai / (selesai + batal) if selesai + batal else None
+    }
+
+
+def analisis_laporan_db(db: DatabaseManager, status: str = None,
+                        tanggal_mulai: str = None, tanggal_akhir: str = None) -> Optional[Dict]:
+    """
+    Menghasilkan statistik yang sama dengan analisis_laporan, tetapi dihitung
+    dengan query agregat di database sehingga baris laporan tidak perlu diambil.
     
-    # Statistik per status
-    status_count = {}
-    for item in laporan:
-        status = item['status']
-        status_count[status] = status_count.get(status, 0) + 1
+    Args:
+        db (DatabaseManager): Instance database manager
+        status (str, optional): Filter status. Default None.
+        tanggal_mulai (str, optional): Filter tanggal mulai. Default None.
+        tanggal_akhir (str, optional): Filter tanggal akhir. Default None.
     
-    # Rata-rata jumlah orang per pemesanan
-    avg_orang = total_orang / total_pemesanan if total_pemesanan > 0 else 0
+    Returns:
+        dict: Dictionary berisi statistik analisis, atau None jika tidak ada data
+    """
+    return db.get_statistik_pemesanan(status, tanggal_mulai, tanggal_akhir)
+
+
+def analisis_laporan_harian(db: DatabaseManager, status: str = None,
+                            tanggal_mulai: str = None, tanggal_akhir: str = None) -> Optional[Dict]:
+    """
+    Menghasilkan statistik seperti analisis_laporan dari tabel ringkasan
+    harian (pemesanan_harian), sehingga biayanya sebanding dengan jumlah hari.
+    Ringkasan disusul (catch-up) lebih dulu oleh get_statistik_harian.
     
-    # Meja paling populer
-    meja_count = {}
-    for item in laporan:
-        meja = item['nomor_meja']
-        meja_count[meja] = meja_count.get(meja, 0) + 1
+    Args:
+        db (DatabaseManager): Instance database manager
+        status (str, optional): Filter status. Default None.
+        tanggal_mulai (str, optional): Filter tanggal mulai. Default None.
+        tanggal_akhir (str, optional): Filter tanggal akhir. Default None.
     
-    meja_populer = max(meja_count.items(), key=lambda x: x[1]) if meja_count else (None, 0)
+    Returns:
+        dict: Dictionary berisi statistik analisis, atau None jika tidak ada data
+    """
+    return db.get_statistik_harian(status, tanggal_mulai, tanggal_akhir)
+
+
+def ringkasan_harian(db: DatabaseManager, status: str = None,
+                     tanggal_mulai: str = None, tanggal_akhir: str = None) -> Optional[List[Dict]]:
+    """
+    Mendapatkan jumlah pemesanan dan tamu per hari dari tabel ringkasan harian.
     
-    # Pelanggan dengan pemesanan terbanyak
-    pelanggan_count = {}
-    for item in laporan:
-        pelanggan = item['nama_pelanggan']
-        pelanggan_count[pelanggan] = pelanggan_count.get(pelanggan, 0) + 1
+    Args:
+        db (DatabaseManager): Instance database manager
+        status (str, optional): Filter status. Default None.
+        tanggal_mulai (str, optional): Filter tanggal mulai. Default None.
+        tanggal_akhir (str, optional): Filter tanggal akhir. Default None.
     
-    pelanggan_setia = max(pelanggan_count.items(), key=lambda x: x[1]) if pelanggan_count else (None, 0)
+    Returns:
+        list: List dictionary (tanggal, jumlah_pemesanan, jumlah_orang), atau None jika kosong
+    """
+    ringkasan = db.get_ringkasan_harian(status, tanggal_mulai, tanggal_akhir)
     
-    return {
-        'total_pemesanan': total_pemesanan,
-        'total_orang': total_orang,
-        'avg_orang': avg_orang,
-        'status_count': status_count,
-        'meja_populer': meja_populer,
-        'pelanggan_setia': pelanggan_setia
-    }
+    if ringkasan:
+        return ringkasan
+    else:
+        print("✗ Tidak ada data ringkasan harian")
+        return None
 
 
-def print_laporan(laporan: List[Dict]):
+def print_laporan(laporan: Iterable[Dict]):
     """
     Mencetak laporan pemesanan dengan format yang rapi dan analisis.
+    Baris dicetak sambil dianalisis dalam satu kali loop, sehingga
+    laporan juga bisa berupa iterator dari generate_laporan_stream.
+    Laporan berbentuk kolom (result_format FORMAT_KOLOM) dicetak dengan
+    zip atas kolom tanpa dict per baris.
     
     Args:
-        laporan (list): List dictionary data pemesanan
+        laporan (iterable | dict): List atau iterator dictionary data pemesanan,
+            atau dict {nama kolom: list nilai}
     """
-    if not laporan or len(laporan) == 0:
+    kolom = laporan if isinstance(laporan, dict) else None
+    if kolom is None:
+        rows = iter(laporan or [])
+        try:
+            pertama = next(rows, None)
+        except DB_ERRORS:
+            print("✗ Gagal membaca data laporan")
+            return
+        kosong = pertama is None
+    else:
+        kosong = not kolom.get('id')
+    if kosong:
         print("\n📊 Tidak ada data untuk ditampilkan")
         return
     
@@ -573,23 +1173,46 @@ def print_laporan(laporan: List[Dict]):
         'cancelled': '❌'
     }
     
-    for item in laporan:
-        pemesanan_id = str(item['id'])
-        nama = item['nama_pelanggan'][:20]  # Batasi panjang
-        meja = f"#{item['nomor_meja']}"
-        tanggal = str(item['tanggal_pemesanan'])[:19]
-        orang = str(item['jumlah_orang'])
-        status = item['status']
+    def cetak(pemesanan_id, nama, meja, tanggal, orang, status, catatan):
+        """Mencetak satu baris laporan."""
+        pemesanan_id = str(pemesanan_id)
+        nama = nama[:20]  # Batasi panjang
+        meja = f"#{meja}"
+        tanggal = str(tanggal)[:19]
+        orang = str(orang)
         status_display = f"{status_symbol.get(status, '•')} {status}"
-        catatan = item['catatan'][:19] if item['catatan'] else "-"
+        catatan = catatan[:19] if catatan else "-"
         
         print(f"{pemesanan_id:<5} {nama:<22} {meja:<8} {tanggal:<20} {orang:<7} {status_display:<14} {catatan:<20}")
     
+    def cetak_baris(items):
+        """Mencetak setiap baris lalu meneruskannya ke analisis."""
+        for item in items:
+            cetak(item['id'], item['nama_pelanggan'], item['nomor_meja'],
+                  item['tanggal_pemesanan'], item['jumlah_orang'], item['status'],
+                  item['catatan'])
+            yield item
+    
+    if kolom is None:
+        # Cetak data sekaligus hitung analisis
+        try:
+            analisis = analisis_laporan(cetak_baris(itertools.chain([pertama], rows)))
+        except DB_ERRORS:
+            # Baris yang sudah tercetak bukan laporan lengkap; jangan tampilkan total
+            print("-"*100)
+            print("✗ Laporan terhenti karena error database, data di atas tidak lengkap")
+            return
+    else:
+        for baris in zip(kolom['id'], kolom['nama_pelanggan'], kolom['nomor_meja'],
+                         kolom['tanggal_pemesanan'], kolom['jumlah_orang'], kolom['status'],
+                         kolom['catatan']):
+            cetak(*baris)
+        analisis = analisis_laporan(kolom)
+    
     print("="*100)
-    print(f"📈 Total: {len(laporan)} pemesanan")
+    print(f"📈 Total: {analisis['total_pemesanan']} pemesanan")
     
     # Tampilkan analisis
-    analisis = analisis_laporan(laporan)
     if analisis:
         print("\n" + "="*100)
         print("📊 ANALISIS DATA")
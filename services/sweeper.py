@@ -0,0 +1,159 @@
+"""
+Sweeper Module
+Module ini berisi penyapu berkala untuk pemesanan no-show dan tutup hari.
+
+Setiap putaran menjalankan dua transisi set-based lewat
+DatabaseManager.transisi_pemesanan_sebelum: pemesanan pending yang lewat
+toleransi keterlambatan dibatalkan, dan (jika jam_tutup diatur) pemesanan
+confirmed sebelum jam tutup hari ini diselesaikan. Meja terkait dibebaskan
+dalam transaksi yang sama. Waktu setiap putaran dicatat untuk metrik.
+"""
+
+import threading
+import time
+from datetime import datetime, time as jam, timedelta
+from typing import Dict, Optional
+
+from models.meja import Meja
+from models.pemesanan import Pemesanan
+
+
+class NoShowSweeper:
+    """
+    Penyapu berkala pemesanan no-show dan tutup hari, berjalan di thread latar.
+
+    Attributes:
+        db (DatabaseManager): Instance database manager
+        interval (float): Jeda antar putaran dalam detik
+        telat (timedelta): Toleransi keterlambatan pemesanan pending
+        jam_tutup (time): Jam tutup restoran (None = tidak menutup hari)
+        limit (int): Jumlah maksimum pemesanan per transisi per putaran
+    """
+
+    def __init__(self, db, interval: float = 60.0, telat: timedelta = timedelta(minutes=30),
+                 jam_tutup: Optional[jam] = None, limit: int = None):
+        """
+        Inisialisasi NoShowSweeper.
+
+        Args:
+            db (DatabaseManager): Instance database manager
+            interval (float, optional): Jeda antar putaran (detik). Default 60.0.
+            telat (timedelta, optional): Toleransi keterlambatan. Default 30 menit.
+            jam_tutup (time, optional): Jam tutup, misal time(23, 0). Default None.
+            limit (int, optional): Batas pemesanan per transisi. Default None (semua).
+        """
+        self.db = db
+        self.interval = interval
+        self.telat = telat
+        self.jam_tutup = jam_tutup
+        self.limit = limit
+        self._berhenti = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self._runs = 0
+        self._errors = 0
+        self._total_dibatalkan = 0
+        self._total_ditutup = 0
+        self._total_ms = 0.0
+        self._last_ms = 0.0
+        self._max_ms = 0.0
+
+    def jalankan_sekali(self, sekarang: datetime = None) -> Dict:
+        """
+        Menjalankan satu putaran penyapuan.
+
+        Args:
+            sekarang (datetime, optional): Waktu acuan. Default None (waktu sekarang).
+
+        Returns:
+            dict: dibatalkan (list ID), ditutup (list ID), durasi_ms (float);
+                  list bernilai None jika transisinya gagal
+        """
+        sekarang = sekarang if sekarang is not None else datetime.now()
+        mulai = time.perf_counter()
+
+        dibatalkan = self.db.transisi_pemesanan_sebelum(
+            sekarang - self.telat, Pemesanan.STATUS_CANCELLED,
+            (Pemesanan.STATUS_PENDING,), Meja.STATUS_TERSEDIA, self.limit)
+
+        ditutup = []
+        if self.jam_tutup is not None:
+            batas_tutup = datetime.combine(sekarang.date(), self.jam_tutup)
+            if sekarang >= batas_tutup:
+                ditutup = self.db.transisi_pemesanan_sebelum(
+                    batas_tutup, Pemesanan.STATUS_COMPLETED,
+                    Pemesanan.TRANSISI[Pemesanan.STATUS_COMPLETED],
+                    Meja.STATUS_TERSEDIA, self.limit)
+
+        durasi_ms = (time.perf_counter() - mulai) * 1000
+        with self._lock:
+            self._runs += 1
+            if dibatalkan is None or ditutup is None:
+                self._errors += 1
+            self._total_dibatalkan += len(dibatalkan or [])
+            self._total_ditutup += len(ditutup or [])
+            self._total_ms += durasi_ms
+            self._last_ms = durasi_ms
+            self._max_ms = max(self._max_ms, durasi_ms)
+
+        return {'dibatalkan': dibatalkan, 'ditutup': ditutup, 'durasi_ms': durasi_ms}
+
+    def _loop(self):
+        """Loop thread latar: jalankan putaran, tunggu interval, ulangi sampai stop()."""
+        while True:
+            try:
+                self.jalankan_sekali()
+            except Exception as e:
+                with self._lock:
+                    self._errors += 1
+                print(f"Error pada sweeper: {e}")
+            if self._berhenti.wait(self.interval):
+                break
+
+    def start(self):
+        """Menjalankan penyapu di thread latar (daemon). Tidak berefek jika sudah jalan."""
+        if self.is_running():
+            return
+        self._berhenti.clear()
+        self._thread = threading.Thread(target=self._loop, name="NoShowSweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """
+        Menghentikan thread penyapu dan menunggunya selesai.
+
+        Args:
+            timeout (float, optional): Batas waktu tunggu (detik). Default None.
+        """
+        self._berhenti.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def is_running(self) -> bool:
+        """
+        Memeriksa apakah thread penyapu sedang berjalan.
+
+        Returns:
+            bool: True jika berjalan
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    def stats(self) -> Dict:
+        """
+        Mendapatkan metrik penyapu.
+
+        Returns:
+            dict: runs, errors, total_dibatalkan, total_ditutup, last_ms, avg_ms, max_ms
+        """
+        with self._lock:
+            return {
+                'runs': self._runs,
+                'errors': self._errors,
+                'total_dibatalkan': self._total_dibatalkan,
+                'total_ditutup': self._total_ditutup,
+                'last_ms': self._last_ms,
+                'avg_ms': self._total_ms / self._runs if self._runs else 0.0,
+                'max_ms': self._max_ms
+            }
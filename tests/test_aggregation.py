@@ -0,0 +1,68 @@
+"""
+Unit Tests untuk Agregator Laporan
+Module ini menguji ReportAggregator: satu kali jalan, top-k, dan penggabungan shard.
+"""
+
+import csv
+import io
+import unittest
+from services.aggregation import ReportAggregator, agregasi_paralel
+from services.restaurant_service import analisis_laporan
+from tests.test_laporan import buat_laporan
+
+
+class TestReportAggregator(unittest.TestCase):
+    """
+    Test case untuk kelas ReportAggregator.
+    """
+
+    def test_iterator_sekali_jalan(self):
+        """Test agregator hanya membaca iterator satu kali."""
+        agregator = ReportAggregator().tambah_semua(iter(buat_laporan()))
+        self.assertEqual(agregator.hasil(), analisis_laporan(buat_laporan()))
+        self.assertEqual((agregator.min_orang, agregator.max_orang), (2, 6))
+
+    def test_top_k(self):
+        """Test top-k terurut menurun dengan seri dimenangkan kunci yang muncul lebih dulu."""
+        agregator = ReportAggregator().tambah_semua(buat_laporan())
+        self.assertEqual(agregator.top_meja(2), [(1, 2), (2, 2)])
+        self.assertEqual(agregator.top_pelanggan(1), [('Alice', 3)])
+
+    def test_gabung_sama_dengan_sekaligus(self):
+        """Test menggabungkan shard memberi hasil sama dengan menghitung sekaligus."""
+        laporan = buat_laporan()
+        a = ReportAggregator().tambah_semua(laporan[:2])
+        b = ReportAggregator().tambah_semua(laporan[2:])
+        self.assertEqual(a.gabung(b).hasil(), analisis_laporan(laporan))
+
+    def test_gabung_agregator_kosong(self):
+        """Test menggabungkan shard kosong tidak mengubah hasil."""
+        a = ReportAggregator().tambah_semua(buat_laporan())
+        sebelum = a.hasil()
+        self.assertEqual(a.gabung(ReportAggregator()).hasil(), sebelum)
+        self.assertIsNone(ReportAggregator().hasil())
+
+    def test_sumber_csv(self):
+        """Test baris CSV (nilai string) bisa langsung dihitung."""
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=['nomor_meja', 'nama_pelanggan',
+                                                    'jumlah_orang', 'status'])
+        writer.writeheader()
+        for item in buat_laporan():
+            writer.writerow({k: item[k] for k in writer.fieldnames})
+        buffer.seek(0)
+
+        hasil = ReportAggregator().tambah_semua(csv.DictReader(buffer)).hasil()
+        self.assertEqual(hasil['total_orang'], 17)
+        self.assertEqual(hasil['meja_populer'], ('1', 2))
+
+    def test_agregasi_paralel(self):
+        """Test shard dihitung paralel lalu digabung sesuai urutan."""
+        laporan = buat_laporan()
+        shard = [laporan[0:1], laporan[1:3], iter(laporan[3:])]
+        hasil = agregasi_paralel(shard, max_workers=3).hasil()
+        self.assertEqual(hasil, analisis_laporan(laporan))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Unit Tests untuk Table Assigner
+Module ini menguji pemilihan meja best-fit, alokasi batch, dan pemesanan
+otomatis yang bercampur dengan pemesanan meja pilihan di database.
+"""
+
+import contextlib
+import io
+import unittest
+from database.sqlite_manager import SQLiteDatabaseManager
+from services.assignment import TableAssigner, total_tamu_duduk
+from services.availability import AvailabilityIndex
+from services.restaurant_service import (tambah_pemesanan, tambah_pemesanan_batch,
+                                          tambah_pemesanan_otomatis)
+
+
+def buat_meja(*kapasitas):
+    """Membuat list meja dengan nomor berurutan dari daftar kapasitas."""
+    return [{'id': i, 'nomor_meja': i, 'kapasitas': k}
+            for i, k in enumerate(kapasitas, start=1)]
+
+
+class TestTableAssigner(unittest.TestCase):
+    """
+    Test case untuk kelas TableAssigner.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.index = AvailabilityIndex()
+        self.assigner = TableAssigner(buat_meja(8, 2, 4, 4, 6), self.index)
+
+    def test_pilih_meja_terkecil_yang_muat(self):
+        """Test 2 orang mendapat meja 2 kursi, bukan meja 8 kursi."""
+        meja = self.assigner.pilih_meja(2, "2025-12-24 19:00:00")
+        self.assertEqual(meja['kapasitas'], 2)
+
+        meja = self.assigner.pilih_meja(5, "2025-12-24 19:00:00")
+        self.assertEqual(meja['kapasitas'], 6)
+
+    def test_pilih_meja_lewati_slot_terisi(self):
+        """Test meja yang sudah dipesan pada slot tersebut dilewati."""
+        self.index.tambah(1, meja_id=2, mulai="2025-12-24 19:00:00")
+        meja = self.assigner.pilih_meja(2, "2025-12-24 19:30:00")
+        self.assertEqual(meja['kapasitas'], 4)
+
+    def test_pilih_meja_tidak_ada_yang_muat(self):
+        """Test rombongan lebih besar dari semua meja."""
+        self.assertIsNone(self.assigner.pilih_meja(10, "2025-12-24 19:00:00"))
+
+    def test_alokasi_batch_rombongan_besar_dahulu(self):
+        """Test batch menempatkan rombongan besar sebelum rombongan kecil."""
+        assigner = TableAssigner(buat_meja(2, 6))
+        waktu = "2025-12-24 19:00:00"
+        permintaan = [
+            {'jumlah_orang': 2, 'tanggal_pemesanan': waktu},
+            {'jumlah_orang': 2, 'tanggal_pemesanan': waktu},
+            {'jumlah_orang': 6, 'tanggal_pemesanan': waktu},
+        ]
+        alokasi = assigner.alokasi_batch(permintaan)
+
+        self.assertEqual(alokasi[2][1]['kapasitas'], 6)
+        self.assertEqual(alokasi[0][1]['kapasitas'], 2)
+        self.assertIsNone(alokasi[1][1])
+        self.assertEqual(total_tamu_duduk(alokasi), 8)
+
+    def test_alokasi_batch_slot_berbeda_meja_sama(self):
+        """Test satu meja dipakai dua kali pada slot yang tidak beririsan."""
+        assigner = TableAssigner(buat_meja(4))
+        permintaan = [
+            {'jumlah_orang': 4, 'tanggal_pemesanan': "2025-12-24 17:00:00"},
+            {'jumlah_orang': 4, 'tanggal_pemesanan': "2025-12-24 19:00:00"},
+        ]
+        alokasi = assigner.alokasi_batch(permintaan)
+        self.assertTrue(all(meja is not None for _, meja in alokasi))
+        self.assertEqual(len(assigner.index), 0)
+
+
+
+class TestPemesananCampuran(unittest.TestCase):
+    """
+    Test case untuk pemesanan otomatis (slot waktu) dan meja pilihan (flag
+    meja.status) pada database yang sama.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.db = SQLiteDatabaseManager(':memory:')
+        self.assertTrue(self.db.connect() and self.db.create_tables())
+        self.pelanggan_id = self.db.create_pelanggan("Budi", "081234567890")
+        self.meja_id = self.db.create_meja(1, 4)
+        self.out = io.StringIO()
+
+    def tearDown(self):
+        """Cleanup setelah setiap test."""
+        self.db.disconnect()
+
+    def otomatis(self, tanggal):
+        """Memesan meja otomatis untuk 2 orang."""
+        with contextlib.redirect_stdout(self.out):
+            return tambah_pemesanan_otomatis(self.db, self.pelanggan_id, tanggal, 2)
+
+    def pilih_meja(self, tanggal):
+        """Memesan meja test untuk 2 orang."""
+        with contextlib.redirect_stdout(self.out):
+            return tambah_pemesanan(self.db, self.pelanggan_id, self.meja_id, tanggal, 2)
+
+    def test_meja_pilihan_setelah_otomatis(self):
+        """Test meja yang sudah dipesan otomatis tidak bisa dipesan lagi di jam yang sama."""
+        self.assertTrue(self.otomatis("2026-12-01 19:00:00"))
+        self.assertEqual(self.db.read_meja(self.meja_id)[0]['status'], 'tersedia')
+
+        self.assertIsNone(self.pilih_meja("2026-12-01 20:00:00"))
+        self.assertIn("sudah dipesan pada waktu tersebut", self.out.getvalue())
+        self.assertEqual(len(self.db.read_pemesanan()), 1)
+        self.assertEqual(self.db.read_meja(self.meja_id)[0]['status'], 'tersedia')
+
+        # Slot yang tidak beririsan tetap bisa dipesan lewat meja pilihan
+        self.assertTrue(self.pilih_meja("2026-12-01 21:00:00"))
+
+    def test_otomatis_setelah_meja_pilihan(self):
+        """Test pemesanan otomatis melewati meja yang sudah dipesan di jam yang sama."""
+        self.assertTrue(self.pilih_meja("2026-12-01 19:00:00"))
+        self.assertIsNone(self.otomatis("2026-12-01 19:30:00"))
+        self.assertEqual(len(self.db.read_pemesanan()), 1)
+
+
+    def test_batch_validasi_per_permintaan(self):
+        """Test permintaan batch yang tidak valid dilaporkan tanpa menggagalkan yang lain."""
+        permintaan = [
+            {'pelanggan_id': self.pelanggan_id, 'tanggal_pemesanan': "2026-12-01 19:00:00",
+             'jumlah_orang': 2},
+            {'pelanggan_id': self.pelanggan_id, 'tanggal_pemesanan': "01-12-2026 19:00",
+             'jumlah_orang': 2},
+            {'pelanggan_id': self.pelanggan_id, 'tanggal_pemesanan': "2026-12-01 12:00:00",
+             'jumlah_orang': 0},
+            {'pelanggan_id': self.pelanggan_id, 'tanggal_pemesanan': "2026-12-01 12:00:00",
+             'jumlah_orang': 2, 'status': 'selesai'},
+            {'pelanggan_id': self.pelanggan_id, 'tanggal_pemesanan': "2026-12-01 12:00:00"},
+            {'pelanggan_id': self.pelanggan_id, 'tanggal_pemesanan': "2026-12-01 20:00:00",
+             'jumlah_orang': 2},
+        ]
+        with contextlib.redirect_stdout(self.out):
+            hasil = tambah_pemesanan_batch(self.db, permintaan)
+
+        self.assertEqual([h['berhasil'] for h in hasil],
+                         [True, False, False, False, False, False])
+        self.assertTrue(hasil[0]['pemesanan_id'])
+        self.assertIn("Format tanggal tidak valid", hasil[1]['pesan'])
+        self.assertIn("Jumlah orang harus lebih dari 0", hasil[2]['pesan'])
+        self.assertIn("Status harus salah satu dari", hasil[3]['pesan'])
+        self.assertIn("tipenya salah", hasil[4]['pesan'])
+        self.assertIn("Tidak ada meja kosong", hasil[5]['pesan'])
+        self.assertIsNone(hasil[1]['meja_id'])
+        self.assertEqual(len(self.db.read_pemesanan()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
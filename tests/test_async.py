@@ -0,0 +1,101 @@
+"""
+Unit Tests untuk API Async
+Module ini menguji AsyncDatabaseManager dan fungsi service async di atas SQLite.
+"""
+
+import asyncio
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from database.async_manager import AsyncDatabaseManager
+from database.sqlite_manager import SQLiteDatabaseManager
+from services import async_service
+
+
+class TestAsyncDatabaseManager(unittest.TestCase):
+    """
+    Test case untuk facade AsyncDatabaseManager.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.db = SQLiteDatabaseManager(':memory:')
+
+    def test_tanpa_pool_satu_thread(self):
+        """Test koneksi bersama hanya dipakai satu thread."""
+        self.assertEqual(AsyncDatabaseManager(self.db).max_workers, 1)
+
+    def test_method_db_bisa_di_await(self):
+        """Test method publik DatabaseManager diteruskan sebagai coroutine."""
+        async def skenario():
+            async with AsyncDatabaseManager(self.db) as adb:
+                self.assertTrue(await adb.connect())
+                self.assertTrue(await adb.create_tables())
+                meja_id = await adb.create_meja(1, 4)
+                meja = await adb.read_meja(meja_id)
+                return meja, adb.stats(), adb.DIALEK
+
+        meja, stats, dialek = asyncio.run(skenario())
+        self.assertEqual(meja[0]['nomor_meja'], 1)
+        self.assertEqual(stats['calls'], 4)
+        self.assertEqual(stats['in_flight'], 0)
+        self.assertEqual(dialek, 'sqlite')
+
+    def test_atribut_privat_tidak_diteruskan(self):
+        """Test atribut privat tidak dibuka lewat facade."""
+        with self.assertRaises(AttributeError):
+            AsyncDatabaseManager(self.db)._transisi
+
+
+class TestAsyncService(unittest.TestCase):
+    """
+    Test case untuk fungsi service async pada database file dengan pool.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.direktori = tempfile.mkdtemp()
+        self.config = {'backend': 'sqlite', 'path': os.path.join(self.direktori, "r.db"),
+                       'pool_size': 4}
+
+    def tearDown(self):
+        """Cleanup setelah setiap test."""
+        shutil.rmtree(self.direktori, ignore_errors=True)
+
+    def test_pemesanan_bersamaan(self):
+        """Test banyak tambah_pemesanan bersamaan pada satu meja: hanya satu berhasil."""
+        async def skenario():
+            adb = await async_service.init_database_async(self.config)
+            async with adb:
+                pelanggan_id = await async_service.tambah_pelanggan(adb, "Budi", "081234567890")
+                meja_id = await adb.create_meja(1, 4)
+
+                hasil = await asyncio.gather(*[
+                    async_service.tambah_pemesanan(adb, pelanggan_id, meja_id,
+                                                   "2025-12-24 19:00:00", 2)
+                    for _ in range(10)])
+                tersedia = await async_service.lihat_meja_tersedia(adb)
+                laporan = await async_service.generate_laporan_pemesanan(adb)
+                return hasil, tersedia, laporan, adb.stats()
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            hasil, tersedia, laporan, stats = asyncio.run(skenario())
+
+        self.assertEqual(len([h for h in hasil if h]), 1)
+        self.assertIsNone(tersedia)
+        self.assertEqual(len(laporan), 1)
+        self.assertEqual(stats['max_workers'], 4)
+        self.assertGreater(stats['max_in_flight'], 1)
+
+    def test_init_gagal(self):
+        """Test init_database_async mengembalikan None jika koneksi gagal."""
+        config = dict(self.config, path=os.path.join(self.direktori, "tidak", "ada.db"))
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertIsNone(asyncio.run(async_service.init_database_async(config)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Unit Tests untuk Availability Index
+Module ini menguji pencarian meja kosong berbasis slot waktu.
+"""
+
+import unittest
+from datetime import datetime, timedelta
+from services.availability import AvailabilityIndex
+
+
+class TestAvailabilityIndex(unittest.TestCase):
+    """
+    Test case untuk kelas AvailabilityIndex.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.index = AvailabilityIndex(durasi=timedelta(hours=2))
+        self.index.tambah(1, meja_id=10, mulai="2025-12-24 21:00:00", pelanggan_id=5)
+        self.index.tambah(2, meja_id=11, mulai="2025-12-24 18:00:00", pelanggan_id=6)
+
+    def test_meja_dipesan_malam_bebas_sore(self):
+        """Test meja yang dipesan jam 21:00 tetap kosong jam 17:00-19:00."""
+        self.assertTrue(self.index.is_bebas(10, "2025-12-24 17:00:00"))
+        self.assertTrue(self.index.is_bebas(10, "2025-12-24 19:00:00"))
+        self.assertFalse(self.index.is_bebas(10, "2025-12-24 19:30:00"))
+        self.assertFalse(self.index.is_bebas(10, "2025-12-24 22:30:00"))
+        self.assertTrue(self.index.is_bebas(10, "2025-12-24 23:00:00"))
+
+    def test_meja_bebas(self):
+        """Test penyaringan beberapa meja sekaligus."""
+        bebas = self.index.meja_bebas([10, 11, 12], datetime(2025, 12, 24, 19, 30))
+        self.assertEqual(bebas, [12])
+
+    def test_slot_bebas(self):
+        """Test celah waktu kosong dalam satu hari."""
+        celah = self.index.slot_bebas(10, "2025-12-24 17:00:00", "2025-12-25 00:00:00")
+        self.assertEqual(celah, [
+            (datetime(2025, 12, 24, 17), datetime(2025, 12, 24, 21)),
+            (datetime(2025, 12, 24, 23), datetime(2025, 12, 25, 0)),
+        ])
+
+    def test_listener_status_cancelled(self):
+        """Test pembatalan lewat event database membebaskan slot."""
+        self.index.on_perubahan('pemesanan_status', {'pemesanan_id': 1, 'status': 'cancelled'})
+        self.assertTrue(self.index.is_bebas(10, "2025-12-24 21:00:00"))
+        self.assertEqual(len(self.index), 1)
+
+    def test_listener_pemesanan_diupdate_pindah_meja(self):
+        """Test update pemesanan memindahkan interval ke meja baru."""
+        self.index.on_perubahan('pemesanan_diupdate', {
+            'pemesanan_id': 1, 'pelanggan_id': 5, 'meja_id': 12,
+            'tanggal_pemesanan': "2025-12-24 21:00:00", 'status': 'confirmed'})
+        self.assertTrue(self.index.is_bebas(10, "2025-12-24 21:00:00"))
+        self.assertFalse(self.index.is_bebas(12, "2025-12-24 21:00:00"))
+
+    def test_listener_hapus_pelanggan(self):
+        """Test penghapusan pelanggan ikut menghapus pemesanannya (cascade)."""
+        self.index.on_perubahan('pelanggan_dihapus', {'pelanggan_id': 6})
+        self.assertTrue(self.index.is_bebas(11, "2025-12-24 18:00:00"))
+
+    def test_muat_abaikan_status_tidak_aktif(self):
+        """Test pemesanan completed/cancelled tidak menempati slot."""
+        index = AvailabilityIndex()
+        index.muat([
+            {'id': 1, 'meja_id': 1, 'tanggal_pemesanan': datetime(2025, 1, 1, 19), 'status': 'completed'},
+            {'id': 2, 'meja_id': 1, 'tanggal_pemesanan': datetime(2025, 1, 1, 19), 'status': 'pending'},
+        ])
+        self.assertEqual(len(index), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+"""
+Unit Tests untuk Impor Massal
+Module ini menguji validasi dan pelaporan error per baris pada impor bulk.
+"""
+
+import unittest
+from services.restaurant_service import tambah_pelanggan_bulk, tambah_pemesanan_bulk
+
+
+class FakeBulkDB:
+    """DatabaseManager tiruan yang mencatat baris bulk dan menolak telepon duplikat."""
+
+    def __init__(self):
+        self.rows = []
+
+    def bulk_create_pelanggan(self, rows, chunk_size=1000):
+        gagal = []
+        for i, row in enumerate(rows):
+            if any(r[1] == row[1] for r in self.rows):
+                gagal.append((i, "Duplicate entry"))
+            else:
+                self.rows.append(row)
+        return {'berhasil': len(rows) - len(gagal), 'gagal': gagal}
+
+    def bulk_create_pemesanan(self, rows, chunk_size=1000):
+        self.rows.extend(rows)
+        return {'berhasil': len(rows), 'gagal': []}
+
+
+class TestImporBulk(unittest.TestCase):
+    """
+    Test case untuk fungsi tambah_*_bulk.
+    """
+
+    def test_pelanggan_error_per_baris(self):
+        """Test baris tidak valid dan baris yang ditolak database dilaporkan dengan indeks asli."""
+        db = FakeBulkDB()
+        data = [
+            {'nama': "John Doe", 'telepon': "081234567890", 'email': "john@example.com"},
+            {'nama': "John123", 'telepon': "081234567891"},
+            {'nama': "Jane Doe", 'telepon': "081234567890"},
+            {'nama': "Budi", 'telepon': "081234567892", 'email': None},
+        ]
+        hasil = tambah_pelanggan_bulk(db, data)
+
+        self.assertEqual(hasil['total'], 4)
+        self.assertEqual(hasil['berhasil'], 2)
+        self.assertEqual([g['baris'] for g in hasil['gagal']], [1, 2])
+        self.assertIn("angka", hasil['gagal'][0]['pesan'])
+        self.assertEqual(db.rows[1], ("Budi", "081234567892", ""))
+
+    def test_pemesanan_memakai_validasi_model(self):
+        """Test impor pemesanan memakai Pemesanan.validate_data."""
+        db = FakeBulkDB()
+        data = [
+            {'pelanggan_id': 1, 'meja_id': 1, 'tanggal_pemesanan': "2025-12-01 19:00:00",
+             'jumlah_orang': 4, 'status': 'completed'},
+            {'pelanggan_id': 1, 'meja_id': 1, 'tanggal_pemesanan': "01/12/2025",
+             'jumlah_orang': 4},
+        ]
+        hasil = tambah_pemesanan_bulk(db, data)
+
+        self.assertEqual(hasil['berhasil'], 1)
+        self.assertIn("Format tanggal", hasil['gagal'][0]['pesan'])
+        self.assertEqual(db.rows[0][4], 'completed')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Unit Tests untuk Cache
+Module ini menguji LRUCache (LRU, TTL, metrik) dan invalidasi pada CachedDatabaseManager.
+"""
+
+import unittest
+from database.cache import LRUCache, CachedDatabaseManager
+
+
+class FakeClock:
+    """Jam tiruan yang bisa dimajukan manual."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestLRUCache(unittest.TestCase):
+    """
+    Test case untuk kelas LRUCache.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.clock = FakeClock()
+        self.cache = LRUCache(maxsize=2, ttl=10, clock=self.clock)
+
+    def test_hit_miss(self):
+        """Test hit dan miss dihitung."""
+        self.assertIsNone(self.cache.get(('meja', 1)))
+        self.cache.set(('meja', 1), "a")
+        self.assertEqual(self.cache.get(('meja', 1)), "a")
+
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 1))
+        self.assertAlmostEqual(stats['hit_rate'], 0.5)
+
+    def test_lru_eviction(self):
+        """Test entri yang paling lama tidak dipakai dikeluarkan lebih dulu."""
+        self.cache.set(('meja', 1), "a")
+        self.cache.set(('meja', 2), "b")
+        self.cache.get(('meja', 1))
+        self.cache.set(('meja', 3), "c")
+
+        self.assertIsNone(self.cache.get(('meja', 2)))
+        self.assertEqual(self.cache.get(('meja', 1)), "a")
+        self.assertEqual(self.cache.stats()['evictions'], 1)
+
+    def test_ttl(self):
+        """Test entri kedaluwarsa setelah TTL."""
+        self.cache.set(('pelanggan', 1), "x")
+        self.clock.now = 10
+        self.assertIsNone(self.cache.get(('pelanggan', 1)))
+        self.assertEqual(self.cache.stats()['expired'], 1)
+
+    def test_invalidate_namespace(self):
+        """Test invalidasi namespace hanya menghapus entri namespace tersebut."""
+        self.cache.set(('meja', 1), "a")
+        self.cache.set(('pelanggan', 1), "x")
+        self.cache.invalidate_namespace('meja')
+
+        self.assertIsNone(self.cache.get(('meja', 1)))
+        self.assertEqual(self.cache.get(('pelanggan', 1)), "x")
+
+    def test_nilai_basi_tidak_disimpan(self):
+        """Test nilai yang dimuat sebelum invalidasi tidak masuk cache."""
+        versi = self.cache.versi('meja')
+        self.cache.invalidate_namespace('meja')
+        self.assertFalse(self.cache.set(('meja', 1), "lama", versi=versi))
+        self.assertIsNone(self.cache.get(('meja', 1)))
+
+
+class FakeCachedDB(CachedDatabaseManager):
+    """CachedDatabaseManager dengan execute_query tiruan yang menghitung query."""
+
+    def __init__(self):
+        super().__init__(cache_size=16, cache_ttl=None)
+        self.meja = {1: {'id': 1, 'nomor_meja': 5, 'kapasitas': 4, 'status': 'tersedia'}}
+        self.queries = []
+
+    def execute_query(self, query, params=None, fetch=False):
+        self.queries.append(query)
+        if query.startswith("SELECT * FROM meja WHERE id"):
+            return [dict(self.meja[params[0]])] if params[0] in self.meja else []
+        if query.startswith("UPDATE meja SET status"):
+            self.meja[params[1]]['status'] = params[0]
+        return 0
+
+
+class TestCachedDatabaseManager(unittest.TestCase):
+    """
+    Test case untuk read-through dan invalidasi CachedDatabaseManager.
+    """
+
+    def test_read_through(self):
+        """Test pembacaan kedua dilayani cache tanpa query."""
+        db = FakeCachedDB()
+        db.read_meja(1)
+        db.read_meja(1)
+        self.assertEqual(len(db.queries), 1)
+        self.assertEqual(db.get_cache_stats()['hits'], 1)
+
+    def test_update_menginvalidasi(self):
+        """Test update status meja membuat pembacaan berikutnya mengambil data baru."""
+        db = FakeCachedDB()
+        self.assertEqual(db.read_meja(1)[0]['status'], 'tersedia')
+        db.update_meja_status(1, 'terisi')
+        self.assertEqual(db.read_meja(1)[0]['status'], 'terisi')
+
+    def test_hasil_adalah_salinan(self):
+        """Test mengubah hasil pembacaan tidak mengubah isi cache."""
+        db = FakeCachedDB()
+        db.read_meja(1)[0]['status'] = 'rusak'
+        self.assertEqual(db.read_meja(1)[0]['status'], 'tersedia')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,125 @@
+"""
+Unit Tests untuk Connection Pool
+Module ini menguji checkout/release, health check, dan metrik pool.
+"""
+
+import threading
+import unittest
+from database.connection_pool import ConnectionPool, PoolExhaustedError
+
+
+class FakeConnection:
+    """Koneksi tiruan untuk pengujian pool tanpa server database."""
+
+    def __init__(self):
+        self.alive = True
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+
+class TestConnectionPool(unittest.TestCase):
+    """
+    Test case untuk kelas ConnectionPool.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.dibuat = []
+
+        def factory():
+            conn = FakeConnection()
+            self.dibuat.append(conn)
+            return conn
+
+        self.pool = ConnectionPool(factory, size=2, timeout=0.05,
+                                   health_check=lambda conn: conn.alive)
+
+    def test_checkout_reuse(self):
+        """Test koneksi yang dikembalikan dipakai ulang."""
+        conn = self.pool.checkout()
+        self.pool.release(conn)
+        self.assertIs(self.pool.checkout(), conn)
+        self.assertEqual(len(self.dibuat), 1)
+
+    def test_exhausted_timeout(self):
+        """Test pool habis melempar PoolExhaustedError dan dicatat di metrik."""
+        self.pool.checkout()
+        self.pool.checkout()
+        with self.assertRaises(PoolExhaustedError):
+            self.pool.checkout()
+
+        stats = self.pool.stats()
+        self.assertEqual(stats['in_use'], 2)
+        self.assertEqual(stats['exhausted'], 1)
+        self.assertEqual(stats['timeouts'], 1)
+
+    def test_health_check_replaces_dead_connection(self):
+        """Test koneksi mati diganti koneksi baru saat checkout."""
+        conn = self.pool.checkout()
+        self.pool.release(conn)
+        conn.alive = False
+
+        baru = self.pool.checkout()
+        self.assertIsNot(baru, conn)
+        self.assertTrue(conn.closed)
+        self.assertEqual(self.pool.stats()['health_check_failed'], 1)
+
+    def test_waiter_gets_released_connection(self):
+        """Test thread yang menunggu mendapat koneksi yang dikembalikan."""
+        self.pool.timeout = 2.0
+        a = self.pool.checkout()
+        self.pool.checkout()
+        hasil = []
+
+        t = threading.Thread(target=lambda: hasil.append(self.pool.checkout()))
+        t.start()
+        self.pool.release(a)
+        t.join()
+
+        self.assertIs(hasil[0], a)
+        self.assertEqual(self.pool.stats()['exhausted'], 1)
+
+    def test_context_manager_discards_broken_connection(self):
+        """Test koneksi yang rusak saat error tidak dikembalikan ke pool."""
+        with self.assertRaises(RuntimeError):
+            with self.pool.connection() as conn:
+                conn.alive = False
+                raise RuntimeError("query gagal")
+
+        stats = self.pool.stats()
+        self.assertEqual(stats['in_use'], 0)
+        self.assertEqual(stats['idle'], 0)
+        self.assertTrue(conn.closed)
+
+    def test_generator_ditutup_mengembalikan_koneksi(self):
+        """Test generator yang ditutup sebelum habis tetap mengembalikan koneksinya."""
+        def stream():
+            with self.pool.connection() as conn:
+                yield conn
+                yield conn
+
+        for _ in range(3):
+            gen = stream()
+            next(gen)
+            gen.close()
+
+        stats = self.pool.stats()
+        self.assertEqual(stats['in_use'], 0)
+        self.assertEqual(stats['idle'], 1)
+        self.assertFalse(self.dibuat[0].closed)
+
+    def test_interrupt_mengembalikan_koneksi(self):
+        """Test KeyboardInterrupt di dalam blok tidak membuat koneksi bocor."""
+        with self.assertRaises(KeyboardInterrupt):
+            with self.pool.connection():
+                raise KeyboardInterrupt
+
+        self.assertEqual(self.pool.stats()['in_use'], 0)
+        self.pool.checkout()
+        self.pool.checkout()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Unit Tests untuk Laporan & Analisis
+Module ini menguji analisis_laporan dan print_laporan tanpa database.
+"""
+
+import contextlib
+import io
+import unittest
+from datetime import datetime
+from services.restaurant_service import analisis_laporan, analisis_operasional, print_laporan
+
+
+def ke_kolom(laporan):
+    """Mengubah list baris menjadi bentuk kolom (result_format FORMAT_KOLOM)."""
+    return {k: [baris[k] for baris in laporan] for k in laporan[0]}
+
+
+def buat_laporan():
+    """Membuat data laporan contoh (format baris get_laporan_pemesanan)."""
+    data = [
+        (1, 'Alice', 1, 1, 4, 'completed'),
+        (2, 'Bob', 2, 2, 2, 'confirmed'),
+        (3, 'Alice', 1, 1, 3, 'completed'),
+        (4, 'Charlie', 3, 2, 6, 'cancelled'),
+        (5, 'Alice', 1, 3, 2, 'pending'),
+    ]
+    return [{'id': pid, 'pelanggan_id': pel_id, 'nama_pelanggan': nama,
+             'meja_id': meja, 'nomor_meja': meja, 'kapasitas': 6,
+             'tanggal_pemesanan': datetime(2025, 12, pid, 19), 'jumlah_orang': orang,
+             'status': status, 'catatan': ''}
+            for pid, nama, pel_id, meja, orang, status in data]
+
+
+class TestAnalisisLaporan(unittest.TestCase):
+    """
+    Test case untuk fungsi analisis_laporan.
+    """
+
+    def test_analisis(self):
+        """Test statistik dasar laporan."""
+        analisis = analisis_laporan(buat_laporan())
+        self.assertEqual(analisis['total_pemesanan'], 5)
+        self.assertEqual(analisis['total_orang'], 17)
+        self.assertAlmostEqual(analisis['avg_orang'], 3.4)
+        self.assertEqual(analisis['status_count'],
+                         {'completed': 2, 'confirmed': 1, 'cancelled': 1, 'pending': 1})
+        self.assertEqual(analisis['meja_populer'], (1, 2))
+        self.assertEqual(analisis['pelanggan_setia'], ('Alice', 3))
+
+    def test_analisis_iterator(self):
+        """Test analisis dari iterator sama dengan dari list."""
+        self.assertEqual(analisis_laporan(iter(buat_laporan())),
+                         analisis_laporan(buat_laporan()))
+
+    def test_analisis_kolom(self):
+        """Test analisis dari bentuk kolom sama dengan dari list baris."""
+        laporan = buat_laporan()
+        self.assertEqual(analisis_laporan(ke_kolom(laporan)), analisis_laporan(laporan))
+        self.assertIsNone(analisis_laporan({k: [] for k in laporan[0]}))
+
+    def test_analisis_operasional(self):
+        """Test distribusi per jam dan tingkat keberhasilan."""
+        laporan = buat_laporan()
+        laporan[1]['tanggal_pemesanan'] = datetime(2025, 12, 2, 12)
+        hasil = analisis_operasional(laporan)
+        self.assertEqual(hasil['per_jam'][19], 4)
+        self.assertEqual(hasil['per_jam'][12], 1)
+        self.assertEqual(hasil['jam_tersibuk'], (19, 4))
+        # 2 completed, 1 cancelled
+        self.assertAlmostEqual(hasil['tingkat_keberhasilan'], 2 / 3)
+        self.assertEqual(analisis_operasional(ke_kolom(laporan)), hasil)
+        self.assertIsNone(analisis_operasional([]))
+
+    def test_analisis_kosong(self):
+        """Test laporan kosong menghasilkan None."""
+        self.assertIsNone(analisis_laporan([]))
+        self.assertIsNone(analisis_laporan(iter([])))
+
+    def test_print_laporan_iterator(self):
+        """Test print_laporan mencetak semua baris dan total dari iterator."""
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            print_laporan(iter(buat_laporan()))
+        teks = out.getvalue()
+        self.assertIn("Total: 5 pemesanan", teks)
+        self.assertIn("Charlie", teks)
+        self.assertIn("Pelanggan Setia        : Alice (3 kali)", teks)
+
+
+    def test_print_laporan_kolom(self):
+        """Test print_laporan bentuk kolom mencetak output yang sama."""
+        cetakan = []
+        for laporan in (buat_laporan(), ke_kolom(buat_laporan())):
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                print_laporan(laporan)
+            cetakan.append(out.getvalue())
+        self.assertEqual(cetakan[0], cetakan[1])
+
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            print_laporan({k: [] for k in buat_laporan()[0]})
+        self.assertIn("Tidak ada data", out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
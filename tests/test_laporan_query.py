@@ -0,0 +1,186 @@
+"""
+Unit Tests untuk Query Laporan
+Module ini menguji filter tanggal laporan yang sargable (bisa memakai index).
+
+Test EXPLAIN dan paritas statistik agregat membutuhkan MySQL/MariaDB dan hanya dijalankan jika environment
+variable RESTAURANT_TEST_DB berisi nama database uji (kredensial memakai
+RESTAURANT_DB_HOST, RESTAURANT_DB_USER, RESTAURANT_DB_PASSWORD).
+"""
+
+import os
+import unittest
+from contextlib import contextmanager
+from decimal import Decimal
+from datetime import datetime, date, timedelta
+from database.db_manager import DatabaseManager
+from services.restaurant_service import analisis_laporan
+
+
+class TestRentangTanggal(unittest.TestCase):
+    """
+    Test case untuk konversi filter tanggal ke rentang setengah terbuka.
+    """
+
+    def test_rentang_inklusif_menjadi_setengah_terbuka(self):
+        """Test tanggal akhir inklusif menjadi awal hari berikutnya (eksklusif)."""
+        mulai, akhir = DatabaseManager._rentang_tanggal("2025-12-01", "2025-12-31")
+        self.assertEqual(mulai, datetime(2025, 12, 1))
+        self.assertEqual(akhir, datetime(2026, 1, 1))
+
+    def test_rentang_menerima_date(self):
+        """Test filter menerima objek date/datetime."""
+        mulai, akhir = DatabaseManager._rentang_tanggal(date(2025, 2, 28), datetime(2025, 2, 28, 19))
+        self.assertEqual(akhir - mulai, timedelta(days=1))
+
+    def test_query_tanpa_fungsi_pada_kolom(self):
+        """Test query laporan tidak membungkus kolom tanggal dengan DATE()."""
+        query, params = DatabaseManager()._query_laporan('confirmed', "2025-12-01", "2025-12-02")
+        self.assertNotIn("DATE(", query)
+        self.assertIn("p.tanggal_pemesanan >= %s", query)
+        self.assertIn("p.tanggal_pemesanan < %s", query)
+        self.assertEqual(params, ('confirmed', datetime(2025, 12, 1), datetime(2025, 12, 3)))
+
+    def test_format_tanggal_tidak_valid(self):
+        """Test format tanggal salah ditolak."""
+        with self.assertRaises(ValueError):
+            DatabaseManager._rentang_tanggal("31/12/2025", None)
+
+
+
+class FakeAgregatCursor:
+    """Cursor tiruan yang mengembalikan hasil GROUP BY sesuai urutan query."""
+
+    def __init__(self, hasil):
+        self.hasil = list(hasil)
+        self.queries = []
+
+    def execute(self, query, params=None):
+        self.queries.append(query)
+        self._rows = self.hasil.pop(0)
+
+    def fetchall(self):
+        return self._rows
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+
+class TestStatistikPemesanan(unittest.TestCase):
+    """
+    Test case untuk pembentukan hasil get_statistik_pemesanan.
+    """
+
+    def buat_db(self, hasil):
+        db = DatabaseManager()
+        db.cursor_uji = FakeAgregatCursor(hasil)
+
+        @contextmanager
+        def transaction():
+            yield db.cursor_uji
+
+        db.transaction = transaction
+        return db
+
+    def test_bentuk_sama_dengan_analisis_laporan(self):
+        """Test hasil agregat memiliki key dan tipe yang sama dengan analisis_laporan."""
+        db = self.buat_db([
+            [{'status': 'completed', 'jumlah': 3, 'orang': Decimal(10)},
+             {'status': 'pending', 'jumlah': 1, 'orang': Decimal(2)}],
+            [{'nama': 5, 'jumlah': 2}],
+            [{'nama': "Alice", 'jumlah': 3}],
+        ])
+        hasil = db.get_statistik_pemesanan(tanggal_mulai="2025-12-01")
+
+        self.assertEqual(hasil, {
+            'total_pemesanan': 4,
+            'total_orang': 12,
+            'avg_orang': 3.0,
+            'status_count': {'completed': 3, 'pending': 1},
+            'meja_populer': (5, 2),
+            'pelanggan_setia': ("Alice", 3)
+        })
+        self.assertIsInstance(hasil['total_orang'], int)
+        self.assertTrue(all("GROUP BY" in q for q in db.cursor_uji.queries))
+
+    def test_kosong_mengembalikan_none(self):
+        """Test tanpa data mengembalikan None seperti analisis_laporan."""
+        db = self.buat_db([[]])
+        self.assertIsNone(db.get_statistik_pemesanan(status='cancelled'))
+
+
+@unittest.skipUnless(os.environ.get('RESTAURANT_TEST_DB'), "butuh database MySQL uji")
+class TestLaporanMemakaiIndex(unittest.TestCase):
+    """
+    Regression test berbasis EXPLAIN: filter tanggal laporan harus bisa
+    memakai idx_tanggal.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        cls.db = DatabaseManager(host=os.environ.get('RESTAURANT_DB_HOST', 'localhost'),
+                                 database=os.environ['RESTAURANT_TEST_DB'],
+                                 user=os.environ.get('RESTAURANT_DB_USER', 'root'),
+                                 password=os.environ.get('RESTAURANT_DB_PASSWORD', ''))
+        # create_tables() juga menjalankan migrasi index
+        if not cls.db.connect() or not cls.db.create_tables():
+            raise unittest.SkipTest("database uji tidak bisa diakses")
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.db.disconnect()
+
+    def explain(self, query, params):
+        """Menjalankan EXPLAIN dan mengembalikan baris untuk tabel pemesanan (alias p)."""
+        rows = self.db.execute_query("EXPLAIN " + query, params, fetch=True)
+        return next(r for r in rows if r['table'] == 'p')
+
+    def test_rentang_tanggal_memakai_idx_tanggal(self):
+        """Test idx_tanggal menjadi kandidat index untuk filter tanggal."""
+        query, params = self.db._query_laporan(None, "2025-12-01", "2025-12-07")
+        baris = self.explain(query, params)
+        self.assertIn('idx_tanggal', baris['possible_keys'] or '')
+
+    def test_query_lama_tidak_bisa_memakai_index(self):
+        """Test pembanding: DATE(kolom) membuat index tidak bisa dipakai."""
+        query = """SELECT p.id FROM pemesanan p
+                   WHERE DATE(p.tanggal_pemesanan) >= %s AND DATE(p.tanggal_pemesanan) <= %s"""
+        baris = self.explain(query, ("2025-12-01", "2025-12-07"))
+        self.assertNotIn('idx_tanggal', baris['possible_keys'] or '')
+
+
+@unittest.skipUnless(os.environ.get('RESTAURANT_TEST_DB'), "butuh database MySQL uji")
+class TestStatistikAgregat(unittest.TestCase):
+    """
+    Test paritas: get_statistik_pemesanan (SQL) harus sama dengan
+    analisis_laporan atas baris laporan yang sama.
+    """
+
+    setUpClass = TestLaporanMemakaiIndex.setUpClass
+    tearDownClass = TestLaporanMemakaiIndex.tearDownClass
+
+    def bandingkan(self, **filter_laporan):
+        """Membandingkan hasil kedua jalur untuk filter yang sama."""
+        python = analisis_laporan(self.db.iter_laporan_pemesanan(**filter_laporan))
+        sql = self.db.get_statistik_pemesanan(**filter_laporan)
+        if python is None:
+            self.assertIsNone(sql)
+            return
+
+        for key in ('total_pemesanan', 'total_orang', 'status_count'):
+            self.assertEqual(sql[key], python[key])
+        self.assertAlmostEqual(sql['avg_orang'], python['avg_orang'])
+        # Nama bisa berbeda bila seri pada tanggal yang sama; jumlahnya harus sama
+        self.assertEqual(sql['meja_populer'][1], python['meja_populer'][1])
+        self.assertEqual(sql['pelanggan_setia'][1], python['pelanggan_setia'][1])
+
+    def test_paritas_semua(self):
+        """Test statistik semua pemesanan."""
+        self.bandingkan()
+
+    def test_paritas_dengan_filter(self):
+        """Test statistik dengan filter status dan tanggal."""
+        self.bandingkan(status='completed', tanggal_mulai="2025-01-01", tanggal_akhir="2025-12-31")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+Unit Tests untuk Migrasi Skema
+Module ini menguji urutan dan idempotensi migrasi tanpa server database.
+"""
+
+import unittest
+from database import migrations
+
+
+class FakeMigrasiCursor:
+    """Cursor tiruan yang menyimulasikan schema_version dan information_schema."""
+
+    def __init__(self, db):
+        self.db = db
+        self._hasil = None
+
+    def execute(self, query, params=None):
+        self.db.log.append(query)
+        if "MAX(versi)" in query:
+            self._hasil = (max(self.db.versi) if self.db.versi else None,)
+        elif "information_schema.statistics" in query:
+            self._hasil = (1,) if params in self.db.index else None
+        elif query.startswith("CREATE INDEX"):
+            nama, tabel = query.split()[2], query.split()[4]
+            self.db.index.add((tabel, nama))
+        elif query.startswith("INSERT INTO schema_version"):
+            self.db.versi.append(params[0])
+
+    def fetchone(self):
+        return self._hasil
+
+    def close(self):
+        pass
+
+
+class FakeMigrasiConnection:
+    """Koneksi tiruan yang menyimpan index dan versi skema."""
+
+    def __init__(self, index=()):
+        self.index = set(index)
+        self.versi = []
+        self.log = []
+        self.commits = 0
+
+    def cursor(self, buffered=False):
+        return FakeMigrasiCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+
+class TestMigrasi(unittest.TestCase):
+    """
+    Test case untuk jalankan_migrasi.
+    """
+
+    def test_migrasi_database_baru(self):
+        """Test database tanpa index mendapat semua index dan versi terbaru."""
+        conn = FakeMigrasiConnection()
+        diterapkan = migrations.jalankan_migrasi(conn)
+
+        self.assertEqual(diterapkan, [m.versi for m in migrations.MIGRASI])
+        self.assertIn(('pemesanan', 'idx_tanggal'), conn.index)
+        self.assertIn(('pemesanan', 'idx_status_tanggal'), conn.index)
+        self.assertEqual(conn.commits, len(migrations.MIGRASI))
+
+    def test_migrasi_idempotent(self):
+        """Test migrasi kedua kali tidak menjalankan apa pun."""
+        conn = FakeMigrasiConnection()
+        migrations.jalankan_migrasi(conn)
+        jumlah_index = len(conn.index)
+
+        self.assertEqual(migrations.jalankan_migrasi(conn), [])
+        self.assertEqual(len(conn.index), jumlah_index)
+
+    def test_index_setup_sql_tidak_dibuat_ulang(self):
+        """Test index yang sudah ada (dari setup.sql) dilewati tetapi versi tetap dicatat."""
+        conn = FakeMigrasiConnection(index=[('pemesanan', 'idx_tanggal')])
+        migrations.jalankan_migrasi(conn, sampai=1)
+
+        self.assertEqual(conn.versi, [1])
+        self.assertFalse(any("CREATE INDEX idx_tanggal" in q for q in conn.log))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -185,6 +185,15 @@ class TestPemesanan(unittest.TestCase):
         self.assertFalse(result)
         self.assertEqual(self.pemesanan.status, 'pending')  # Status tetap sama
     
+    def test_bisa_transisi(self):
+        """Test mesin status pending -> confirmed -> completed/cancelled."""
+        self.assertTrue(Pemesanan.bisa_transisi('pending', 'confirmed'))
+        self.assertTrue(Pemesanan.bisa_transisi('confirmed', 'completed'))
+        self.assertTrue(Pemesanan.bisa_transisi('pending', 'cancelled'))
+        self.assertFalse(Pemesanan.bisa_transisi('pending', 'completed'))
+        self.assertFalse(Pemesanan.bisa_transisi('completed', 'cancelled'))
+        self.assertFalse(Pemesanan.bisa_transisi('cancelled', 'pending'))
+    
     def test_validate_data_success(self):
         """Test validasi data pemesanan yang benar."""
         is_valid, error_msg = self.pemesanan.validate_data()
@@ -227,10 +236,26 @@ class TestPemesanan(unittest.TestCase):
     def test_default_tanggal_pemesanan(self):
         """Test default tanggal pemesanan menggunakan waktu sekarang."""
         pemesanan = Pemesanan(pelanggan_id=1, meja_id=1, jumlah_orang=2)
-        self.assertIsNotNone(pemesanan.tanggal_pemesanan)
+        self.assertIsInstance(pemesanan.tanggal_pemesanan, datetime)
         # Cek apakah tanggal pemesanan adalah hari ini
-        today = datetime.now().strftime('%Y-%m-%d')
-        self.assertIn(today, pemesanan.tanggal_pemesanan)
+        self.assertEqual(pemesanan.tanggal_pemesanan.date(), datetime.now().date())
+        self.assertEqual(pemesanan.tanggal_pemesanan.microsecond, 0)
+    
+    def test_tanggal_teks_menjadi_datetime(self):
+        """Test tanggal berformat teks disimpan sebagai datetime."""
+        pemesanan = Pemesanan(pelanggan_id=1, meja_id=1, jumlah_orang=2,
+                              tanggal_pemesanan="2025-12-24 19:00:00")
+        self.assertEqual(pemesanan.tanggal_pemesanan, datetime(2025, 12, 24, 19))
+        self.assertTrue(pemesanan.validate_data()[0])
+    
+    def test_tanggal_tidak_valid_tetap_dilaporkan(self):
+        """Test tanggal tidak valid disimpan mentah dan ditolak validate_data."""
+        pemesanan = Pemesanan(pelanggan_id=1, meja_id=1, jumlah_orang=2,
+                              tanggal_pemesanan="24/12/2025 19:00")
+        self.assertEqual(pemesanan.tanggal_pemesanan, "24/12/2025 19:00")
+        is_valid, error_msg = pemesanan.validate_data()
+        self.assertFalse(is_valid)
+        self.assertIn("Format tanggal", error_msg)
 
 
 class TestInheritance(unittest.TestCase):
@@ -291,6 +316,45 @@ class TestPolymorphism(unittest.TestCase):
         self.assertIn("2", pemesanan.display_info())
 
 
+class TestEntityRow(unittest.TestCase):
+    """
+    Test case untuk entitas __slots__ dan pembuatan dari baris database.
+    """
+    
+    def test_tanpa_dict_per_objek(self):
+        """Test entitas memakai __slots__ sehingga tidak punya __dict__."""
+        for entity in (Pelanggan(), Meja(), Pemesanan()):
+            self.assertFalse(hasattr(entity, '__dict__'))
+        with self.assertRaises(AttributeError):
+            Meja().lokasi = "teras"
+    
+    def test_from_row_tuple_dan_dict(self):
+        """Test from_row dari tuple (urutan KOLOM) dan dari dictionary."""
+        waktu = datetime(2025, 12, 24, 19, 0)
+        row = (7, 1, 2, waktu, 4, 'confirmed', "ulang tahun", waktu)
+        pemesanan = Pemesanan.from_row(row)
+        self.assertEqual((pemesanan.id, pemesanan.meja_id, pemesanan.status), (7, 2, 'confirmed'))
+        self.assertEqual(Pemesanan.from_row(pemesanan.to_dict()).to_dict(), pemesanan.to_dict())
+        self.assertTrue(pemesanan.validate_data()[0])
+    
+    def test_from_rows_kolom_lain(self):
+        """Test from_rows dengan urutan kolom lain; kolom di luar entitas diabaikan."""
+        kolom = ('nomor_meja', 'id', 'nama_area', 'kapasitas', 'status')
+        meja = Meja.from_rows([(5, 1, "teras", 4, 'tersedia'), (6, 2, "dalam", 2, 'terisi')],
+                              kolom)
+        self.assertEqual([m.nomor_meja for m in meja], [5, 6])
+        self.assertTrue(meja[0].is_tersedia())
+        self.assertIsNone(meja[1].to_dict()['created_at'])
+    
+    def test_from_rows_cepat(self):
+        """Test jalur cepat from_rows sama dengan from_row."""
+        rows = [(i, f"Pelanggan {i}", "081234567890", "", None) for i in range(1, 4)]
+        hasil = Pelanggan.from_rows(rows)
+        self.assertEqual([p.to_dict() for p in hasil],
+                         [Pelanggan.from_row(r).to_dict() for r in rows])
+        self.assertEqual(hasil[2].get_nama(), "Pelanggan 3")
+
+
 def run_tests():
     """
     Menjalankan semua unit tests dan menampilkan hasilnya.
@@ -308,6 +372,7 @@ def run_tests():
     suite.addTests(loader.loadTestsFromTestCase(TestPemesanan))
     suite.addTests(loader.loadTestsFromTestCase(TestInheritance))
     suite.addTests(loader.loadTestsFromTestCase(TestPolymorphism))
+    suite.addTests(loader.loadTestsFromTestCase(TestEntityRow))
     
     # Jalankan tests dengan verbose output
     runner = unittest.TextTestRunner(verbosity=2)
@@ -0,0 +1,123 @@
+"""
+Unit Tests untuk Backend Analisis NumPy
+Module ini menguji bahwa services/numpy_analytics.py menghasilkan statistik
+yang identik dengan jalur Python. Dilewati jika numpy tidak terinstall.
+"""
+
+import contextlib
+import io
+import random
+import unittest
+from datetime import datetime, timedelta
+from unittest import mock
+from services import numpy_analytics
+from services.numpy_analytics import NUMPY_TERSEDIA
+from services.restaurant_service import analisis_laporan, analisis_operasional
+
+
+def buat_laporan(jumlah, seed=1):
+    """Membuat baris laporan acak dengan banyak seri dan nama pelanggan kembar."""
+    rng = random.Random(seed)
+    awal = datetime(2025, 1, 1)
+    nama = ["Budi", "Siti", "Andi", "Dewi", "Budi"]
+    status = ['pending', 'confirmed', 'completed', 'cancelled']
+    laporan = []
+    for i in range(jumlah):
+        pelanggan_id = rng.randrange(len(nama))
+        meja = rng.randint(1, 8)
+        laporan.append({'id': i + 1, 'pelanggan_id': pelanggan_id + 1,
+                        'nama_pelanggan': nama[pelanggan_id], 'meja_id': meja,
+                        'nomor_meja': meja * 10, 'kapasitas': 4,
+                        'tanggal_pemesanan': awal + timedelta(minutes=rng.randrange(525600)),
+                        'jumlah_orang': rng.randint(1, 12),
+                        'status': rng.choice(status), 'catatan': ''})
+    return laporan
+
+
+def ke_kolom(laporan):
+    """Mengubah list baris menjadi bentuk kolom (result_format FORMAT_KOLOM)."""
+    return {k: [baris[k] for baris in laporan] for k in laporan[0]}
+
+
+@unittest.skipUnless(NUMPY_TERSEDIA, "butuh numpy")
+class TestNumpyAnalytics(unittest.TestCase):
+    """
+    Test case untuk kesetaraan backend NumPy dan Python.
+    """
+
+    def test_analisis_identik(self):
+        """Test analisis_laporan numpy identik dari baris, iterator, dan kolom."""
+        for jumlah in (1, 7, 500):
+            laporan = buat_laporan(jumlah, seed=jumlah)
+            python = analisis_laporan(laporan)
+            with self.subTest(jumlah=jumlah):
+                self.assertEqual(analisis_laporan(laporan, backend='numpy'), python)
+                self.assertEqual(analisis_laporan(iter(laporan), backend='numpy'), python)
+                self.assertEqual(analisis_laporan(ke_kolom(laporan), backend='numpy'), python)
+
+    def test_seri_dimenangkan_yang_muncul_dulu(self):
+        """Test meja/pelanggan seri dipilih sesuai urutan kemunculan seperti jalur Python."""
+        laporan = buat_laporan(4)
+        for item, meja, pelanggan in zip(laporan, (3, 1, 1, 3), (2, 1, 1, 2)):
+            item['meja_id'] = item['nomor_meja'] = meja
+            item['pelanggan_id'] = pelanggan
+            item['nama_pelanggan'] = ("Budi", "Siti")[pelanggan - 1]
+        hasil = analisis_laporan(laporan, backend='numpy')
+        self.assertEqual(hasil['meja_populer'], (3, 2))
+        self.assertEqual(hasil['pelanggan_setia'], ("Siti", 2))
+        self.assertEqual(hasil, analisis_laporan(laporan))
+
+    def test_jumlah_orang_teks(self):
+        """Test jumlah_orang berupa teks (misal dari CSV) dihitung sama."""
+        laporan = buat_laporan(50)
+        for item in laporan:
+            item['jumlah_orang'] = str(item['jumlah_orang'])
+        self.assertEqual(analisis_laporan(laporan, backend='numpy'), analisis_laporan(laporan))
+
+    def test_operasional_identik(self):
+        """Test histogram per jam dan tingkat keberhasilan identik."""
+        laporan = buat_laporan(500)
+        python = analisis_operasional(laporan)
+        self.assertEqual(sum(python['per_jam']), 500)
+        self.assertEqual(analisis_operasional(laporan, backend='numpy'), python)
+        self.assertEqual(analisis_operasional(ke_kolom(laporan), backend='numpy'), python)
+
+        for item in laporan:
+            item['tanggal_pemesanan'] = item['tanggal_pemesanan'].strftime('%Y-%m-%d %H:%M:%S')
+            item['status'] = 'pending'
+        python = analisis_operasional(laporan)
+        self.assertIsNone(python['tingkat_keberhasilan'])
+        self.assertEqual(analisis_operasional(laporan, backend='numpy'), python)
+
+    def test_waktu_datetime64(self):
+        """Test tanggal dimuat sebagai datetime64[s] yang sama."""
+        laporan = buat_laporan(20)
+        data = numpy_analytics.LaporanArray(laporan)
+        self.assertEqual(data.waktu.tolist(), [r['tanggal_pemesanan'] for r in laporan])
+        self.assertEqual(len(data), 20)
+
+    def test_kosong(self):
+        """Test laporan kosong menghasilkan None."""
+        self.assertIsNone(analisis_laporan([], backend='numpy'))
+        self.assertIsNone(analisis_operasional({'tanggal_pemesanan': [], 'status': []},
+                                               backend='numpy'))
+
+
+class TestTanpaNumpy(unittest.TestCase):
+    """
+    Test case untuk jalur cadangan saat numpy tidak terinstall.
+    """
+
+    def test_kembali_ke_python(self):
+        """Test backend numpy tanpa numpy memakai jalur Python dan memberi pesan."""
+        laporan = buat_laporan(30)
+        out = io.StringIO()
+        with mock.patch.object(numpy_analytics, 'NUMPY_TERSEDIA', False), \
+                contextlib.redirect_stdout(out):
+            hasil = analisis_laporan(laporan, backend='numpy')
+        self.assertEqual(hasil, analisis_laporan(laporan))
+        self.assertIn("NumPy belum terinstall", out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
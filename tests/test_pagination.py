@@ -0,0 +1,82 @@
+"""
+Unit Tests untuk Keyset Pagination
+Module ini menguji kursor halaman pada layer service.
+"""
+
+import unittest
+from services.restaurant_service import lihat_pelanggan_halaman, lihat_pemesanan_halaman
+
+
+class FakePageDB:
+    """DatabaseManager tiruan yang meniru semantik keyset read_*_page."""
+
+    def __init__(self, pelanggan, pemesanan):
+        self.pelanggan = sorted(pelanggan, key=lambda r: r['id'], reverse=True)
+        self.pemesanan = sorted(pemesanan, key=lambda r: (r['tanggal_pemesanan'], r['id']),
+                                reverse=True)
+
+    def read_pelanggan_page(self, after_id=None, page_size=20):
+        rows = [r for r in self.pelanggan if after_id is None or r['id'] < after_id]
+        return rows[:page_size]
+
+    def read_pemesanan_page(self, after_date=None, after_id=None, page_size=20, status=None):
+        rows = [r for r in self.pemesanan
+                if (status is None or r['status'] == status)
+                and (after_id is None
+                     or (r['tanggal_pemesanan'], r['id']) < (after_date, after_id))]
+        return rows[:page_size]
+
+
+class TestPagination(unittest.TestCase):
+    """
+    Test case untuk lihat_pelanggan_halaman dan lihat_pemesanan_halaman.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        pelanggan = [{'id': i, 'nama': f"Pelanggan {i}"} for i in range(1, 8)]
+        # Beberapa pemesanan berbagi tanggal yang sama untuk menguji pemecah seri id
+        pemesanan = [{'id': i, 'tanggal_pemesanan': f"2025-12-0{1 + i // 3} 19:00:00",
+                      'status': 'pending' if i % 2 else 'confirmed'}
+                     for i in range(1, 11)]
+        self.db = FakePageDB(pelanggan, pemesanan)
+
+    def test_pelanggan_semua_halaman(self):
+        """Test menelusuri kursor menghasilkan semua pelanggan tanpa duplikat."""
+        halaman = lihat_pelanggan_halaman(self.db, page_size=3)
+        ids = [p['id'] for p in halaman['data']]
+        while halaman['after_id'] is not None:
+            halaman = lihat_pelanggan_halaman(self.db, halaman['after_id'], page_size=3)
+            ids.extend(p['id'] for p in halaman['data'])
+
+        self.assertEqual(ids, [7, 6, 5, 4, 3, 2, 1])
+
+    def test_halaman_terakhir_tanpa_kursor(self):
+        """Test halaman yang pas habis tidak mengembalikan kursor berikutnya."""
+        halaman = lihat_pelanggan_halaman(self.db, after_id=4, page_size=3)
+        self.assertEqual([p['id'] for p in halaman['data']], [3, 2, 1])
+        self.assertIsNone(halaman['after_id'])
+
+    def test_pemesanan_tanggal_sama_tidak_terlewat(self):
+        """Test pemesanan dengan tanggal sama di batas halaman tidak hilang."""
+        hasil = []
+        halaman = lihat_pemesanan_halaman(self.db, page_size=4)
+        hasil.extend(halaman['data'])
+        while halaman['after_id'] is not None:
+            halaman = lihat_pemesanan_halaman(self.db, halaman['after_date'],
+                                              halaman['after_id'], page_size=4)
+            hasil.extend(halaman['data'])
+
+        self.assertEqual(sorted(p['id'] for p in hasil), list(range(1, 11)))
+        self.assertEqual(hasil, self.db.pemesanan)
+
+    def test_pemesanan_filter_status(self):
+        """Test filter status diteruskan ke setiap halaman."""
+        halaman = lihat_pemesanan_halaman(self.db, page_size=2, status='pending')
+        halaman = lihat_pemesanan_halaman(self.db, halaman['after_date'], halaman['after_id'],
+                                          page_size=2, status='pending')
+        self.assertTrue(all(p['status'] == 'pending' for p in halaman['data']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Unit Tests untuk Reservasi Meja Atomik
+Module ini menguji DatabaseManager.reservasi_meja mode flag meja.status:
+UPDATE bersyarat, hasil konflik, dan rollback saat insert pemesanan gagal.
+Dijalankan pada backend SQLite ':memory:' yang memakai kode reservasi yang sama.
+"""
+
+import contextlib
+import io
+import unittest
+from database.sqlite_manager import SQLiteDatabaseManager
+
+
+class TestReservasiMeja(unittest.TestCase):
+    """
+    Test case untuk reservasi_meja mode flag.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.db = SQLiteDatabaseManager(':memory:')
+        self.assertTrue(self.db.connect() and self.db.create_tables())
+        self.pelanggan_id = self.db.create_pelanggan("Budi", "081234567890")
+        self.meja_id = self.db.create_meja(1, 4)
+
+    def tearDown(self):
+        """Cleanup setelah setiap test."""
+        self.db.disconnect()
+
+    def reservasi(self, jumlah_orang=2, meja_id=None, pelanggan_id=None):
+        """Memesan meja test (atau meja/pelanggan lain) untuk 24 Desember 19:00."""
+        return self.db.reservasi_meja(pelanggan_id or self.pelanggan_id,
+                                      meja_id or self.meja_id,
+                                      "2025-12-24 19:00:00", jumlah_orang)
+
+    def test_berhasil(self):
+        """Test reservasi berhasil menandai meja dan membuat pemesanan pending."""
+        hasil = self.reservasi()
+        self.assertEqual(hasil['hasil'], self.db.RESERVASI_BERHASIL)
+        self.assertIsNone(hasil['meja'])
+
+        pemesanan = self.db.read_pemesanan(hasil['pemesanan_id'])
+        self.assertEqual(pemesanan[0]['status'], 'pending')
+        self.assertEqual(pemesanan[0]['meja_id'], self.meja_id)
+        self.assertEqual(self.db.read_meja(self.meja_id)[0]['status'], 'reserved')
+
+    def test_meja_sudah_dipesan(self):
+        """Test meja yang sudah reserved ditolak tanpa membuat pemesanan baru."""
+        self.reservasi()
+        hasil = self.reservasi()
+        self.assertEqual(hasil['hasil'], self.db.RESERVASI_MEJA_TIDAK_TERSEDIA)
+        self.assertIsNone(hasil['pemesanan_id'])
+        self.assertEqual(hasil['meja']['status'], 'reserved')
+        self.assertEqual(len(self.db.read_pemesanan()), 1)
+
+    def test_melebihi_kapasitas(self):
+        """Test jumlah orang melebihi kapasitas ditolak dan meja tetap tersedia."""
+        hasil = self.reservasi(jumlah_orang=5)
+        self.assertEqual(hasil['hasil'], self.db.RESERVASI_MELEBIHI_KAPASITAS)
+        self.assertEqual(hasil['meja']['kapasitas'], 4)
+        self.assertEqual(self.db.read_meja(self.meja_id)[0]['status'], 'tersedia')
+        self.assertEqual(self.db.read_pemesanan(), [])
+
+    def test_meja_tidak_ditemukan(self):
+        """Test meja yang tidak ada menghasilkan meja_tidak_ditemukan."""
+        hasil = self.reservasi(meja_id=999)
+        self.assertEqual(hasil['hasil'], self.db.RESERVASI_MEJA_TIDAK_DITEMUKAN)
+        self.assertIsNone(hasil['meja'])
+        self.assertEqual(self.db.read_pemesanan(), [])
+
+    def test_rollback_tanpa_pemesanan_yatim(self):
+        """Test insert pemesanan gagal membatalkan klaim meja dan tidak meninggalkan baris."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            hasil = self.reservasi(pelanggan_id=999)
+        self.assertEqual(hasil['hasil'], self.db.RESERVASI_GAGAL)
+        self.assertIsNone(hasil['pemesanan_id'])
+        self.assertEqual(self.db.read_meja(self.meja_id)[0]['status'], 'tersedia')
+        self.assertEqual(self.db.read_pemesanan(), [])
+
+        # Meja bisa dipesan lagi setelah rollback
+        self.assertEqual(self.reservasi()['hasil'], self.db.RESERVASI_BERHASIL)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Unit Tests untuk Ringkasan Harian
+Module ini menguji urutan penyesuaian tabel pemesanan_harian dan filter ringkasan.
+
+Test konsistensi ringkasan vs tabel pemesanan membutuhkan MySQL/MariaDB dan
+hanya dijalankan jika environment variable RESTAURANT_TEST_DB diisi
+(lihat tests/test_laporan_query.py).
+"""
+
+import os
+import unittest
+from contextlib import contextmanager
+from datetime import date
+from database.db_manager import DatabaseManager
+from tests.test_laporan_query import TestLaporanMemakaiIndex
+
+
+class FakeRollupCursor:
+    """Cursor tiruan yang mencatat query dan mengembalikan high-water mark."""
+
+    def __init__(self, id_terakhir):
+        self.id_terakhir = id_terakhir
+        self.lastrowid = id_terakhir + 1
+        self.log = []
+
+    def execute(self, query, params=None):
+        self.log.append((" ".join(query.split()), params))
+
+    def fetchone(self):
+        return {'id_terakhir': self.id_terakhir}
+
+    def fetchall(self):
+        return []
+
+
+def buat_db(id_terakhir=10):
+    """Membuat DatabaseManager dengan transaction() tiruan."""
+    db = DatabaseManager()
+    db.cursor_uji = FakeRollupCursor(id_terakhir)
+
+    @contextmanager
+    def transaction():
+        yield db.cursor_uji
+
+    db.transaction = transaction
+    return db
+
+
+class TestPerubahanPemesanan(unittest.TestCase):
+    """
+    Test case untuk penyesuaian ringkasan saat pemesanan berubah.
+    """
+
+    def test_urutan_kurang_ubah_tambah(self):
+        """Test baris dikunci, dikurangkan, diubah, lalu ditambahkan kembali."""
+        db = buat_db(id_terakhir=10)
+        self.assertTrue(db.update_pemesanan_status(7, 'completed'))
+
+        queries = [q for q, _ in db.cursor_uji.log]
+        self.assertIn("LOCK IN SHARE MODE", queries[0])
+        self.assertIn("FOR UPDATE", queries[1])
+        self.assertIn("-1 * COUNT(*)", queries[2])
+        self.assertTrue(queries[3].startswith("UPDATE pemesanan SET status"))
+        self.assertIn("1 * COUNT(*)", queries[4])
+        self.assertNotIn("-1 * COUNT(*)", queries[4])
+        # Penyesuaian dibatasi pada baris yang sudah masuk ringkasan
+        self.assertEqual(db.cursor_uji.log[2][1], (10, 7))
+
+    def test_hapus_pelanggan_menyesuaikan_semua_pemesanannya(self):
+        """Test hapus pelanggan mengurangkan semua pemesanannya dari ringkasan."""
+        db = buat_db()
+        db.delete_pelanggan(3)
+
+        query, params = db.cursor_uji.log[2]
+        self.assertIn("pelanggan_id = %s", query)
+        self.assertEqual(params, (10, 3))
+
+    def test_refresh_tanpa_baris_baru(self):
+        """Test refresh tanpa id baru tidak mengambil lock dan tidak mengubah apa pun."""
+        db = buat_db(id_terakhir=10)
+        db.cursor_uji.fetchone = lambda: {'id_terakhir': 10, 'id_maks': 10}
+        self.assertEqual(db.refresh_rollup(), 10)
+        self.assertEqual(len(db.cursor_uji.log), 1)
+        self.assertNotIn("FOR UPDATE", db.cursor_uji.log[0][0])
+        self.assertFalse(any("INSERT INTO pemesanan_harian" in q for q, _ in db.cursor_uji.log))
+
+    def test_insert_tanpa_lock_eksklusif(self):
+        """Test insert pemesanan hanya mengambil lock bersama rollup_state, tanpa refresh."""
+        db = buat_db(id_terakhir=10)
+        self.assertEqual(db.create_pemesanan(1, 2, "2025-12-24 19:00:00", 2), 11)
+
+        queries = [q for q, _ in db.cursor_uji.log]
+        self.assertEqual(len(queries), 2)
+        self.assertIn("LOCK IN SHARE MODE", queries[0])
+        self.assertTrue(queries[1].startswith("INSERT INTO pemesanan "))
+
+
+class TestFilterHarian(unittest.TestCase):
+    """
+    Test case untuk filter tanggal pada tabel ringkasan.
+    """
+
+    def test_rentang_tanggal_inklusif(self):
+        """Test tanggal akhir inklusif menjadi batas eksklusif hari berikutnya."""
+        where, params = DatabaseManager()._filter_harian('completed', "2025-12-01", "2025-12-31")
+        self.assertIn("h.tanggal >= %s", where)
+        self.assertIn("h.tanggal < %s", where)
+        self.assertEqual(params, ['completed', date(2025, 12, 1), date(2026, 1, 1)])
+
+
+@unittest.skipUnless(os.environ.get('RESTAURANT_TEST_DB'), "butuh database MySQL uji")
+class TestRingkasanKonsisten(unittest.TestCase):
+    """
+    Test integrasi: statistik dari ringkasan harian harus sama dengan
+    statistik yang dihitung langsung dari tabel pemesanan.
+    """
+
+    setUpClass = TestLaporanMemakaiIndex.setUpClass
+    tearDownClass = TestLaporanMemakaiIndex.tearDownClass
+
+    def bandingkan(self):
+        harian = self.db.get_statistik_harian(dengan_pelanggan=False)
+        langsung = self.db.get_statistik_pemesanan()
+        if langsung is None:
+            self.assertIsNone(harian)
+            return
+        for key in ('total_pemesanan', 'total_orang', 'status_count'):
+            self.assertEqual(harian[key], langsung[key])
+
+    def test_konsisten_setelah_perubahan(self):
+        """Test insert, ubah status, dan hapus menjaga ringkasan tetap konsisten."""
+        pelanggan_id = self.db.create_pelanggan("Rollup Test", "081200000001")
+        meja = self.db.read_meja()
+        self.assertTrue(pelanggan_id and meja)
+
+        pemesanan_id = self.db.create_pemesanan(pelanggan_id, meja[0]['id'],
+                                                "2025-12-24 19:00:00", 4)
+        self.bandingkan()
+        self.db.update_pemesanan_status(pemesanan_id, 'completed')
+        self.bandingkan()
+        self.db.delete_pemesanan(pemesanan_id)
+        self.bandingkan()
+        self.db.delete_pelanggan(pelanggan_id)
+        self.bandingkan()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,301 @@
+"""
+Unit Tests untuk Server HTTP JSON
+Module ini menjalankan server di port acak di atas database SQLite
+dan menguji endpoint lewat http.client.
+"""
+
+import contextlib
+import http.client
+import io
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from database.sqlite_manager import SQLiteDatabaseManager
+from server import RestaurantRequestHandler, buat_server
+from tests.test_sqlite_backend import fetchmany_gagal
+
+
+class TestServerHTTP(unittest.TestCase):
+    """
+    Test case untuk endpoint server HTTP.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.direktori = tempfile.mkdtemp()
+        self.db = SQLiteDatabaseManager(os.path.join(self.direktori, "r.db"), pool_size=4)
+        self.assertTrue(self.db.connect() and self.db.create_tables())
+        self.server = buat_server(self.db, port=0, quiet=True)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        """Cleanup setelah setiap test."""
+        self.server.shutdown()
+        self.server.server_close()
+        self.db.disconnect()
+        shutil.rmtree(self.direktori, ignore_errors=True)
+
+    def koneksi(self) -> http.client.HTTPConnection:
+        return http.client.HTTPConnection('127.0.0.1', self.server.server_port, timeout=10)
+
+    def request(self, method, path, body=None, conn=None):
+        """Mengirim request dan mengembalikan (status, data JSON, response)."""
+        conn = conn or self.koneksi()
+        isi = json.dumps(body) if body is not None else None
+        conn.request(method, path, body=isi,
+                     headers={'Content-Type': 'application/json'} if isi else {})
+        response = conn.getresponse()
+        return response.status, json.loads(response.read()), response
+
+    def test_crud_pelanggan(self):
+        """Test tambah, lihat, update, dan hapus pelanggan lewat HTTP."""
+        status, data, _ = self.request('POST', '/pelanggan',
+                                       {'nama': "Budi", 'telepon': "081234567890"})
+        self.assertEqual(status, 201)
+        pelanggan_id = data['id']
+
+        status, data, _ = self.request('PUT', f'/pelanggan/{pelanggan_id}',
+                                       {'nama': "Budi S", 'telepon': "081234567890"})
+        self.assertEqual(status, 200)
+        status, data, _ = self.request('GET', f'/pelanggan/{pelanggan_id}')
+        self.assertEqual(data['nama'], "Budi S")
+
+        status, data, _ = self.request('GET', '/pelanggan?page_size=10')
+        self.assertEqual(len(data['data']), 1)
+        self.assertIsNone(data['after_id'])
+
+        self.assertEqual(self.request('DELETE', f'/pelanggan/{pelanggan_id}')[0], 200)
+        status, data, _ = self.request('GET', f'/pelanggan/{pelanggan_id}')
+        self.assertEqual(status, 404)
+        self.assertIn("tidak ditemukan", data['error'])
+
+    def test_pesan_validasi_dikirim(self):
+        """Test pesan validasi dari service dikirim ke klien dengan status 400."""
+        status, data, _ = self.request('POST', '/pelanggan', {'nama': "Budi", 'telepon': "12"})
+        self.assertEqual(status, 400)
+        self.assertTrue(data['error'].startswith("Validasi gagal"))
+
+        status, data, _ = self.request('POST', '/meja', {'nomor_meja': "satu", 'kapasitas': 4})
+        self.assertEqual(status, 400)
+
+    def test_alur_pemesanan(self):
+        """Test pemesanan, bentrok meja (409), konfirmasi, dan pemilihan meja otomatis."""
+        pelanggan_id = self.db.create_pelanggan("Budi", "081234567890")
+        meja_id = self.db.create_meja(1, 2)
+        self.db.create_meja(2, 6)
+        pesanan = {'pelanggan_id': pelanggan_id, 'meja_id': meja_id,
+                   'tanggal_pemesanan': "2025-12-24 19:00:00", 'jumlah_orang': 2}
+
+        status, data, _ = self.request('POST', '/pemesanan', pesanan)
+        self.assertEqual(status, 201)
+        pemesanan_id = data['id']
+        self.assertEqual(self.request('POST', '/pemesanan', pesanan)[0], 409)
+
+        status, data, _ = self.request('POST', f'/pemesanan/{pemesanan_id}/konfirmasi')
+        self.assertEqual(status, 200)
+        self.assertEqual(data['status'], 'confirmed')
+        self.assertEqual(data['tanggal_pemesanan'], "2025-12-24 19:00:00")
+        self.assertEqual(self.request('POST', f'/pemesanan/{pemesanan_id}/konfirmasi')[0], 409)
+
+        otomatis = dict(pesanan, meja_id=None, jumlah_orang=5)
+        status, data, _ = self.request('POST', '/pemesanan', otomatis)
+        self.assertEqual(status, 201)
+        status, data, _ = self.request('GET', '/pemesanan?status=pending')
+        self.assertEqual(data['data'][0]['nomor_meja'], 2)
+
+    def test_pemesanan_bersamaan(self):
+        """Test banyak klien memesan meja yang sama bersamaan: hanya satu berhasil."""
+        pelanggan_id = self.db.create_pelanggan("Budi", "081234567890")
+        meja_id = self.db.create_meja(1, 4)
+        pesanan = {'pelanggan_id': pelanggan_id, 'meja_id': meja_id,
+                   'tanggal_pemesanan': "2025-12-24 19:00:00", 'jumlah_orang': 2}
+        hasil = []
+
+        def pesan():
+            hasil.append(self.request('POST', '/pemesanan', pesanan)[0])
+
+        threads = [threading.Thread(target=pesan) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(sorted(hasil), [201] + [409] * 7)
+
+    def test_laporan_streaming(self):
+        """Test laporan dikirim chunked dan berisi semua baris."""
+        pelanggan_id = self.db.create_pelanggan("Budi", "081234567890")
+        meja_id = self.db.create_meja(1, 4)
+        self.db.bulk_create_pemesanan([
+            (pelanggan_id, meja_id, datetime(2025, 12, 1 + i % 28, 19), 2, 'completed', "")
+            for i in range(500)])
+
+        status, data, response = self.request('GET', '/laporan?batch_size=100')
+        self.assertEqual(status, 200)
+        self.assertEqual(response.getheader('Transfer-Encoding'), 'chunked')
+        self.assertEqual(len(data), 500)
+
+        status, data, _ = self.request('GET', '/laporan?tanggal_mulai=2025-12-01'
+                                              '&tanggal_akhir=2025-12-01')
+        self.assertEqual(len(data), 18)
+
+        status, data, _ = self.request('GET', '/laporan/statistik')
+        self.assertEqual(data['total_pemesanan'], 500)
+        status, harian, _ = self.request('GET', '/laporan/statistik?sumber=harian')
+        self.assertEqual(harian['status_count'], data['status_count'])
+
+    def test_laporan_error_database(self):
+        """Test error database pada laporan tidak dikirim sebagai array JSON yang lengkap."""
+        pelanggan_id = self.db.create_pelanggan("Budi", "081234567890")
+        meja_id = self.db.create_meja(1, 4)
+        self.db.bulk_create_pemesanan([
+            (pelanggan_id, meja_id, datetime(2025, 12, 1, 19), 2, 'completed', "")
+            for _ in range(500)])
+
+        with fetchmany_gagal(0), contextlib.redirect_stdout(io.StringIO()):
+            status, data, _ = self.request('GET', '/laporan')
+        self.assertEqual(status, 500)
+        self.assertIn('error', data)
+
+        with fetchmany_gagal(3), contextlib.redirect_stdout(io.StringIO()):
+            conn = self.koneksi()
+            conn.request('GET', '/laporan?batch_size=100')
+            response = conn.getresponse()
+            self.assertEqual(response.status, 200)
+            with self.assertRaises(http.client.IncompleteRead):
+                response.read()
+            conn.close()
+
+        # Koneksi database dikembalikan ke pool
+        status, data, _ = self.request('GET', '/laporan')
+        self.assertEqual(len(data), 500)
+
+    def test_klien_putus_di_tengah_laporan(self):
+        """Test klien yang putus saat laporan dialirkan tidak menahan koneksi pool."""
+        pelanggan_id = self.db.create_pelanggan("Budi", "081234567890")
+        meja_id = self.db.create_meja(1, 4)
+        self.db.bulk_create_pemesanan([
+            (pelanggan_id, meja_id, datetime(2025, 12, 1, 19), 2, 'completed', "x" * 200)
+            for _ in range(20000)])
+
+        for _ in range(self.db.pool_size + 1):
+            conn = self.koneksi()
+            conn.request('GET', '/laporan?batch_size=100')
+            response = conn.getresponse()
+            response.read(1024)
+            conn.sock.shutdown(socket.SHUT_RDWR)
+            conn.close()
+
+        batas = time.monotonic() + 5
+        while self.db.get_pool_stats()['in_use'] and time.monotonic() < batas:
+            time.sleep(0.05)
+        self.assertEqual(self.db.get_pool_stats()['in_use'], 0)
+        status, data, _ = self.request('GET', '/meja')
+        self.assertEqual((status, len(data)), (200, 1))
+
+    def test_stream_ditutup_saat_klien_putus(self):
+        """Test generator laporan ditutup walau penulisan ke klien gagal."""
+        class SocketPutus:
+            def write(self, isi):
+                raise BrokenPipeError(32, "Broken pipe")
+
+        ditutup = []
+
+        def rows():
+            try:
+                yield from ({'id': i} for i in range(1000))
+            finally:
+                ditutup.append(True)
+
+        handler = RestaurantRequestHandler.__new__(RestaurantRequestHandler)
+        handler.server, handler.path = self.server, '/laporan'
+        handler.request_version, handler.wfile = 'HTTP/1.1', SocketPutus()
+        handler.send_response = handler.send_header = lambda *args: None
+        handler.end_headers = lambda: None
+
+        stream = rows()
+        handler._kirim_stream(stream)
+        self.assertEqual(ditutup, [True])
+        self.assertTrue(handler.close_connection)
+
+    def test_keep_alive(self):
+        """Test beberapa request memakai satu koneksi TCP."""
+        conn = self.koneksi()
+        self.request('GET', '/meja', conn=conn)
+        sock = conn.sock
+        for _ in range(3):
+            status, data, _ = self.request('GET', '/meja', conn=conn)
+            self.assertEqual((status, data), (200, []))
+        self.assertIs(conn.sock, sock)
+        conn.close()
+
+    def test_keep_alive_diam_tidak_menahan_worker(self):
+        """Test klien keep-alive yang diam melebihi jumlah worker tidak memblokir klien baru."""
+        server = buat_server(self.db, port=0, workers=1, quiet=True)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            def koneksi():
+                return http.client.HTTPConnection('127.0.0.1', server.server_port, timeout=3)
+
+            diam = [koneksi() for _ in range(3)]
+            for conn in diam:
+                self.assertEqual(self.request('GET', '/meja', conn=conn)[0], 200)
+
+            # Worker satu-satunya harus bebas meski tiga koneksi keep-alive masih terbuka
+            mulai = time.perf_counter()
+            self.assertEqual(self.request('GET', '/meja', conn=koneksi())[0], 200)
+            self.assertLess(time.perf_counter() - mulai, 1.0)
+
+            # Koneksi yang diparkir tetap bisa dipakai ulang
+            for conn in diam:
+                sock = conn.sock
+                self.assertEqual(self.request('GET', '/meja', conn=conn)[0], 200)
+                self.assertIs(conn.sock, sock)
+                conn.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_request_tidak_valid(self):
+        """Test endpoint tidak dikenal, method salah, dan body bukan JSON."""
+        self.assertEqual(self.request('GET', '/menu')[0], 404)
+        self.assertEqual(self.request('PATCH', '/meja')[0], 501)
+        self.assertEqual(self.request('DELETE', '/meja')[0], 405)
+
+        conn = self.koneksi()
+        conn.request('POST', '/meja', body="{bukan json")
+        response = conn.getresponse()
+        self.assertEqual(response.status, 400)
+        response.read()
+
+    def test_stdout_dikembalikan(self):
+        """Test pesan service tidak bocor ke stdout dan stdout asli dikembalikan."""
+        keluaran = io.StringIO()
+        with contextlib.redirect_stdout(keluaran):
+            server = buat_server(self.db, port=0, quiet=True)
+            server.server_close()
+            print("halo")
+        self.assertEqual(keluaran.getvalue(), "halo\n")
+
+    def test_worker_tanpa_pool(self):
+        """Test database tanpa pool (SQLite ':memory:') hanya dilayani satu worker."""
+        db = SQLiteDatabaseManager(':memory:', pool_size=8)
+        self.assertTrue(db.connect())
+        try:
+            server = buat_server(db, port=0, workers=8, quiet=True)
+            self.assertEqual(server.workers, 1)
+            server.server_close()
+        finally:
+            db.disconnect()
+        self.assertEqual(self.server.workers, 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,358 @@
+"""
+Unit Tests untuk Backend SQLite
+Module ini menjalankan CRUD, reservasi, transisi status, ringkasan harian,
+dan laporan DatabaseManager pada SQLite tanpa server database.
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from datetime import date, datetime, timedelta
+from unittest import mock
+from database.sqlite_manager import SQLiteCursor, SQLiteDatabaseManager, terjemahkan_query
+from services.restaurant_service import (analisis_laporan, generate_laporan_stream,
+                                          init_database, print_laporan)
+
+
+def buat_db(path=':memory:', **opsi):
+    """Membuat SQLiteDatabaseManager yang sudah terkoneksi dan bertabel."""
+    db = SQLiteDatabaseManager(path, **opsi)
+    assert db.connect() and db.create_tables()
+    return db
+
+
+def fetchmany_gagal(setelah):
+    """Membuat fetchmany cursor SQLite gagal setelah `setelah` kali pemanggilan."""
+    asli = SQLiteCursor.fetchmany
+    panggilan = []
+
+    def fetchmany(cursor, size=1):
+        panggilan.append(size)
+        if len(panggilan) > setelah:
+            raise sqlite3.OperationalError("disk I/O error")
+        return asli(cursor, size)
+
+    return mock.patch.object(SQLiteCursor, 'fetchmany', fetchmany)
+
+
+def isi_data(db):
+    """Mengisi dua pelanggan, tiga meja, dan beberapa pemesanan."""
+    budi = db.create_pelanggan("Budi", "081234567890", "budi@email.com")
+    siti = db.create_pelanggan("Siti", "081298765432", "")
+    db.bulk_create_meja([(1, 2, 'tersedia'), (2, 4, 'tersedia'), (3, 6, 'tersedia')])
+    meja = [m['id'] for m in db.read_meja()]
+    db.bulk_create_pemesanan([
+        (budi, meja[0], datetime(2025, 12, 1, 19, 0), 2, 'completed', ""),
+        (budi, meja[1], datetime(2025, 12, 1, 20, 0), 4, 'confirmed', ""),
+        (siti, meja[1], datetime(2025, 12, 2, 19, 0), 3, 'pending', ""),
+        (budi, meja[2], datetime(2025, 12, 3, 12, 0), 5, 'cancelled', "ulang tahun"),
+    ])
+    return budi, siti, meja
+
+
+class TestTerjemahanQuery(unittest.TestCase):
+    """
+    Test case untuk penerjemahan query MySQL ke SQLite.
+    """
+
+    def test_placeholder_dan_lock(self):
+        """Test %s menjadi ? dan klausa lock baris dibuang."""
+        self.assertEqual(terjemahkan_query("SELECT * FROM meja WHERE id = %s FOR UPDATE"),
+                         "SELECT * FROM meja WHERE id = ?")
+        self.assertEqual(terjemahkan_query("SELECT id_terakhir FROM rollup_state "
+                                           "WHERE nama = %s LOCK IN SHARE MODE"),
+                         "SELECT id_terakhir FROM rollup_state WHERE nama = ?")
+
+
+class TestSQLiteCrud(unittest.TestCase):
+    """
+    Test case untuk CRUD dan transaksi DatabaseManager di SQLite ':memory:'.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.db = buat_db()
+
+    def tearDown(self):
+        """Cleanup setelah setiap test."""
+        self.db.disconnect()
+
+    def test_skema_termigrasi(self):
+        """Test create_tables menjalankan semua migrasi."""
+        from database.migrations import VERSI_TERBARU
+        self.assertEqual(self.db.get_schema_version(), VERSI_TERBARU)
+        # Aman dijalankan ulang
+        self.assertTrue(self.db.create_tables())
+
+    def test_crud_pelanggan(self):
+        """Test create, read, update, delete pelanggan."""
+        pelanggan_id = self.db.create_pelanggan("Budi", "081234567890", "budi@email.com")
+        self.assertTrue(pelanggan_id)
+
+        self.assertTrue(self.db.update_pelanggan(pelanggan_id, "Budi S", "081234567890", ""))
+        pelanggan = self.db.read_pelanggan(pelanggan_id)
+        self.assertEqual(pelanggan[0]['nama'], "Budi S")
+        self.assertIsInstance(pelanggan[0]['created_at'], datetime)
+
+        self.assertTrue(self.db.delete_pelanggan(pelanggan_id))
+        self.assertEqual(self.db.read_pelanggan(pelanggan_id), [])
+
+    def test_hapus_meja_cascade(self):
+        """Test pemesanan ikut terhapus saat mejanya dihapus (foreign key aktif)."""
+        _, _, meja = isi_data(self.db)
+        self.assertTrue(self.db.delete_meja(meja[1]))
+        self.assertEqual(len(self.db.read_pemesanan()), 2)
+
+    def test_bulk_insert_sebagian_gagal(self):
+        """Test baris duplikat dilaporkan tanpa membatalkan baris lain."""
+        hasil = self.db.bulk_create_meja([(1, 4, 'tersedia'), (1, 4, 'tersedia'),
+                                          (2, 4, 'tersedia')])
+        self.assertEqual(hasil['berhasil'], 2)
+        self.assertEqual([i for i, _ in hasil['gagal']], [1])
+        self.assertEqual([m['nomor_meja'] for m in self.db.read_meja()], [1, 2])
+
+    def test_reservasi_flag_status(self):
+        """Test reservasi kedua pada meja yang sama ditolak."""
+        pelanggan_id = self.db.create_pelanggan("Budi", "081234567890")
+        meja_id = self.db.create_meja(1, 4)
+
+        hasil = self.db.reservasi_meja(pelanggan_id, meja_id, "2025-12-24 19:00:00", 2)
+        self.assertEqual(hasil['hasil'], self.db.RESERVASI_BERHASIL)
+        hasil = self.db.reservasi_meja(pelanggan_id, meja_id, "2025-12-24 19:00:00", 2)
+        self.assertEqual(hasil['hasil'], self.db.RESERVASI_MEJA_TIDAK_TERSEDIA)
+
+    def test_reservasi_slot_waktu(self):
+        """Test mode slot waktu mendeteksi bentrok dengan parameter datetime."""
+        pelanggan_id = self.db.create_pelanggan("Budi", "081234567890")
+        meja_id = self.db.create_meja(1, 4)
+        durasi = timedelta(hours=2)
+
+        hasil = self.db.reservasi_meja(pelanggan_id, meja_id, datetime(2025, 12, 24, 19), 2,
+                                       durasi=durasi)
+        self.assertEqual(hasil['hasil'], self.db.RESERVASI_BERHASIL)
+        hasil = self.db.reservasi_meja(pelanggan_id, meja_id, datetime(2025, 12, 24, 20), 2,
+                                       durasi=durasi)
+        self.assertEqual(hasil['hasil'], self.db.RESERVASI_SLOT_TERISI)
+        hasil = self.db.reservasi_meja(pelanggan_id, meja_id, datetime(2025, 12, 24, 21), 2,
+                                       durasi=durasi)
+        self.assertEqual(hasil['hasil'], self.db.RESERVASI_BERHASIL)
+
+    def test_transisi_status(self):
+        """Test transisi satu pemesanan dan transisi berdasarkan waktu."""
+        _, _, meja = isi_data(self.db)
+        pending = self.db.read_pemesanan(status='pending')[0]
+
+        hasil = self.db.transisi_pemesanan(pending['id'], 'completed', ('confirmed',))
+        self.assertEqual(hasil['hasil'], self.db.TRANSISI_TIDAK_VALID)
+
+        ditutup = self.db.transisi_pemesanan_sebelum(datetime(2025, 12, 2), 'completed',
+                                                     ('confirmed',), 'tersedia')
+        self.assertEqual(len(ditutup), 1)
+        self.assertEqual(self.db.read_meja(meja[1])[0]['status'], 'tersedia')
+
+
+class TestSQLiteLaporan(unittest.TestCase):
+    """
+    Test case untuk laporan, statistik, dan ringkasan harian di SQLite.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.db = buat_db()
+        self.budi, self.siti, self.meja = isi_data(self.db)
+
+    def tearDown(self):
+        """Cleanup setelah setiap test."""
+        self.db.disconnect()
+
+    def test_laporan_filter_tanggal(self):
+        """Test filter tanggal inklusif dan kolom tanggal bertipe datetime."""
+        laporan = self.db.get_laporan_pemesanan(tanggal_mulai="2025-12-01",
+                                                tanggal_akhir="2025-12-02")
+        self.assertEqual(len(laporan), 3)
+        self.assertIsInstance(laporan[0]['tanggal_pemesanan'], datetime)
+        self.assertEqual(laporan[0]['nama_pelanggan'], "Siti")
+
+    def test_statistik_sama_dengan_python(self):
+        """Test get_statistik_pemesanan sama dengan analisis_laporan."""
+        for filter_laporan in ({}, {'status': 'confirmed'},
+                               {'tanggal_mulai': "2025-12-01", 'tanggal_akhir': "2025-12-01"}):
+            python = analisis_laporan(self.db.iter_laporan_pemesanan(**filter_laporan))
+            sql = self.db.get_statistik_pemesanan(**filter_laporan)
+            self.assertEqual(sql, python)
+
+    def test_ringkasan_harian_konsisten(self):
+        """Test ringkasan harian tetap sama dengan tabel pemesanan setelah perubahan."""
+        def bandingkan():
+            # get_statistik_harian menyusul ringkasan sendiri
+            harian = self.db.get_statistik_harian(dengan_pelanggan=False)
+            langsung = self.db.get_statistik_pemesanan()
+            for key in ('total_pemesanan', 'total_orang', 'status_count'):
+                self.assertEqual(harian[key], langsung[key])
+
+        bandingkan()
+        pemesanan_id = self.db.create_pemesanan(self.siti, self.meja[0],
+                                                "2025-12-24 19:00:00", 2)
+        bandingkan()
+        self.db.update_pemesanan_status(pemesanan_id, 'confirmed')
+        bandingkan()
+        self.db.delete_pemesanan(pemesanan_id)
+        bandingkan()
+        self.db.delete_pelanggan(self.siti)
+        bandingkan()
+
+        # Perubahan pada pemesanan yang belum masuk ringkasan tidak dihitung dua kali
+        baru = self.db.create_pemesanan(self.budi, self.meja[1], "2025-12-25 19:00:00", 3)
+        self.db.create_pemesanan(self.budi, self.meja[2], "2025-12-25 20:00:00", 4)
+        self.db.update_pemesanan_status(baru, 'cancelled')
+        bandingkan()
+
+        ringkasan = self.db.get_ringkasan_harian()
+        self.assertEqual(ringkasan[0], {'tanggal': date(2025, 12, 1),
+                                        'jumlah_pemesanan': 2, 'jumlah_orang': 6})
+
+    def test_read_entities(self):
+        """Test baris tabel dibaca sebagai entitas lewat cursor tuple."""
+        from models import Pemesanan
+        pemesanan = self.db.read_entities(Pemesanan, "WHERE status = %s ORDER BY id",
+                                          ('confirmed',))
+        self.assertEqual(len(pemesanan), 1)
+        self.assertIsInstance(pemesanan[0], Pemesanan)
+        self.assertIsInstance(pemesanan[0].tanggal_pemesanan, datetime)
+        self.assertEqual(pemesanan[0].meja_id, self.meja[1])
+        
+        semua = list(self.db.iter_entities(Pemesanan, "ORDER BY id", batch_size=3))
+        self.assertEqual([p.id for p in semua], [p['id'] for p in
+                                                 sorted(self.db.read_pemesanan(),
+                                                        key=lambda p: p['id'])])
+    
+    def test_stream_error_diteruskan(self):
+        """Test error database di tengah aliran dilempar, bukan laporan terpotong."""
+        out = io.StringIO()
+        with fetchmany_gagal(2), contextlib.redirect_stdout(out):
+            stream = self.db.iter_laporan_pemesanan(batch_size=1)
+            self.assertEqual(len([next(stream), next(stream)]), 2)
+            with self.assertRaises(sqlite3.OperationalError):
+                next(stream)
+        self.assertIn("Error saat eksekusi query", out.getvalue())
+
+        # print_laporan tidak menampilkan total untuk laporan yang tidak lengkap
+        out = io.StringIO()
+        with fetchmany_gagal(2), contextlib.redirect_stdout(out):
+            print_laporan(generate_laporan_stream(self.db, batch_size=1))
+        self.assertIn("data di atas tidak lengkap", out.getvalue())
+        self.assertNotIn("Total", out.getvalue())
+
+        out = io.StringIO()
+        with fetchmany_gagal(0), contextlib.redirect_stdout(out):
+            print_laporan(generate_laporan_stream(self.db))
+        self.assertIn("Gagal membaca data laporan", out.getvalue())
+
+    def test_result_format(self):
+        """Test bentuk hasil tuple, namedtuple, dan kolom berisi data yang sama."""
+        dicts = self.db.get_laporan_pemesanan()
+        nama = list(dicts[0])
+        tuples = self.db.get_laporan_pemesanan(result_format='tuple')
+        self.assertEqual(tuples, [tuple(d.values()) for d in dicts])
+        
+        named = self.db.get_laporan_pemesanan(result_format='namedtuple')
+        self.assertEqual([r._asdict() for r in named], dicts)
+        
+        kolom = self.db.get_laporan_pemesanan(result_format='kolom')
+        self.assertEqual(list(kolom), nama)
+        self.assertEqual(kolom['id'], [d['id'] for d in dicts])
+        self.assertEqual(analisis_laporan(kolom), analisis_laporan(dicts))
+        
+        batch = list(self.db.iter_laporan_pemesanan(batch_size=3, result_format='kolom'))
+        self.assertEqual([len(b['id']) for b in batch], [3, 1])
+        self.assertEqual(batch[0]['status'] + batch[1]['status'], kolom['status'])
+        
+        kosong = self.db.get_laporan_pemesanan(status='tidak_ada', result_format='kolom')
+        self.assertEqual(kosong, {k: [] for k in nama})
+        with self.assertRaises(ValueError):
+            self.db.execute_query("SELECT 1", fetch=True, result_format='xml')
+    
+    def test_halaman_keyset(self):
+        """Test keyset pagination menelusuri semua pemesanan tanpa duplikat."""
+        ids = []
+        halaman = self.db.read_pemesanan_page(page_size=3)
+        while halaman:
+            ids.extend(p['id'] for p in halaman)
+            terakhir = halaman[-1]
+            halaman = self.db.read_pemesanan_page(terakhir['tanggal_pemesanan'],
+                                                  terakhir['id'], page_size=3)
+        self.assertEqual(sorted(ids), sorted(p['id'] for p in self.db.read_pemesanan()))
+
+
+class TestSQLiteFile(unittest.TestCase):
+    """
+    Test case untuk database file: WAL, pool koneksi, dan init_database.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.direktori = tempfile.mkdtemp()
+        self.path = os.path.join(self.direktori, "restoran.db")
+
+    def tearDown(self):
+        """Cleanup setelah setiap test."""
+        shutil.rmtree(self.direktori, ignore_errors=True)
+
+    def test_wal_dan_reservasi_bersamaan(self):
+        """Test dua thread dengan koneksi pool berbeda tidak bisa memesan meja yang sama."""
+        db = buat_db(self.path, pool_size=4)
+        try:
+            mode = db.execute_query("PRAGMA journal_mode", fetch=True)
+            self.assertEqual(mode[0]['journal_mode'], 'wal')
+
+            pelanggan_id = db.create_pelanggan("Budi", "081234567890")
+            meja_id = db.create_meja(1, 4)
+            hasil = []
+
+            def pesan():
+                hasil.append(db.reservasi_meja(pelanggan_id, meja_id,
+                                               "2025-12-24 19:00:00", 2)['hasil'])
+
+            threads = [threading.Thread(target=pesan) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            self.assertEqual(hasil.count(db.RESERVASI_BERHASIL), 1)
+        finally:
+            db.disconnect()
+
+    def test_stream_ditutup_lebih_awal(self):
+        """Test laporan stream yang ditutup sebelum habis tidak menghabiskan pool."""
+        db = buat_db(self.path, pool_size=2, pool_timeout=1.0)
+        try:
+            isi_data(db)
+            for _ in range(3):
+                stream = generate_laporan_stream(db, batch_size=1)
+                next(stream)
+                stream.close()
+            self.assertEqual(db.get_pool_stats()['in_use'], 0)
+            self.assertEqual(len(db.read_meja()), 3)
+        finally:
+            db.disconnect()
+
+    def test_init_database_sqlite(self):
+        """Test init_database memilih backend SQLite dari db_config."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            db = init_database({'backend': 'sqlite', 'path': self.path}, cache=True)
+        try:
+            self.assertIsInstance(db, SQLiteDatabaseManager)
+            self.assertTrue(db.create_meja(1, 4))
+            self.assertEqual(len(db.read_meja()), 1)
+            self.assertEqual(db.get_cache_stats()['misses'], 1)
+        finally:
+            db.disconnect()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+"""
+Unit Tests untuk Tutup Hari dan Penyapu No-Show
+Module ini menguji transisi berbasis waktu, service, dan NoShowSweeper.
+"""
+
+import contextlib
+import io
+import unittest
+from contextlib import contextmanager
+from datetime import datetime, time, timedelta
+from database.db_manager import DatabaseManager
+from services.restaurant_service import tutup_hari, batalkan_no_show
+from services.sweeper import NoShowSweeper
+
+
+class FakeSweepCursor:
+    """Cursor tiruan: SELECT ... FOR UPDATE mengembalikan baris tetap."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.log = []
+        self._rows = []
+
+    def execute(self, query, params=None):
+        query = " ".join(query.split())
+        self.log.append((query, params))
+        if query.startswith("SELECT id, meja_id, status FROM pemesanan"):
+            self._rows = [dict(r) for r in self.rows]
+        elif query.startswith("SELECT id_terakhir"):
+            self._rows = [{'id_terakhir': 100}]
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeSweepDB:
+    """Database tiruan yang mencatat panggilan transisi_pemesanan_sebelum."""
+
+    def __init__(self, hasil=None):
+        self.panggilan = []
+        self.hasil = hasil if hasil is not None else {}
+
+    def transisi_pemesanan_sebelum(self, batas_waktu, status_baru, status_asal,
+                                   status_meja=None, limit=None):
+        self.panggilan.append((batas_waktu, status_baru, status_asal, status_meja, limit))
+        return self.hasil.get(status_baru, [])
+
+
+class TestTransisiSebelum(unittest.TestCase):
+    """
+    Test case untuk DatabaseManager.transisi_pemesanan_sebelum.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.db = DatabaseManager()
+        self.cursor = FakeSweepCursor([
+            {'id': 1, 'meja_id': 10, 'status': 'pending'},
+            {'id': 2, 'meja_id': 11, 'status': 'pending'},
+        ])
+
+        @contextmanager
+        def transaction():
+            yield self.cursor
+
+        self.db.transaction = transaction
+
+    def test_satu_statement_dengan_limit(self):
+        """Test pemilihan berbasis waktu memakai ORDER BY + LIMIT dan satu UPDATE."""
+        batas = datetime(2025, 1, 1, 23, 0)
+        hasil = self.db.transisi_pemesanan_sebelum(batas, 'cancelled', ('pending',),
+                                                   'tersedia', limit=500)
+        self.assertEqual(hasil, [1, 2])
+
+        select = [(q, p) for q, p in self.cursor.log if q.startswith("SELECT id, meja_id")][0]
+        self.assertIn("tanggal_pemesanan < %s", select[0])
+        self.assertIn("ORDER BY tanggal_pemesanan, id LIMIT 500 FOR UPDATE", select[0])
+        self.assertEqual(select[1], (batas, 'pending'))
+
+        updates = [q for q, _ in self.cursor.log if q.startswith("UPDATE pemesanan SET status")]
+        self.assertEqual(len(updates), 1)
+
+    def test_meja_tidak_dibebaskan_jika_masih_dipakai(self):
+        """Test meja hanya dibebaskan jika tidak ada pemesanan confirmed lain."""
+        self.db.transisi_pemesanan_sebelum(datetime(2025, 1, 1), 'cancelled',
+                                           ('pending',), 'tersedia')
+        meja = [(q, p) for q, p in self.cursor.log if q.startswith("UPDATE meja")]
+        self.assertEqual(len(meja), 1)
+        self.assertIn("NOT EXISTS", meja[0][0])
+        self.assertEqual(meja[0][1], ('tersedia', 10, 11))
+
+
+class TestTutupHariService(unittest.TestCase):
+    """
+    Test case untuk service tutup_hari dan batalkan_no_show.
+    """
+
+    def test_tutup_hari(self):
+        """Test tutup hari menyelesaikan confirmed dan membebaskan meja."""
+        db = FakeSweepDB({'completed': [4, 5]})
+        batas = datetime(2025, 1, 1, 23, 0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(tutup_hari(db, batas), [4, 5])
+        self.assertEqual(db.panggilan, [(batas, 'completed', ('confirmed',), 'tersedia', None)])
+
+    def test_batalkan_no_show(self):
+        """Test no-show memakai batas sekarang - toleransi."""
+        db = FakeSweepDB({'cancelled': [7]})
+        sekarang = datetime(2025, 1, 1, 20, 0)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertEqual(batalkan_no_show(db, timedelta(minutes=30), sekarang), [7])
+        self.assertEqual(db.panggilan[0][:3], (datetime(2025, 1, 1, 19, 30), 'cancelled',
+                                               ('pending',)))
+
+    def test_gagal(self):
+        """Test kegagalan database menghasilkan None."""
+        db = FakeSweepDB()
+        db.transisi_pemesanan_sebelum = lambda *args, **kwargs: None
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            self.assertIsNone(tutup_hari(db))
+        self.assertIn("✗", out.getvalue())
+
+
+class TestNoShowSweeper(unittest.TestCase):
+    """
+    Test case untuk NoShowSweeper.
+    """
+
+    def test_sebelum_jam_tutup(self):
+        """Test sebelum jam tutup hanya no-show yang disapu."""
+        db = FakeSweepDB({'cancelled': [1, 2]})
+        sweeper = NoShowSweeper(db, jam_tutup=time(23, 0))
+        hasil = sweeper.jalankan_sekali(datetime(2025, 1, 1, 20, 0))
+
+        self.assertEqual(hasil['dibatalkan'], [1, 2])
+        self.assertEqual(hasil['ditutup'], [])
+        self.assertEqual(len(db.panggilan), 1)
+
+    def test_setelah_jam_tutup(self):
+        """Test setelah jam tutup pemesanan confirmed sebelum jam tutup diselesaikan."""
+        db = FakeSweepDB({'cancelled': [1], 'completed': [3, 4, 5]})
+        sweeper = NoShowSweeper(db, jam_tutup=time(23, 0), limit=100)
+        sweeper.jalankan_sekali(datetime(2025, 1, 1, 23, 15))
+
+        self.assertEqual(db.panggilan[1], (datetime(2025, 1, 1, 23, 0), 'completed',
+                                           ('confirmed',), 'tersedia', 100))
+        stats = sweeper.stats()
+        self.assertEqual(stats['runs'], 1)
+        self.assertEqual(stats['total_dibatalkan'], 1)
+        self.assertEqual(stats['total_ditutup'], 3)
+        self.assertEqual(stats['errors'], 0)
+
+    def test_error_dihitung(self):
+        """Test transisi gagal dicatat di metrik errors."""
+        db = FakeSweepDB()
+        db.transisi_pemesanan_sebelum = lambda *args, **kwargs: None
+        sweeper = NoShowSweeper(db)
+        sweeper.jalankan_sekali()
+        self.assertEqual(sweeper.stats()['errors'], 1)
+
+    def test_start_stop(self):
+        """Test thread latar berjalan minimal sekali lalu berhenti."""
+        db = FakeSweepDB()
+        sweeper = NoShowSweeper(db, interval=60)
+        sweeper.start()
+        self.assertTrue(sweeper.is_running())
+        sweeper.stop(timeout=5)
+        self.assertFalse(sweeper.is_running())
+        self.assertGreaterEqual(sweeper.stats()['runs'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Unit Tests untuk Parser Tanggal Pemesanan
+Module ini menguji parse_tanggal dan parse_tanggal_many di models/tanggal.py.
+"""
+
+import unittest
+from datetime import datetime
+from models.tanggal import FORMAT_TANGGAL, parse_tanggal, parse_tanggal_many
+
+
+def parse_strptime(nilai):
+    """Validasi lama Pemesanan.validate_data sebagai pembanding."""
+    try:
+        return datetime.strptime(str(nilai), FORMAT_TANGGAL)
+    except ValueError:
+        return None
+
+
+class TestParseTanggal(unittest.TestCase):
+    """
+    Test case untuk parser tanggal berformat tetap.
+    """
+
+    # Termasuk bentuk tidak baku yang diterima strptime dan bentuk ISO lain
+    # yang diterima fromisoformat tetapi bukan format pemesanan
+    KASUS = [
+        "2025-12-24 19:00:00",
+        "2024-02-29 00:00:59",
+        "2025-02-29 19:00:00",
+        "2025-13-01 19:00:00",
+        "2025-12-24 24:00:00",
+        "2025-1-5 9:00:00",
+        "2025-12-24T19:00:00",
+        "2025-12-24 19:00",
+        "2025-12-24",
+        "20251224 190000",
+        "2025-12-24 19+07:00",
+        "2025-12-24 19:00:00.5",
+        "24/12/2025 19:00:00",
+        "bukan tanggal",
+    ]
+
+    def test_sama_dengan_strptime(self):
+        """Test hasil parse_tanggal identik dengan strptime format tetap."""
+        for teks in self.KASUS:
+            with self.subTest(teks=teks):
+                self.assertEqual(parse_tanggal(teks), parse_strptime(teks))
+
+    def test_datetime_dan_kosong(self):
+        """Test datetime dikembalikan apa adanya, nilai kosong menjadi None."""
+        waktu = datetime(2025, 12, 24, 19, 30)
+        self.assertIs(parse_tanggal(waktu), waktu)
+        self.assertIsNone(parse_tanggal(None))
+        self.assertIsNone(parse_tanggal(""))
+
+    def test_many_bentuk_baku(self):
+        """Test batch berisi teks baku diparse lewat jalur cepat."""
+        teks = ["2025-12-%02d 19:00:00" % hari for hari in range(1, 29)]
+        self.assertEqual(parse_tanggal_many(teks), [parse_strptime(t) for t in teks])
+
+    def test_many_campuran(self):
+        """Test batch campuran (datetime, tidak valid, None) tetap sesuai urutan."""
+        waktu = datetime(2025, 12, 24, 19)
+        data = [waktu] + self.KASUS + [None]
+        hasil = parse_tanggal_many(iter(data))
+        self.assertEqual(len(hasil), len(data))
+        self.assertIs(hasil[0], waktu)
+        self.assertEqual(hasil[1:-1], [parse_strptime(t) for t in self.KASUS])
+        self.assertIsNone(hasil[-1])
+
+    def test_many_tanggal_mustahil(self):
+        """Test bentuk baku dengan tanggal mustahil hanya membatalkan barisnya."""
+        hasil = parse_tanggal_many(["2025-12-24 19:00:00", "2025-02-30 19:00:00"])
+        self.assertEqual(hasil, [datetime(2025, 12, 24, 19), None])
+
+
+if __name__ == '__main__':
+    unittest.main()
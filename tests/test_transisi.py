@@ -0,0 +1,131 @@
+"""
+Unit Tests untuk Transisi Status Pemesanan
+Module ini menguji jalur transisi status satu transaksi dan pesan di layer service.
+"""
+
+import contextlib
+import io
+import unittest
+from contextlib import contextmanager
+from database.db_manager import DatabaseManager
+from services.restaurant_service import konfirmasi_pemesanan, selesaikan_pemesanan_banyak
+
+
+class FakeTransisiCursor:
+    """Cursor tiruan: baris FOR UPDATE diambil dari daftar pemesanan tiruan."""
+
+    def __init__(self, pemesanan):
+        self.pemesanan = pemesanan
+        self.log = []
+        self._rows = []
+
+    def execute(self, query, params=None):
+        query = " ".join(query.split())
+        self.log.append((query, params))
+        if query.startswith("SELECT id, meja_id, status FROM pemesanan"):
+            self._rows = [dict(p) for p in self.pemesanan
+                          if p['id'] in params and p['status'] in params]
+        elif query.startswith("SELECT id_terakhir"):
+            self._rows = [{'id_terakhir': 100}]
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchall(self):
+        return self._rows
+
+
+class TestTransisiDatabase(unittest.TestCase):
+    """
+    Test case untuk DatabaseManager._transisi dan transisi_pemesanan_banyak.
+    """
+
+    def setUp(self):
+        """Setup sebelum setiap test dijalankan."""
+        self.db = DatabaseManager()
+        self.cursor = FakeTransisiCursor([
+            {'id': 1, 'meja_id': 10, 'status': 'confirmed'},
+            {'id': 2, 'meja_id': 10, 'status': 'confirmed'},
+            {'id': 3, 'meja_id': 11, 'status': 'pending'},
+        ])
+        self.commit = []
+
+        @contextmanager
+        def transaction():
+            yield self.cursor
+            self.commit.append(True)
+
+        self.db.transaction = transaction
+        self.events = []
+        self.db.add_listener(lambda event, data: self.events.append((event, data)))
+
+    def test_banyak_satu_transaksi(self):
+        """Test banyak ID diubah dengan satu UPDATE bersyarat dan satu commit."""
+        selesai = self.db.transisi_pemesanan_banyak([1, 2, 3], 'completed', ('confirmed',),
+                                                    'tersedia')
+        self.assertEqual(selesai, [1, 2])
+        self.assertEqual(len(self.commit), 1)
+
+        updates = [(q, p) for q, p in self.cursor.log if q.startswith("UPDATE")]
+        self.assertEqual(len(updates), 2)
+        self.assertIn("status IN (%s)", updates[0][0])
+        self.assertEqual(updates[0][1], ('completed', 1, 2, 'confirmed'))
+        # Meja yang sama hanya diupdate sekali
+        self.assertEqual(updates[1][1], ('tersedia', 10))
+        self.assertEqual([d['pemesanan_id'] for e, d in self.events], [1, 2])
+
+    def test_tidak_ada_yang_memenuhi(self):
+        """Test tanpa baris yang memenuhi syarat tidak ada UPDATE maupun event."""
+        self.assertEqual(self.db.transisi_pemesanan_banyak([3], 'completed', ('confirmed',)), [])
+        self.assertFalse(any(q.startswith("UPDATE") for q, _ in self.cursor.log))
+        self.assertEqual(self.events, [])
+
+
+class FakeServiceDB:
+    """DatabaseManager tiruan untuk menguji pesan layer service."""
+
+    def __init__(self, hasil):
+        self.hasil = hasil
+        self.panggilan = []
+
+    def transisi_pemesanan(self, pemesanan_id, status_baru, status_asal, status_meja=None):
+        self.panggilan.append((pemesanan_id, status_baru, status_asal, status_meja))
+        return self.hasil
+
+    def transisi_pemesanan_banyak(self, ids, status_baru, status_asal, status_meja=None):
+        return [i for i in ids if i % 2]
+
+
+class TestTransisiService(unittest.TestCase):
+    """
+    Test case untuk fungsi konfirmasi/selesaikan di layer service.
+    """
+
+    def test_konfirmasi_memakai_mesin_status(self):
+        """Test konfirmasi hanya dari pending dan mengubah meja menjadi terisi."""
+        db = FakeServiceDB({'hasil': DatabaseManager.TRANSISI_BERHASIL,
+                            'status': 'confirmed', 'meja_id': 1})
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.assertTrue(konfirmasi_pemesanan(db, 5))
+        self.assertEqual(db.panggilan, [(5, 'confirmed', ('pending',), 'terisi')])
+
+    def test_transisi_tidak_valid(self):
+        """Test status yang tidak memenuhi mesin status dilaporkan."""
+        db = FakeServiceDB({'hasil': DatabaseManager.TRANSISI_TIDAK_VALID,
+                            'status': 'completed', 'meja_id': 1})
+        keluaran = io.StringIO()
+        with contextlib.redirect_stdout(keluaran):
+            self.assertFalse(konfirmasi_pemesanan(db, 5))
+        self.assertIn("berstatus completed", keluaran.getvalue())
+
+    def test_selesaikan_banyak(self):
+        """Test ID yang dilewati dilaporkan."""
+        keluaran = io.StringIO()
+        with contextlib.redirect_stdout(keluaran):
+            selesai = selesaikan_pemesanan_banyak(FakeServiceDB(None), [1, 2, 3])
+        self.assertEqual(selesai, [1, 3])
+        self.assertIn("Dilewati", keluaran.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+"""
+Unit Tests untuk Mesin Validasi Pelanggan
+Module ini menguji kode error, pesan, dan validasi batch di models/validasi.py.
+"""
+
+import unittest
+from models.pelanggan import Pelanggan
+from models import validasi
+from models.validasi import PESAN, VALID, validasi_pelanggan, validate_many
+
+
+class TestValidasiPelanggan(unittest.TestCase):
+    """
+    Test case untuk validasi_pelanggan dan validate_many.
+    """
+
+    # (nama, telepon, email, kode yang diharapkan), termasuk kasus test_validasi.py
+    KASUS = [
+        ("John123", "081234567890", "john@test.com", validasi.NAMA_MENGANDUNG_ANGKA),
+        ("A", "081234567890", "john@test.com", validasi.NAMA_TERLALU_PENDEK),
+        ("   ", "081234567890", "", validasi.NAMA_KOSONG),
+        ("John Doe", "", "", validasi.TELEPON_KOSONG),
+        ("John Doe", "123456789", "john@test.com", validasi.TELEPON_AWALAN),
+        ("John Doe", "0812-34a5-6789", "", validasi.TELEPON_BUKAN_ANGKA),
+        ("John Doe", "081234", "john@test.com", validasi.TELEPON_PANJANG),
+        ("John Doe", "081234567890", "johndomain.com", validasi.EMAIL_TANPA_AT_TITIK),
+        ("John Doe", "081234567890", "john@domain", validasi.EMAIL_TANPA_AT_TITIK),
+        ("John Doe", "081234567890", "jo@hn@domain.com", validasi.EMAIL_FORMAT),
+        ("John Doe", "081234567890", "john@example.com", VALID),
+        ("Ahmad", "6281234567890", "ahmad@test.co.id", VALID),
+        ("Siti Nurhaliza", "+62 812-3456-7890", "siti@mail.com", VALID),
+        ("Budi", "(0812) 3456 7890", "", VALID),
+    ]
+
+    def test_kode_dan_pesan_sama_dengan_model(self):
+        """Test kode setiap kasus dan pesannya sama dengan Pelanggan.validate_data."""
+        for nama, telepon, email, kode in self.KASUS:
+            with self.subTest(nama=nama, telepon=telepon, email=email):
+                self.assertEqual(validasi_pelanggan(nama, telepon, email), kode)
+                hasil = Pelanggan(nama=nama, telepon=telepon, email=email).validate_data()
+                self.assertEqual(hasil, (kode == VALID, PESAN[kode]))
+
+    def test_validate_many(self):
+        """Test validate_many menerima tuple dan dictionary, urutan hasil sama dengan input."""
+        rows = [k[:3] for k in self.KASUS]
+        self.assertEqual(validate_many(rows), [k[3] for k in self.KASUS])
+        self.assertEqual(validate_many([{'nama': "Budi", 'telepon': "081234567890"},
+                                        {'nama': "Budi", 'telepon': "081234567890",
+                                         'email': None},
+                                        ("Budi", None)]),
+                         [VALID, VALID, validasi.TELEPON_KOSONG])
+
+
+if __name__ == '__main__':
+    unittest.main()